@@ -0,0 +1,90 @@
+"""
+Benchmark of the decoders compiled from the response dataclasses.
+
+Compares the hand-written from_payload of entities with the decoders generated by
+compile_decoder, on the fixtures of tests/test_data, with and without an identity
+map. Entities decoded by their own from_payload, such as journeys, are left out.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_compiled_decoders
+"""
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from navitia_client.entities.response import (
+    Arrival,
+    CommercialMode,
+    Line,
+    Place,
+    PtObject,
+    Route,
+    StopArea,
+    StopPoint,
+)
+from navitia_client.entities.response.dataset import Dataset
+from navitia_client.entities.response.decoder_compiler import compile_decoder
+from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.identity_map import identity_scope
+from navitia_client.entities.response.route_schedule import RouteSchedule
+from navitia_client.entities.response.stop_schedule import (
+    StopSchedule,
+    TerminusSchedule,
+)
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+NUMBER = 500
+
+
+def _best_of(statement: Callable[[], object], number: int = NUMBER) -> float:
+    """Best time of one run of `statement`, in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def bench(name: str, collection: str, entity: type[Any]) -> None:
+    payload = json.loads((TEST_DATA / name).read_text(encoding="utf-8"))[collection]
+    decode: Callable[[dict[str, Any]], Any] = compile_decoder(entity)
+
+    def hand_written() -> None:
+        for data in payload:
+            entity.from_payload(data)
+
+    def compiled() -> None:
+        for data in payload:
+            decode(data)
+
+    def scoped(parse: Callable[[], None]) -> Callable[[], None]:
+        def run() -> None:
+            with identity_scope():
+                parse()
+
+        return run
+
+    print(f"{name}: {len(payload)} {entity.__name__}")
+    for scope, wrap in (("", lambda parse: parse), (" in identity scope", scoped)):
+        hand_written_time = _best_of(wrap(hand_written))
+        compiled_time = _best_of(wrap(compiled))
+        print(
+            f"  from_payload{scope:18} {hand_written_time:9.1f} us\n"
+            f"  compiled    {scope:18} {compiled_time:9.1f} us "
+            f"({hand_written_time / compiled_time:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    bench("departures.json", "departures", Departure)
+    bench("arrivals.json", "arrivals", Arrival)
+    bench("stop_schedules.json", "stop_schedules", StopSchedule)
+    bench("terminus_schedules.json", "terminus_schedules", TerminusSchedule)
+    bench("route_schedules.json", "route_schedules", RouteSchedule)
+    bench("stop_areas.json", "stop_areas", StopArea)
+    bench("stop_points.json", "stop_points", StopPoint)
+    bench("line.json", "lines", Line)
+    bench("routes.json", "routes", Route)
+    bench("commercial_mode.json", "commercial_modes", CommercialMode)
+    bench("places_nearby.json", "places_nearby", Place)
+    bench("public_transport_objects.json", "pt_objects", PtObject)
+    bench("datasets.json", "datasets", Dataset)
@@ -0,0 +1,95 @@
+"""
+Benchmark of the parsing of Navitia timestamps.
+
+Compares datetime.strptime with navitia_client.entities.response.datetime_parser on
+the timestamps of tests/test_data/departures.json and journeys.json, then measures
+the share of the parsing of whole responses spent on timestamps.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_datetime_parsing
+"""
+
+import json
+import re
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from navitia_client.entities.response import Journey
+from navitia_client.entities.response.datetime_parser import parse_datetime
+from navitia_client.entities.response.departure import Departure
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+TIMESTAMP = re.compile(r'"(\d{8}T\d{6})"')
+NUMBER = 2000
+
+
+def _strptime(value: str) -> datetime:
+    return datetime.strptime(value, "%Y%m%dT%H%M%S")
+
+
+def _best_of(statement, number: int = NUMBER) -> float:
+    """Best time of one run of `statement`, in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def bench_timestamps(name: str) -> None:
+    timestamps = TIMESTAMP.findall((TEST_DATA / name).read_text(encoding="utf-8"))
+
+    def cold() -> None:
+        parse_datetime.cache_clear()
+        for value in timestamps:
+            parse_datetime(value)
+
+    strptime_time = _best_of(lambda: [_strptime(value) for value in timestamps])
+    cold_time = _best_of(cold)
+    warm_time = _best_of(lambda: [parse_datetime(value) for value in timestamps])
+    print(
+        f"{name}: {len(timestamps)} timestamps, {len(set(timestamps))} distinct\n"
+        f"  strptime        {strptime_time:9.1f} us\n"
+        f"  parse_datetime  {cold_time:9.1f} us cold ({strptime_time / cold_time:.1f}x)"
+        f", {warm_time:.1f} us memoized ({strptime_time / warm_time:.1f}x)"
+    )
+
+
+def bench_entities(name: str, collection: str, entity: type[Any]) -> None:
+    payload = json.loads((TEST_DATA / name).read_text(encoding="utf-8"))[collection]
+
+    def parse() -> None:
+        parse_datetime.cache_clear()
+        for data in payload:
+            entity.from_payload(data)
+
+    fast_time = _best_of(parse)
+    # The previous implementation: one strptime call per timestamp
+    patches = [
+        patch.object(module, "parse_datetime", _strptime)
+        for module in list(sys.modules.values())
+        if module is not None
+        and module.__name__.startswith("navitia_client.entities.response.")
+        and getattr(module, "parse_datetime", None) is parse_datetime
+    ]
+    for patcher in patches:
+        patcher.start()
+    try:
+        strptime_time = _best_of(parse)
+    finally:
+        for patcher in patches:
+            patcher.stop()
+    print(
+        f"{name}: {entity.__name__}.from_payload of {len(payload)} items\n"
+        f"  with strptime       {strptime_time:9.1f} us\n"
+        f"  with parse_datetime {fast_time:9.1f} us "
+        f"({1 - fast_time / strptime_time:.0%} faster)"
+    )
+
+
+if __name__ == "__main__":
+    bench_timestamps("departures.json")
+    bench_timestamps("journeys.json")
+    bench_entities("departures.json", "departures", Departure)
+    bench_entities("journeys.json", "journeys", Journey)
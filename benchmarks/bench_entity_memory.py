@@ -0,0 +1,62 @@
+"""
+Benchmark of the memory used by response entities.
+
+Response entities are slotted dataclasses. This compares the memory held by many
+StopPoint, StopArea and Coord objects with the same classes declared as regular
+dataclasses, whose instances carry a __dict__.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_entity_memory
+"""
+
+import dataclasses
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from navitia_client.entities.response import StopPoint
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+COUNT = 100_000
+
+
+def _without_slots(cls: type) -> type:
+    """Same dataclass as `cls`, without __slots__."""
+    return dataclasses.make_dataclass(
+        cls.__name__, [(field.name, field.type) for field in dataclasses.fields(cls)]
+    )
+
+
+def _allocated(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by the objects returned by `build`."""
+    tracemalloc.start()
+    objects = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def bench(entity: Any) -> None:
+    cls = type(entity)
+    plain_cls = _without_slots(cls)
+    values = {
+        field.name: getattr(entity, field.name) for field in dataclasses.fields(cls)
+    }
+    # Attribute values are shared: only the objects themselves are measured
+    slotted = _allocated(lambda: [cls(**values) for _ in range(COUNT)]) / COUNT
+    plain = _allocated(lambda: [plain_cls(**values) for _ in range(COUNT)]) / COUNT
+    print(
+        f"{cls.__name__:<10} {plain:7.0f} B -> {slotted:5.0f} B per object "
+        f"({1 - slotted / plain:.0%} less)"
+    )
+
+
+if __name__ == "__main__":
+    payload = json.loads((TEST_DATA / "stop_points.json").read_text(encoding="utf-8"))
+    stop_point = StopPoint.from_payload(payload["stop_points"][0])
+    bench(stop_point)
+    bench(stop_point.stop_area)
+    bench(stop_point.coord)
@@ -0,0 +1,69 @@
+"""
+Benchmark of the memory used by geometries.
+
+Compares the memory held by the geojson of the isochrone and journey sections of
+tests/test_data, as decoded nested lists and as compact Geometry objects.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_geometry_memory
+"""
+
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from navitia_client.entities.response.geometry import Geometry
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+COPIES = 1000
+
+
+def _allocated(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by the objects returned by `build`."""
+    tracemalloc.start()
+    objects = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def bench(name: str, geojsons: list[dict[str, Any]]) -> None:
+    texts = [json.dumps(geojson) for geojson in geojsons]
+    positions = sum(len(Geometry.from_payload(geojson)) for geojson in geojsons)
+
+    # Copies of the geometries, as kept by a cache of parsed responses
+    lists = _allocated(
+        lambda: [json.loads(text) for text in texts for _ in range(COPIES)]
+    )
+    compact = _allocated(
+        lambda: [
+            Geometry.from_payload(json.loads(text))
+            for text in texts
+            for _ in range(COPIES)
+        ]
+    )
+    per_position = positions * COPIES
+    print(
+        f"{name}: {len(geojsons)} geometries, {positions} positions\n"
+        f"  nested lists {lists / per_position:7.1f} B per position\n"
+        f"  Geometry     {compact / per_position:7.1f} B per position "
+        f"({1 - compact / lists:.0%} less)"
+    )
+
+
+if __name__ == "__main__":
+    isochrones = json.loads((TEST_DATA / "isochrones.json").read_text("utf-8"))
+    bench("isochrones.json", [data["geojson"] for data in isochrones["isochrones"]])
+    journeys = json.loads((TEST_DATA / "journeys.json").read_text("utf-8"))
+    bench(
+        "journeys.json",
+        [
+            section["geojson"]
+            for journey in journeys["journeys"]
+            for section in journey["sections"]
+            if "geojson" in section
+        ],
+    )
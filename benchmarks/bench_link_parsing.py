@@ -0,0 +1,95 @@
+"""
+Benchmark of the parsing of links.
+
+Compares the parsing of schedules, departures and journeys with links kept as raw
+payloads, built on first access, and with the previous implementation, which built
+every Link eagerly and rebuilt its entity mapping on each of them.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_link_parsing
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Sequence
+from unittest.mock import patch
+
+from navitia_client.entities.response import Journey, Line, Network, Route
+from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.link import LinkList
+from navitia_client.entities.response.physical_mode import CommercialMode, PhysicalMode
+from navitia_client.entities.response.route_schedule import RouteSchedule
+from navitia_client.entities.response.stop_schedule import StopSchedule
+from navitia_client.entities.response.vehicle_journey import VehicleJourney
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+NUMBER = 500
+
+
+class _EagerLink:
+    """The previous Link."""
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "_EagerLink":
+        entity_mapping: dict[str, type[Any]] = {
+            "lines": Line,
+            "vehicle_journeys": VehicleJourney,
+            "routes": Route,
+            "commercial_modes": CommercialMode,
+            "physical_modes": PhysicalMode,
+            "networks": Network,
+        }
+        obj = cls()
+        for key, entity_class in entity_mapping.items():
+            if key in payload:
+                setattr(obj, key, [entity_class.from_payload(i) for i in payload[key]])
+        return obj
+
+
+def _eager_links(payloads: Sequence[dict[str, Any]]) -> list[_EagerLink]:
+    return [_EagerLink.from_payload(payload) for payload in payloads]
+
+
+def _best_of(statement, number: int = NUMBER) -> float:
+    """Best time of one run of `statement`, in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def bench(name: str, collection: str, entity: type[Any]) -> None:
+    payload = json.loads((TEST_DATA / name).read_text(encoding="utf-8"))[collection]
+
+    def parse() -> None:
+        for data in payload:
+            entity.from_payload(data)
+
+    deferred_time = _best_of(parse)
+    patches = [
+        patch.object(module, "LinkList", _eager_links)
+        for module in list(sys.modules.values())
+        if module is not None
+        and module.__name__.startswith("navitia_client.entities.response.")
+        and getattr(module, "LinkList", None) is LinkList
+    ]
+    for patcher in patches:
+        patcher.start()
+    try:
+        eager_time = _best_of(parse)
+    finally:
+        for patcher in patches:
+            patcher.stop()
+    print(
+        f"{name}: {entity.__name__}.from_payload of {len(payload)} items\n"
+        f"  eager links    {eager_time:9.1f} us\n"
+        f"  deferred links {deferred_time:9.1f} us "
+        f"({1 - deferred_time / eager_time:.0%} faster)"
+    )
+
+
+if __name__ == "__main__":
+    bench("stop_schedules.json", "stop_schedules", StopSchedule)
+    bench("route_schedules.json", "route_schedules", RouteSchedule)
+    bench("departures.json", "departures", Departure)
+    bench("journeys.json", "journeys", Journey)
@@ -0,0 +1,100 @@
+"""
+Benchmark of streaming the entities of a large page against buffering it.
+
+Builds count=1000 pages of stop points, stop areas and routes from the fixtures of
+tests/test_data, and reads it by chunks of STREAM_CHUNK_SIZE bytes as if received
+from the network: either buffered whole, decoded and then parsed, as
+get_navitia_api does, or fed to a CollectionParser, entities being parsed as their
+bytes arrive, as stream_navitia_api does. Reports the time to the first entity, the
+time to the last one, and the peak memory allocated while reading, with the
+entities dropped once consumed as an ETL job would.
+
+Run from the root of the repository:
+
+    python -m benchmarks.bench_streaming
+"""
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from navitia_client.client.decoders import get_json_decoder
+from navitia_client.client.streaming import STREAM_CHUNK_SIZE, CollectionParser
+from navitia_client.entities.response.line_and_route import Route
+from navitia_client.entities.response.stop_area import StopArea, StopPoint
+
+TEST_DATA = Path(__file__).resolve().parent.parent / "tests" / "test_data"
+COUNT = 1000
+REPEAT = 5
+
+
+def _page(name: str, collection: str) -> bytes:
+    """Body of a page of COUNT items, repeating those of a fixture."""
+    payload = json.loads((TEST_DATA / name).read_text(encoding="utf-8"))
+    items = payload[collection]
+    payload[collection] = [items[index % len(items)] for index in range(COUNT)]
+    return json.dumps(payload).encode()
+
+
+def _chunks(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), STREAM_CHUNK_SIZE):
+        yield body[start : start + STREAM_CHUNK_SIZE]
+
+
+def buffered(body: bytes, collection: str, entity: Any) -> Iterator[Any]:
+    decode = get_json_decoder()
+    payload = decode(b"".join(_chunks(body)))
+    yield from [entity.from_payload(item) for item in payload[collection]]
+
+
+def streamed(body: bytes, collection: str, entity: Any) -> Iterator[Any]:
+    parser = CollectionParser(collection)
+    for chunk in _chunks(body):
+        for item in parser.feed(chunk):
+            yield entity.from_payload(item)
+    for item in parser.close():
+        yield entity.from_payload(item)
+
+
+def measure(
+    read: Callable[[bytes, str, Any], Iterator[Any]],
+    body: bytes,
+    collection: str,
+    entity: Any,
+) -> tuple[float, float, float]:
+    """Best time to the first and last entity, in ms, and peak memory, in MiB."""
+    first, last = [], []
+    for _ in range(REPEAT):
+        started_at = time.perf_counter()
+        entities = read(body, collection, entity)
+        next(entities)
+        first.append(time.perf_counter() - started_at)
+        for _ in entities:
+            pass
+        last.append(time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    for _ in read(body, collection, entity):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(first) * 1e3, min(last) * 1e3, peak / 2**20
+
+
+def bench(name: str, collection: str, entity: Any) -> None:
+    body = _page(name, collection)
+    print(f"{name}: {COUNT} {entity.__name__}, {len(body) / 2**20:.1f} MiB body")
+    for label, read in (("buffered", buffered), ("streamed", streamed)):
+        first, last, peak = measure(read, body, collection, entity)
+        print(
+            f"  {label}  first entity {first:8.2f} ms  "
+            f"last entity {last:8.2f} ms  peak {peak:6.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    bench("stop_points.json", "stop_points", StopPoint)
+    bench("stop_areas.json", "stop_areas", StopArea)
+    bench("routes.json", "routes", Route)
@@ -1,3 +1,13 @@
 # ruff: noqa: F401
 
-from .client import NavitiaClient
+from .client import (
+    NO_RETRY,
+    AsyncNavitiaClient,
+    NavitiaClient,
+    RateLimiter,
+    ResponseCache,
+    SQLiteResponseCache,
+    deadline,
+    RetryPolicy,
+    RetryStats,
+)
@@ -1,3 +1,8 @@
 # ruff: noqa: F401
 
+from .async_navitia_client import AsyncNavitiaClient
+from .cache import ResponseCache, SQLiteResponseCache
+from .deadline import deadline
 from .navitia_client import NavitiaClient
+from .rate_limit import RateLimiter
+from .retry import NO_RETRY, RetryPolicy, RetryStats
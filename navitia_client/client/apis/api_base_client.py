@@ -1,26 +1,164 @@
-from typing import Any
+import asyncio
+import functools
+import inspect
+import time
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Optional,
+    TypeVar,
+    cast,
+)
 from requests import Response, Session  # type: ignore
+from requests.exceptions import ConnectionError as RequestsConnectionError  # type: ignore
+from requests.exceptions import Timeout as RequestsTimeout  # type: ignore
 
+from navitia_client.client.deadline import (
+    bound_timeouts,
+    check_deadline,
+    raise_if_deadline_exceeded,
+    remaining_time,
+)
 from navitia_client.client.exceptions import (
     NavitiaAccessTokenMissingError,
+    NavitiaDeadlineExceededError,
     NavitiaForbiddenAccessError,
     NavitiaNotFoundError,
     NavitiaUnknownObjectError,
     NavitiaUnableToParseError,
 )
+from navitia_client.client.cache import ResponseCache, normalize_cache_key
+from navitia_client.client.decoders import JsonDecoder, get_json_decoder
+from navitia_client.client.rate_limit import RateLimiter
+from navitia_client.client.response import NavitiaResponse
+from navitia_client.client.retry import RetryPolicy, RetryStats
+from navitia_client.client.session import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    build_async_session,
+    build_session,
+)
+from navitia_client.client.singleflight import AsyncSingleFlight, SingleFlight
+from navitia_client.client.streaming import STREAM_CHUNK_SIZE, CollectionParser
+from navitia_client.entities.response.identity_map import (
+    IdentityMap,
+    current_identity_map,
+    identity_scope,
+)
 
+try:
+    import httpx
 
-class ApiBaseClient:
-    """Common base client for API calls."""
+    _ASYNC_CONNECTION_ERRORS: tuple[type[Exception], ...] = (
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+        httpx.ConnectTimeout,
+    )
+    _ASYNC_TIMEOUT_ERRORS: tuple[type[Exception], ...] = (httpx.TimeoutException,)
+except ImportError:  # pragma: no cover
+    _ASYNC_CONNECTION_ERRORS = ()
+    _ASYNC_TIMEOUT_ERRORS = ()
 
-    def __init__(self, auth_token: str, base_navitia_url: str) -> None:
-        self.base_navitia_url = base_navitia_url
-        self.session = Session()
-        self.session.headers.update({"Authorization": auth_token})
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+TMethod = TypeVar("TMethod", bound=Callable[..., Any])
+
+
+def identity_scoped(method: TMethod) -> TMethod:
+    """
+    Decorate an API client method parsing responses, so that the entities repeated in
+    a response are parsed once and shared, through the identity map of the client or
+    else a new map per call.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with identity_scope(self._scope_identity_map()):
+                return await method(self, *args, **kwargs)
+
+        return cast(TMethod, async_wrapper)
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with identity_scope(self._scope_identity_map()):
+            return method(self, *args, **kwargs)
+
+    return cast(TMethod, wrapper)
+
+
+class _ApiBaseClientCore:
+    """Transport-agnostic logic shared by synchronous and asynchronous base clients."""
+
+    auth_token: str
+    base_navitia_url: str
+    json_decoder: JsonDecoder
+    retry_policy: RetryPolicy
+    retry_stats: RetryStats
+    rate_limiter: Optional[RateLimiter]
+    response_cache: Optional[ResponseCache]
+    connect_timeout: Optional[float]
+    read_timeout: Optional[float]
+    identity_map: Optional[IdentityMap]
+
+    def _init_retries(
+        self, retry_policy: Optional[RetryPolicy], retry_stats: Optional[RetryStats]
+    ) -> None:
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_stats = retry_stats if retry_stats is not None else RetryStats()
+
+    def _get_cached_response(self, url: str) -> Optional[NavitiaResponse]:
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(url, self.auth_token)
+
+    def _scope_identity_map(self) -> Optional[IdentityMap]:
+        """Identity map of a parsing call: the client one, or the one of an outer call."""
+        if self.identity_map is not None:
+            return self.identity_map
+        return current_identity_map()
+
+    def _cache_response(self, response: NavitiaResponse) -> None:
+        if self.response_cache is not None and response.status_code == 200:
+            self.response_cache.set(response.url, response, self.auth_token)
+
+    def _next_retry_delay(
+        self, attempt: int, reason: str, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Delay before attempting a GET call again, or None once attempts are exhausted."""
+        if not self.retry_policy.allows_retry("GET", attempt):
+            self.retry_stats.record_exhausted()
+            return None
+        delay = self.retry_policy.compute_delay(attempt, retry_after)
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            raise NavitiaDeadlineExceededError(
+                f"Deadline exceeded before retrying after {reason}"
+            )
+        self.retry_stats.record_retry(reason, delay)
+        return delay
+
+    def _build_navitia_response(
+        self, url: str, status_code: int, content: bytes, started_at: float
+    ) -> NavitiaResponse:
+        """Decode the body of a response and raise on Navitia errors."""
+        payload = self.json_decoder(content)
+        self._check_payload_for_exception(payload)
+        return NavitiaResponse(
+            url=url,
+            status_code=status_code,
+            content=content,
+            payload=payload,
+            elapsed=time.perf_counter() - started_at,
+        )
 
     @staticmethod
-    def _check_response_for_exception(response: Response) -> Response:
-        json_payload = response.json()
+    def _check_payload_for_exception(json_payload: Any) -> None:
         if "error" in json_payload:
             error_message = json_payload["error"]["message"]
             match json_payload["error"]["id"]:
@@ -38,8 +176,6 @@ class ApiBaseClient:
             if " either read-protected or not readable" in error_message:
                 raise NavitiaForbiddenAccessError(error_message)
 
-        return response
-
     @staticmethod
     def _generate_filter_query(filters: dict[str, Any]) -> str:
         """Generate query string regarding provided filters"""
@@ -53,5 +189,278 @@ class ApiBaseClient:
                 filter_query += f"&{key}={value}"
         return "?" + filter_query[1:] if len(filter_query) > 0 else ""
 
-    def get_navitia_api(self, endpoint: str) -> Response:
-        return self._check_response_for_exception(self.session.get(endpoint))
+
+class ApiBaseClient(_ApiBaseClientCore):
+    """Common base client for API calls."""
+
+    def __init__(
+        self,
+        auth_token: str,
+        base_navitia_url: str,
+        session: Optional[Session] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_stats: Optional[RetryStats] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        singleflight: Optional[SingleFlight] = None,
+        identity_map: Optional[IdentityMap] = None,
+    ) -> None:
+        self.auth_token = auth_token
+        self.base_navitia_url = base_navitia_url
+        self.session = session if session is not None else build_session(auth_token)
+        self.json_decoder = (
+            json_decoder if json_decoder is not None else get_json_decoder()
+        )
+        self._init_retries(retry_policy, retry_stats)
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.singleflight = singleflight
+        self.identity_map = identity_map
+
+    def get_navitia_api(self, endpoint: str) -> NavitiaResponse:
+        cached_response = self._get_cached_response(endpoint)
+        if cached_response is not None:
+            return cached_response
+
+        if self.singleflight is None:
+            response = self._fetch(endpoint)
+        else:
+            response = self.singleflight.do(
+                normalize_cache_key(endpoint), partial(self._fetch, endpoint)
+            )
+        self._cache_response(response)
+        return response
+
+    def stream_navitia_api(
+        self,
+        endpoint: str,
+        collection: str,
+        payload: Optional[dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Iterate over the items of a collection of a response while its body arrives.
+
+        Each item is decoded as soon as its bytes are received, so that the first
+        entities are available before the end of the body and that memory use does
+        not grow with the size of the collection. The deadline, if any, is checked
+        before each chunk is parsed. The response is neither cached nor shared
+        through the singleflight, and items are not parsed in an identity scope. Items
+        are decoded by the standard json module, which finds where each of them ends,
+        whatever the `json_decoder` of the client. The request is sent once iteration
+        starts.
+
+        Args:
+            endpoint (str): URL of the endpoint.
+            collection (str): Key of the array whose items are yielded.
+            payload (Optional[dict[str, Any]]): Filled with the other members of the
+                response, such as "pagination", once every item has been yielded.
+
+        Yields:
+            Any: The decoded payload of each item.
+
+        Raises:
+            ValueError: If the body is not a complete JSON object.
+            NavitiaDeadlineExceededError: If the deadline passes while the body
+                arrives.
+        """
+        response = self._send(endpoint, stream=True)
+        parser = CollectionParser(collection)
+        try:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                # The read timeout bounds each chunk, not the whole body
+                check_deadline()
+                yield from parser.feed(chunk)
+        finally:
+            response.close()
+        last_items = parser.close()
+        self._check_payload_for_exception(parser.payload)
+        yield from last_items
+        if payload is not None:
+            payload.update(parser.payload)
+
+    def _fetch(self, endpoint: str) -> NavitiaResponse:
+        started_at = time.perf_counter()
+        response = self._send(endpoint)
+        return self._build_navitia_response(
+            endpoint, response.status_code, response.content, started_at
+        )
+
+    def _send(self, endpoint: str, stream: bool = False) -> Response:
+        """GET an endpoint, retrying as allowed by the retry policy."""
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self.retry_stats.record_attempt()
+            timeout = bound_timeouts(self.connect_timeout, self.read_timeout)
+            try:
+                response = (
+                    self.session.get(endpoint, timeout=timeout, stream=True)
+                    if stream
+                    else self.session.get(endpoint, timeout=timeout)
+                )
+            except RequestsConnectionError as error:
+                raise_if_deadline_exceeded(error)
+                delay = self._next_retry_delay(attempt, type(error).__name__)
+                if delay is None:
+                    raise
+            except RequestsTimeout as error:
+                raise_if_deadline_exceeded(error)
+                raise
+            else:
+                if not self.retry_policy.is_retryable_status(response.status_code):
+                    break
+                delay = self._next_retry_delay(
+                    attempt,
+                    str(response.status_code),
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    break
+                if stream:
+                    # Release the connection of the unread body before retrying
+                    response.close()
+            time.sleep(delay)
+            attempt += 1
+        return response
+
+
+class AsyncApiBaseClient(_ApiBaseClientCore):
+    """Common base client for asynchronous API calls.
+
+    Requires the optional `httpx` dependency.
+    """
+
+    def __init__(
+        self,
+        auth_token: str,
+        base_navitia_url: str,
+        session: Optional["AsyncClient"] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_stats: Optional[RetryStats] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        singleflight: Optional[AsyncSingleFlight] = None,
+        identity_map: Optional[IdentityMap] = None,
+    ) -> None:
+        self.auth_token = auth_token
+        self.base_navitia_url = base_navitia_url
+        self.session = (
+            session if session is not None else build_async_session(auth_token)
+        )
+        self.json_decoder = (
+            json_decoder if json_decoder is not None else get_json_decoder()
+        )
+        self._init_retries(retry_policy, retry_stats)
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.singleflight = singleflight
+        self.identity_map = identity_map
+
+    async def get_navitia_api(self, endpoint: str) -> NavitiaResponse:
+        cached_response = self._get_cached_response(endpoint)
+        if cached_response is not None:
+            return cached_response
+
+        if self.singleflight is None:
+            response = await self._fetch(endpoint)
+        else:
+            response = await self.singleflight.do(
+                normalize_cache_key(endpoint), partial(self._fetch, endpoint)
+            )
+        self._cache_response(response)
+        return response
+
+    async def stream_navitia_api(
+        self,
+        endpoint: str,
+        collection: str,
+        payload: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Asynchronously iterate over the items of a collection of a response while its
+        body arrives.
+
+        See ApiBaseClient.stream_navitia_api.
+        """
+        response = await self._send(endpoint, stream=True)
+        parser = CollectionParser(collection)
+        try:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                check_deadline()
+                for item in parser.feed(chunk):
+                    yield item
+        finally:
+            await response.aclose()
+        last_items = parser.close()
+        self._check_payload_for_exception(parser.payload)
+        for item in last_items:
+            yield item
+        if payload is not None:
+            payload.update(parser.payload)
+
+    async def _fetch(self, endpoint: str) -> NavitiaResponse:
+        started_at = time.perf_counter()
+        response = await self._send(endpoint)
+        return self._build_navitia_response(
+            endpoint, response.status_code, response.content, started_at
+        )
+
+    async def _send(self, endpoint: str, stream: bool = False) -> "httpx.Response":
+        """GET an endpoint, retrying as allowed by the retry policy."""
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            self.retry_stats.record_attempt()
+            connect_timeout, read_timeout = bound_timeouts(
+                self.connect_timeout, self.read_timeout
+            )
+            timeout = httpx.Timeout(
+                connect=connect_timeout,
+                read=read_timeout,
+                write=read_timeout,
+                pool=connect_timeout,
+            )
+            try:
+                response = (
+                    await self.session.send(
+                        self.session.build_request("GET", endpoint, timeout=timeout),
+                        stream=True,
+                    )
+                    if stream
+                    else await self.session.get(endpoint, timeout=timeout)
+                )
+            except _ASYNC_CONNECTION_ERRORS as error:
+                raise_if_deadline_exceeded(error)
+                delay = self._next_retry_delay(attempt, type(error).__name__)
+                if delay is None:
+                    raise
+            except _ASYNC_TIMEOUT_ERRORS as error:
+                raise_if_deadline_exceeded(error)
+                raise
+            else:
+                if not self.retry_policy.is_retryable_status(response.status_code):
+                    break
+                delay = self._next_retry_delay(
+                    attempt,
+                    str(response.status_code),
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    break
+                if stream:
+                    await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+        return response
@@ -1,8 +1,24 @@
-from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from functools import partial
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Tuple
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.bulk import (
+    DEFAULT_BULK_WORKERS,
+    BulkResult,
+    afetch_many,
+    fetch_many,
+)
+from navitia_client.client.pagination import aiter_results, iter_results
+from navitia_client.client.stop_time_columns import StopTimeColumns
 from navitia_client.entities.request.arrival import ArrivalRequest
 from navitia_client.entities.response import Pagination
+from navitia_client.entities.response.decoder_compiler import compile_decoder
 from navitia_client.entities.response.arrival import Arrival
+from navitia_client.entities.response.link import LinkedResults, LinkResolver
+from navitia_client.entities.response.projection import parse_entities
 
 
 class ArrivalApiClient(ApiBaseClient):
@@ -14,45 +30,56 @@ class ArrivalApiClient(ApiBaseClient):
     @staticmethod
     def _get_arrival_objects_from_response(
         response: Any,
+        fields: Optional[Sequence[str]] = None,
     ) -> Sequence[Arrival]:
         """Convert raw response data into a list of Arrival objects.
 
         Args:
             response: The raw response data from the API containing arrivals' information.
+            fields: Dotted paths of the fields to parse, such as "route.id", every field when None.
 
         Returns:
             A list of Arrival objects created from the raw response data.
         """
 
+        if fields is not None:
+            return parse_entities(Arrival, response, fields)
+
+        decode = compile_decoder(Arrival)
         arrivals = []
         for arrival_data in response:
-            arrivals.append(Arrival.from_payload(arrival_data))
+            arrivals.append(decode(arrival_data))
 
         return arrivals
 
+    @identity_scoped
     def _get_arrivals(
-        self, url: str, filters: dict
-    ) -> Tuple[Sequence[Arrival], Pagination]:
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
         """Fetch arrivals based on a given URL and filters.
 
         Args:
             url: The URL for the API request.
             filters: The filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
 
         Returns:
             A tuple containing a list of Arrival objects and a Pagination object for managing result pages.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        raw_results = results.json()["arrivals"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
-        return self._get_arrival_objects_from_response(raw_results), pagination
+        raw_results = results.payload["arrivals"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            self._get_arrival_objects_from_response(raw_results, fields),
+            LinkResolver(results.payload),
+        ), pagination
 
     def list_arrivals_by_region_id_and_path(
         self,
         region_id: str,
         resource_path: str,
         request: ArrivalRequest,
-    ) -> Tuple[Sequence[Arrival], Pagination]:
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
         """Retrieve a list of arrivals for a specific region and resource path.
 
         Args:
@@ -67,7 +94,68 @@ class ArrivalApiClient(ApiBaseClient):
             f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/arrivals"
         )
 
-        return self._get_arrivals(request_url, request.to_filters())
+        return self._get_arrivals(request_url, request.to_filters(), request.fields)
+
+    def iter_arrivals_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: ArrivalRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Arrival]:
+        """Iterate over all the arrivals for a specific region and resource path.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_id: The identifier of the region to fetch arrivals from.
+            resource_path: The resource path within the region to fetch arrivals for.
+            request: The ArrivalRequest containing filters and parameters for the query.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Arrival objects.
+        """
+        return iter_results(
+            partial(self.list_arrivals_by_region_id_and_path, region_id, resource_path),
+            request,
+            prefetch,
+        )
+
+    def list_arrivals_by_region_id_and_paths(
+        self,
+        region_id: str,
+        resource_paths: Sequence[str],
+        request: ArrivalRequest,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkResult[Tuple[LinkedResults[Arrival], Pagination]]:
+        """Retrieve the arrivals of many resource paths of a region at once.
+
+        Paths are fetched concurrently by a bounded pool of threads and repeated paths
+        are fetched once. A failing path does not fail the others.
+
+        Args:
+            region_id: The identifier of the region to fetch arrivals from.
+            resource_paths: The resource paths to fetch arrivals for, such as "stop_points/stop_point:1".
+            request: The request object containing query parameters, shared by every path.
+            max_workers: Maximum number of paths fetched at the same time.
+
+        Returns:
+            A BulkResult holding, per resource path, either the tuple returned by list_arrivals_by_region_id_and_path or the exception raised.
+        """
+        return fetch_many(
+            partial(self._list_arrivals_by_path, region_id, request),
+            resource_paths,
+            max_workers,
+        )
+
+    def _list_arrivals_by_path(
+        self, region_id: str, request: ArrivalRequest, resource_path: str
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
+        return self.list_arrivals_by_region_id_and_path(
+            region_id, resource_path, request
+        )
 
     def list_arrivals_by_coordinates(
         self,
@@ -76,7 +164,7 @@ class ArrivalApiClient(ApiBaseClient):
         lon: float,
         lat: float,
         request: ArrivalRequest,
-    ) -> Tuple[Sequence[Arrival], Pagination]:
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
         """Retrieve a list of arrivals for specific coordinates.
 
         Args:
@@ -92,4 +180,278 @@ class ArrivalApiClient(ApiBaseClient):
         # List of objects near the resource, navitia guesses the region from coordinates
         request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/arrivals"
 
-        return self._get_arrivals(request_url, request.to_filters())
+        return self._get_arrivals(request_url, request.to_filters(), request.fields)
+
+    def iter_arrivals_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: ArrivalRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Arrival]:
+        """Iterate over all the arrivals for specific coordinates.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_lon: The longitude of the region to fetch arrivals from.
+            region_lat: The latitude of the region to fetch arrivals from.
+            lon: The longitude of the specific location to fetch arrivals for.
+            lat: The latitude of the specific location to fetch arrivals for.
+            request: The ArrivalRequest containing filters and parameters for the query.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Arrival objects.
+        """
+        return iter_results(
+            partial(
+                self.list_arrivals_by_coordinates, region_lon, region_lat, lon, lat
+            ),
+            request,
+            prefetch,
+        )
+
+    def _get_arrival_columns(
+        self, url: str, filters: dict
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Fetch arrivals from the Navitia API as columns.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the arrivals and a Pagination object.
+        """
+        results = self.get_navitia_api(url + self._generate_filter_query(filters))
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return StopTimeColumns.from_arrivals(results.payload["arrivals"]), pagination
+
+    def list_arrival_columns_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: ArrivalRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the arrivals of a specified region and resource path as columns.
+
+        Arrival objects are not built: stop point and route ids, date times and data freshness are read from the response straight into arrays, ready for NumPy or pandas.
+
+        Args:
+            region_id: The region ID.
+            resource_path: The resource path.
+            request: The request object containing query parameters.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the arrivals and a Pagination object.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/arrivals"
+        )
+
+        return self._get_arrival_columns(request_url, request.to_filters())
+
+    def list_arrival_columns_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: ArrivalRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the arrivals of a specified set of coordinates as columns.
+
+        See list_arrival_columns_by_region_id_and_path.
+
+        Args:
+            region_lon: The longitude of the region.
+            region_lat: The latitude of the region.
+            lon: The longitude of the coordinates.
+            lat: The latitude of the coordinates.
+            request: The request object containing query parameters.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the arrivals and a Pagination object.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/arrivals"
+
+        return self._get_arrival_columns(request_url, request.to_filters())
+
+
+class AsyncArrivalApiClient(AsyncApiBaseClient):
+    """Asynchronous client for interacting with the Navitia API to retrieve arrival information.
+
+    See https://doc.navitia.io/#arrivals
+    """
+
+    @identity_scoped
+    async def _get_arrivals(
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
+        """Fetch arrivals from the Navitia API based on the provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: The filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
+
+        Returns:
+            A tuple containing a list of Arrival objects and a Pagination object for managing result pages.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        raw_results = results.payload["arrivals"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            ArrivalApiClient._get_arrival_objects_from_response(raw_results, fields),
+            LinkResolver(results.payload),
+        ), pagination
+
+    async def list_arrivals_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: ArrivalRequest,
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
+        """Retrieve a list of arrivals for a specific region and resource path.
+
+        See ArrivalApiClient.list_arrivals_by_region_id_and_path.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/arrivals"
+        )
+
+        return await self._get_arrivals(
+            request_url, request.to_filters(), request.fields
+        )
+
+    def iter_arrivals_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: ArrivalRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Arrival]:
+        """Asynchronously iterate over all the arrivals for a specific region and resource path.
+
+        See ArrivalApiClient.iter_arrivals_by_region_id_and_path.
+        """
+        return aiter_results(
+            partial(self.list_arrivals_by_region_id_and_path, region_id, resource_path),
+            request,
+            prefetch,
+        )
+
+    async def list_arrivals_by_region_id_and_paths(
+        self,
+        region_id: str,
+        resource_paths: Sequence[str],
+        request: ArrivalRequest,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkResult[Tuple[LinkedResults[Arrival], Pagination]]:
+        """Retrieve the arrivals of many resource paths of a region at once.
+
+        See ArrivalApiClient.list_arrivals_by_region_id_and_paths.
+        """
+        return await afetch_many(
+            partial(self._list_arrivals_by_path, region_id, request),
+            resource_paths,
+            max_workers,
+        )
+
+    async def _list_arrivals_by_path(
+        self, region_id: str, request: ArrivalRequest, resource_path: str
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
+        return await self.list_arrivals_by_region_id_and_path(
+            region_id, resource_path, request
+        )
+
+    async def list_arrivals_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: ArrivalRequest,
+    ) -> Tuple[LinkedResults[Arrival], Pagination]:
+        """Retrieve a list of arrivals for specific coordinates.
+
+        See ArrivalApiClient.list_arrivals_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/arrivals"
+
+        return await self._get_arrivals(
+            request_url, request.to_filters(), request.fields
+        )
+
+    def iter_arrivals_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: ArrivalRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Arrival]:
+        """Asynchronously iterate over all the arrivals for specific coordinates.
+
+        See ArrivalApiClient.iter_arrivals_by_coordinates.
+        """
+        return aiter_results(
+            partial(
+                self.list_arrivals_by_coordinates, region_lon, region_lat, lon, lat
+            ),
+            request,
+            prefetch,
+        )
+
+    async def _get_arrival_columns(
+        self, url: str, filters: dict
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Fetch arrivals from the Navitia API as columns.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the arrivals and a Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return StopTimeColumns.from_arrivals(results.payload["arrivals"]), pagination
+
+    async def list_arrival_columns_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: ArrivalRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the arrivals of a specified region and resource path as columns.
+
+        See ArrivalApiClient.list_arrival_columns_by_region_id_and_path.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/arrivals"
+        )
+
+        return await self._get_arrival_columns(request_url, request.to_filters())
+
+    async def list_arrival_columns_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: ArrivalRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the arrivals of a specified set of coordinates as columns.
+
+        See ArrivalApiClient.list_arrival_columns_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/arrivals"
+
+        return await self._get_arrival_columns(request_url, request.to_filters())
@@ -1,6 +1,12 @@
-from typing import Any, Sequence, Tuple
+from functools import partial
+from typing import Any, AsyncIterator, Iterator, Sequence, Tuple
 
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.pagination import aiter_results, iter_results
 from navitia_client.entities.request.contributor import ContributorRequest
 from navitia_client.entities.response.contributor import Contributor
 from navitia_client.entities.response import Pagination
@@ -30,6 +36,7 @@ class ContributorsApiClient(ApiBaseClient):
 
         return contributors
 
+    @identity_scoped
     def list_contributors(
         self, region_id: str, request: ContributorRequest
     ) -> Tuple[Sequence[Contributor], Pagination]:
@@ -46,12 +53,36 @@ class ContributorsApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        raw_results = results.json()["contributors"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        raw_results = results.payload["contributors"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return ContributorsApiClient._get_contributors_from_response(
             raw_results
         ), pagination
 
+    def iter_contributors(
+        self,
+        region_id: str,
+        request: ContributorRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Contributor]:
+        """Iterate over all the contributors for a specific region.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_id: The identifier of the region to fetch contributors from.
+            request: The request object containing query parameters.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Contributor objects.
+        """
+        return iter_results(
+            partial(self.list_contributors, region_id), request, prefetch
+        )
+
+    @identity_scoped
     def get_contributor_on_dataset(
         self, region_id: str, dataset_id: str, request: ContributorRequest
     ) -> Tuple[Sequence[Contributor], Pagination]:
@@ -69,8 +100,65 @@ class ContributorsApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        raw_results = results.json()["contributors"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        raw_results = results.payload["contributors"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return ContributorsApiClient._get_contributors_from_response(
+            raw_results
+        ), pagination
+
+
+class AsyncContributorsApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching contributors.
+
+    See https://doc.navitia.io/#contributors
+    """
+
+    @identity_scoped
+    async def list_contributors(
+        self, region_id: str, request: ContributorRequest
+    ) -> Tuple[Sequence[Contributor], Pagination]:
+        """Retrieve a list of contributors for a specific region.
+
+        See ContributorsApiClient.list_contributors.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/contributors"
+        results = await self.get_navitia_api(
+            url + self._generate_filter_query(request.to_filters())
+        )
+        raw_results = results.payload["contributors"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return ContributorsApiClient._get_contributors_from_response(
+            raw_results
+        ), pagination
+
+    def iter_contributors(
+        self,
+        region_id: str,
+        request: ContributorRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Contributor]:
+        """Asynchronously iterate over all the contributors for a specific region.
+
+        See ContributorsApiClient.iter_contributors.
+        """
+        return aiter_results(
+            partial(self.list_contributors, region_id), request, prefetch
+        )
+
+    @identity_scoped
+    async def get_contributor_on_dataset(
+        self, region_id: str, dataset_id: str, request: ContributorRequest
+    ) -> Tuple[Sequence[Contributor], Pagination]:
+        """Retrieve a list of contributors for a specific dataset in a region.
+
+        See ContributorsApiClient.get_contributor_on_dataset.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/contributors/{dataset_id}"
+        results = await self.get_navitia_api(
+            url + self._generate_filter_query(request.to_filters())
+        )
+        raw_results = results.payload["contributors"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return ContributorsApiClient._get_contributors_from_response(
             raw_results
         ), pagination
@@ -1,6 +1,12 @@
-from typing import Any, Sequence, Tuple
-
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from functools import partial
+from typing import Any, AsyncIterator, Iterator, Sequence, Tuple
+
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.pagination import aiter_results, iter_results
 from navitia_client.entities.request.coverage import CoverageRequest
 from navitia_client.entities.response.administrative_region import Region
 from navitia_client.entities.response import Pagination
@@ -27,6 +33,7 @@ class CoverageApiClient(ApiBaseClient):
             regions.append(Region.from_payload(region_data))
         return regions
 
+    @identity_scoped
     def list_covered_areas(
         self, request: CoverageRequest
     ) -> Tuple[Sequence[Region], Pagination]:
@@ -42,11 +49,31 @@ class CoverageApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        result_regions = results.json()["regions"]
+        result_regions = results.payload["regions"]
         regions = CoverageApiClient._get_regions_from_response(result_regions)
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return regions, pagination
 
+    def iter_covered_areas(
+        self,
+        request: CoverageRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Region]:
+        """Iterate over all the covered areas from the Navitia API.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            request: The request object containing query parameters.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Region objects.
+        """
+        return iter_results(partial(self.list_covered_areas), request, prefetch)
+
+    @identity_scoped
     def get_coverage_by_region_id(
         self, region_id: str, request: CoverageRequest
     ) -> Tuple[Sequence[Region], Pagination]:
@@ -63,11 +90,12 @@ class CoverageApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        result_regions = results.json()["regions"]
+        result_regions = results.payload["regions"]
         regions = CoverageApiClient._get_regions_from_response(result_regions)
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return regions, pagination
 
+    @identity_scoped
     def get_coverage_by_region_coordinates_and_coordinates(
         self, lon: float, lat: float, request: CoverageRequest
     ) -> Tuple[Sequence[Region], Pagination]:
@@ -85,7 +113,74 @@ class CoverageApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        result_regions = results.json()["regions"]
+        result_regions = results.payload["regions"]
+        regions = CoverageApiClient._get_regions_from_response(result_regions)
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return regions, pagination
+
+
+class AsyncCoverageApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching coverage area information.
+
+    See https://doc.navitia.io/#coverage
+    """
+
+    @identity_scoped
+    async def _get_coverage(
+        self, url: str, filters: dict
+    ) -> Tuple[Sequence[Region], Pagination]:
+        """Fetch regions from the Navitia API based on the provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing a list of Region objects and a Pagination object for managing result pages.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        result_regions = results.payload["regions"]
         regions = CoverageApiClient._get_regions_from_response(result_regions)
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return regions, pagination
+
+    async def list_covered_areas(
+        self, request: CoverageRequest
+    ) -> Tuple[Sequence[Region], Pagination]:
+        """Retrieve a list of covered areas from the Navitia API.
+
+        See CoverageApiClient.list_covered_areas.
+        """
+        url = f"{self.base_navitia_url}/coverage"
+        return await self._get_coverage(url, request.to_filters())
+
+    def iter_covered_areas(
+        self,
+        request: CoverageRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Region]:
+        """Asynchronously iterate over all the covered areas from the Navitia API.
+
+        See CoverageApiClient.iter_covered_areas.
+        """
+        return aiter_results(partial(self.list_covered_areas), request, prefetch)
+
+    async def get_coverage_by_region_id(
+        self, region_id: str, request: CoverageRequest
+    ) -> Tuple[Sequence[Region], Pagination]:
+        """Retrieve information about a specific region by its ID.
+
+        See CoverageApiClient.get_coverage_by_region_id.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}"
+        return await self._get_coverage(url, request.to_filters())
+
+    async def get_coverage_by_region_coordinates_and_coordinates(
+        self, lon: float, lat: float, request: CoverageRequest
+    ) -> Tuple[Sequence[Region], Pagination]:
+        """Retrieve information about a region based on coordinates.
+
+        See CoverageApiClient.get_coverage_by_region_coordinates_and_coordinates.
+        """
+        url = f"{self.base_navitia_url}/coverage/{lon};{lat}"
+        return await self._get_coverage(url, request.to_filters())
@@ -1,6 +1,12 @@
-from typing import Any, Sequence, Tuple
+from functools import partial
+from typing import Any, AsyncIterator, Iterator, Sequence, Tuple
 
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.pagination import aiter_results, iter_results
 from navitia_client.entities.request.dataset import DatasetRequest
 from navitia_client.entities.response.dataset import Dataset
 from navitia_client.entities.response import Pagination
@@ -32,6 +38,7 @@ class DatasetsApiClient(ApiBaseClient):
 
         return datasets
 
+    @identity_scoped
     def list_datasets(
         self, region_id: str, request: DatasetRequest
     ) -> Tuple[Sequence[Dataset], Pagination]:
@@ -48,10 +55,32 @@ class DatasetsApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        raw_results = results.json()["datasets"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        raw_results = results.payload["datasets"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return DatasetsApiClient._get_datasets_from_response(raw_results), pagination
 
+    def iter_datasets(
+        self,
+        region_id: str,
+        request: DatasetRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Dataset]:
+        """Iterate over all the datasets for a specified region from the Navitia API.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_id: The identifier of the region to fetch datasets from.
+            request: The request object containing query parameters.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Dataset objects.
+        """
+        return iter_results(partial(self.list_datasets, region_id), request, prefetch)
+
+    @identity_scoped
     def get_dataset_by_id(
         self, region_id: str, dataset_id: str, request: DatasetRequest
     ) -> Tuple[Sequence[Dataset], Pagination]:
@@ -69,6 +98,57 @@ class DatasetsApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             url + self._generate_filter_query(request.to_filters())
         )
-        raw_results = results.json()["datasets"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        raw_results = results.payload["datasets"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return DatasetsApiClient._get_datasets_from_response(raw_results), pagination
+
+
+class AsyncDatasetsApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching datasets.
+
+    See https://doc.navitia.io/#datasets
+    """
+
+    @identity_scoped
+    async def list_datasets(
+        self, region_id: str, request: DatasetRequest
+    ) -> Tuple[Sequence[Dataset], Pagination]:
+        """Retrieve a list of datasets for a specific region.
+
+        See DatasetsApiClient.list_datasets.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/datasets"
+        results = await self.get_navitia_api(
+            url + self._generate_filter_query(request.to_filters())
+        )
+        raw_results = results.payload["datasets"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return DatasetsApiClient._get_datasets_from_response(raw_results), pagination
+
+    def iter_datasets(
+        self,
+        region_id: str,
+        request: DatasetRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Dataset]:
+        """Asynchronously iterate over all the datasets for a specified region from the Navitia API.
+
+        See DatasetsApiClient.iter_datasets.
+        """
+        return aiter_results(partial(self.list_datasets, region_id), request, prefetch)
+
+    @identity_scoped
+    async def get_dataset_by_id(
+        self, region_id: str, dataset_id: str, request: DatasetRequest
+    ) -> Tuple[Sequence[Dataset], Pagination]:
+        """Retrieve information about a specific dataset by its ID within a region.
+
+        See DatasetsApiClient.get_dataset_by_id.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/datasets/{dataset_id}"
+        results = await self.get_navitia_api(
+            url + self._generate_filter_query(request.to_filters())
+        )
+        raw_results = results.payload["datasets"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return DatasetsApiClient._get_datasets_from_response(raw_results), pagination
@@ -1,8 +1,24 @@
-from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from functools import partial
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Tuple
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.bulk import (
+    DEFAULT_BULK_WORKERS,
+    BulkResult,
+    afetch_many,
+    fetch_many,
+)
+from navitia_client.client.pagination import aiter_results, iter_results
+from navitia_client.client.stop_time_columns import StopTimeColumns
 from navitia_client.entities.request.departure import DepartureRequest
 from navitia_client.entities.response import Pagination
+from navitia_client.entities.response.decoder_compiler import compile_decoder
 from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.link import LinkedResults, LinkResolver
+from navitia_client.entities.response.projection import parse_entities
 
 
 class DepartureApiClient(ApiBaseClient):
@@ -14,44 +30,55 @@ class DepartureApiClient(ApiBaseClient):
     @staticmethod
     def _get_departure_objects_from_response(
         response: Any,
+        fields: Optional[Sequence[str]] = None,
     ) -> Sequence[Departure]:
         """Convert raw response data into a list of Departure objects.
 
         Args:
             response: The raw response data from the API containing departures' information.
+            fields: Dotted paths of the fields to parse, such as "route.id", every field when None.
 
         Returns:
             A list of Departure objects created from the raw response data.
         """
+        if fields is not None:
+            return parse_entities(Departure, response, fields)
+
+        decode = compile_decoder(Departure)
         departures = []
         for departure_data in response:
-            departures.append(Departure.from_payload(departure_data))
+            departures.append(decode(departure_data))
 
         return departures
 
+    @identity_scoped
     def _get_departures(
-        self, url: str, filters: dict
-    ) -> Tuple[Sequence[Departure], Pagination]:
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
         """Fetch departures from the Navitia API based on the provided URL and filters.
 
         Args:
             url: The URL to fetch departures from.
             filters: A dictionary of filters to apply to the query.
+            fields: Dotted paths of the fields to parse, every field when None.
 
         Returns:
             A tuple containing a list of Departure objects and a Pagination object for managing result pages.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        raw_results = results.json()["departures"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
-        return self._get_departure_objects_from_response(raw_results), pagination
+        raw_results = results.payload["departures"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            self._get_departure_objects_from_response(raw_results, fields),
+            LinkResolver(results.payload),
+        ), pagination
 
     def list_departures_by_region_id_and_path(
         self,
         region_id: str,
         resource_path: str,
         request: DepartureRequest,
-    ) -> Tuple[Sequence[Departure], Pagination]:
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
         """Retrieve a list of departures for a specified region and resource path.
 
         Args:
@@ -66,7 +93,70 @@ class DepartureApiClient(ApiBaseClient):
             f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/departures"
         )
 
-        return self._get_departures(request_url, request.to_filters())
+        return self._get_departures(request_url, request.to_filters(), request.fields)
+
+    def iter_departures_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: DepartureRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Departure]:
+        """Iterate over all the departures for a specified region and resource path.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_id: The identifier of the region to fetch departures from.
+            resource_path: The resource path to fetch departures for.
+            request: The request object containing query parameters.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Departure objects.
+        """
+        return iter_results(
+            partial(
+                self.list_departures_by_region_id_and_path, region_id, resource_path
+            ),
+            request,
+            prefetch,
+        )
+
+    def list_departures_by_region_id_and_paths(
+        self,
+        region_id: str,
+        resource_paths: Sequence[str],
+        request: DepartureRequest,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkResult[Tuple[LinkedResults[Departure], Pagination]]:
+        """Retrieve the departures of many resource paths of a region at once.
+
+        Paths are fetched concurrently by a bounded pool of threads and repeated paths
+        are fetched once. A failing path does not fail the others.
+
+        Args:
+            region_id: The identifier of the region to fetch departures from.
+            resource_paths: The resource paths to fetch departures for, such as "stop_points/stop_point:1".
+            request: The request object containing query parameters, shared by every path.
+            max_workers: Maximum number of paths fetched at the same time.
+
+        Returns:
+            A BulkResult holding, per resource path, either the tuple returned by list_departures_by_region_id_and_path or the exception raised.
+        """
+        return fetch_many(
+            partial(self._list_departures_by_path, region_id, request),
+            resource_paths,
+            max_workers,
+        )
+
+    def _list_departures_by_path(
+        self, region_id: str, request: DepartureRequest, resource_path: str
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
+        return self.list_departures_by_region_id_and_path(
+            region_id, resource_path, request
+        )
 
     def list_departures_by_coordinates(
         self,
@@ -75,7 +165,7 @@ class DepartureApiClient(ApiBaseClient):
         lon: float,
         lat: float,
         request: DepartureRequest,
-    ) -> Tuple[Sequence[Departure], Pagination]:
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
         """Retrieve a list of departures for a specified region and coordinates.
 
         Args:
@@ -90,4 +180,286 @@ class DepartureApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/departures"
 
-        return self._get_departures(request_url, request.to_filters())
+        return self._get_departures(request_url, request.to_filters(), request.fields)
+
+    def iter_departures_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: DepartureRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Departure]:
+        """Iterate over all the departures for a specified region and coordinates.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_lon: The longitude of the region.
+            region_lat: The latitude of the region.
+            lon: The longitude of the specific location.
+            lat: The latitude of the specific location.
+            request: The request object containing query parameters.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Departure objects.
+        """
+        return iter_results(
+            partial(
+                self.list_departures_by_coordinates, region_lon, region_lat, lon, lat
+            ),
+            request,
+            prefetch,
+        )
+
+    def _get_departure_columns(
+        self, url: str, filters: dict
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Fetch departures from the Navitia API as columns.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the departures and a Pagination object.
+        """
+        results = self.get_navitia_api(url + self._generate_filter_query(filters))
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return StopTimeColumns.from_departures(
+            results.payload["departures"]
+        ), pagination
+
+    def list_departure_columns_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: DepartureRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the departures of a specified region and resource path as columns.
+
+        Departure objects are not built: stop point and route ids, date times and data freshness are read from the response straight into arrays, ready for NumPy or pandas.
+
+        Args:
+            region_id: The region ID.
+            resource_path: The resource path.
+            request: The request object containing query parameters.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the departures and a Pagination object.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/departures"
+        )
+
+        return self._get_departure_columns(request_url, request.to_filters())
+
+    def list_departure_columns_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: DepartureRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the departures of a specified set of coordinates as columns.
+
+        See list_departure_columns_by_region_id_and_path.
+
+        Args:
+            region_lon: The longitude of the region.
+            region_lat: The latitude of the region.
+            lon: The longitude of the coordinates.
+            lat: The latitude of the coordinates.
+            request: The request object containing query parameters.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the departures and a Pagination object.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/departures"
+
+        return self._get_departure_columns(request_url, request.to_filters())
+
+
+class AsyncDepartureApiClient(AsyncApiBaseClient):
+    """Asynchronous client for interacting with the Navitia API to retrieve departure schedules.
+
+    See https://doc.navitia.io/#departures
+    """
+
+    @identity_scoped
+    async def _get_departures(
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
+        """Fetch departures from the Navitia API based on the provided URL and filters.
+
+        Args:
+            url: The URL to fetch departures from.
+            filters: A dictionary of filters to apply to the query.
+            fields: Dotted paths of the fields to parse, every field when None.
+
+        Returns:
+            A tuple containing a list of Departure objects and a Pagination object for managing result pages.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        raw_results = results.payload["departures"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            DepartureApiClient._get_departure_objects_from_response(
+                raw_results, fields
+            ),
+            LinkResolver(results.payload),
+        ), pagination
+
+    async def list_departures_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: DepartureRequest,
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
+        """Retrieve a list of departures for a specified region and resource path.
+
+        See DepartureApiClient.list_departures_by_region_id_and_path.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/departures"
+        )
+
+        return await self._get_departures(
+            request_url, request.to_filters(), request.fields
+        )
+
+    def iter_departures_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: DepartureRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Departure]:
+        """Asynchronously iterate over all the departures for a specified region and resource path.
+
+        See DepartureApiClient.iter_departures_by_region_id_and_path.
+        """
+        return aiter_results(
+            partial(
+                self.list_departures_by_region_id_and_path, region_id, resource_path
+            ),
+            request,
+            prefetch,
+        )
+
+    async def list_departures_by_region_id_and_paths(
+        self,
+        region_id: str,
+        resource_paths: Sequence[str],
+        request: DepartureRequest,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkResult[Tuple[LinkedResults[Departure], Pagination]]:
+        """Retrieve the departures of many resource paths of a region at once.
+
+        See DepartureApiClient.list_departures_by_region_id_and_paths.
+        """
+        return await afetch_many(
+            partial(self._list_departures_by_path, region_id, request),
+            resource_paths,
+            max_workers,
+        )
+
+    async def _list_departures_by_path(
+        self, region_id: str, request: DepartureRequest, resource_path: str
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
+        return await self.list_departures_by_region_id_and_path(
+            region_id, resource_path, request
+        )
+
+    async def list_departures_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: DepartureRequest,
+    ) -> Tuple[LinkedResults[Departure], Pagination]:
+        """Retrieve a list of departures for a specified region and coordinates.
+
+        See DepartureApiClient.list_departures_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/departures"
+
+        return await self._get_departures(
+            request_url, request.to_filters(), request.fields
+        )
+
+    def iter_departures_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: DepartureRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Departure]:
+        """Asynchronously iterate over all the departures for a specified region and coordinates.
+
+        See DepartureApiClient.iter_departures_by_coordinates.
+        """
+        return aiter_results(
+            partial(
+                self.list_departures_by_coordinates, region_lon, region_lat, lon, lat
+            ),
+            request,
+            prefetch,
+        )
+
+    async def _get_departure_columns(
+        self, url: str, filters: dict
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Fetch departures from the Navitia API as columns.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the departures and a Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return StopTimeColumns.from_departures(
+            results.payload["departures"]
+        ), pagination
+
+    async def list_departure_columns_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: DepartureRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the departures of a specified region and resource path as columns.
+
+        See DepartureApiClient.list_departure_columns_by_region_id_and_path.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/departures"
+        )
+
+        return await self._get_departure_columns(request_url, request.to_filters())
+
+    async def list_departure_columns_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: DepartureRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the departures of a specified set of coordinates as columns.
+
+        See DepartureApiClient.list_departure_columns_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/departures"
+
+        return await self._get_departure_columns(request_url, request.to_filters())
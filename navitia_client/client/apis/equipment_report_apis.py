@@ -1,5 +1,9 @@
 from typing import Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.equipment_report import EquipmentReportRequest
 from navitia_client.entities.response.equipment_reports import EquipmentReports
 from navitia_client.entities.response import Pagination
@@ -11,6 +15,7 @@ class EquipmentReportsApiClient(ApiBaseClient):
     See https://doc.navitia.io/#equipment-reports
     """
 
+    @identity_scoped
     def _get_equipment_reports(
         self, url: str, filters: dict
     ) -> Tuple[Sequence[EquipmentReports], Pagination]:
@@ -26,9 +31,9 @@ class EquipmentReportsApiClient(ApiBaseClient):
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
         equipment_reports = [
             EquipmentReports.from_payload(data)
-            for data in results.json()["equipment_reports"]
+            for data in results.payload["equipment_reports"]
         ]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return equipment_reports, pagination
 
     def list_equipment_reports(
@@ -82,3 +87,56 @@ class EquipmentReportsApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/equipment_reports"
         return self._get_equipment_reports(request_url, request.to_filters())
+
+
+class AsyncEquipmentReportsApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching equipment reports.
+
+    See https://doc.navitia.io/#equipment-reports
+    """
+
+    @identity_scoped
+    async def _get_equipment_reports(
+        self, url: str, filters: dict
+    ) -> Tuple[Sequence[EquipmentReports], Pagination]:
+        """Retrieve equipment reports from the Navitia API based on provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing sequences of EquipmentReports objects and Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        equipment_reports = [
+            EquipmentReports.from_payload(data)
+            for data in results.payload["equipment_reports"]
+        ]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return equipment_reports, pagination
+
+    async def list_equipment_reports(
+        self,
+        region_id: str,
+        request: EquipmentReportRequest,
+    ) -> Tuple[Sequence[EquipmentReports], Pagination]:
+        """Retrieve equipment reports for a specified region from the Navitia API.
+
+        See EquipmentReportsApiClient.list_equipment_reports.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/equipment_reports"
+        return await self._get_equipment_reports(request_url, request.to_filters())
+
+    async def list_equipment_reports_with_resource_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: EquipmentReportRequest,
+    ) -> Tuple[Sequence[EquipmentReports], Pagination]:
+        """Retrieve equipment reports for a specific resource path in a region.
+
+        See EquipmentReportsApiClient.list_equipment_reports_with_resource_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/equipment_reports"
+        return await self._get_equipment_reports(request_url, request.to_filters())
@@ -1,6 +1,10 @@
 from typing import Sequence, Tuple
 
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.freefloatings_nearby import (
     FreefloatingsNearbyRequest,
 )
@@ -14,6 +18,7 @@ class FreefloatingsNearbyApiClient(ApiBaseClient):
     See https://doc.navitia.io/#freefloatings-nearby-api
     """
 
+    @identity_scoped
     def _get_freefloatings_nearby(
         self, url: str, filters: dict
     ) -> Tuple[Sequence[FreeFloating], Pagination]:
@@ -28,9 +33,10 @@ class FreefloatingsNearbyApiClient(ApiBaseClient):
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
         free_floatings = [
-            FreeFloating.from_payload(data) for data in results.json()["free_floatings"]
+            FreeFloating.from_payload(data)
+            for data in results.payload["free_floatings"]
         ]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return free_floatings, pagination
 
     def list_freefloatings_nearby(
@@ -144,3 +150,86 @@ class FreefloatingsNearbyApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coord/{lon};{lat}/freefloatings_nearby"
         return self._get_freefloatings_nearby(request_url, request.to_filters())
+
+
+class AsyncFreefloatingsNearbyApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching nearby free-floating vehicles.
+
+    See https://doc.navitia.io/#freefloatings-nearby-api
+    """
+
+    @identity_scoped
+    async def _get_freefloatings_nearby(
+        self, url: str, filters: dict
+    ) -> Tuple[Sequence[FreeFloating], Pagination]:
+        """Retrieve free-floating vehicles from the Navitia API based on provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing sequences of FreeFloating objects and Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        free_floatings = [
+            FreeFloating.from_payload(data)
+            for data in results.payload["free_floatings"]
+        ]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return free_floatings, pagination
+
+    async def list_freefloatings_nearby(
+        self,
+        region_id: str,
+        lon: float,
+        lat: float,
+        request: FreefloatingsNearbyRequest,
+    ) -> Tuple[Sequence[FreeFloating], Pagination]:
+        """Retrieve free-floating vehicles near coordinates in a specific region.
+
+        See FreefloatingsNearbyApiClient.list_freefloatings_nearby.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/coords/{lon};{lat}/freefloatings_nearby"
+        return await self._get_freefloatings_nearby(request_url, request.to_filters())
+
+    async def list_freefloatings_nearby_with_resource_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: FreefloatingsNearbyRequest,
+    ) -> Tuple[Sequence[FreeFloating], Pagination]:
+        """Retrieve free-floating vehicles near a specific resource path in a region.
+
+        See FreefloatingsNearbyApiClient.list_freefloatings_nearby_with_resource_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/freefloatings_nearby"
+        return await self._get_freefloatings_nearby(request_url, request.to_filters())
+
+    async def list_freefloatings_nearby_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: FreefloatingsNearbyRequest = FreefloatingsNearbyRequest(),
+    ) -> Tuple[Sequence[FreeFloating], Pagination]:
+        """Retrieve free-floating vehicles near coordinates, navitia guesses the region from coordinates.
+
+        See FreefloatingsNearbyApiClient.list_freefloatings_nearby_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/freefloatings_nearby"
+        return await self._get_freefloatings_nearby(request_url, request.to_filters())
+
+    async def list_freefloatings_nearby_by_coordinates_only(
+        self,
+        lon: float,
+        lat: float,
+        request: FreefloatingsNearbyRequest = FreefloatingsNearbyRequest(),
+    ) -> Tuple[Sequence[FreeFloating], Pagination]:
+        """Retrieve free-floating vehicles near coordinates without any region id.
+
+        See FreefloatingsNearbyApiClient.list_freefloatings_nearby_by_coordinates_only.
+        """
+        request_url = f"{self.base_navitia_url}/coord/{lon};{lat}/freefloatings_nearby"
+        return await self._get_freefloatings_nearby(request_url, request.to_filters())
@@ -1,5 +1,9 @@
 from typing import Any, Sequence
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.response.place import Place
 
 
@@ -25,6 +29,7 @@ class InvertedGeocodingApiClient(ApiBaseClient):
 
         return entities
 
+    @identity_scoped
     def get_address_and_region_from_coordinates(
         self, lon: float, lat: float
     ) -> Sequence[Place]:
@@ -38,9 +43,10 @@ class InvertedGeocodingApiClient(ApiBaseClient):
             A list of Place objects representing the address and region information.
         """
         result = self.get_navitia_api(f"{self.base_navitia_url}/places/{lon};{lat}")
-        places = self._get_regions_from_response(result.json()["places"])
+        places = self._get_regions_from_response(result.payload["places"])
         return places
 
+    @identity_scoped
     def get_address_and_region_from_id(self, id: str) -> Sequence[Place]:
         """Retrieve address and region information based on a given place ID.
 
@@ -51,9 +57,10 @@ class InvertedGeocodingApiClient(ApiBaseClient):
             A list of Place objects representing the address and region information.
         """
         result = self.get_navitia_api(f"{self.base_navitia_url}/places/{id}")
-        places = self._get_regions_from_response(result.json()["places"])
+        places = self._get_regions_from_response(result.payload["places"])
         return places
 
+    @identity_scoped
     def get_address_from_region_coordinates_and_coordinates(
         self, region_lon: float, region_lat: float, lon: float, lat: float
     ) -> Sequence[Place]:
@@ -71,9 +78,10 @@ class InvertedGeocodingApiClient(ApiBaseClient):
         result = self.get_navitia_api(
             f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/places/{lon};{lat}"
         )
-        places = self._get_regions_from_response(result.json()["places"])
+        places = self._get_regions_from_response(result.payload["places"])
         return places
 
+    @identity_scoped
     def get_address_from_region_coordinates_and_id(
         self, region_lon: float, region_lat: float, id: str
     ) -> Sequence[Place]:
@@ -90,9 +98,10 @@ class InvertedGeocodingApiClient(ApiBaseClient):
         result = self.get_navitia_api(
             f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/places/{id}"
         )
-        places = self._get_regions_from_response(result.json()["places"])
+        places = self._get_regions_from_response(result.payload["places"])
         return places
 
+    @identity_scoped
     def get_address_from_region_id_and_coordinates(
         self, region_id: str, lon: float, lat: float
     ) -> Sequence[Place]:
@@ -109,9 +118,10 @@ class InvertedGeocodingApiClient(ApiBaseClient):
         result = self.get_navitia_api(
             f"{self.base_navitia_url}/coverage/{region_id}/places/{lon};{lat}"
         )
-        places = self._get_regions_from_response(result.json()["places"])
+        places = self._get_regions_from_response(result.payload["places"])
         return places
 
+    @identity_scoped
     def get_address_from_region_id_and_id(
         self, region_id: str, id: str
     ) -> Sequence[Place]:
@@ -127,5 +137,87 @@ class InvertedGeocodingApiClient(ApiBaseClient):
         result = self.get_navitia_api(
             f"{self.base_navitia_url}/coverage/{region_id}/places/{id}"
         )
-        places = self._get_regions_from_response(result.json()["places"])
+        places = self._get_regions_from_response(result.payload["places"])
         return places
+
+
+class AsyncInvertedGeocodingApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for performing inverted geocoding operations.
+
+    See https://doc.navitia.io/#coord
+    """
+
+    @identity_scoped
+    async def _get_places(self, url: str) -> Sequence[Place]:
+        """Fetch places from the Navitia API based on the provided URL.
+
+        Args:
+            url: The URL for the API request.
+
+        Returns:
+            A list of Place objects created from the API response.
+        """
+        result = await self.get_navitia_api(url)
+        return InvertedGeocodingApiClient._get_regions_from_response(
+            result.payload["places"]
+        )
+
+    async def get_address_and_region_from_coordinates(
+        self, lon: float, lat: float
+    ) -> Sequence[Place]:
+        """Retrieve address and region information based on given coordinates.
+
+        See InvertedGeocodingApiClient.get_address_and_region_from_coordinates.
+        """
+        return await self._get_places(f"{self.base_navitia_url}/places/{lon};{lat}")
+
+    async def get_address_and_region_from_id(self, id: str) -> Sequence[Place]:
+        """Retrieve address and region information based on a given place ID.
+
+        See InvertedGeocodingApiClient.get_address_and_region_from_id.
+        """
+        return await self._get_places(f"{self.base_navitia_url}/places/{id}")
+
+    async def get_address_from_region_coordinates_and_coordinates(
+        self, region_lon: float, region_lat: float, lon: float, lat: float
+    ) -> Sequence[Place]:
+        """Retrieve address information based on region coordinates and specific coordinates.
+
+        See InvertedGeocodingApiClient.get_address_from_region_coordinates_and_coordinates.
+        """
+        return await self._get_places(
+            f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/places/{lon};{lat}"
+        )
+
+    async def get_address_from_region_coordinates_and_id(
+        self, region_lon: float, region_lat: float, id: str
+    ) -> Sequence[Place]:
+        """Retrieve address information based on region coordinates and a specific place ID.
+
+        See InvertedGeocodingApiClient.get_address_from_region_coordinates_and_id.
+        """
+        return await self._get_places(
+            f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/places/{id}"
+        )
+
+    async def get_address_from_region_id_and_coordinates(
+        self, region_id: str, lon: float, lat: float
+    ) -> Sequence[Place]:
+        """Retrieve address information based on a region ID and specific coordinates.
+
+        See InvertedGeocodingApiClient.get_address_from_region_id_and_coordinates.
+        """
+        return await self._get_places(
+            f"{self.base_navitia_url}/coverage/{region_id}/places/{lon};{lat}"
+        )
+
+    async def get_address_from_region_id_and_id(
+        self, region_id: str, id: str
+    ) -> Sequence[Place]:
+        """Retrieve address information based on a region ID and a specific place ID.
+
+        See InvertedGeocodingApiClient.get_address_from_region_id_and_id.
+        """
+        return await self._get_places(
+            f"{self.base_navitia_url}/coverage/{region_id}/places/{id}"
+        )
@@ -1,5 +1,9 @@
 from typing import Sequence
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.isochrone import IsochroneRequest
 from navitia_client.entities.response.isochrones import Isochrone
 
@@ -10,19 +14,24 @@ class IsochronesApiClient(ApiBaseClient):
     See https://doc.navitia.io/#isochrones-api
     """
 
-    def _get_traffic_reports(self, url: str, filters: dict) -> Sequence[Isochrone]:
+    @identity_scoped
+    def _get_isochrones(
+        self, url: str, filters: dict, compact_geometry: bool = False
+    ) -> Sequence[Isochrone]:
         """Fetch isochrone data based on the provided URL and filters.
 
         Args:
             url: The API endpoint URL for fetching isochrone data.
             filters: The query parameters for filtering the isochrone data.
+            compact_geometry: Whether the geojson of isochrones is parsed into a Geometry.
 
         Returns:
             A list of Isochrone objects created from the API response.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
         isochrones = [
-            Isochrone.from_payload(data) for data in results.json()["isochrones"]
+            Isochrone.from_payload(data, compact_geometry)
+            for data in results.payload["isochrones"]
         ]
         return isochrones
 
@@ -30,30 +39,91 @@ class IsochronesApiClient(ApiBaseClient):
         self,
         region_id: str,
         request: IsochroneRequest,
+        compact_geometry: bool = False,
     ) -> Sequence[Isochrone]:
         """Fetch isochrones data for a specific region based on various parameters.
 
         Args:
             region_id: The identifier of the region.
             request: The request object containing query parameters.
+            compact_geometry: Whether geojson is a Geometry, holding coordinates in an array, instead of nested lists.
 
         Returns:
             A list of Isochrone objects representing the isochrone data.
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_id}/isochrones"
-        return self._get_traffic_reports(request_url, request.to_filters())
+        return self._get_isochrones(request_url, request.to_filters(), compact_geometry)
 
     def list_isochrones(
         self,
         request: IsochroneRequest,
+        compact_geometry: bool = False,
     ) -> Sequence[Isochrone]:
         """Fetch isochrones data based on various parameters.
 
         Args:
             request: The request object containing query parameters.
+            compact_geometry: Whether geojson is a Geometry, holding coordinates in an array, instead of nested lists.
 
         Returns:
             A list of Isochrone objects representing the isochrone data.
         """
         request_url = f"{self.base_navitia_url}/isochrones"
-        return self._get_traffic_reports(request_url, request.to_filters())
+        return self._get_isochrones(request_url, request.to_filters(), compact_geometry)
+
+
+class AsyncIsochronesApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching isochrones data.
+
+    See https://doc.navitia.io/#isochrones-api
+    """
+
+    @identity_scoped
+    async def _get_isochrones(
+        self, url: str, filters: dict, compact_geometry: bool = False
+    ) -> Sequence[Isochrone]:
+        """Fetch isochrone data based on the provided URL and filters.
+
+        Args:
+            url: The API endpoint URL for fetching isochrone data.
+            filters: The query parameters for filtering the isochrone data.
+            compact_geometry: Whether the geojson of isochrones is parsed into a Geometry.
+
+        Returns:
+            A list of Isochrone objects created from the API response.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        isochrones = [
+            Isochrone.from_payload(data, compact_geometry)
+            for data in results.payload["isochrones"]
+        ]
+        return isochrones
+
+    async def list_isochrones_with_region_id(
+        self,
+        region_id: str,
+        request: IsochroneRequest,
+        compact_geometry: bool = False,
+    ) -> Sequence[Isochrone]:
+        """Fetch isochrones data for a specific region based on various parameters.
+
+        See IsochronesApiClient.list_isochrones_with_region_id.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/isochrones"
+        return await self._get_isochrones(
+            request_url, request.to_filters(), compact_geometry
+        )
+
+    async def list_isochrones(
+        self,
+        request: IsochroneRequest,
+        compact_geometry: bool = False,
+    ) -> Sequence[Isochrone]:
+        """Fetch isochrones data based on various parameters.
+
+        See IsochronesApiClient.list_isochrones.
+        """
+        request_url = f"{self.base_navitia_url}/isochrones"
+        return await self._get_isochrones(
+            request_url, request.to_filters(), compact_geometry
+        )
@@ -1,7 +1,21 @@
-from typing import Sequence
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from functools import partial
+from typing import Optional, Sequence
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.bulk import DEFAULT_BULK_WORKERS, afetch_many, fetch_many
+from navitia_client.client.cache import ResponseCache
+from navitia_client.client.journey_matrix import (
+    JourneyMatrix,
+    build_journey_matrix,
+    matrix_pairs,
+    pair_request,
+)
 from navitia_client.entities.request.journey import JourneyRequest
 from navitia_client.entities.response import Journey
+from navitia_client.entities.response.link import LinkedResults, LinkResolver
 
 
 class JourneyApiClient(ApiBaseClient):
@@ -10,68 +24,307 @@ class JourneyApiClient(ApiBaseClient):
     See https://doc.navitia.io/#journeys
     """
 
-    def _get_journeys(self, url: str, filters: dict) -> Sequence[Journey]:
+    @identity_scoped
+    def _get_journeys(
+        self,
+        url: str,
+        filters: dict,
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
         """Internal method to fetch journey data based on the provided URL and filters.
 
         Args:
             url: The API endpoint URL for fetching journey data.
             filters: The query parameters for filtering the journey data.
+            lazy: Whether the nested objects of journeys are parsed on first access.
+            compact_geometry: Whether the geojson of sections is parsed into a Geometry.
 
         Returns:
             A list of Journey objects created from the API response.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        journeys = [Journey.from_payload(data) for data in results.json()["journeys"]]
-        return journeys
+        journeys = [
+            Journey.from_payload(data, lazy=lazy, compact_geometry=compact_geometry)
+            for data in results.payload["journeys"]
+        ]
+        return LinkedResults(journeys, LinkResolver(results.payload))
 
     def list_journeys(
         self,
         request: JourneyRequest,
-    ) -> Sequence[Journey]:
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
         """Fetch journey data based on various parameters.
 
         Args:
             request: Journey request containing all query parameters.
+            lazy: Whether sections, places, links and fare are parsed on first access instead of eagerly.
+            compact_geometry: Whether the geojson of sections is a Geometry, holding coordinates in an array, instead of nested lists.
 
         Returns:
             A list of Journey objects representing the journey results.
         """
         request_url = f"{self.base_navitia_url}/journeys"
 
-        return self._get_journeys(request_url, request.to_filters())
+        return self._get_journeys(
+            request_url, request.to_filters(), lazy, compact_geometry
+        )
 
     def list_journeys_with_region_id(
         self,
         region_id: str,
         request: JourneyRequest,
-    ) -> Sequence[Journey]:
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
         """Fetch journey data for a specific region based on various parameters.
 
         Args:
             region_id: The ID of the region to fetch journey data for.
             request: Journey request containing all query parameters.
+            lazy: Whether sections, places, links and fare are parsed on first access instead of eagerly.
+            compact_geometry: Whether the geojson of sections is a Geometry, holding coordinates in an array, instead of nested lists.
 
         Returns:
             A list of Journey objects representing the journey results for the specified region.
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_id}/journeys"
 
-        return self._get_journeys(request_url, request.to_filters())
+        return self._get_journeys(
+            request_url, request.to_filters(), lazy, compact_geometry
+        )
 
     def list_journeys_with_resource_path(
         self,
         resource_path: str,
         request: JourneyRequest,
-    ) -> Sequence[Journey]:
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
         """Fetch journey data for a specific resource path based on various parameters.
 
         Args:
             resource_path: The resource path to fetch journey data for.
             request: Journey request containing all query parameters.
+            lazy: Whether sections, places, links and fare are parsed on first access instead of eagerly.
+            compact_geometry: Whether the geojson of sections is a Geometry, holding coordinates in an array, instead of nested lists.
 
         Returns:
             A list of Journey objects representing the journey results for the specified resource path.
         """
         request_url = f"{self.base_navitia_url}/coverage/{resource_path}/journeys"
 
-        return self._get_journeys(request_url, request.to_filters())
+        return self._get_journeys(
+            request_url, request.to_filters(), lazy, compact_geometry
+        )
+
+    @identity_scoped
+    def _get_pair_journeys(
+        self, pair_cache: Optional[ResponseCache], url: str
+    ) -> Sequence[Journey]:
+        """Fetch the journeys of a pair, looking them up in `pair_cache` first."""
+        response = (
+            pair_cache.get(url, self.auth_token) if pair_cache is not None else None
+        )
+        if response is None:
+            response = self.get_navitia_api(url)
+            if pair_cache is not None:
+                pair_cache.set(url, response, self.auth_token)
+        # Matrices only read durations and transfers: nested objects are parsed on demand
+        return [
+            Journey.from_payload(data, lazy=True)
+            for data in response.payload["journeys"]
+        ]
+
+    @staticmethod
+    def _get_pair_urls(
+        request_url: str,
+        origins: Sequence[str],
+        destinations: Sequence[str],
+        request: JourneyRequest,
+    ) -> dict[tuple[str, str], str]:
+        """Build the URL requested for each distinct pair of a matrix."""
+        return {
+            (origin, destination): request_url
+            + ApiBaseClient._generate_filter_query(
+                pair_request(request, origin, destination).to_filters()
+            )
+            for origin, destination in matrix_pairs(origins, destinations)
+        }
+
+    def journey_matrix(
+        self,
+        origins: Sequence[str],
+        destinations: Sequence[str],
+        request: JourneyRequest,
+        region_id: Optional[str] = None,
+        include_journeys: bool = False,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        pair_cache: Optional[ResponseCache] = None,
+    ) -> JourneyMatrix:
+        """Compute the fastest journey between every origin and every destination.
+
+        One journey request is made per distinct pair, concurrently over a bounded pool
+        of threads. Pairs going from a place to itself take no time and are not
+        requested. A failing pair does not fail the others.
+
+        Args:
+            origins: The starting points, such as stop area ids or "lon;lat" coordinates.
+            destinations: The ending points.
+            request: Template of the journey request of each pair; its from_ and to_ are ignored.
+            region_id: The ID of the region to compute journeys in, if any.
+            include_journeys: Whether the Journey objects of each pair are kept in the matrix.
+            max_workers: Maximum number of pairs requested at the same time.
+            pair_cache: Cache of the response of each pair. Journeys are not cached by the default time to live table, so it needs a "journeys" time to live, such as ResponseCache(ttls={"journeys": 3600}).
+
+        Returns:
+            A JourneyMatrix with the duration and the number of transfers of the fastest journey of each pair.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/journeys"
+            if region_id is not None
+            else f"{self.base_navitia_url}/journeys"
+        )
+        pair_urls = self._get_pair_urls(request_url, origins, destinations, request)
+        bulk_result = fetch_many(
+            partial(self._get_pair_journeys, pair_cache),
+            pair_urls.values(),
+            max_workers,
+        )
+        return build_journey_matrix(
+            origins, destinations, pair_urls, bulk_result, include_journeys
+        )
+
+
+class AsyncJourneyApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching journey data.
+
+    See https://doc.navitia.io/#journeys
+    """
+
+    @identity_scoped
+    async def _get_journeys(
+        self,
+        url: str,
+        filters: dict,
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
+        """Internal method to fetch journey data based on the provided URL and filters.
+
+        Args:
+            url: The API endpoint URL for fetching journey data.
+            filters: The query parameters for filtering the journey data.
+            lazy: Whether the nested objects of journeys are parsed on first access.
+            compact_geometry: Whether the geojson of sections is parsed into a Geometry.
+
+        Returns:
+            A list of Journey objects created from the API response.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        journeys = [
+            Journey.from_payload(data, lazy=lazy, compact_geometry=compact_geometry)
+            for data in results.payload["journeys"]
+        ]
+        return LinkedResults(journeys, LinkResolver(results.payload))
+
+    async def list_journeys(
+        self,
+        request: JourneyRequest,
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
+        """Fetch journey data based on various parameters.
+
+        See JourneyApiClient.list_journeys.
+        """
+        request_url = f"{self.base_navitia_url}/journeys"
+
+        return await self._get_journeys(
+            request_url, request.to_filters(), lazy, compact_geometry
+        )
+
+    async def list_journeys_with_region_id(
+        self,
+        region_id: str,
+        request: JourneyRequest,
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
+        """Fetch journey data for a specific region based on various parameters.
+
+        See JourneyApiClient.list_journeys_with_region_id.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/journeys"
+
+        return await self._get_journeys(
+            request_url, request.to_filters(), lazy, compact_geometry
+        )
+
+    async def list_journeys_with_resource_path(
+        self,
+        resource_path: str,
+        request: JourneyRequest,
+        lazy: bool = False,
+        compact_geometry: bool = False,
+    ) -> LinkedResults[Journey]:
+        """Fetch journey data for a specific resource path based on various parameters.
+
+        See JourneyApiClient.list_journeys_with_resource_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{resource_path}/journeys"
+
+        return await self._get_journeys(
+            request_url, request.to_filters(), lazy, compact_geometry
+        )
+
+    @identity_scoped
+    async def _get_pair_journeys(
+        self, pair_cache: Optional[ResponseCache], url: str
+    ) -> Sequence[Journey]:
+        """Fetch the journeys of a pair, looking them up in `pair_cache` first."""
+        response = (
+            pair_cache.get(url, self.auth_token) if pair_cache is not None else None
+        )
+        if response is None:
+            response = await self.get_navitia_api(url)
+            if pair_cache is not None:
+                pair_cache.set(url, response, self.auth_token)
+        # Matrices only read durations and transfers: nested objects are parsed on demand
+        return [
+            Journey.from_payload(data, lazy=True)
+            for data in response.payload["journeys"]
+        ]
+
+    async def journey_matrix(
+        self,
+        origins: Sequence[str],
+        destinations: Sequence[str],
+        request: JourneyRequest,
+        region_id: Optional[str] = None,
+        include_journeys: bool = False,
+        max_workers: int = DEFAULT_BULK_WORKERS,
+        pair_cache: Optional[ResponseCache] = None,
+    ) -> JourneyMatrix:
+        """Compute the fastest journey between every origin and every destination.
+
+        See JourneyApiClient.journey_matrix.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/journeys"
+            if region_id is not None
+            else f"{self.base_navitia_url}/journeys"
+        )
+        pair_urls = JourneyApiClient._get_pair_urls(
+            request_url, origins, destinations, request
+        )
+        bulk_result = await afetch_many(
+            partial(self._get_pair_journeys, pair_cache),
+            pair_urls.values(),
+            max_workers,
+        )
+        return build_journey_matrix(
+            origins, destinations, pair_urls, bulk_result, include_journeys
+        )
@@ -1,5 +1,9 @@
 from typing import Any, Sequence
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.place import PlaceRequest
 from navitia_client.entities.response.place import Place
 
@@ -25,6 +29,7 @@ class PlacesApiClient(ApiBaseClient):
             entities.append(Place.from_payload(entity_data))
         return entities
 
+    @identity_scoped
     def list_places(
         self,
         region_id: str,
@@ -43,5 +48,29 @@ class PlacesApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             request_url + self._generate_filter_query(request.to_filters())
         )
-        raw_results = results.json()["places"]
+        raw_results = results.payload["places"]
         return self._get_pt_objects_from_response(raw_results)
+
+
+class AsyncPlacesApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching place data.
+
+    See https://doc.navitia.io/#places
+    """
+
+    @identity_scoped
+    async def list_places(
+        self,
+        region_id: str,
+        request: PlaceRequest,
+    ) -> Sequence[Place]:
+        """Retrieve a list of places based on the provided query and region ID.
+
+        See PlacesApiClient.list_places.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/places"
+        results = await self.get_navitia_api(
+            request_url + self._generate_filter_query(request.to_filters())
+        )
+        raw_results = results.payload["places"]
+        return PlacesApiClient._get_pt_objects_from_response(raw_results)
@@ -1,5 +1,11 @@
-from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from functools import partial
+from typing import Any, AsyncIterator, Iterator, Sequence, Tuple
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.pagination import aiter_results, iter_results
 from navitia_client.entities.request.places_nearby import PlacesNearbyRequest
 from navitia_client.entities.response import Pagination
 from navitia_client.entities.response.place import Place
@@ -27,6 +33,7 @@ class PlacesNearbyApiClient(ApiBaseClient):
 
         return entities
 
+    @identity_scoped
     def _get_places_nearby(
         self, url: str, filters: dict
     ) -> Tuple[Sequence[Place], Pagination]:
@@ -40,8 +47,8 @@ class PlacesNearbyApiClient(ApiBaseClient):
             A tuple containing a list of nearby Place objects and pagination information.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        raw_results = results.json()["places_nearby"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        raw_results = results.payload["places_nearby"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return self._get_pt_objects_from_response(raw_results), pagination
 
     def list_objects_by_region_id_and_path(
@@ -64,6 +71,33 @@ class PlacesNearbyApiClient(ApiBaseClient):
 
         return self._get_places_nearby(request_url, request.to_filters())
 
+    def iter_objects_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Place]:
+        """Iterate over all the places nearby based on region ID and resource path.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_id: The region ID.
+            resource_path: The resource path.
+            request: The PlacesNearbyRequest containing filters and parameters for the query.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Place objects.
+        """
+        return iter_results(
+            partial(self.list_objects_by_region_id_and_path, region_id, resource_path),
+            request,
+            prefetch,
+        )
+
     def list_objects_by_region_id_and_coordinates(
         self,
         region_id: str,
@@ -88,6 +122,37 @@ class PlacesNearbyApiClient(ApiBaseClient):
 
         return self._get_places_nearby(request_url, request.to_filters())
 
+    def iter_objects_by_region_id_and_coordinates(
+        self,
+        region_id: str,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Place]:
+        """Iterate over all the places nearby based on region ID and coordinates.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_id: The region ID.
+            lon: The longitude coordinate.
+            lat: The latitude coordinate.
+            request: The PlacesNearbyRequest containing filters and parameters for the query.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Place objects.
+        """
+        return iter_results(
+            partial(
+                self.list_objects_by_region_id_and_coordinates, region_id, lon, lat
+            ),
+            request,
+            prefetch,
+        )
+
     def list_objects_by_coordinates(
         self,
         region_lon: float,
@@ -112,6 +177,37 @@ class PlacesNearbyApiClient(ApiBaseClient):
 
         return self._get_places_nearby(request_url, request.to_filters())
 
+    def iter_objects_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Place]:
+        """Iterate over all the places nearby based on the provided coordinates.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            region_lon: The longitude coordinate of the region.
+            region_lat: The latitude coordinate of the region.
+            lon: The longitude coordinate.
+            lat: The latitude coordinate.
+            request: The PlacesNearbyRequest containing filters and parameters for the query.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Place objects.
+        """
+        return iter_results(
+            partial(self.list_objects_by_coordinates, region_lon, region_lat, lon, lat),
+            request,
+            prefetch,
+        )
+
     def list_objects_by_object_coordinates_only(
         self,
         lon: float,
@@ -131,3 +227,191 @@ class PlacesNearbyApiClient(ApiBaseClient):
         request_url = f"{self.base_navitia_url}/coverage/{lon};{lat}/places_nearby"
 
         return self._get_places_nearby(request_url, request.to_filters())
+
+    def iter_objects_by_object_coordinates_only(
+        self,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> Iterator[Place]:
+        """Iterate over all the places nearby based on the provided coordinates.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` results have been returned.
+
+        Args:
+            lon: The longitude coordinate.
+            lat: The latitude coordinate.
+            request: The PlacesNearbyRequest containing filters and parameters for the query.
+            prefetch: Whether the next page is fetched in the background while the current one is consumed.
+
+        Returns:
+            An iterator over Place objects.
+        """
+        return iter_results(
+            partial(self.list_objects_by_object_coordinates_only, lon, lat),
+            request,
+            prefetch,
+        )
+
+
+class AsyncPlacesNearbyApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching nearby places information.
+
+    See https://doc.navitia.io/#places_nearby
+    """
+
+    @identity_scoped
+    async def _get_places_nearby(
+        self, url: str, filters: dict
+    ) -> Tuple[Sequence[Place], Pagination]:
+        """Fetch nearby places based on the provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to be applied to the API request.
+
+        Returns:
+            A tuple containing a list of nearby Place objects and pagination information.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        raw_results = results.payload["places_nearby"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return PlacesNearbyApiClient._get_pt_objects_from_response(
+            raw_results
+        ), pagination
+
+    async def list_objects_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: PlacesNearbyRequest,
+    ) -> Tuple[Sequence[Place], Pagination]:
+        """Retrieve a list of places nearby based on region ID and resource path.
+
+        See PlacesNearbyApiClient.list_objects_by_region_id_and_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/places_nearby"
+
+        return await self._get_places_nearby(request_url, request.to_filters())
+
+    def iter_objects_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Place]:
+        """Asynchronously iterate over all the places nearby based on region ID and resource path.
+
+        See PlacesNearbyApiClient.iter_objects_by_region_id_and_path.
+        """
+        return aiter_results(
+            partial(self.list_objects_by_region_id_and_path, region_id, resource_path),
+            request,
+            prefetch,
+        )
+
+    async def list_objects_by_region_id_and_coordinates(
+        self,
+        region_id: str,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+    ) -> Tuple[Sequence[Place], Pagination]:
+        """Retrieve a list of places nearby based on region ID and coordinates.
+
+        See PlacesNearbyApiClient.list_objects_by_region_id_and_coordinates.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/coverage/{region_id}/{lon};{lat}/places_nearby"
+        )
+
+        return await self._get_places_nearby(request_url, request.to_filters())
+
+    def iter_objects_by_region_id_and_coordinates(
+        self,
+        region_id: str,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Place]:
+        """Asynchronously iterate over all the places nearby based on region ID and coordinates.
+
+        See PlacesNearbyApiClient.iter_objects_by_region_id_and_coordinates.
+        """
+        return aiter_results(
+            partial(
+                self.list_objects_by_region_id_and_coordinates, region_id, lon, lat
+            ),
+            request,
+            prefetch,
+        )
+
+    async def list_objects_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+    ) -> Tuple[Sequence[Place], Pagination]:
+        """Retrieve a list of places nearby based on the provided coordinates.
+
+        See PlacesNearbyApiClient.list_objects_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/places_nearby"
+
+        return await self._get_places_nearby(request_url, request.to_filters())
+
+    def iter_objects_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Place]:
+        """Asynchronously iterate over all the places nearby based on the provided coordinates.
+
+        See PlacesNearbyApiClient.iter_objects_by_coordinates.
+        """
+        return aiter_results(
+            partial(self.list_objects_by_coordinates, region_lon, region_lat, lon, lat),
+            request,
+            prefetch,
+        )
+
+    async def list_objects_by_object_coordinates_only(
+        self,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+    ) -> Tuple[Sequence[Place], Pagination]:
+        """Retrieve a list of places nearby based on the provided coordinates.
+
+        See PlacesNearbyApiClient.list_objects_by_object_coordinates_only.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{lon};{lat}/places_nearby"
+
+        return await self._get_places_nearby(request_url, request.to_filters())
+
+    def iter_objects_by_object_coordinates_only(
+        self,
+        lon: float,
+        lat: float,
+        request: PlacesNearbyRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Place]:
+        """Asynchronously iterate over all the places nearby based on the provided coordinates.
+
+        See PlacesNearbyApiClient.iter_objects_by_object_coordinates_only.
+        """
+        return aiter_results(
+            partial(self.list_objects_by_object_coordinates_only, lon, lat),
+            request,
+            prefetch,
+        )
@@ -1,5 +1,9 @@
 from typing import Any, Sequence
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.public_transport_object import (
     PublicTransportObjectRequest,
 )
@@ -28,6 +32,7 @@ class PublicTransportObjectsApiClient(ApiBaseClient):
 
         return pt_objects
 
+    @identity_scoped
     def list_public_transport_objects(
         self,
         region_id: str,
@@ -46,5 +51,31 @@ class PublicTransportObjectsApiClient(ApiBaseClient):
         results = self.get_navitia_api(
             request_url + self._generate_filter_query(request.to_filters())
         )
-        raw_results = results.json()["pt_objects"]
+        raw_results = results.payload["pt_objects"]
         return self._get_pt_objects_from_response(raw_results)
+
+
+class AsyncPublicTransportObjectsApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching public transport objects.
+
+    See https://doc.navitia.io/#pt-objects
+    """
+
+    @identity_scoped
+    async def list_public_transport_objects(
+        self,
+        region_id: str,
+        request: PublicTransportObjectRequest,
+    ) -> Sequence[PtObject]:
+        """Retrieve a list of public transport objects for a specified region.
+
+        See PublicTransportObjectsApiClient.list_public_transport_objects.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/pt_objects"
+        results = await self.get_navitia_api(
+            request_url + self._generate_filter_query(request.to_filters())
+        )
+        raw_results = results.payload["pt_objects"]
+        return PublicTransportObjectsApiClient._get_pt_objects_from_response(
+            raw_results
+        )
@@ -1,10 +1,19 @@
-from .commercial_mode_apis import CommercialModeApiClient  # noqa: F401
-from .company_apis import CompanyApiClient  # noqa: F401
-from .disruption_apis import DisruptionApiClient  # noqa: F401
-from .line_apis import LineApiClient  # noqa: F401
-from .network_apis import NetworkApiClient  # noqa: F401
-from .physical_mode_apis import PhysicalModeApiClient  # noqa: F401
-from .route_apis import RouteApiClient  # noqa: F401
-from .stop_area_apis import StopAreaApiClient  # noqa: F401
-from .stop_point_apis import StopPointApiClient  # noqa: F401
-from .vehicle_journey_apis import VehicleJourneyApiClient  # noqa: F401
+from .commercial_mode_apis import (  # noqa: F401
+    AsyncCommercialModeApiClient,
+    CommercialModeApiClient,
+)
+from .company_apis import AsyncCompanyApiClient, CompanyApiClient  # noqa: F401
+from .disruption_apis import AsyncDisruptionApiClient, DisruptionApiClient  # noqa: F401
+from .line_apis import AsyncLineApiClient, LineApiClient  # noqa: F401
+from .network_apis import AsyncNetworkApiClient, NetworkApiClient  # noqa: F401
+from .physical_mode_apis import (  # noqa: F401
+    AsyncPhysicalModeApiClient,
+    PhysicalModeApiClient,
+)
+from .route_apis import AsyncRouteApiClient, RouteApiClient  # noqa: F401
+from .stop_area_apis import AsyncStopAreaApiClient, StopAreaApiClient  # noqa: F401
+from .stop_point_apis import AsyncStopPointApiClient, StopPointApiClient  # noqa: F401
+from .vehicle_journey_apis import (  # noqa: F401
+    AsyncVehicleJourneyApiClient,
+    VehicleJourneyApiClient,
+)
@@ -1,6 +1,12 @@
 from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
-from navitia_client.client.apis.public_transportation_apis.entity_apis import EntityApi
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+)
+from navitia_client.client.apis.public_transportation_apis.entity_apis import (
+    AsyncEntityApi,
+    EntityApi,
+)
 from navitia_client.entities.request.base_entity_request import BasePTEntityRequest
 from navitia_client.entities.response.company import Company
 from navitia_client.entities.response import Pagination
@@ -109,3 +115,18 @@ class CompanyApiClient(ApiBaseClient, EntityApi[Company]):
         """
         url = f"{self.base_navitia_url}/coverage/{lon};{lat}/{self.entity_name}/{object_id}"
         return self._get_entity_results(url, self.entity_name, request.to_filters())
+
+
+class AsyncCompanyApiClient(AsyncApiBaseClient, AsyncEntityApi[Company]):
+    """Asynchronous API client for handling 'Company' entities in the Navitia API.
+
+    See https://doc.navitia.io/#pt-ref
+
+    Attributes:
+        entity_name: Name of the entity ('companies').
+        get_navitia_api: Coroutine to get the Navitia API.
+    """
+
+    entity_name: str = "companies"
+    get_navitia_api = AsyncApiBaseClient.get_navitia_api
+    _get_entity_from_response = staticmethod(CompanyApiClient._get_entity_from_response)
@@ -1,5 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Sequence, Tuple, TypeVar
+from functools import partial
+from typing import Any, AsyncIterator, Generic, Iterator, Sequence, Tuple, TypeVar
+
+from navitia_client.client.apis.api_base_client import identity_scoped
+from navitia_client.client.pagination import (
+    DEFAULT_FETCH_ALL_WORKERS,
+    afetch_all,
+    aiter_results,
+    fetch_all,
+    has_next_page,
+    iter_results,
+    page_request,
+)
 
 from navitia_client.entities.request.base_entity_request import BasePTEntityRequest
 from navitia_client.entities.response.company import Company
@@ -35,10 +47,13 @@ class EntityApi(Generic[TEntity], ABC):
     Attributes:
         entity_name: Name of the entity.
         get_navitia_api: Method to get the Navitia API.
+        stream_navitia_api: Method to stream a collection of the Navitia API.
     """
 
     entity_name: str
+    base_navitia_url: str
     get_navitia_api: Any
+    stream_navitia_api: Any
 
     @staticmethod
     @abstractmethod
@@ -66,6 +81,7 @@ class EntityApi(Generic[TEntity], ABC):
         filter_query = "&".join([f"{key}={value}" for key, value in filters.items()])
         return "?" + filter_query if filter_query else ""
 
+    @identity_scoped
     def _get_entity_results(
         self, url: str, entity: str, filters: dict[str, Any]
     ) -> Tuple[Sequence[TEntity], Pagination]:
@@ -81,10 +97,34 @@ class EntityApi(Generic[TEntity], ABC):
         """
         query_string = self._generate_filter_query(filters)
         results = self.get_navitia_api(url + query_string)
-        raw_results = results.json()[entity]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        raw_results = results.payload[entity]
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return self._get_entity_from_response(raw_results), pagination
 
+    def _stream_entity_results(
+        self, url: str, request: BasePTEntityRequest
+    ) -> Iterator[TEntity]:
+        """Stream the entities of every page, from `request.start_page` on.
+
+        Args:
+            url: API endpoint URL.
+            request: Request parameters of the first page.
+
+        Yields:
+            Entity instances, as their payload is received.
+        """
+        while True:
+            payload: dict[str, Any] = {}
+            query_string = self._generate_filter_query(request.to_filters())
+            for raw_entity in self.stream_navitia_api(
+                url + query_string, self.entity_name, payload
+            ):
+                yield from self._get_entity_from_response([raw_entity])
+            pagination = Pagination.from_payload(payload["pagination"])
+            if not has_next_page(pagination):
+                return
+            request = page_request(request, pagination.start_page + 1)
+
     @abstractmethod
     def list_entity_collection_from_region(
         self,
@@ -160,3 +200,401 @@ class EntityApi(Generic[TEntity], ABC):
             List of entities and pagination information.
         """
         raise NotImplementedError
+
+    def iter_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+        prefetch: bool = True,
+    ) -> Iterator[TEntity]:
+        """Iterate over every entity of a given region.
+
+        Pages are fetched while iterating, from `request.start_page` until
+        `Pagination.total_result` entities have been returned.
+
+        Args:
+            region_id: ID of the region.
+            request: Request parameters for filtering.
+            prefetch: Whether the next page is fetched in the background while the
+                current one is consumed.
+
+        Returns:
+            Iterator over the entities.
+        """
+        return iter_results(
+            partial(self.list_entity_collection_from_region, region_id),
+            request,
+            prefetch,
+        )
+
+    def iter_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+        prefetch: bool = True,
+    ) -> Iterator[TEntity]:
+        """Iterate over every entity for given geographic coordinates.
+
+        See iter_entity_collection_from_region.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            request: Request parameters for filtering.
+            prefetch: Whether the next page is fetched in the background while the
+                current one is consumed.
+
+        Returns:
+            Iterator over the entities.
+        """
+        return iter_results(
+            partial(self.list_entity_collection_from_coordinates, lon, lat),
+            request,
+            prefetch,
+        )
+
+    def stream_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+    ) -> Iterator[TEntity]:
+        """Iterate over every entity of a given region, parsing responses as they arrive.
+
+        Unlike iter_entity_collection_from_region, each entity is yielded as soon as
+        its part of the response body is received: the first entities of a large page
+        come before its end, and memory use does not grow with `request.count`. Pages
+        are fetched one after the other, from `request.start_page` on. Responses are
+        not cached, and entities repeated across the stream are not shared.
+
+        Args:
+            region_id: ID of the region.
+            request: Request parameters for filtering.
+
+        Returns:
+            Iterator over the entities.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/{self.entity_name}"
+        return self._stream_entity_results(url, request)
+
+    def stream_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+    ) -> Iterator[TEntity]:
+        """Iterate over every entity for given coordinates, parsing responses as they arrive.
+
+        See stream_entity_collection_from_region.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            request: Request parameters for filtering.
+
+        Returns:
+            Iterator over the entities.
+        """
+        url = f"{self.base_navitia_url}/coverage/{lon};{lat}/{self.entity_name}"
+        return self._stream_entity_results(url, request)
+
+    def fetch_all_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+        max_workers: int = DEFAULT_FETCH_ALL_WORKERS,
+    ) -> list[TEntity]:
+        """Fetch every entity of a given region, loading pages concurrently.
+
+        The first page gives `Pagination.total_result`, then the remaining pages are
+        fetched in parallel. Entities are returned in page order.
+
+        Args:
+            region_id: ID of the region.
+            request: Request parameters for filtering.
+            max_workers: Maximum number of pages fetched at the same time.
+
+        Returns:
+            List of every entity.
+        """
+        return fetch_all(
+            partial(self.list_entity_collection_from_region, region_id),
+            request,
+            max_workers,
+        )
+
+    def fetch_all_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+        max_workers: int = DEFAULT_FETCH_ALL_WORKERS,
+    ) -> list[TEntity]:
+        """Fetch every entity for given geographic coordinates, loading pages concurrently.
+
+        See fetch_all_entity_collection_from_region.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            request: Request parameters for filtering.
+            max_workers: Maximum number of pages fetched at the same time.
+
+        Returns:
+            List of every entity.
+        """
+        return fetch_all(
+            partial(self.list_entity_collection_from_coordinates, lon, lat),
+            request,
+            max_workers,
+        )
+
+
+class AsyncEntityApi(Generic[TEntity], ABC):
+    """Abstract base class for asynchronous API clients dealing with entities in the Navitia API.
+
+    Asynchronous counterpart of EntityApi. As every PT entity endpoint shares the same
+    URL layout, the listing methods are implemented here once and rely on `entity_name`
+    and `_get_entity_from_response` provided by the concrete client.
+
+    Attributes:
+        entity_name: Name of the entity.
+        base_navitia_url: Base URL of the Navitia API.
+        get_navitia_api: Coroutine to get the Navitia API.
+        stream_navitia_api: Method to stream a collection of the Navitia API.
+    """
+
+    entity_name: str
+    base_navitia_url: str
+    get_navitia_api: Any
+    stream_navitia_api: Any
+
+    @staticmethod
+    @abstractmethod
+    def _get_entity_from_response(raw_entity_response: Any) -> Sequence[TEntity]:
+        """Extract entity instances from the raw API response.
+
+        Args:
+            raw_entity_response: Raw API response containing entity data.
+
+        Returns:
+            List of entity instances.
+        """
+        raise NotImplementedError
+
+    _generate_filter_query = staticmethod(EntityApi._generate_filter_query)
+
+    @identity_scoped
+    async def _get_entity_results(
+        self, url: str, entity: str, filters: dict[str, Any]
+    ) -> Tuple[Sequence[TEntity], Pagination]:
+        """Fetch entity results from the API.
+
+        Args:
+            url: API endpoint URL.
+            entity: Name of the entity.
+            filters: Dictionary of filters.
+
+        Returns:
+            List of entity instances and pagination information.
+        """
+        query_string = self._generate_filter_query(filters)
+        results = await self.get_navitia_api(url + query_string)
+        raw_results = results.payload[entity]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return self._get_entity_from_response(raw_results), pagination
+
+    async def _stream_entity_results(
+        self, url: str, request: BasePTEntityRequest
+    ) -> AsyncIterator[TEntity]:
+        """Asynchronously stream the entities of every page.
+
+        See EntityApi._stream_entity_results.
+        """
+        while True:
+            payload: dict[str, Any] = {}
+            query_string = self._generate_filter_query(request.to_filters())
+            async for raw_entity in self.stream_navitia_api(
+                url + query_string, self.entity_name, payload
+            ):
+                for entity in self._get_entity_from_response([raw_entity]):
+                    yield entity
+            pagination = Pagination.from_payload(payload["pagination"])
+            if not has_next_page(pagination):
+                return
+            request = page_request(request, pagination.start_page + 1)
+
+    async def list_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+    ) -> Tuple[Sequence[TEntity], Pagination]:
+        """List entities for a given region.
+
+        Args:
+            region_id: ID of the region.
+            request: Request parameters for filtering.
+
+        Returns:
+            List of entities and pagination information.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/{self.entity_name}"
+        return await self._get_entity_results(
+            url, self.entity_name, request.to_filters()
+        )
+
+    async def get_entity_by_id(
+        self,
+        region_id: str,
+        object_id: str,
+        request: BasePTEntityRequest,
+    ) -> Tuple[Sequence[TEntity], Pagination]:
+        """Get an entity by its ID in a given region.
+
+        Args:
+            region_id: ID of the region.
+            object_id: ID of the entity.
+            request: Request parameters for filtering.
+
+        Returns:
+            List of entities and pagination information.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/{self.entity_name}/{object_id}"
+        return await self._get_entity_results(
+            url, self.entity_name, request.to_filters()
+        )
+
+    async def list_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+    ) -> Tuple[Sequence[TEntity], Pagination]:
+        """List entities for given geographic coordinates.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            request: Request parameters for filtering.
+
+        Returns:
+            List of entities and pagination information.
+        """
+        url = f"{self.base_navitia_url}/coverage/{lon};{lat}/{self.entity_name}"
+        return await self._get_entity_results(
+            url, self.entity_name, request.to_filters()
+        )
+
+    async def get_entity_by_id_and_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        object_id: str,
+        request: BasePTEntityRequest,
+    ) -> Tuple[Sequence[TEntity], Pagination]:
+        """Get an entity by its ID for given geographic coordinates.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            object_id: ID of the entity.
+            request: Request parameters for filtering.
+
+        Returns:
+            List of entities and pagination information.
+        """
+        url = f"{self.base_navitia_url}/coverage/{lon};{lat}/{self.entity_name}/{object_id}"
+        return await self._get_entity_results(
+            url, self.entity_name, request.to_filters()
+        )
+
+    def iter_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[TEntity]:
+        """Asynchronously iterate over every entity of a given region.
+
+        See EntityApi.iter_entity_collection_from_region.
+        """
+        return aiter_results(
+            partial(self.list_entity_collection_from_region, region_id),
+            request,
+            prefetch,
+        )
+
+    def iter_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+        prefetch: bool = True,
+    ) -> AsyncIterator[TEntity]:
+        """Asynchronously iterate over every entity for given geographic coordinates.
+
+        See EntityApi.iter_entity_collection_from_coordinates.
+        """
+        return aiter_results(
+            partial(self.list_entity_collection_from_coordinates, lon, lat),
+            request,
+            prefetch,
+        )
+
+    def stream_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+    ) -> AsyncIterator[TEntity]:
+        """Asynchronously iterate over every entity of a given region, parsing responses.
+
+        See EntityApi.stream_entity_collection_from_region.
+        """
+        url = f"{self.base_navitia_url}/coverage/{region_id}/{self.entity_name}"
+        return self._stream_entity_results(url, request)
+
+    def stream_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+    ) -> AsyncIterator[TEntity]:
+        """Asynchronously iterate over every entity for given coordinates, parsing responses.
+
+        See EntityApi.stream_entity_collection_from_coordinates.
+        """
+        url = f"{self.base_navitia_url}/coverage/{lon};{lat}/{self.entity_name}"
+        return self._stream_entity_results(url, request)
+
+    async def fetch_all_entity_collection_from_region(
+        self,
+        region_id: str,
+        request: BasePTEntityRequest,
+        max_workers: int = DEFAULT_FETCH_ALL_WORKERS,
+    ) -> list[TEntity]:
+        """Fetch every entity of a given region, loading pages concurrently.
+
+        See EntityApi.fetch_all_entity_collection_from_region.
+        """
+        return await afetch_all(
+            partial(self.list_entity_collection_from_region, region_id),
+            request,
+            max_workers,
+        )
+
+    async def fetch_all_entity_collection_from_coordinates(
+        self,
+        lon: float,
+        lat: float,
+        request: BasePTEntityRequest,
+        max_workers: int = DEFAULT_FETCH_ALL_WORKERS,
+    ) -> list[TEntity]:
+        """Fetch every entity for given geographic coordinates, loading pages concurrently.
+
+        See EntityApi.fetch_all_entity_collection_from_coordinates.
+        """
+        return await afetch_all(
+            partial(self.list_entity_collection_from_coordinates, lon, lat),
+            request,
+            max_workers,
+        )
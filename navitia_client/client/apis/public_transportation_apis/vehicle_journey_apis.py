@@ -1,6 +1,12 @@
 from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
-from navitia_client.client.apis.public_transportation_apis.entity_apis import EntityApi
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+)
+from navitia_client.client.apis.public_transportation_apis.entity_apis import (
+    AsyncEntityApi,
+    EntityApi,
+)
 from navitia_client.entities.request.base_entity_request import BasePTEntityRequest
 from navitia_client.entities.response import Pagination
 from navitia_client.entities.response.vehicle_journey import VehicleJourney
@@ -110,3 +116,20 @@ class VehicleJourneyApiClient(ApiBaseClient, EntityApi[VehicleJourney]):
         """
         url = f"{self.base_navitia_url}/coverage/{lon};{lat}/{self.entity_name}/{object_id}"
         return self._get_entity_results(url, self.entity_name, request.to_filters())
+
+
+class AsyncVehicleJourneyApiClient(AsyncApiBaseClient, AsyncEntityApi[VehicleJourney]):
+    """Asynchronous API client for handling 'VehicleJourney' entities in the Navitia API.
+
+    See https://doc.navitia.io/#pt-ref
+
+    Attributes:
+        entity_name: Name of the entity ('vehicle_journeys').
+        get_navitia_api: Coroutine to get the Navitia API.
+    """
+
+    entity_name: str = "vehicle_journeys"
+    get_navitia_api = AsyncApiBaseClient.get_navitia_api
+    _get_entity_from_response = staticmethod(
+        VehicleJourneyApiClient._get_entity_from_response
+    )
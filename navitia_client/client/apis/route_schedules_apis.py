@@ -1,7 +1,14 @@
-from typing import Any, Sequence
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.route_schedule import RouteScheduleRequest
+from navitia_client.entities.response.decoder_compiler import compile_decoder
 from navitia_client.entities.response.route_schedule import RouteSchedule
+from navitia_client.entities.response.link import LinkedResults, LinkResolver
+from navitia_client.entities.response.projection import parse_entities
 
 
 class RouteSchedulesApiClient(ApiBaseClient):
@@ -13,41 +20,74 @@ class RouteSchedulesApiClient(ApiBaseClient):
     @staticmethod
     def _get_route_schedule_object_from_response(
         response: Any,
+        fields: Optional[Sequence[str]] = None,
     ) -> Sequence[RouteSchedule]:
         """Transform raw API response data into a list of RouteSchedule objects.
 
         Args:
             response: The raw API response data.
+            fields: Dotted paths of the fields to parse, such as "table.rows", every field when None.
 
         Returns:
             A sequence of RouteSchedule objects.
         """
+        if fields is not None:
+            return parse_entities(RouteSchedule, response, fields)
+
+        decode = compile_decoder(RouteSchedule)
         route_schedules = []
         for route_schedule_data in response:
-            route_schedules.append(RouteSchedule.from_payload(route_schedule_data))
+            route_schedules.append(decode(route_schedule_data))
 
         return route_schedules
 
-    def _get_routes_nearby(self, url: str, filters: dict) -> Sequence[RouteSchedule]:
+    @identity_scoped
+    def _get_routes_nearby(
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> LinkedResults[RouteSchedule]:
         """Retrieve route schedules from the Navitia API based on provided URL and filters.
 
         Args:
             url: The URL for the API request.
             filters: Filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
 
         Returns:
             A sequence of RouteSchedule objects.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        raw_results = results.json()["route_schedules"]
-        return self._get_route_schedule_object_from_response(raw_results)
+        raw_results = results.payload["route_schedules"]
+        return LinkedResults(
+            self._get_route_schedule_object_from_response(raw_results, fields),
+            LinkResolver(results.payload),
+        )
+
+    def _stream_route_schedules(
+        self, url: str, request: RouteScheduleRequest
+    ) -> Iterator[RouteSchedule]:
+        """Stream route schedules from the Navitia API, as each one is received.
+
+        Args:
+            url: The URL for the API request.
+            request: The request object containing query parameters.
+
+        Yields:
+            RouteSchedule objects, as their payload is received.
+        """
+        query_string = self._generate_filter_query(request.to_filters())
+        for raw_route_schedule in self.stream_navitia_api(
+            url + query_string, "route_schedules"
+        ):
+            yield from self._get_route_schedule_object_from_response(
+                [raw_route_schedule], request.fields
+            )
 
     def list_route_schedules_by_region_id_and_path(
         self,
         region_id: str,
         resource_path: str,
         request: RouteScheduleRequest,
-    ) -> Sequence[RouteSchedule]:
+    ) -> LinkedResults[RouteSchedule]:
         """Retrieve route schedules for a specified region and resource path.
 
         Args:
@@ -60,7 +100,9 @@ class RouteSchedulesApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/route_schedules"
 
-        return self._get_routes_nearby(request_url, request.to_filters())
+        return self._get_routes_nearby(
+            request_url, request.to_filters(), request.fields
+        )
 
     def list_route_schedules_by_coordinates(
         self,
@@ -69,7 +111,7 @@ class RouteSchedulesApiClient(ApiBaseClient):
         lon: float,
         lat: float,
         request: RouteScheduleRequest,
-    ) -> Sequence[RouteSchedule]:
+    ) -> LinkedResults[RouteSchedule]:
         """Retrieve route schedules for a specified set of coordinates.
 
         Args:
@@ -84,4 +126,166 @@ class RouteSchedulesApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/route_schedules"
 
-        return self._get_routes_nearby(request_url, request.to_filters())
+        return self._get_routes_nearby(
+            request_url, request.to_filters(), request.fields
+        )
+
+    def stream_route_schedules_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: RouteScheduleRequest,
+    ) -> Iterator[RouteSchedule]:
+        """Stream the route schedules of a specified region and resource path.
+
+        Each route schedule, with its whole table, is parsed as soon as its bytes arrive, so that the first schedules are available before the end of the response. Streamed responses are not cached.
+
+        Args:
+            region_id: The region ID.
+            resource_path: The resource path.
+            request: The request object containing query parameters.
+
+        Yields:
+            RouteSchedule objects, as their payload is received.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/route_schedules"
+
+        return self._stream_route_schedules(request_url, request)
+
+    def stream_route_schedules_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: RouteScheduleRequest,
+    ) -> Iterator[RouteSchedule]:
+        """Stream the route schedules of a specified set of coordinates.
+
+        See stream_route_schedules_by_region_id_and_path.
+
+        Args:
+            region_lon: The longitude of the region.
+            region_lat: The latitude of the region.
+            lon: The longitude of the coordinates.
+            lat: The latitude of the coordinates.
+            request: The request object containing query parameters.
+
+        Yields:
+            RouteSchedule objects, as their payload is received.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/route_schedules"
+
+        return self._stream_route_schedules(request_url, request)
+
+
+class AsyncRouteSchedulesApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching route schedules.
+
+    See https://doc.navitia.io/#route-schedules
+    """
+
+    @identity_scoped
+    async def _get_route_schedules(
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> LinkedResults[RouteSchedule]:
+        """Retrieve route schedules from the Navitia API based on provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
+
+        Returns:
+            A sequence of RouteSchedule objects.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        raw_results = results.payload["route_schedules"]
+        return LinkedResults(
+            RouteSchedulesApiClient._get_route_schedule_object_from_response(
+                raw_results, fields
+            ),
+            LinkResolver(results.payload),
+        )
+
+    async def list_route_schedules_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: RouteScheduleRequest,
+    ) -> LinkedResults[RouteSchedule]:
+        """Retrieve route schedules for a specified region and resource path.
+
+        See RouteSchedulesApiClient.list_route_schedules_by_region_id_and_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/route_schedules"
+
+        return await self._get_route_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+    async def list_route_schedules_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: RouteScheduleRequest,
+    ) -> LinkedResults[RouteSchedule]:
+        """Retrieve route schedules for a specified set of coordinates.
+
+        See RouteSchedulesApiClient.list_route_schedules_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/route_schedules"
+
+        return await self._get_route_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+    async def _stream_route_schedules(
+        self, url: str, request: RouteScheduleRequest
+    ) -> AsyncIterator[RouteSchedule]:
+        """Asynchronously stream route schedules from the Navitia API.
+
+        See RouteSchedulesApiClient._stream_route_schedules.
+        """
+        query_string = self._generate_filter_query(request.to_filters())
+        async for raw_route_schedule in self.stream_navitia_api(
+            url + query_string, "route_schedules"
+        ):
+            for (
+                route_schedule
+            ) in RouteSchedulesApiClient._get_route_schedule_object_from_response(
+                [raw_route_schedule], request.fields
+            ):
+                yield route_schedule
+
+    def stream_route_schedules_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: RouteScheduleRequest,
+    ) -> AsyncIterator[RouteSchedule]:
+        """Asynchronously stream the route schedules of a specified region and resource path.
+
+        See RouteSchedulesApiClient.stream_route_schedules_by_region_id_and_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/route_schedules"
+
+        return self._stream_route_schedules(request_url, request)
+
+    def stream_route_schedules_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: RouteScheduleRequest,
+    ) -> AsyncIterator[RouteSchedule]:
+        """Asynchronously stream the route schedules of a specified set of coordinates.
+
+        See RouteSchedulesApiClient.stream_route_schedules_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/route_schedules"
+
+        return self._stream_route_schedules(request_url, request)
@@ -1,8 +1,16 @@
-from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from typing import Any, Optional, Sequence, Tuple
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.stop_time_columns import StopTimeColumns
 from navitia_client.entities.request.stop_schedule import StopScheduleRequest
 from navitia_client.entities.response import Pagination
+from navitia_client.entities.response.decoder_compiler import compile_decoder
 from navitia_client.entities.response.stop_schedule import StopSchedule
+from navitia_client.entities.response.link import LinkedResults, LinkResolver
+from navitia_client.entities.response.projection import parse_entities
 
 
 class StopSchedulesApiClient(ApiBaseClient):
@@ -14,37 +22,48 @@ class StopSchedulesApiClient(ApiBaseClient):
     @staticmethod
     def _get_stop_schedule_objects_from_response(
         response: Any,
+        fields: Optional[Sequence[str]] = None,
     ) -> Sequence[StopSchedule]:
         """Transform raw API response data into a list of StopSchedule objects.
 
         Args:
             response: The raw API response data.
+            fields: Dotted paths of the fields to parse, such as "route.id", every field when None.
 
         Returns:
             A sequence of StopSchedule objects.
         """
+        if fields is not None:
+            return parse_entities(StopSchedule, response, fields)
+
+        decode = compile_decoder(StopSchedule)
         stop_schedules = []
         for stop_schedule_data in response:
-            stop_schedules.append(StopSchedule.from_payload(stop_schedule_data))
+            stop_schedules.append(decode(stop_schedule_data))
 
         return stop_schedules
 
+    @identity_scoped
     def _get_stop_schedules(
-        self, url: str, filters: dict
-    ) -> Tuple[Sequence[StopSchedule], Pagination]:
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[StopSchedule], Pagination]:
         """Retrieve stop schedules from the Navitia API based on provided URL and filters.
 
         Args:
             url: The URL for the API request.
             filters: Filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
 
         Returns:
             A tuple containing a sequence of StopSchedule objects and Pagination object.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        raw_results = results.json()["stop_schedules"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
-        return self._get_stop_schedule_objects_from_response(raw_results), pagination
+        raw_results = results.payload["stop_schedules"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            self._get_stop_schedule_objects_from_response(raw_results, fields),
+            LinkResolver(results.payload),
+        ), pagination
 
     def list_stop_schedules_by_coordinates(
         self,
@@ -53,7 +72,7 @@ class StopSchedulesApiClient(ApiBaseClient):
         lon: float,
         lat: float,
         request: StopScheduleRequest,
-    ) -> Tuple[Sequence[StopSchedule], Pagination]:
+    ) -> Tuple[LinkedResults[StopSchedule], Pagination]:
         """Retrieve stop schedules for a specified set of coordinates.
 
         Args:
@@ -68,14 +87,16 @@ class StopSchedulesApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/stop_schedules"
 
-        return self._get_stop_schedules(request_url, request.to_filters())
+        return self._get_stop_schedules(
+            request_url, request.to_filters(), request.fields
+        )
 
     def list_stop_schedules_by_region_id_and_path(
         self,
         region_id: str,
         resource_path: str,
         request: StopScheduleRequest,
-    ) -> Tuple[Sequence[StopSchedule], Pagination]:
+    ) -> Tuple[LinkedResults[StopSchedule], Pagination]:
         """Retrieve stop schedules for a specified region and resource path.
 
         Args:
@@ -88,4 +109,185 @@ class StopSchedulesApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/stop_schedules"
 
-        return self._get_stop_schedules(request_url, request.to_filters())
+        return self._get_stop_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+    def _get_stop_schedule_columns(
+        self, url: str, filters: dict
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Fetch stop schedules from the Navitia API as columns.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the stop schedules and a Pagination object.
+        """
+        results = self.get_navitia_api(url + self._generate_filter_query(filters))
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return StopTimeColumns.from_stop_schedules(
+            results.payload["stop_schedules"]
+        ), pagination
+
+    def list_stop_schedule_columns_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: StopScheduleRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the stop schedules of a specified region and resource path as columns.
+
+        StopSchedule objects are not built: stop point and route ids, date times and data freshness are read from the response straight into arrays, ready for NumPy or pandas.
+
+        Args:
+            region_id: The region ID.
+            resource_path: The resource path.
+            request: The request object containing query parameters.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the stop schedules and a Pagination object.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/stop_schedules"
+
+        return self._get_stop_schedule_columns(request_url, request.to_filters())
+
+    def list_stop_schedule_columns_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: StopScheduleRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the stop schedules of a specified set of coordinates as columns.
+
+        See list_stop_schedule_columns_by_region_id_and_path.
+
+        Args:
+            region_lon: The longitude of the region.
+            region_lat: The latitude of the region.
+            lon: The longitude of the coordinates.
+            lat: The latitude of the coordinates.
+            request: The request object containing query parameters.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the stop schedules and a Pagination object.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/stop_schedules"
+
+        return self._get_stop_schedule_columns(request_url, request.to_filters())
+
+
+class AsyncStopSchedulesApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching stop schedules.
+
+    See https://doc.navitia.io/#stop-schedules
+    """
+
+    @identity_scoped
+    async def _get_stop_schedules(
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[StopSchedule], Pagination]:
+        """Retrieve stop schedules from the Navitia API based on provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
+
+        Returns:
+            A tuple containing a sequence of StopSchedule objects and Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        raw_results = results.payload["stop_schedules"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            StopSchedulesApiClient._get_stop_schedule_objects_from_response(
+                raw_results, fields
+            ),
+            LinkResolver(results.payload),
+        ), pagination
+
+    async def list_stop_schedules_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: StopScheduleRequest,
+    ) -> Tuple[LinkedResults[StopSchedule], Pagination]:
+        """Retrieve stop schedules for a specified set of coordinates.
+
+        See StopSchedulesApiClient.list_stop_schedules_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/stop_schedules"
+
+        return await self._get_stop_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+    async def list_stop_schedules_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: StopScheduleRequest,
+    ) -> Tuple[LinkedResults[StopSchedule], Pagination]:
+        """Retrieve stop schedules for a specified region and resource path.
+
+        See StopSchedulesApiClient.list_stop_schedules_by_region_id_and_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/stop_schedules"
+
+        return await self._get_stop_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+    async def _get_stop_schedule_columns(
+        self, url: str, filters: dict
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Fetch stop schedules from the Navitia API as columns.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing the StopTimeColumns of the stop schedules and a Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return StopTimeColumns.from_stop_schedules(
+            results.payload["stop_schedules"]
+        ), pagination
+
+    async def list_stop_schedule_columns_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: StopScheduleRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the stop schedules of a specified region and resource path as columns.
+
+        See StopSchedulesApiClient.list_stop_schedule_columns_by_region_id_and_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/stop_schedules"
+
+        return await self._get_stop_schedule_columns(request_url, request.to_filters())
+
+    async def list_stop_schedule_columns_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: StopScheduleRequest,
+    ) -> Tuple[StopTimeColumns, Pagination]:
+        """Retrieve the stop schedules of a specified set of coordinates as columns.
+
+        See StopSchedulesApiClient.list_stop_schedule_columns_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/stop_schedules"
+
+        return await self._get_stop_schedule_columns(request_url, request.to_filters())
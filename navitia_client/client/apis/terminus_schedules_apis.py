@@ -1,8 +1,15 @@
-from typing import Any, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from typing import Any, Optional, Sequence, Tuple
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
 from navitia_client.entities.request.terminus_schedule import TerminusScheduleRequest
 from navitia_client.entities.response import Pagination
+from navitia_client.entities.response.decoder_compiler import compile_decoder
 from navitia_client.entities.response.stop_schedule import TerminusSchedule
+from navitia_client.entities.response.link import LinkedResults, LinkResolver
+from navitia_client.entities.response.projection import parse_entities
 
 
 class TerminusSchedulesApiClient(ApiBaseClient):
@@ -14,40 +21,47 @@ class TerminusSchedulesApiClient(ApiBaseClient):
     @staticmethod
     def _get_terminus_schedule_objects_from_response(
         response: Any,
+        fields: Optional[Sequence[str]] = None,
     ) -> Sequence[TerminusSchedule]:
         """Transform raw API response data into a list of TerminusSchedule objects.
 
         Args:
             response: The raw API response data.
+            fields: Dotted paths of the fields to parse, such as "route.id", every field when None.
 
         Returns:
             A sequence of TerminusSchedule objects.
         """
+        if fields is not None:
+            return parse_entities(TerminusSchedule, response, fields)
+
+        decode = compile_decoder(TerminusSchedule)
         terminus_schedules = []
         for terminus_schedule_data in response:
-            terminus_schedules.append(
-                TerminusSchedule.from_payload(terminus_schedule_data)
-            )
+            terminus_schedules.append(decode(terminus_schedule_data))
 
         return terminus_schedules
 
+    @identity_scoped
     def _get_stop_schedules(
-        self, url: str, filters: dict
-    ) -> Tuple[Sequence[TerminusSchedule], Pagination]:
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[TerminusSchedule], Pagination]:
         """Retrieve terminus schedules from the Navitia API based on provided URL and filters.
 
         Args:
             url: The URL for the API request.
             filters: Filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
 
         Returns:
             A tuple containing a sequence of TerminusSchedule objects and Pagination object.
         """
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
-        raw_results = results.json()["terminus_schedules"]
-        pagination = Pagination.from_payload(results.json()["pagination"])
-        return self._get_terminus_schedule_objects_from_response(
-            raw_results
+        raw_results = results.payload["terminus_schedules"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            self._get_terminus_schedule_objects_from_response(raw_results, fields),
+            LinkResolver(results.payload),
         ), pagination
 
     def list_terminus_schedules_by_region_id_and_path(
@@ -55,7 +69,7 @@ class TerminusSchedulesApiClient(ApiBaseClient):
         region_id: str,
         resource_path: str,
         request: TerminusScheduleRequest,
-    ) -> Tuple[Sequence[TerminusSchedule], Pagination]:
+    ) -> Tuple[LinkedResults[TerminusSchedule], Pagination]:
         """Retrieve terminus schedules for a specified region and resource path.
 
         Args:
@@ -68,7 +82,9 @@ class TerminusSchedulesApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/terminus_schedules"
 
-        return self._get_stop_schedules(request_url, request.to_filters())
+        return self._get_stop_schedules(
+            request_url, request.to_filters(), request.fields
+        )
 
     def list_terminus_schedules_by_coordinates(
         self,
@@ -77,7 +93,7 @@ class TerminusSchedulesApiClient(ApiBaseClient):
         lon: float,
         lat: float,
         request: TerminusScheduleRequest,
-    ) -> Tuple[Sequence[TerminusSchedule], Pagination]:
+    ) -> Tuple[LinkedResults[TerminusSchedule], Pagination]:
         """Retrieve terminus schedules for a specified set of coordinates.
 
         Args:
@@ -92,4 +108,71 @@ class TerminusSchedulesApiClient(ApiBaseClient):
         """
         request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/terminus_schedules"
 
-        return self._get_stop_schedules(request_url, request.to_filters())
+        return self._get_stop_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+
+class AsyncTerminusSchedulesApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching terminus schedules.
+
+    See https://doc.navitia.io/#terminus-schedules
+    """
+
+    @identity_scoped
+    async def _get_terminus_schedules(
+        self, url: str, filters: dict, fields: Optional[Sequence[str]] = None
+    ) -> Tuple[LinkedResults[TerminusSchedule], Pagination]:
+        """Retrieve terminus schedules from the Navitia API based on provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+            fields: Dotted paths of the fields to parse, every field when None.
+
+        Returns:
+            A tuple containing a sequence of TerminusSchedule objects and Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        raw_results = results.payload["terminus_schedules"]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return LinkedResults(
+            TerminusSchedulesApiClient._get_terminus_schedule_objects_from_response(
+                raw_results, fields
+            ),
+            LinkResolver(results.payload),
+        ), pagination
+
+    async def list_terminus_schedules_by_region_id_and_path(
+        self,
+        region_id: str,
+        resource_path: str,
+        request: TerminusScheduleRequest,
+    ) -> Tuple[LinkedResults[TerminusSchedule], Pagination]:
+        """Retrieve terminus schedules for a specified region and resource path.
+
+        See TerminusSchedulesApiClient.list_terminus_schedules_by_region_id_and_path.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/terminus_schedules"
+
+        return await self._get_terminus_schedules(
+            request_url, request.to_filters(), request.fields
+        )
+
+    async def list_terminus_schedules_by_coordinates(
+        self,
+        region_lon: float,
+        region_lat: float,
+        lon: float,
+        lat: float,
+        request: TerminusScheduleRequest,
+    ) -> Tuple[LinkedResults[TerminusSchedule], Pagination]:
+        """Retrieve terminus schedules for a specified set of coordinates.
+
+        See TerminusSchedulesApiClient.list_terminus_schedules_by_coordinates.
+        """
+        request_url = f"{self.base_navitia_url}/coverage/{region_lon};{region_lat}/coords/{lon};{lat}/terminus_schedules"
+
+        return await self._get_terminus_schedules(
+            request_url, request.to_filters(), request.fields
+        )
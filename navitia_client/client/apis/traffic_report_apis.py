@@ -1,5 +1,10 @@
-from typing import Optional, Sequence, Tuple
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Tuple
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    identity_scoped,
+)
+from navitia_client.client.pagination import has_next_page, page_request
 from navitia_client.entities.request.traffic_report import TrafficReportRequest
 from navitia_client.entities.response.disruption import Disruption
 from navitia_client.entities.response import Pagination
@@ -12,6 +17,7 @@ class TrafficReportsApiClient(ApiBaseClient):
     See https://doc.navitia.io/#traffic-reports
     """
 
+    @identity_scoped
     def _get_traffic_reports(
         self, url: str, filters: dict
     ) -> Tuple[Sequence[Disruption], Sequence[TrafficReport], Pagination]:
@@ -27,12 +33,12 @@ class TrafficReportsApiClient(ApiBaseClient):
         results = self.get_navitia_api(url + self._generate_filter_query(filters))
         line_reports = [
             TrafficReport.from_payload(data)
-            for data in results.json()["traffic_reports"]
+            for data in results.payload["traffic_reports"]
         ]
         disruptions = [
-            Disruption.from_payload(data) for data in results.json()["disruptions"]
+            Disruption.from_payload(data) for data in results.payload["disruptions"]
         ]
-        pagination = Pagination.from_payload(results.json()["pagination"])
+        pagination = Pagination.from_payload(results.payload["pagination"])
         return disruptions, line_reports, pagination
 
     def list_traffic_reports(
@@ -59,3 +65,129 @@ class TrafficReportsApiClient(ApiBaseClient):
             )
 
         return self._get_traffic_reports(request_url, request.to_filters())
+
+    def stream_traffic_reports(
+        self,
+        request: TrafficReportRequest,
+        region_id: Optional[str] = None,
+        resource_path: Optional[str] = None,
+        disruptions: Optional[list[Disruption]] = None,
+    ) -> Iterator[TrafficReport]:
+        """Stream the traffic reports of every page, as each one is received.
+
+        Pages are requested one after the other, from `request.start_page` on, and
+        each traffic report is parsed as soon as its bytes arrive, so that memory use
+        does not grow with the size of the responses. Streamed responses are not
+        cached.
+
+        Args:
+            request: The request object containing query parameters of the first page.
+            region_id: The region ID.
+            resource_path: The resource path.
+            disruptions: Extended with the Disruption objects of each page, once its traffic reports have been yielded.
+
+        Yields:
+            TrafficReport objects, as their payload is received.
+        """
+        if resource_path:
+            url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/traffic_reports"
+        else:
+            url = f"{self.base_navitia_url}/coverage/{region_id}/traffic_reports"
+
+        while True:
+            payload: dict[str, Any] = {}
+            query_string = self._generate_filter_query(request.to_filters())
+            for raw_traffic_report in self.stream_navitia_api(
+                url + query_string, "traffic_reports", payload
+            ):
+                yield TrafficReport.from_payload(raw_traffic_report)
+            if disruptions is not None:
+                disruptions.extend(
+                    Disruption.from_payload(data) for data in payload["disruptions"]
+                )
+            pagination = Pagination.from_payload(payload["pagination"])
+            if not has_next_page(pagination):
+                return
+            request = page_request(request, pagination.start_page + 1)
+
+
+class AsyncTrafficReportsApiClient(AsyncApiBaseClient):
+    """Asynchronous client class to interact with the Navitia API for fetching traffic reports.
+
+    See https://doc.navitia.io/#traffic-reports
+    """
+
+    @identity_scoped
+    async def _get_traffic_reports(
+        self, url: str, filters: dict
+    ) -> Tuple[Sequence[Disruption], Sequence[TrafficReport], Pagination]:
+        """Retrieve traffic reports from the Navitia API based on provided URL and filters.
+
+        Args:
+            url: The URL for the API request.
+            filters: Filters to apply to the API request.
+
+        Returns:
+            A tuple containing sequences of Disruption and TrafficReport objects, and Pagination object.
+        """
+        results = await self.get_navitia_api(url + self._generate_filter_query(filters))
+        traffic_reports = [
+            TrafficReport.from_payload(data)
+            for data in results.payload["traffic_reports"]
+        ]
+        disruptions = [
+            Disruption.from_payload(data) for data in results.payload["disruptions"]
+        ]
+        pagination = Pagination.from_payload(results.payload["pagination"])
+        return disruptions, traffic_reports, pagination
+
+    async def list_traffic_reports(
+        self,
+        request: TrafficReportRequest,
+        region_id: Optional[str] = None,
+        resource_path: Optional[str] = None,
+    ) -> Tuple[Sequence[Disruption], Sequence[TrafficReport], Pagination]:
+        """Retrieve traffic reports for a specified region and resource path.
+
+        See TrafficReportsApiClient.list_traffic_reports.
+        """
+        if resource_path:
+            request_url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/traffic_reports"
+        else:
+            request_url = (
+                f"{self.base_navitia_url}/coverage/{region_id}/traffic_reports"
+            )
+
+        return await self._get_traffic_reports(request_url, request.to_filters())
+
+    async def stream_traffic_reports(
+        self,
+        request: TrafficReportRequest,
+        region_id: Optional[str] = None,
+        resource_path: Optional[str] = None,
+        disruptions: Optional[list[Disruption]] = None,
+    ) -> AsyncIterator[TrafficReport]:
+        """Asynchronously stream the traffic reports of every page.
+
+        See TrafficReportsApiClient.stream_traffic_reports.
+        """
+        if resource_path:
+            url = f"{self.base_navitia_url}/coverage/{region_id}/{resource_path}/traffic_reports"
+        else:
+            url = f"{self.base_navitia_url}/coverage/{region_id}/traffic_reports"
+
+        while True:
+            payload: dict[str, Any] = {}
+            query_string = self._generate_filter_query(request.to_filters())
+            async for raw_traffic_report in self.stream_navitia_api(
+                url + query_string, "traffic_reports", payload
+            ):
+                yield TrafficReport.from_payload(raw_traffic_report)
+            if disruptions is not None:
+                disruptions.extend(
+                    Disruption.from_payload(data) for data in payload["disruptions"]
+                )
+            pagination = Pagination.from_payload(payload["pagination"])
+            if not has_next_page(pagination):
+                return
+            request = page_request(request, pagination.start_page + 1)
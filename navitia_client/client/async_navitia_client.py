@@ -0,0 +1,403 @@
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, TypeVar
+
+from navitia_client.client.apis.api_base_client import AsyncApiBaseClient
+from navitia_client.client.apis.arrival_apis import AsyncArrivalApiClient
+from navitia_client.client.apis.contributors_apis import AsyncContributorsApiClient
+from navitia_client.client.apis.coverage_apis import AsyncCoverageApiClient
+from navitia_client.client.apis.datasets_apis import AsyncDatasetsApiClient
+from navitia_client.client.apis.departure_apis import AsyncDepartureApiClient
+from navitia_client.client.apis.equipment_report_apis import (
+    AsyncEquipmentReportsApiClient,
+)
+from navitia_client.client.apis.freefloatings_nearby_apis import (
+    AsyncFreefloatingsNearbyApiClient,
+)
+from navitia_client.client.apis.inverted_geocoding_apis import (
+    AsyncInvertedGeocodingApiClient,
+)
+from navitia_client.client.apis.isochrone_apis import AsyncIsochronesApiClient
+from navitia_client.client.apis.journeys_apis import AsyncJourneyApiClient
+from navitia_client.client.apis.line_report_apis import AsyncLineReportsApiClient
+from navitia_client.client.apis.place_apis import AsyncPlacesApiClient
+from navitia_client.client.apis.places_nearby_apis import AsyncPlacesNearbyApiClient
+from navitia_client.client.apis.public_transport_objects_apis import (
+    AsyncPublicTransportObjectsApiClient,
+)
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncCommercialModeApiClient,
+    AsyncCompanyApiClient,
+    AsyncDisruptionApiClient,
+    AsyncLineApiClient,
+    AsyncNetworkApiClient,
+    AsyncPhysicalModeApiClient,
+    AsyncRouteApiClient,
+    AsyncStopAreaApiClient,
+    AsyncStopPointApiClient,
+    AsyncVehicleJourneyApiClient,
+)
+from navitia_client.client.apis.route_schedules_apis import AsyncRouteSchedulesApiClient
+from navitia_client.client.apis.stop_schedules_apis import AsyncStopSchedulesApiClient
+from navitia_client.client.apis.terminus_schedules_apis import (
+    AsyncTerminusSchedulesApiClient,
+)
+from navitia_client.client.apis.traffic_report_apis import AsyncTrafficReportsApiClient
+from navitia_client.client.cache import ResponseCache
+from navitia_client.client.decoders import (
+    AUTO_DECODER,
+    JsonDecoder,
+    get_json_decoder,
+)
+from navitia_client.client.navitia_client import BASE_NAVITIA_URL
+from navitia_client.client.raw.raw_client import AsyncRawClient
+from navitia_client.client.rate_limit import RateLimiter
+from navitia_client.client.retry import RetryPolicy, RetryStats
+from navitia_client.client.session import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_READ_TIMEOUT,
+    build_async_session,
+)
+from navitia_client.client.singleflight import AsyncSingleFlight
+from navitia_client.entities.response.identity_map import IdentityMap
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+TAsyncApiClient = TypeVar("TAsyncApiClient", bound=AsyncApiBaseClient)
+
+
+@dataclass
+class AsyncNavitiaClient:
+    """
+    Asynchronous Navitia API client for accessing various endpoints.
+
+    Mirrors NavitiaClient: every property returns the asynchronous counterpart of the
+    matching API client, whose methods are coroutines accepting the same request objects.
+    Requires the optional `httpx` dependency (`pip install python-navitia-client[async]`).
+
+    Attributes
+    ----------
+    auth_token : str
+        Authorization token for accessing the API.
+    base_navitia_url : str
+        Base URL of the Navitia API.
+    max_connections : int
+        Maximum number of concurrent connections of the shared client.
+    max_keepalive_connections : int
+        Maximum number of idle connections kept open.
+    keep_alive : bool
+        Whether HTTP connections are reused between requests.
+    json_decoder : str
+        JSON decoder backend: "orjson", "msgspec", "json" or "auto" (default), which
+        picks the fastest installed one.
+    retry_policy : RetryPolicy
+        Retry policy applied by every API client: attempts, backoff and Retry-After
+        handling. Pass NO_RETRY to disable retries.
+    rate_limit : Optional[float]
+        Maximum number of calls per second, shared by every API client. Calls over the
+        limit wait for their turn instead of failing. Unlimited when None (default).
+    rate_limit_burst : int
+        Number of calls allowed at once, on top of the rate, after an idle period.
+    response_cache : Optional[ResponseCache]
+        Cache of responses shared by every API client. Disabled when None (default).
+    connect_timeout : Optional[float]
+        Time allowed to open a connection, in seconds. None for no limit.
+    read_timeout : Optional[float]
+        Time allowed between two bytes received, in seconds. None for no limit.
+    coalesce_requests : bool
+        Whether identical concurrent calls share a single HTTP request (default is False).
+    identity_map : Optional[IdentityMap]
+        Identity map shared by the responses of every API client, so that entities
+        repeated across responses are parsed once. When None (default), entities are
+        only shared within each response.
+    session : httpx.AsyncClient
+        HTTP client shared by every API client. Built from the pool settings.
+    retry_stats : RetryStats
+        Retry counters aggregated over every API client.
+    rate_limiter : Optional[RateLimiter]
+        Token bucket built from the rate limit settings, None when unlimited.
+    singleflight : Optional[AsyncSingleFlight]
+        Coalescing group of identical calls in flight, None when disabled.
+
+    Sub-clients are created once, on first access, and share the same session.
+
+    Methods
+    -------
+    coverage -> AsyncCoverageApiClient:
+        Get an instance of AsyncCoverageApiClient for accessing coverage-related endpoints.
+    datasets -> AsyncDatasetsApiClient:
+        Get an instance of AsyncDatasetsApiClient for accessing dataset-related endpoints.
+    contributors -> AsyncContributorsApiClient:
+        Get an instance of AsyncContributorsApiClient for accessing contributor-related endpoints.
+    networks -> AsyncNetworkApiClient:
+        Get an instance of AsyncNetworkApiClient for accessing network-related endpoints.
+    companies -> AsyncCompanyApiClient:
+        Get an instance of AsyncCompanyApiClient for accessing company-related endpoints.
+    commercial_modes -> AsyncCommercialModeApiClient:
+        Get an instance of AsyncCommercialModeApiClient for accessing commercial mode-related endpoints.
+    physical_modes -> AsyncPhysicalModeApiClient:
+        Get an instance of AsyncPhysicalModeApiClient for accessing physical mode-related endpoints.
+    stop_areas -> AsyncStopAreaApiClient:
+        Get an instance of AsyncStopAreaApiClient for accessing stop area-related endpoints.
+    stop_points -> AsyncStopPointApiClient:
+        Get an instance of AsyncStopPointApiClient for accessing stop point-related endpoints.
+    lines -> AsyncLineApiClient:
+        Get an instance of AsyncLineApiClient for accessing line-related endpoints.
+    routes -> AsyncRouteApiClient:
+        Get an instance of AsyncRouteApiClient for accessing route-related endpoints.
+    disruptions -> AsyncDisruptionApiClient:
+        Get an instance of AsyncDisruptionApiClient for accessing disruption-related endpoints.
+    vehicle_journeys -> AsyncVehicleJourneyApiClient:
+        Get an instance of AsyncVehicleJourneyApiClient for accessing vehicle-related endpoints.
+    pt_objects -> AsyncPublicTransportObjectsApiClient:
+        Get an instance of AsyncPublicTransportObjectsApiClient for accessing public-transport-related endpoints.
+    places -> AsyncPlacesApiClient:
+        Get an instance of AsyncPlacesApiClient for accessing places-related endpoints.
+    places_nearby -> AsyncPlacesNearbyApiClient:
+        Get an instance of AsyncPlacesNearbyApiClient for accessing nearby-places-related endpoints.
+    inverted_geocoding -> AsyncInvertedGeocodingApiClient:
+        Get an instance of AsyncInvertedGeocodingApiClient for accessing inverted-geocoding-related endpoints.
+    route_schedules -> AsyncRouteSchedulesApiClient:
+        Get an instance of AsyncRouteSchedulesApiClient for accessing routes-related endpoints.
+    stop_schedules -> AsyncStopSchedulesApiClient:
+        Get an instance of AsyncStopSchedulesApiClient for accessing stop-schedules-related endpoints.
+    terminus_schedules -> AsyncTerminusSchedulesApiClient:
+        Get an instance of AsyncTerminusSchedulesApiClient for accessing terminate-schedules-related endpoints.
+    departures -> AsyncDepartureApiClient:
+        Get an instance of AsyncDepartureApiClient for accessing departures-related endpoints.
+    arrivals -> AsyncArrivalApiClient:
+        Get an instance of AsyncArrivalApiClient for accessing arrivals-related endpoints.
+    line_reports -> AsyncLineReportsApiClient:
+        Get an instance of AsyncLineReportsApiClient for accessing line-reports-related endpoints.
+    traffic_reports -> AsyncTrafficReportsApiClient:
+        Get an instance of AsyncTrafficReportsApiClient for accessing traffic-reports-related endpoints.
+    equipment_reports -> AsyncEquipmentReportsApiClient:
+        Get an instance of AsyncEquipmentReportsApiClient for accessing equipment-reports-related endpoints.
+    freefloatings_nearby -> AsyncFreefloatingsNearbyApiClient:
+        Get an instance of AsyncFreefloatingsNearbyApiClient for accessing nearby free-floating vehicle endpoints.
+    journeys -> AsyncJourneyApiClient:
+        Get an instance of AsyncJourneyApiClient for accessing journey-related endpoints.
+    isochrones -> AsyncIsochronesApiClient:
+        Get an instance of AsyncIsochronesApiClient for accessing isochrones-related endpoints.
+    raw -> AsyncRawClient:
+        Get an instance of AsyncRawClient for accessing APIs and get raw response.
+    """
+
+    auth_token: str
+    base_navitia_url: str = BASE_NAVITIA_URL
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keep_alive: bool = True
+    json_decoder: str = AUTO_DECODER
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limit: Optional[float] = None
+    rate_limit_burst: int = 1
+    response_cache: Optional[ResponseCache] = None
+    connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT
+    read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT
+    coalesce_requests: bool = False
+    identity_map: Optional[IdentityMap] = None
+    session: "AsyncClient" = field(init=False, repr=False, compare=False)
+    decode_json: JsonDecoder = field(init=False, repr=False, compare=False)
+    retry_stats: RetryStats = field(init=False, repr=False, compare=False)
+    rate_limiter: Optional[RateLimiter] = field(init=False, repr=False, compare=False)
+    singleflight: Optional[AsyncSingleFlight] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.decode_json = get_json_decoder(self.json_decoder)
+        self.retry_stats = RetryStats()
+        self.rate_limiter = (
+            RateLimiter(self.rate_limit, self.rate_limit_burst)
+            if self.rate_limit is not None
+            else None
+        )
+        self.singleflight = AsyncSingleFlight() if self.coalesce_requests else None
+        self.session = build_async_session(
+            auth_token=self.auth_token,
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keep_alive=self.keep_alive,
+        )
+
+    def _create_client(self, client_class: type[TAsyncApiClient]) -> TAsyncApiClient:
+        """Instantiate an API client sharing this client's session and settings."""
+        return client_class(
+            auth_token=self.auth_token,
+            base_navitia_url=self.base_navitia_url,
+            session=self.session,
+            json_decoder=self.decode_json,
+            retry_policy=self.retry_policy,
+            retry_stats=self.retry_stats,
+            rate_limiter=self.rate_limiter,
+            response_cache=self.response_cache,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            singleflight=self.singleflight,
+            identity_map=self.identity_map,
+        )
+
+    async def aclose(self) -> None:
+        """Close the shared session and release pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncNavitiaClient":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    @cached_property
+    def coverage(self) -> AsyncCoverageApiClient:
+        """Get an instance of AsyncCoverageApiClient for accessing coverage-related endpoints."""
+        return self._create_client(AsyncCoverageApiClient)
+
+    @cached_property
+    def datasets(self) -> AsyncDatasetsApiClient:
+        """Get an instance of AsyncDatasetsApiClient for accessing dataset-related endpoints."""
+        return self._create_client(AsyncDatasetsApiClient)
+
+    @cached_property
+    def contributors(self) -> AsyncContributorsApiClient:
+        """Get an instance of AsyncContributorsApiClient for accessing contributor-related endpoints."""
+        return self._create_client(AsyncContributorsApiClient)
+
+    @cached_property
+    def networks(self) -> AsyncNetworkApiClient:
+        """Get an instance of AsyncNetworkApiClient for accessing network-related endpoints."""
+        return self._create_client(AsyncNetworkApiClient)
+
+    @cached_property
+    def companies(self) -> AsyncCompanyApiClient:
+        """Get an instance of AsyncCompanyApiClient for accessing company-related endpoints."""
+        return self._create_client(AsyncCompanyApiClient)
+
+    @cached_property
+    def commercial_modes(self) -> AsyncCommercialModeApiClient:
+        """Get an instance of AsyncCommercialModeApiClient for accessing commercial mode-related endpoints."""
+        return self._create_client(AsyncCommercialModeApiClient)
+
+    @cached_property
+    def physical_modes(self) -> AsyncPhysicalModeApiClient:
+        """Get an instance of AsyncPhysicalModeApiClient for accessing physical mode-related endpoints."""
+        return self._create_client(AsyncPhysicalModeApiClient)
+
+    @cached_property
+    def stop_areas(self) -> AsyncStopAreaApiClient:
+        """Get an instance of AsyncStopAreaApiClient for accessing stop area-related endpoints."""
+        return self._create_client(AsyncStopAreaApiClient)
+
+    @cached_property
+    def stop_points(self) -> AsyncStopPointApiClient:
+        """Get an instance of AsyncStopPointApiClient for accessing stop point-related endpoints."""
+        return self._create_client(AsyncStopPointApiClient)
+
+    @cached_property
+    def lines(self) -> AsyncLineApiClient:
+        """Get an instance of AsyncLineApiClient for accessing line-related endpoints."""
+        return self._create_client(AsyncLineApiClient)
+
+    @cached_property
+    def routes(self) -> AsyncRouteApiClient:
+        """Get an instance of AsyncRouteApiClient for accessing route-related endpoints."""
+        return self._create_client(AsyncRouteApiClient)
+
+    @cached_property
+    def disruptions(self) -> AsyncDisruptionApiClient:
+        """Get an instance of AsyncDisruptionApiClient for accessing disruption-related endpoints."""
+        return self._create_client(AsyncDisruptionApiClient)
+
+    @cached_property
+    def vehicle_journeys(self) -> AsyncVehicleJourneyApiClient:
+        """Get an instance of AsyncVehicleJourneyApiClient for accessing vehicle-related endpoints."""
+        return self._create_client(AsyncVehicleJourneyApiClient)
+
+    @cached_property
+    def pt_objects(self) -> AsyncPublicTransportObjectsApiClient:
+        """Get an instance of AsyncPublicTransportObjectsApiClient for accessing public-transport-related endpoints."""
+        return self._create_client(AsyncPublicTransportObjectsApiClient)
+
+    @cached_property
+    def places(self) -> AsyncPlacesApiClient:
+        """Get an instance of AsyncPlacesApiClient for accessing places-related endpoints"""
+        return self._create_client(AsyncPlacesApiClient)
+
+    @cached_property
+    def places_nearby(self) -> AsyncPlacesNearbyApiClient:
+        """Get an instance of AsyncPlacesNearbyApiClient for accessing nearby-places-related endpoints."""
+        return self._create_client(AsyncPlacesNearbyApiClient)
+
+    @cached_property
+    def inverted_geocoding(self) -> AsyncInvertedGeocodingApiClient:
+        """Get an instance of AsyncInvertedGeocodingApiClient for accessing inverted-geocoding-related endpoints."""
+        return self._create_client(AsyncInvertedGeocodingApiClient)
+
+    @cached_property
+    def route_schedules(self) -> AsyncRouteSchedulesApiClient:
+        """Get an instance of AsyncRouteSchedulesApiClient for accessing routes-related endpoints."""
+        return self._create_client(AsyncRouteSchedulesApiClient)
+
+    @cached_property
+    def stop_schedules(self) -> AsyncStopSchedulesApiClient:
+        """Get an instance of AsyncStopSchedulesApiClient for accessing stop-schedules-related endpoints."""
+        return self._create_client(AsyncStopSchedulesApiClient)
+
+    @cached_property
+    def terminus_schedules(self) -> AsyncTerminusSchedulesApiClient:
+        """Get an instance of AsyncTerminusSchedulesApiClient for accessing terminate-schedules-related endpoints."""
+        return self._create_client(AsyncTerminusSchedulesApiClient)
+
+    @cached_property
+    def departures(self) -> AsyncDepartureApiClient:
+        """Get an instance of AsyncDepartureApiClient for accessing departures-related endpoints."""
+        return self._create_client(AsyncDepartureApiClient)
+
+    @cached_property
+    def arrivals(self) -> AsyncArrivalApiClient:
+        """Get an instance of AsyncArrivalApiClient for accessing arrivals-related endpoints."""
+        return self._create_client(AsyncArrivalApiClient)
+
+    @cached_property
+    def line_reports(self) -> AsyncLineReportsApiClient:
+        """Get an instance of AsyncLineReportsApiClient for accessing line-reports-related endpoints."""
+        return self._create_client(AsyncLineReportsApiClient)
+
+    @cached_property
+    def traffic_reports(self) -> AsyncTrafficReportsApiClient:
+        """Get an instance of AsyncTrafficReportsApiClient for accessing traffic-reports-related endpoints."""
+        return self._create_client(AsyncTrafficReportsApiClient)
+
+    @cached_property
+    def equipment_reports(self) -> AsyncEquipmentReportsApiClient:
+        """Get an instance of AsyncEquipmentReportsApiClient for accessing equipment-reports-related endpoints."""
+        return self._create_client(AsyncEquipmentReportsApiClient)
+
+    @cached_property
+    def freefloatings_nearby(self) -> AsyncFreefloatingsNearbyApiClient:
+        """Get an instance of AsyncFreefloatingsNearbyApiClient for accessing nearby free-floating vehicle endpoints."""
+        return self._create_client(AsyncFreefloatingsNearbyApiClient)
+
+    @cached_property
+    def journeys(self) -> AsyncJourneyApiClient:
+        """Get an instance of AsyncJourneyApiClient for accessing journey-related endpoints."""
+        return self._create_client(AsyncJourneyApiClient)
+
+    @cached_property
+    def isochrones(self) -> AsyncIsochronesApiClient:
+        """Get an instance of AsyncIsochronesApiClient for accessing isochrones-related endpoints."""
+        return self._create_client(AsyncIsochronesApiClient)
+
+    @cached_property
+    def raw(self) -> AsyncRawClient:
+        """Get an instance of AsyncRawClient for accessing APIs and get raw response"""
+        return AsyncRawClient(
+            auth_token=self.auth_token,
+            base_navitia_url=self.base_navitia_url,
+            session=self.session,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+        )
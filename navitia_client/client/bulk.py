@@ -0,0 +1,110 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, Iterable, TypeVar
+
+from navitia_client.client.session import DEFAULT_POOL_MAXSIZE
+
+TResult = TypeVar("TResult")
+
+# One worker per pooled connection, so that no request waits for or opens a throwaway
+# connection with the default session.
+DEFAULT_BULK_WORKERS: int = DEFAULT_POOL_MAXSIZE
+
+
+@dataclass
+class BulkResult(Generic[TResult]):
+    """
+    Outcome of a bulk call, keyed by the requested item.
+
+    A failing item does not fail the others: its exception is kept in `errors` and the
+    item is missing from `results`.
+
+    Attributes:
+        results (dict[str, TResult]): Result of each item that succeeded.
+        errors (dict[str, Exception]): Exception raised by each item that failed.
+    """
+
+    results: dict[str, TResult] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every item succeeded."""
+        return not self.errors
+
+
+def fetch_many(
+    fetch: Callable[[str], TResult],
+    keys: Iterable[str],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+) -> BulkResult[TResult]:
+    """
+    Call `fetch` for each key over a bounded pool of threads.
+
+    Repeated keys are fetched once.
+
+    Args:
+        fetch (Callable[[str], TResult]): Function fetching one item.
+        keys (Iterable[str]): Items to fetch, such as resource paths.
+        max_workers (int): Maximum number of items fetched at the same time.
+
+    Returns:
+        BulkResult[TResult]: The result or the exception of each distinct key.
+
+    Raises:
+        ValueError: If `max_workers` is lower than 1.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    unique_keys = list(dict.fromkeys(keys))
+    bulk_result: BulkResult[TResult] = BulkResult()
+    if not unique_keys:
+        return bulk_result
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_keys))) as executor:
+        # Each item runs in a copy of the current context to keep the deadline
+        futures = {
+            key: executor.submit(contextvars.copy_context().run, fetch, key)
+            for key in unique_keys
+        }
+        for key, future in futures.items():
+            try:
+                bulk_result.results[key] = future.result()
+            except Exception as error:
+                bulk_result.errors[key] = error
+    return bulk_result
+
+
+async def afetch_many(
+    fetch: Callable[[str], Awaitable[TResult]],
+    keys: Iterable[str],
+    max_workers: int = DEFAULT_BULK_WORKERS,
+) -> BulkResult[TResult]:
+    """
+    Asynchronously await `fetch` for each key, at most `max_workers` at the same time.
+
+    See fetch_many.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    unique_keys = list(dict.fromkeys(keys))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch_bounded(key: str) -> TResult:
+        async with semaphore:
+            return await fetch(key)
+
+    outcomes = await asyncio.gather(
+        *(fetch_bounded(key) for key in unique_keys), return_exceptions=True
+    )
+    bulk_result: BulkResult[TResult] = BulkResult()
+    for key, outcome in zip(unique_keys, outcomes):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            bulk_result.errors[key] = outcome
+        else:
+            bulk_result.results[key] = outcome
+    return bulk_result
@@ -0,0 +1,358 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from navitia_client.client.decoders import JsonDecoder, get_json_decoder
+from navitia_client.client.response import NavitiaResponse
+
+DEFAULT_CACHE_MAX_SIZE: int = 1024
+
+_ONE_MINUTE = 60.0
+_ONE_HOUR = 60 * _ONE_MINUTE
+_ONE_DAY = 24 * _ONE_HOUR
+
+# Time to live, in seconds, of the responses of each endpoint family. The family of a
+# URL is the last of its path segments found in this table, so that
+# coverage/{region}/lines/{line}/departures belongs to "departures".
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    # Public transport referential, updated at most daily
+    "coverage": _ONE_HOUR,
+    "contributors": _ONE_DAY,
+    "datasets": _ONE_DAY,
+    "networks": _ONE_DAY,
+    "lines": _ONE_DAY,
+    "routes": _ONE_DAY,
+    "stop_areas": _ONE_DAY,
+    "stop_points": _ONE_DAY,
+    "commercial_modes": _ONE_DAY,
+    "physical_modes": _ONE_DAY,
+    "companies": _ONE_DAY,
+    "vehicle_journeys": _ONE_HOUR,
+    "pt_objects": _ONE_DAY,
+    "places": _ONE_DAY,
+    "places_nearby": _ONE_HOUR,
+    # Real time data
+    "disruptions": _ONE_MINUTE,
+    "line_reports": _ONE_MINUTE,
+    "traffic_reports": _ONE_MINUTE,
+    "equipment_reports": _ONE_MINUTE,
+    "route_schedules": _ONE_MINUTE,
+    "stop_schedules": 30.0,
+    "terminus_schedules": 30.0,
+    "departures": 15.0,
+    "arrivals": 15.0,
+    "freefloatings_nearby": 15.0,
+    # Computed for the requested date time, not cached
+    "journeys": 0.0,
+    "isochrones": 0.0,
+}
+
+_DUPLICATE_SLASHES = re.compile(r"/{2,}")
+
+
+def normalize_cache_key(url: str, auth_token: Optional[str] = None) -> str:
+    """
+    Normalize a URL so that equivalent requests share the same cache key.
+
+    The scheme and host are lower-cased, duplicate and trailing slashes are removed
+    from the path and query parameters are sorted by name, keeping the order of
+    repeated parameters. When a token is given, a fingerprint of it is appended, so
+    that clients with different tokens, and thus maybe different coverages or access
+    rights, never share responses. The token itself is not part of the key.
+
+    Args:
+        url (str): The requested URL.
+        auth_token (Optional[str]): The authorization token of the request.
+
+    Returns:
+        str: The cache key.
+    """
+    parts = urlsplit(url)
+    path = _DUPLICATE_SLASHES.sub("/", parts.path).rstrip("/")
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True), key=lambda p: p[0])
+    fingerprint = (
+        hashlib.sha256(auth_token.encode()).hexdigest()[:32]
+        if auth_token is not None
+        else ""
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            path,
+            urlencode(query),
+            fingerprint,
+        )
+    )
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory cache of decoded responses, with per-endpoint TTL and LRU
+    eviction.
+
+    Cached responses are shared between callers and must not be mutated. Entries are
+    keyed by URL and by a fingerprint of the token they were requested with, so a
+    cache, including a SQLiteResponseCache file, can be shared by clients with
+    different tokens.
+
+    Attributes:
+        max_size (int): Maximum number of responses kept. The least recently used one is
+            evicted when the cache is full.
+        ttls (Mapping[str, float]): Time to live in seconds per endpoint family, such as
+            "lines" or "departures".
+        default_ttl (float): Time to live of endpoints missing from `ttls`. Responses
+            with a time to live of 0 are not cached.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found in the cache, or expired.
+        evictions (int): Number of responses dropped to make room for new ones.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0.0,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of responses kept.
+            ttls (Optional[Mapping[str, float]]): Time to live per endpoint family.
+                Defaults to DEFAULT_CACHE_TTLS.
+            default_ttl (float): Time to live of endpoints missing from `ttls`.
+
+        Raises:
+            ValueError: If max_size is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttls = dict(ttls) if ttls is not None else dict(DEFAULT_CACHE_TTLS)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, NavitiaResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache, 0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def ttl_for(self, url: str) -> float:
+        """Time to live of the responses of a URL, found from its endpoint family."""
+        for segment in reversed(urlsplit(url).path.split("/")):
+            if segment in self.ttls:
+                return self.ttls[segment]
+        return self.default_ttl
+
+    def get(
+        self, url: str, auth_token: Optional[str] = None
+    ) -> Optional[NavitiaResponse]:
+        """
+        Look a response up.
+
+        Args:
+            url (str): The requested URL.
+            auth_token (Optional[str]): The token the response was requested with.
+
+        Returns:
+            Optional[NavitiaResponse]: The cached response, or None when missing or
+            expired.
+        """
+        key = normalize_cache_key(url, auth_token)
+        with self._lock:
+            response = self._load(key)
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return response
+
+    def set(
+        self, url: str, response: NavitiaResponse, auth_token: Optional[str] = None
+    ) -> None:
+        """
+        Store a response for the time to live of its endpoint family.
+
+        Args:
+            url (str): The requested URL.
+            response (NavitiaResponse): The response to store.
+            auth_token (Optional[str]): The token the response was requested with.
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return
+
+        key = normalize_cache_key(url, auth_token)
+        with self._lock:
+            self.evictions += self._save(key, ttl, response)
+
+    def clear(self) -> None:
+        """Drop every cached response. Statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: str) -> Optional[NavitiaResponse]:
+        """Return the live entry of a key, dropping it when expired. Called under lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _save(self, key: str, ttl: float, response: NavitiaResponse) -> int:
+        """Store an entry and return the number of evicted ones. Called under lock."""
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        evicted = 0
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Response cache persisted in a SQLite database.
+
+    Entries survive restarts and are shared by every process opening the same file,
+    which avoids a cold start of a fleet of workers re-fetching the same referential.
+    Raw bodies are stored compressed with zlib and decoded again when read. Expiration
+    dates use the wall clock so that they stay valid across processes.
+
+    Attributes:
+        path (str): Path of the database file.
+        compression_level (int): zlib compression level of the stored bodies, from 0 to 9.
+        json_decoder (JsonDecoder): Function decoding the stored bodies.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0.0,
+        compression_level: int = 6,
+        json_decoder: Optional[JsonDecoder] = None,
+    ) -> None:
+        """
+        Open, and create when needed, a cache database.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the database file.
+            max_size (int): Maximum number of responses kept.
+            ttls (Optional[Mapping[str, float]]): Time to live per endpoint family.
+                Defaults to DEFAULT_CACHE_TTLS.
+            default_ttl (float): Time to live of endpoints missing from `ttls`.
+            compression_level (int): zlib compression level of the stored bodies.
+            json_decoder (Optional[JsonDecoder]): Function decoding the stored bodies.
+                Defaults to the fastest installed backend.
+        """
+        super().__init__(max_size=max_size, ttls=ttls, default_ttl=default_ttl)
+        self.path = os.fspath(path)
+        self.compression_level = compression_level
+        self.json_decoder = (
+            json_decoder if json_decoder is not None else get_json_decoder()
+        )
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT NOT NULL, status_code INTEGER NOT NULL, "
+            "content BLOB NOT NULL, elapsed REAL NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+        return count
+
+    def _load(self, key: str) -> Optional[NavitiaResponse]:
+        now = time.time()
+        row = self._connection.execute(
+            "SELECT url, status_code, content, elapsed, expires_at "
+            "FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        url, status_code, compressed_content, elapsed, expires_at = row
+        if expires_at <= now:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+        self._connection.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        content = zlib.decompress(compressed_content)
+        return NavitiaResponse(
+            url=url,
+            status_code=status_code,
+            content=content,
+            payload=self.json_decoder(content),
+            elapsed=elapsed,
+        )
+
+    def _save(self, key: str, ttl: float, response: NavitiaResponse) -> int:
+        now = time.time()
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, content, elapsed, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    zlib.compress(response.content, self.compression_level),
+                    response.elapsed,
+                    now + ttl,
+                    now,
+                ),
+            )
+            return self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_size,),
+            ).rowcount
+
+    def clear(self) -> None:
+        """Drop every cached response. Statistics are kept."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,92 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from navitia_client.client.exceptions import NavitiaDeadlineExceededError
+
+_deadline: ContextVar[Optional[float]] = ContextVar("navitia_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound the time spent on every API call made within the block.
+
+    The deadline covers retries, rate limiting and every request issued by helpers
+    making several calls. It is stored in a context variable, so it follows asyncio
+    tasks and work submitted with a copy of the current context. Nested deadlines
+    cannot extend the enclosing one.
+
+    Args:
+        seconds (float): Time allowed from now.
+
+    Raises:
+        NavitiaDeadlineExceededError: From API calls made, or waiting, past the deadline.
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Time left before the current deadline, in seconds, or None without deadline."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def check_deadline() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        Optional[float]: The time left in seconds, or None without deadline.
+
+    Raises:
+        NavitiaDeadlineExceededError: If the deadline has passed.
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise NavitiaDeadlineExceededError("Deadline exceeded")
+    return remaining
+
+
+def bound_timeouts(
+    connect_timeout: Optional[float], read_timeout: Optional[float]
+) -> tuple[Optional[float], Optional[float]]:
+    """
+    Shorten the timeouts of a request so that it does not outlive the current deadline.
+
+    Args:
+        connect_timeout (Optional[float]): Connect timeout in seconds, None for no limit.
+        read_timeout (Optional[float]): Read timeout in seconds, None for no limit.
+
+    Returns:
+        tuple[Optional[float], Optional[float]]: The connect and read timeouts to use.
+
+    Raises:
+        NavitiaDeadlineExceededError: If the deadline has passed.
+    """
+    remaining = check_deadline()
+    if remaining is None:
+        return connect_timeout, read_timeout
+    return (
+        remaining if connect_timeout is None else min(connect_timeout, remaining),
+        remaining if read_timeout is None else min(read_timeout, remaining),
+    )
+
+
+def raise_if_deadline_exceeded(error: Exception) -> None:
+    """Raise NavitiaDeadlineExceededError from a transport error once the deadline has passed."""
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise NavitiaDeadlineExceededError("Deadline exceeded") from error
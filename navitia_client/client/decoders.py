@@ -0,0 +1,61 @@
+import json
+from typing import Any, Callable
+
+JsonDecoder = Callable[[bytes], Any]
+
+AUTO_DECODER: str = "auto"
+
+
+def _orjson_decoder() -> JsonDecoder:
+    import orjson  # type: ignore
+
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JsonDecoder:
+    import msgspec  # type: ignore
+
+    return msgspec.json.Decoder().decode
+
+
+def _stdlib_decoder() -> JsonDecoder:
+    return json.loads
+
+
+_DECODER_FACTORIES: dict[str, Callable[[], JsonDecoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": _stdlib_decoder,
+}
+
+
+def get_json_decoder(name: str = AUTO_DECODER) -> JsonDecoder:
+    """
+    Get a function decoding a JSON body into Python objects.
+
+    Args:
+        name (str): Decoder backend, one of "orjson", "msgspec", "json" or "auto".
+            "auto" picks the fastest installed backend, in that order, and falls back
+            to the standard library `json` module.
+
+    Returns:
+        JsonDecoder: A callable taking the raw body as bytes.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if name == AUTO_DECODER:
+        for factory in _DECODER_FACTORIES.values():
+            try:
+                return factory()
+            except ImportError:
+                continue
+
+    if name not in _DECODER_FACTORIES:
+        raise ValueError(
+            f"Unknown JSON decoder '{name}', "
+            f"expected one of {[AUTO_DECODER, *_DECODER_FACTORIES]}"
+        )
+
+    return _DECODER_FACTORIES[name]()
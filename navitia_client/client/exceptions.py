@@ -16,3 +16,7 @@ class NavitiaUnableToParseError(Exception):
 
 class NavitiaNotFoundError(Exception):
     pass
+
+
+class NavitiaDeadlineExceededError(Exception):
+    pass
@@ -0,0 +1,166 @@
+import copy
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Optional, Sequence
+
+from navitia_client.client.bulk import BulkResult
+from navitia_client.entities.request.journey import JourneyRequest
+from navitia_client.entities.response import Journey
+
+# Value of the cells of the pairs without journey
+NO_JOURNEY: int = -1
+
+
+@dataclass
+class JourneyMatrix:
+    """
+    Durations and transfers of the fastest journey between origins and destinations.
+
+    Cells are stored row by row, one row per origin, in arrays of machine integers:
+    a 200 x 200 matrix takes about 160 kB per array. Pairs without journey, because
+    Navitia found no solution or the call failed, hold NO_JOURNEY.
+
+    Attributes:
+        origins (Sequence[str]): Origins, one row each, in the requested order.
+        destinations (Sequence[str]): Destinations, one column each, in the requested
+            order.
+        durations (array): Duration of the fastest journey of each pair, in seconds.
+        nb_transfers (array): Number of transfers of the fastest journey of each pair.
+        journeys (Optional[dict[tuple[str, str], Sequence[Journey]]]): Journeys returned
+            for each (origin, destination) pair, when requested.
+        errors (dict[tuple[str, str], Exception]): Exception raised by each pair that
+            failed, Navitia finding no solution included.
+    """
+
+    origins: Sequence[str]
+    destinations: Sequence[str]
+    durations: array
+    nb_transfers: array
+    journeys: Optional[dict[tuple[str, str], Sequence[Journey]]] = None
+    errors: dict[tuple[str, str], Exception] = field(default_factory=dict)
+
+    @classmethod
+    def empty(
+        cls, origins: Sequence[str], destinations: Sequence[str], with_journeys: bool
+    ) -> "JourneyMatrix":
+        """Build a matrix of the given shape where no pair has a journey."""
+        size = len(origins) * len(destinations)
+        return cls(
+            origins=list(origins),
+            destinations=list(destinations),
+            durations=array("i", [NO_JOURNEY]) * size,
+            nb_transfers=array("i", [NO_JOURNEY]) * size,
+            journeys={} if with_journeys else None,
+        )
+
+    def __post_init__(self) -> None:
+        # Repeated origins or destinations share the result of the same pair
+        self._rows: dict[str, list[int]] = {}
+        for row, origin in enumerate(self.origins):
+            self._rows.setdefault(origin, []).append(row)
+        self._columns: dict[str, list[int]] = {}
+        for column, destination in enumerate(self.destinations):
+            self._columns.setdefault(destination, []).append(column)
+
+    def _set_cells(
+        self, origin: str, destination: str, duration: int, nb_transfers: int
+    ) -> None:
+        width = len(self.destinations)
+        for row in self._rows[origin]:
+            for column in self._columns[destination]:
+                self.durations[row * width + column] = duration
+                self.nb_transfers[row * width + column] = nb_transfers
+
+    def set_pair(
+        self, origin: str, destination: str, journeys: Sequence[Journey]
+    ) -> None:
+        """Fill the cells of a pair with its fastest journey."""
+        fastest = min(journeys, key=lambda journey: journey.duration, default=None)
+        if fastest is not None:
+            self._set_cells(origin, destination, fastest.duration, fastest.nb_transfers)
+        if self.journeys is not None:
+            self.journeys[(origin, destination)] = journeys
+
+    def set_trivial_pair(self, place: str) -> None:
+        """Fill the cells going from a place to itself, which take no time."""
+        self._set_cells(place, place, 0, 0)
+
+    def duration(self, origin: str, destination: str) -> Optional[int]:
+        """Duration in seconds of the fastest journey of a pair, None without journey."""
+        return self._cell(self.durations, origin, destination)
+
+    def transfers(self, origin: str, destination: str) -> Optional[int]:
+        """Number of transfers of the fastest journey of a pair, None without journey."""
+        return self._cell(self.nb_transfers, origin, destination)
+
+    def duration_row(self, origin: str) -> array:
+        """Durations from an origin to every destination, in the order of destinations."""
+        row = self._rows[origin][0]
+        width = len(self.destinations)
+        return self.durations[row * width : (row + 1) * width]
+
+    def _cell(self, values: array, origin: str, destination: str) -> Optional[int]:
+        row = self._rows[origin][0]
+        column = self._columns[destination][0]
+        value = values[row * len(self.destinations) + column]
+        return None if value == NO_JOURNEY else value
+
+
+def matrix_pairs(
+    origins: Iterable[str], destinations: Iterable[str]
+) -> list[tuple[str, str]]:
+    """
+    Distinct (origin, destination) pairs worth a journey request.
+
+    Repeated origins or destinations and pairs going from a place to itself are
+    skipped.
+    """
+    unique_destinations = list(dict.fromkeys(destinations))
+    return [
+        (origin, destination)
+        for origin in dict.fromkeys(origins)
+        for destination in unique_destinations
+        if origin != destination
+    ]
+
+
+def pair_request(
+    request: JourneyRequest, origin: str, destination: str
+) -> JourneyRequest:
+    """Copy a template request, pointing it at a pair."""
+    new_request = copy.copy(request)
+    new_request.from_ = origin
+    new_request.to_ = destination
+    return new_request
+
+
+def build_journey_matrix(
+    origins: Sequence[str],
+    destinations: Sequence[str],
+    pair_urls: Mapping[tuple[str, str], str],
+    bulk_result: BulkResult[Sequence[Journey]],
+    include_journeys: bool,
+) -> JourneyMatrix:
+    """
+    Build a matrix from the journeys fetched for each pair.
+
+    Args:
+        origins (Sequence[str]): Origins, one row each.
+        destinations (Sequence[str]): Destinations, one column each.
+        pair_urls (Mapping[tuple[str, str], str]): URL requested for each pair.
+        bulk_result (BulkResult[Sequence[Journey]]): Journeys, or exception, keyed by
+            requested URL.
+        include_journeys (bool): Whether the journeys are kept in the matrix.
+
+    Returns:
+        JourneyMatrix: The matrix.
+    """
+    matrix = JourneyMatrix.empty(origins, destinations, include_journeys)
+    for place in set(origins).intersection(destinations):
+        matrix.set_trivial_pair(place)
+    for (origin, destination), url in pair_urls.items():
+        if url in bulk_result.results:
+            matrix.set_pair(origin, destination, bulk_result.results[url])
+        else:
+            matrix.errors[(origin, destination)] = bulk_result.errors[url]
+    return matrix
@@ -1,5 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional, TypeVar
 
+from requests import Session  # type: ignore
+
+from navitia_client.client.apis.api_base_client import ApiBaseClient
 from navitia_client.client.apis.arrival_apis import ArrivalApiClient
 from navitia_client.client.apis.contributors_apis import ContributorsApiClient
 from navitia_client.client.apis.coverage_apis import CoverageApiClient
@@ -40,10 +45,29 @@ from navitia_client.client.apis.terminus_schedules_apis import (
     TerminusSchedulesApiClient,
 )
 from navitia_client.client.apis.traffic_report_apis import TrafficReportsApiClient
+from navitia_client.client.cache import ResponseCache
+from navitia_client.client.decoders import (
+    AUTO_DECODER,
+    JsonDecoder,
+    get_json_decoder,
+)
 from navitia_client.client.raw.raw_client import RawClient
+from navitia_client.client.rate_limit import RateLimiter
+from navitia_client.client.retry import RetryPolicy, RetryStats
+from navitia_client.client.session import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_READ_TIMEOUT,
+    build_session,
+)
+from navitia_client.client.singleflight import SingleFlight
+from navitia_client.entities.response.identity_map import IdentityMap
 
 BASE_NAVITIA_URL: str = "https://api.navitia.io/v1/"
 
+TApiClient = TypeVar("TApiClient", bound=ApiBaseClient)
+
 
 @dataclass
 class NavitiaClient:
@@ -56,6 +80,48 @@ class NavitiaClient:
         Authorization token for accessing the API.
     base_navitia_url : str
         Base URL of the Navitia API.
+    pool_connections : int
+        Number of per-host connection pools kept by the shared session.
+    pool_maxsize : int
+        Maximum number of connections kept open per host.
+    pool_block : bool
+        Whether to wait for a free connection when the pool is full.
+    keep_alive : bool
+        Whether HTTP connections are reused between requests.
+    json_decoder : str
+        JSON decoder backend: "orjson", "msgspec", "json" or "auto" (default), which
+        picks the fastest installed one.
+    retry_policy : RetryPolicy
+        Retry policy applied by every API client: attempts, backoff and Retry-After
+        handling. Pass NO_RETRY to disable retries.
+    rate_limit : Optional[float]
+        Maximum number of calls per second, shared by every API client. Calls over the
+        limit wait for their turn instead of failing. Unlimited when None (default).
+    rate_limit_burst : int
+        Number of calls allowed at once, on top of the rate, after an idle period.
+    response_cache : Optional[ResponseCache]
+        Cache of responses shared by every API client. Disabled when None (default).
+    connect_timeout : Optional[float]
+        Time allowed to open a connection, in seconds. None for no limit.
+    read_timeout : Optional[float]
+        Time allowed between two bytes received, in seconds. None for no limit.
+    coalesce_requests : bool
+        Whether identical concurrent calls share a single HTTP request (default is False).
+    identity_map : Optional[IdentityMap]
+        Identity map shared by the responses of every API client, so that entities
+        repeated across responses are parsed once. When None (default), entities are
+        only shared within each response. The map keeps its `max_size` most recently
+        used entities; call its `clear` method when the data it holds may be stale.
+    session : requests.Session
+        HTTP session shared by every API client. Built from the pool settings.
+    retry_stats : RetryStats
+        Retry counters aggregated over every API client.
+    rate_limiter : Optional[RateLimiter]
+        Token bucket built from the rate limit settings, None when unlimited.
+    singleflight : Optional[SingleFlight]
+        Coalescing group of identical calls in flight, None when disabled.
+
+    Sub-clients are created once, on first access, and share the same session.
 
     Methods
     -------
@@ -119,206 +185,216 @@ class NavitiaClient:
 
     auth_token: str
     base_navitia_url: str = BASE_NAVITIA_URL
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_block: bool = False
+    keep_alive: bool = True
+    json_decoder: str = AUTO_DECODER
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limit: Optional[float] = None
+    rate_limit_burst: int = 1
+    response_cache: Optional[ResponseCache] = None
+    connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT
+    read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT
+    coalesce_requests: bool = False
+    identity_map: Optional[IdentityMap] = None
+    session: Session = field(init=False, repr=False, compare=False)
+    decode_json: JsonDecoder = field(init=False, repr=False, compare=False)
+    retry_stats: RetryStats = field(init=False, repr=False, compare=False)
+    rate_limiter: Optional[RateLimiter] = field(init=False, repr=False, compare=False)
+    singleflight: Optional[SingleFlight] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.decode_json = get_json_decoder(self.json_decoder)
+        self.retry_stats = RetryStats()
+        self.rate_limiter = (
+            RateLimiter(self.rate_limit, self.rate_limit_burst)
+            if self.rate_limit is not None
+            else None
+        )
+        self.singleflight = SingleFlight() if self.coalesce_requests else None
+        self.session = build_session(
+            auth_token=self.auth_token,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            keep_alive=self.keep_alive,
+        )
+
+    def _create_client(self, client_class: type[TApiClient]) -> TApiClient:
+        """Instantiate an API client sharing this client's session and settings."""
+        return client_class(
+            auth_token=self.auth_token,
+            base_navitia_url=self.base_navitia_url,
+            session=self.session,
+            json_decoder=self.decode_json,
+            retry_policy=self.retry_policy,
+            retry_stats=self.retry_stats,
+            rate_limiter=self.rate_limiter,
+            response_cache=self.response_cache,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
+            singleflight=self.singleflight,
+            identity_map=self.identity_map,
+        )
+
+    def close(self) -> None:
+        """Close the shared session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "NavitiaClient":
+        return self
 
-    @property
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @cached_property
     def coverage(self) -> CoverageApiClient:
         """Get an instance of CoverageApiClient for accessing coverage-related endpoints."""
-        return CoverageApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(CoverageApiClient)
 
-    @property
+    @cached_property
     def datasets(self) -> DatasetsApiClient:
         """Get an instance of DatasetsApiClient for accessing dataset-related endpoints."""
-        return DatasetsApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(DatasetsApiClient)
 
-    @property
+    @cached_property
     def contributors(self) -> ContributorsApiClient:
         """Get an instance of ContributorsApiClient for accessing contributor-related endpoints."""
-        return ContributorsApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(ContributorsApiClient)
 
-    @property
+    @cached_property
     def networks(self) -> NetworkApiClient:
         """Get an instance of NetworkApiClient for accessing network-related endpoints."""
-        return NetworkApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(NetworkApiClient)
 
-    @property
+    @cached_property
     def companies(self) -> CompanyApiClient:
         """Get an instance of CompanyApiClient for accessing company-related endpoints."""
-        return CompanyApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(CompanyApiClient)
 
-    @property
+    @cached_property
     def commercial_modes(self) -> CommercialModeApiClient:
         """Get an instance of CommercialModeApiClient for accessing commercial mode-related endpoints."""
-        return CommercialModeApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(CommercialModeApiClient)
 
-    @property
+    @cached_property
     def physical_modes(self) -> PhysicalModeApiClient:
         """Get an instance of PhysicalModeApiClient for accessing physical mode-related endpoints."""
-        return PhysicalModeApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(PhysicalModeApiClient)
 
-    @property
+    @cached_property
     def stop_areas(self) -> StopAreaApiClient:
         """Get an instance of StopAreaApiClient for accessing stop area-related endpoints."""
-        return StopAreaApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(StopAreaApiClient)
 
-    @property
+    @cached_property
     def stop_points(self) -> StopPointApiClient:
         """Get an instance of StopPointApiClient for accessing stop point-related endpoints."""
-        return StopPointApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(StopPointApiClient)
 
-    @property
+    @cached_property
     def lines(self) -> LineApiClient:
         """Get an instance of LineApiClient for accessing line-related endpoints."""
-        return LineApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(LineApiClient)
 
-    @property
+    @cached_property
     def routes(self) -> RouteApiClient:
         """Get an instance of RouteApiClient for accessing route-related endpoints."""
-        return RouteApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(RouteApiClient)
 
-    @property
+    @cached_property
     def disruptions(self) -> DisruptionApiClient:
         """Get an instance of DisruptionApiClient for accessing disruption-related endpoints."""
-        return DisruptionApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(DisruptionApiClient)
 
-    @property
+    @cached_property
     def vehicle_journeys(self) -> VehicleJourneyApiClient:
         """Get an instance of VehicleJourneyApiClient for accessing vehicle-related endpoints."""
-        return VehicleJourneyApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(VehicleJourneyApiClient)
 
-    @property
+    @cached_property
     def pt_objects(self) -> PublicTransportObjectsApiClient:
         """Get an instance of PublicTransportObjectsApiClient for accessing public-transport-related endpoints."""
-        return PublicTransportObjectsApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(PublicTransportObjectsApiClient)
 
-    @property
+    @cached_property
     def places(self) -> PlacesApiClient:
         """Get an instance of PlacesApiClient for accessing places-related endpoints"""
-        return PlacesApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(PlacesApiClient)
 
-    @property
+    @cached_property
     def places_nearby(self) -> PlacesNearbyApiClient:
         """Get an instance of PlacesNearbyApiClient for accessing nearby-places-related endpoints."""
-        return PlacesNearbyApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(PlacesNearbyApiClient)
 
-    @property
+    @cached_property
     def inverted_geocoding(self) -> InvertedGeocodingApiClient:
         """Get an instance of InvertedGeocodingApiClient for accessing inverted-geocoding-related endpoints."""
-        return InvertedGeocodingApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(InvertedGeocodingApiClient)
 
-    @property
+    @cached_property
     def route_schedules(self) -> RouteSchedulesApiClient:
         """Get an instance of RouteSchedulesApiClient for accessing routes-related endpoints."""
-        return RouteSchedulesApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(RouteSchedulesApiClient)
 
-    @property
+    @cached_property
     def stop_schedules(self) -> StopSchedulesApiClient:
         """Get an instance of StopSchedulesApiClient for accessing stop-schedules-related endpoints."""
-        return StopSchedulesApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(StopSchedulesApiClient)
 
-    @property
+    @cached_property
     def terminus_schedules(self) -> TerminusSchedulesApiClient:
         """Get an instance of TerminusSchedulesApiClient for accessing terminate-schedules-related endpoints."""
-        return TerminusSchedulesApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(TerminusSchedulesApiClient)
 
-    @property
+    @cached_property
     def departures(self) -> DepartureApiClient:
         """Get an instance of DepartureApiClient for accessing departures-related endpoints."""
-        return DepartureApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(DepartureApiClient)
 
-    @property
+    @cached_property
     def arrivals(self) -> ArrivalApiClient:
         """Get an instance of ArrivalApiClient for accessing arrivals-related endpoints."""
-        return ArrivalApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(ArrivalApiClient)
 
-    @property
+    @cached_property
     def line_reports(self) -> LineReportsApiClient:
         """Get an instance of LineReportsApiClient for accessing line-reports-related endpoints."""
-        return LineReportsApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(LineReportsApiClient)
 
-    @property
+    @cached_property
     def traffic_reports(self) -> TrafficReportsApiClient:
         """Get an instance of TrafficReportsApiClient for accessing traffic-reports-related endpoints."""
-        return TrafficReportsApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(TrafficReportsApiClient)
 
-    @property
+    @cached_property
     def equipment_reports(self) -> EquipmentReportsApiClient:
         """Get an instance of EquipmentReportsApiClient for accessing equipment-reports-related endpoints."""
-        return EquipmentReportsApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(EquipmentReportsApiClient)
 
-    @property
+    @cached_property
     def freefloatings_nearby(self) -> FreefloatingsNearbyApiClient:
         """Get an instance of FreefloatingsNearbyApiClient for accessing nearby free-floating vehicle endpoints."""
-        return FreefloatingsNearbyApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(FreefloatingsNearbyApiClient)
 
-    @property
+    @cached_property
     def journeys(self) -> JourneyApiClient:
         """Get an instance of JourneyApiClient for accessing journey-related endpoints."""
-        return JourneyApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(JourneyApiClient)
 
-    @property
+    @cached_property
     def isochrones(self) -> IsochronesApiClient:
         """Get an instance of IsochronesApiClient for accessing isochrones-related endpoints."""
-        return IsochronesApiClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
-        )
+        return self._create_client(IsochronesApiClient)
 
-    @property
+    @cached_property
     def raw(self) -> RawClient:
         """Get an instance of RawClient for accessing APIs and get raw response"""
         return RawClient(
-            auth_token=self.auth_token, base_navitia_url=self.base_navitia_url
+            auth_token=self.auth_token,
+            base_navitia_url=self.base_navitia_url,
+            session=self.session,
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout,
         )
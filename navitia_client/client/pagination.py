@@ -0,0 +1,255 @@
+import asyncio
+import contextvars
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from navitia_client.entities.request.base_entity_request import BaseEntityRequest
+from navitia_client.entities.response import Pagination
+
+TResult = TypeVar("TResult")
+TRequest = TypeVar("TRequest", bound=BaseEntityRequest)
+
+Page = Tuple[Sequence[TResult], Pagination]
+
+DEFAULT_FETCH_ALL_WORKERS: int = 8
+
+
+def has_next_page(pagination: Pagination) -> bool:
+    """Whether results remain after the page described by `pagination`."""
+    if pagination.items_on_page == 0 or pagination.items_per_page == 0:
+        return False
+    fetched = pagination.start_page * pagination.items_per_page
+    return fetched + pagination.items_on_page < pagination.total_result
+
+
+def remaining_pages(pagination: Pagination) -> range:
+    """Page numbers following the page described by `pagination`, up to the last one."""
+    if not has_next_page(pagination):
+        return range(0)
+    page_count = -(-pagination.total_result // pagination.items_per_page)
+    return range(pagination.start_page + 1, page_count)
+
+
+def page_request(request: TRequest, start_page: int) -> TRequest:
+    """Copy a request, pointing it at another page."""
+    new_request = copy.copy(request)
+    new_request.start_page = start_page
+    return new_request
+
+
+def iter_pages(
+    fetch_page: Callable[[TRequest], Page[TResult]],
+    request: TRequest,
+    prefetch: bool = True,
+) -> Generator[Page[TResult], None, None]:
+    """
+    Iterate over the pages of a paginated endpoint, starting at `request.start_page`.
+
+    Iteration stops once `Pagination.total_result` results have been returned, so that
+    memory use is bounded by the size of a page whatever the size of the collection.
+
+    Args:
+        fetch_page (Callable[[TRequest], Page[TResult]]): Function fetching one page,
+            such as a bound `list_*` method with every argument but the request.
+        request (TRequest): The request of the first page. It is not modified.
+        prefetch (bool): Whether the next page is fetched in a background thread while
+            the current one is consumed.
+
+    Yields:
+        Page[TResult]: The results and pagination of each page.
+    """
+    results, pagination = fetch_page(request)
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    next_page: Optional[Future[Page[TResult]]] = None
+    try:
+        while True:
+            next_request = (
+                page_request(request, pagination.start_page + 1)
+                if has_next_page(pagination)
+                else None
+            )
+            if executor is not None and next_request is not None:
+                # The copied context carries the current deadline to the worker thread
+                next_page = executor.submit(
+                    contextvars.copy_context().run, fetch_page, next_request
+                )
+            yield results, pagination
+            if next_request is None:
+                return
+            if next_page is not None:
+                results, pagination = next_page.result()
+                next_page = None
+            else:
+                results, pagination = fetch_page(next_request)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iter_results(
+    fetch_page: Callable[[TRequest], Page[TResult]],
+    request: TRequest,
+    prefetch: bool = True,
+) -> Iterator[TResult]:
+    """
+    Iterate over the results of a paginated endpoint, page after page.
+
+    See iter_pages.
+    """
+    for results, _ in iter_pages(fetch_page, request, prefetch):
+        yield from results
+
+
+def fetch_all(
+    fetch_page: Callable[[TRequest], Page[TResult]],
+    request: TRequest,
+    max_workers: int = DEFAULT_FETCH_ALL_WORKERS,
+) -> list[TResult]:
+    """
+    Fetch every result of a paginated endpoint, loading pages concurrently.
+
+    The first page gives `Pagination.total_result`, from which the remaining pages
+    are fetched in parallel by a bounded pool of threads. Results are returned in
+    page order.
+
+    Args:
+        fetch_page (Callable[[TRequest], Page[TResult]]): Function fetching one page,
+            such as a bound `list_*` method with every argument but the request.
+        request (TRequest): The request of the first page. It is not modified.
+        max_workers (int): Maximum number of pages fetched at the same time.
+
+    Returns:
+        list[TResult]: The results of every page, from `request.start_page` on.
+
+    Raises:
+        ValueError: If `max_workers` is lower than 1.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    results, pagination = fetch_page(request)
+    all_results = list(results)
+    pages = remaining_pages(pagination)
+    if not pages:
+        return all_results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+        # Each page runs in a copy of the current context to keep the deadline
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                fetch_page,
+                page_request(request, start_page),
+            )
+            for start_page in pages
+        ]
+        try:
+            for future in futures:
+                all_results.extend(future.result()[0])
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return all_results
+
+
+async def aiter_pages(
+    fetch_page: Callable[[TRequest], Awaitable[Page[TResult]]],
+    request: TRequest,
+    prefetch: bool = True,
+) -> AsyncGenerator[Page[TResult], None]:
+    """
+    Asynchronously iterate over the pages of a paginated endpoint.
+
+    See iter_pages. The next page is prefetched in a task of the running event loop.
+    """
+    results, pagination = await fetch_page(request)
+    next_page: Optional[asyncio.Future[Page[TResult]]] = None
+    try:
+        while True:
+            next_request = (
+                page_request(request, pagination.start_page + 1)
+                if has_next_page(pagination)
+                else None
+            )
+            if prefetch and next_request is not None:
+                next_page = asyncio.ensure_future(fetch_page(next_request))
+            yield results, pagination
+            if next_request is None:
+                return
+            if next_page is not None:
+                results, pagination = await next_page
+                next_page = None
+            else:
+                results, pagination = await fetch_page(next_request)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def aiter_results(
+    fetch_page: Callable[[TRequest], Awaitable[Page[TResult]]],
+    request: TRequest,
+    prefetch: bool = True,
+) -> AsyncIterator[TResult]:
+    """
+    Asynchronously iterate over the results of a paginated endpoint, page after page.
+
+    See iter_pages.
+    """
+    async for results, _ in aiter_pages(fetch_page, request, prefetch):
+        for result in results:
+            yield result
+
+
+async def afetch_all(
+    fetch_page: Callable[[TRequest], Awaitable[Page[TResult]]],
+    request: TRequest,
+    max_workers: int = DEFAULT_FETCH_ALL_WORKERS,
+) -> list[TResult]:
+    """
+    Asynchronously fetch every result of a paginated endpoint, loading pages
+    concurrently.
+
+    See fetch_all. At most `max_workers` pages are requested at the same time. When a
+    page fails, or the call is cancelled, the requests of the other pages are
+    cancelled before the exception is raised.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    results, pagination = await fetch_page(request)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch_bounded(start_page: int) -> Page[TResult]:
+        async with semaphore:
+            return await fetch_page(page_request(request, start_page))
+
+    tasks = [
+        asyncio.ensure_future(fetch_bounded(start_page))
+        for start_page in remaining_pages(pagination)
+    ]
+    try:
+        pages = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancelled requests so that none outlives the call
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    all_results = list(results)
+    for page_results, _ in pages:
+        all_results.extend(page_results)
+    return all_results
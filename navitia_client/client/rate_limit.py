@@ -0,0 +1,101 @@
+import asyncio
+import threading
+import time
+
+from navitia_client.client.deadline import remaining_time
+from navitia_client.client.exceptions import NavitiaDeadlineExceededError
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting the rate of API calls.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per second.
+    Each call takes one token. When the bucket is empty the call is not rejected: it
+    reserves the next token to come and waits for it, so callers are served in arrival
+    order and the throughput stays at the configured rate.
+
+    A single limiter can be shared by synchronous clients (`acquire`), asynchronous
+    clients (`aacquire`) and threads. Calls made within a `deadline` do not wait past
+    it: when the token would come too late, it is given back and the call fails at
+    once.
+
+    Attributes:
+        rate (float): Sustained number of calls allowed per second.
+        burst (int): Number of calls allowed at once after an idle period.
+        waits (int): Number of calls that had to wait for a token.
+        wait_time (float): Total time calls waited for a token, in seconds.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate (float): Sustained number of calls allowed per second.
+            burst (int): Capacity of the bucket.
+
+        Raises:
+            ValueError: If rate is not positive or burst is lower than 1.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.waits = 0
+        self.wait_time = 0.0
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take a token, possibly in advance, and return how long to wait for it.
+
+        Raises:
+            NavitiaDeadlineExceededError: If the token comes after the current
+                deadline. The token is given back.
+        """
+        max_delay = remaining_time()
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            delay = -self._tokens / self.rate
+            if max_delay is not None and delay > max_delay:
+                self._tokens += 1
+                raise NavitiaDeadlineExceededError("Deadline exceeded")
+            self.waits += 1
+            self.wait_time += delay
+            return delay
+
+    def acquire(self) -> None:
+        """
+        Block the current thread until a call is allowed.
+
+        Raises:
+            NavitiaDeadlineExceededError: If the call is not allowed before the current
+                deadline.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """
+        Wait, without blocking the event loop, until a call is allowed.
+
+        See acquire.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
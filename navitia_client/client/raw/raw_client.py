@@ -1,6 +1,23 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 from requests import Response, Session  # type: ignore
 
+from navitia_client.client.deadline import bound_timeouts
+from navitia_client.client.session import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    build_async_session,
+    build_session,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+    from httpx import Response as AsyncResponse
+
 
 class RawClient:
     """
@@ -11,19 +28,35 @@ class RawClient:
     Attributes:
         base_navitia_url (str): The base URL for the Navitia API.
         session (requests.Session): The session used to make HTTP requests with the provided authorization token.
+        connect_timeout (Optional[float]): Time allowed to connect, in seconds.
+        read_timeout (Optional[float]): Time allowed between bytes received, in seconds.
     """
 
-    def __init__(self, auth_token: str, base_navitia_url: str) -> None:
+    def __init__(
+        self,
+        auth_token: str,
+        base_navitia_url: str,
+        session: Optional[Session] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+    ) -> None:
         """
         Initialize the RawClient with an authorization token and base URL.
 
         Args:
             auth_token (str): The authorization token for API access.
             base_navitia_url (str): The base URL for the Navitia API.
+            session (Optional[requests.Session]): A pre-configured session to reuse.
+                A new one is built when omitted.
+            connect_timeout (Optional[float]): Time allowed to connect, in seconds.
+                None for no limit.
+            read_timeout (Optional[float]): Time allowed between bytes received, in
+                seconds. None for no limit.
         """
         self.base_navitia_url = base_navitia_url
-        self.session = Session()
-        self.session.headers.update({"Authorization": auth_token})
+        self.session = session if session is not None else build_session(auth_token)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
 
     @staticmethod
     def _generate_filter_query(filters: dict[str, Any]) -> str:
@@ -54,5 +87,80 @@ class RawClient:
             f"{self.base_navitia_url}/{endpoint}/"
             + self._generate_filter_query(filters)
         )
-        response = self.session.get(request_url)
+        response = self.session.get(
+            request_url,
+            timeout=bound_timeouts(self.connect_timeout, self.read_timeout),
+        )
         return response
+
+
+class AsyncRawClient:
+    """
+    Asynchronous client to perform raw calls on the APIs.
+
+    This class is intended for debug purposes and requires the optional `httpx` dependency.
+
+    Attributes:
+        base_navitia_url (str): The base URL for the Navitia API.
+        session (httpx.AsyncClient): The client used to make HTTP requests with the provided authorization token.
+        connect_timeout (Optional[float]): Time allowed to connect, in seconds.
+        read_timeout (Optional[float]): Time allowed between bytes received, in seconds.
+    """
+
+    _generate_filter_query = staticmethod(RawClient._generate_filter_query)
+
+    def __init__(
+        self,
+        auth_token: str,
+        base_navitia_url: str,
+        session: Optional["AsyncClient"] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the AsyncRawClient with an authorization token and base URL.
+
+        Args:
+            auth_token (str): The authorization token for API access.
+            base_navitia_url (str): The base URL for the Navitia API.
+            session (Optional[httpx.AsyncClient]): A pre-configured client to reuse.
+                A new one is built when omitted.
+            connect_timeout (Optional[float]): Time allowed to connect, in seconds.
+                None for no limit.
+            read_timeout (Optional[float]): Time allowed between bytes received, in
+                seconds. None for no limit.
+        """
+        self.base_navitia_url = base_navitia_url
+        self.session = (
+            session if session is not None else build_async_session(auth_token)
+        )
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+
+    async def call_api(self, endpoint: str, filters: dict[str, Any]) -> "AsyncResponse":
+        """
+        Perform a GET request to the specified API endpoint with the given filters.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+            filters (dict[str, Any]): A dictionary of filters to include in the API call.
+
+        Returns:
+            httpx.Response: The response from the API call.
+        """
+        request_url = (
+            f"{self.base_navitia_url}/{endpoint}/"
+            + self._generate_filter_query(filters)
+        )
+        connect_timeout, read_timeout = bound_timeouts(
+            self.connect_timeout, self.read_timeout
+        )
+        return await self.session.get(
+            request_url,
+            timeout=httpx.Timeout(
+                connect=connect_timeout,
+                read=read_timeout,
+                write=read_timeout,
+                pool=connect_timeout,
+            ),
+        )
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class NavitiaResponse:
+    """
+    Response of a Navitia API call, decoded once.
+
+    json(), text and ok behave as those of requests.Response, so that code written
+    when get_navitia_api returned a requests.Response keeps working.
+
+    Attributes:
+        url (str): The requested URL.
+        status_code (int): HTTP status code of the response.
+        content (bytes): Raw body of the response.
+        payload (Any): JSON document decoded from the body.
+        elapsed (float): Time spent on the call, body download and decoding included, in seconds.
+    """
+
+    url: str
+    status_code: int
+    content: bytes
+    payload: Any
+    elapsed: float
+
+    def json(self) -> Any:
+        """The decoded payload, as requests.Response.json() returned it."""
+        return self.payload
+
+    @property
+    def text(self) -> str:
+        """The body decoded as UTF-8, the encoding of Navitia responses."""
+        return self.content.decode("utf-8")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the status code is lower than 400."""
+        return self.status_code < 400
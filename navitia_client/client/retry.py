@@ -0,0 +1,133 @@
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+DEFAULT_RETRY_STATUSES: frozenset[int] = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS: frozenset[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Policy deciding whether and when a failed call is attempted again.
+
+    Attributes:
+        max_attempts (int): Maximum number of attempts per call, the first one included.
+            1 disables retries.
+        backoff_factor (float): Base delay in seconds; the n-th retry waits up to
+            backoff_factor * 2 ** (n - 1).
+        max_backoff (float): Upper bound of any delay in seconds, Retry-After included.
+        jitter (bool): Whether delays are drawn uniformly between 0 and the backoff
+            ("full jitter") so that concurrent clients do not retry in lockstep.
+        respect_retry_after (bool): Whether the Retry-After header of the response is
+            used as the delay when present.
+        retry_statuses (frozenset[int]): HTTP statuses triggering a retry.
+        retry_methods (frozenset[str]): HTTP methods that may be retried. Only
+            idempotent methods are allowed by default.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+
+    def allows_retry(self, method: str, attempt: int) -> bool:
+        """Whether a call using `method` may be attempted again after `attempt` tries."""
+        return attempt < self.max_attempts and method.upper() in self.retry_methods
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def compute_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute the delay to wait before the next attempt.
+
+        Args:
+            attempt (int): Number of attempts already made, starting at 1.
+            retry_after (Optional[str]): Value of the Retry-After header, if any.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.respect_retry_after and retry_after is not None:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryStats:
+    """
+    Thread-safe counters describing the cost of retries.
+
+    Attributes:
+        attempts (int): HTTP requests sent, retries included.
+        retries (int): Requests sent again after a failure.
+        exhausted (int): Calls that failed after using all their attempts.
+        backoff_time (float): Total time spent waiting between attempts, in seconds.
+        retries_by_reason (dict[str, int]): Retries per cause: the HTTP status code
+            or the name of the connection error.
+    """
+
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    backoff_time: float = 0.0
+    retries_by_reason: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def record_attempt(self) -> None:
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_time += delay
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def reset(self) -> None:
+        """Set every counter back to zero."""
+        with self._lock:
+            self.attempts = 0
+            self.retries = 0
+            self.exhausted = 0
+            self.backoff_time = 0.0
+            self.retries_by_reason = {}
@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING
+
+from requests import Session  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
+
+DEFAULT_POOL_CONNECTIONS: int = 10
+DEFAULT_POOL_MAXSIZE: int = 10
+DEFAULT_MAX_CONNECTIONS: int = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+DEFAULT_CONNECT_TIMEOUT: float = 5.0
+DEFAULT_READ_TIMEOUT: float = 30.0
+
+
+def build_session(
+    auth_token: str,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> Session:
+    """
+    Build an authenticated HTTP session backed by a configurable connection pool.
+
+    Args:
+        auth_token (str): The authorization token for API access.
+        pool_connections (int): Number of per-host connection pools to keep.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+        pool_block (bool): Whether to wait for a free connection when the pool is full
+            instead of opening a throwaway one.
+        keep_alive (bool): Whether connections are reused between requests.
+
+    Returns:
+        requests.Session: The session to share between API clients.
+    """
+    session = Session()
+    session.headers.update({"Authorization": auth_token})
+    if not keep_alive:
+        session.headers.update({"Connection": "close"})
+
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def build_async_session(
+    auth_token: str,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keep_alive: bool = True,
+) -> "AsyncClient":
+    """
+    Build an authenticated asynchronous HTTP client backed by a connection pool.
+
+    Requires the optional `httpx` dependency (`pip install python-navitia-client[async]`).
+
+    Args:
+        auth_token (str): The authorization token for API access.
+        max_connections (int): Maximum number of concurrent connections.
+        max_keepalive_connections (int): Maximum number of idle connections kept open.
+        keep_alive (bool): Whether connections are reused between requests.
+
+    Returns:
+        httpx.AsyncClient: The client to share between asynchronous API clients.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for asynchronous clients, "
+            "install it with `pip install python-navitia-client[async]`"
+        )
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections if keep_alive else 0,
+    )
+    return httpx.AsyncClient(headers={"Authorization": auth_token}, limits=limits)
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from navitia_client.client.deadline import remaining_time
+from navitia_client.client.exceptions import NavitiaDeadlineExceededError
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A call in flight, awaited by the callers asking for the same key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _follower_error(error: BaseException) -> BaseException:
+    """
+    A new exception like the one raised by a call, for a caller that waited for it.
+
+    Each caller gets its own instance, chained to the call's by the caller, so that
+    tracebacks and attributes added by one caller do not leak to the others. Errors
+    that cannot be built from their arguments are wrapped in a RuntimeError.
+    """
+    try:
+        follower_error = type(error)(*error.args)
+    except Exception:
+        return RuntimeError(f"Coalesced call failed: {error!r}")
+    follower_error.__dict__.update(error.__dict__)
+    return follower_error
+
+
+def _has_time_left() -> bool:
+    """Whether the current deadline, if any, has not passed yet."""
+    remaining = remaining_time()
+    return remaining is None or remaining > 0
+
+
+class SingleFlight:
+    """
+    Thread-safe coalescing of concurrent calls sharing the same key.
+
+    While a call for a key is in flight, other callers asking for the same key do not
+    start their own call: they wait for the first one and get its result, or a copy of
+    its exception chained to it. When the call fails on the deadline of the caller
+    that started it, the waiting callers with time left make the call again.
+
+    Attributes:
+        coalesced (int): Number of calls served by a call already in flight.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, function: Callable[[], T]) -> T:
+        """
+        Call `function`, unless a call for `key` is already in flight.
+
+        Args:
+            key (str): Identifier of the call, such as a normalized URL.
+            function (Callable[[], T]): The call to make.
+
+        Returns:
+            T: The result of the call in flight for `key`.
+
+        Raises:
+            NavitiaDeadlineExceededError: If the current deadline passes while waiting
+                for a call started by another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            if not call.done.wait(timeout=remaining_time()):
+                raise NavitiaDeadlineExceededError("Deadline exceeded")
+            if call.error is None:
+                return call.result
+            if (
+                isinstance(call.error, NavitiaDeadlineExceededError)
+                and _has_time_left()
+            ):
+                return self.do(key, function)
+            raise _follower_error(call.error) from call.error
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Coalescing of concurrent coroutine calls sharing the same key.
+
+    Asynchronous counterpart of SingleFlight. The call runs in its own task, so that
+    cancelling one of the callers does not cancel the call for the others. When the
+    call itself is cancelled, the waiting callers make it again instead of getting
+    CancelledError.
+
+    Attributes:
+        coalesced (int): Number of calls served by a call already in flight.
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `function()`, unless a call for `key` is already in flight.
+
+        See SingleFlight.do.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(function())
+            call.add_done_callback(lambda done_call: self._forget(key, done_call))
+            leader = True
+        else:
+            self.coalesced += 1
+            leader = False
+
+        # Unlike wait_for, wait leaves the call running on timeout or cancellation
+        await asyncio.wait((call,), timeout=remaining_time())
+        if not call.done():
+            raise NavitiaDeadlineExceededError("Deadline exceeded")
+        if leader:
+            return call.result()
+        if call.cancelled():
+            # The call was cancelled, not the waiting caller: make it again
+            return await self.do(key, function)
+        error = call.exception()
+        if error is None:
+            return call.result()
+        if isinstance(error, NavitiaDeadlineExceededError) and _has_time_left():
+            return await self.do(key, function)
+        raise _follower_error(error) from error
+
+    def _forget(self, key: str, call: "asyncio.Future[Any]") -> None:
+        self._calls.pop(key, None)
+        if not call.cancelled():
+            # Mark the exception as retrieved when every caller gave up waiting
+            call.exception()
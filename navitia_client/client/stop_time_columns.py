@@ -0,0 +1,160 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from navitia_client.entities.response.datetime_parser import (
+    MISSING_DATE_TIME,
+    parse_epoch_seconds,
+)
+
+# Codes of the data freshness column, by index
+DATA_FRESHNESS_CODES: tuple[str, ...] = (
+    "base_schedule",
+    "adapted_schedule",
+    "realtime",
+)
+
+# Code of a missing or unknown data freshness
+UNKNOWN_DATA_FRESHNESS: int = -1
+
+_DATA_FRESHNESS_INDEX = {name: code for code, name in enumerate(DATA_FRESHNESS_CODES)}
+
+
+@dataclass
+class StopTimeColumns:
+    """
+    Stop times of departures, arrivals or stop schedules, as one array per attribute.
+
+    Rows are built straight from the payloads of the response, without entity
+    objects. Date times are Navitia local times, as seconds since 1970-01-01T00:00:00
+    in signed 64-bit arrays, the layout of NumPy `datetime64[s]`; missing ones hold
+    MISSING_DATE_TIME, which NumPy reads as NaT.
+
+    Attributes:
+        stop_point_ids (list[str]): Stop point of each row.
+        route_ids (list[str]): Route of each row.
+        base_date_times (array): Theoretical date time of each row.
+        date_times (array): Real time date time of each row: departure date times for
+            departures, arrival date times for arrivals, date times of stop schedules.
+        data_freshness (array): Index of the data freshness of each row in
+            DATA_FRESHNESS_CODES, UNKNOWN_DATA_FRESHNESS when missing.
+    """
+
+    stop_point_ids: list[str] = field(default_factory=list)
+    route_ids: list[str] = field(default_factory=list)
+    base_date_times: array = field(default_factory=lambda: array("q"))
+    date_times: array = field(default_factory=lambda: array("q"))
+    data_freshness: array = field(default_factory=lambda: array("b"))
+
+    def __len__(self) -> int:
+        return len(self.stop_point_ids)
+
+    def append(
+        self,
+        stop_point_id: str,
+        route_id: str,
+        base_date_time: Optional[str],
+        date_time: Optional[str],
+        data_freshness: Optional[str],
+    ) -> None:
+        """Add a row, date times being given as Navitia strings."""
+        self.stop_point_ids.append(stop_point_id)
+        self.route_ids.append(route_id)
+        self.base_date_times.append(
+            parse_epoch_seconds(base_date_time) if base_date_time else MISSING_DATE_TIME
+        )
+        self.date_times.append(
+            parse_epoch_seconds(date_time) if date_time else MISSING_DATE_TIME
+        )
+        self.data_freshness.append(
+            _DATA_FRESHNESS_INDEX.get(data_freshness, UNKNOWN_DATA_FRESHNESS)  # type: ignore[arg-type]
+        )
+
+    def extend(self, other: "StopTimeColumns") -> None:
+        """Add the rows of other columns, such as those of the next page."""
+        self.stop_point_ids.extend(other.stop_point_ids)
+        self.route_ids.extend(other.route_ids)
+        self.base_date_times.extend(other.base_date_times)
+        self.date_times.extend(other.date_times)
+        self.data_freshness.extend(other.data_freshness)
+
+    @classmethod
+    def _from_stop_date_times(
+        cls, payloads: Iterable[dict[str, Any]], prefix: str
+    ) -> "StopTimeColumns":
+        columns = cls()
+        base_key = f"base_{prefix}_date_time"
+        key = f"{prefix}_date_time"
+        for payload in payloads:
+            stop_date_time = payload["stop_date_time"]
+            columns.append(
+                payload["stop_point"]["id"],
+                payload["route"]["id"],
+                stop_date_time.get(base_key),
+                stop_date_time.get(key),
+                stop_date_time.get("data_freshness"),
+            )
+        return columns
+
+    @classmethod
+    def from_departures(cls, payloads: Iterable[dict[str, Any]]) -> "StopTimeColumns":
+        """Build columns from the "departures" of a response."""
+        return cls._from_stop_date_times(payloads, "departure")
+
+    @classmethod
+    def from_arrivals(cls, payloads: Iterable[dict[str, Any]]) -> "StopTimeColumns":
+        """Build columns from the "arrivals" of a response."""
+        return cls._from_stop_date_times(payloads, "arrival")
+
+    @classmethod
+    def from_stop_schedules(
+        cls, payloads: Iterable[dict[str, Any]]
+    ) -> "StopTimeColumns":
+        """Build columns from the "stop_schedules" of a response, a row per date time."""
+        columns = cls()
+        for payload in payloads:
+            stop_point_id = payload["stop_point"]["id"]
+            route_id = payload["route"]["id"]
+            for date_time in payload["date_times"]:
+                columns.append(
+                    stop_point_id,
+                    route_id,
+                    date_time.get("base_date_time"),
+                    date_time.get("date_time"),
+                    date_time.get("data_freshness"),
+                )
+        return columns
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        NumPy arrays of the columns, by attribute name.
+
+        Date times are zero-copy `datetime64[s]` views of the arrays and data freshness
+        an int8 view; ids are object arrays. Requires NumPy, which is not a dependency
+        of navitia_client.
+        """
+        import numpy  # type: ignore
+
+        return {
+            "stop_point_ids": numpy.array(self.stop_point_ids, dtype=object),
+            "route_ids": numpy.array(self.route_ids, dtype=object),
+            "base_date_times": numpy.frombuffer(
+                self.base_date_times, dtype="datetime64[s]"
+            ),
+            "date_times": numpy.frombuffer(self.date_times, dtype="datetime64[s]"),
+            "data_freshness": numpy.frombuffer(self.data_freshness, dtype=numpy.int8),
+        }
+
+    def to_pandas(self) -> Any:
+        """
+        A pandas DataFrame of the columns, data freshness being categorical.
+
+        Requires pandas, which is not a dependency of navitia_client.
+        """
+        import pandas  # type: ignore
+
+        columns = self.to_numpy()
+        columns["data_freshness"] = pandas.Categorical.from_codes(
+            columns["data_freshness"], categories=DATA_FRESHNESS_CODES
+        )
+        return pandas.DataFrame(columns)
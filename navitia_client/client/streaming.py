@@ -0,0 +1,187 @@
+import codecs
+import json
+import re
+from typing import Any
+
+# Size of the chunks of body read at once when streaming a response
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SCALAR_START = frozenset("-0123456789tfn")
+_SCALAR_END = frozenset(" \t\n\r,]}")
+
+
+class CollectionParser:
+    """
+    Incremental parser of a Navitia response, yielding the items of a collection as
+    the body arrives.
+
+    The body must be a JSON object. The items of the array under `collection` are
+    decoded one at a time, as soon as the bytes of each are fed, and handed over by
+    `feed`, or by `close` for the last ones: only the text of the item being received
+    is buffered, whatever the size of the array. The other members of the object,
+    such as "pagination" or "error", are decoded whole into `payload`, complete once
+    the parser is closed.
+
+    Values are decoded by the C scanner of the standard json module, which reports
+    where each value ends. A value not received whole is decoded again once
+    STREAM_CHUNK_SIZE more characters, or as many as already buffered if more, have
+    been fed: fed by chunks of STREAM_CHUNK_SIZE bytes, each item is handed over
+    with the chunk completing it, and a large item is not rescanned for every chunk.
+
+    Attributes:
+        collection (str): Key of the array whose items are streamed.
+        payload (dict[str, Any]): The other members of the response.
+    """
+
+    def __init__(self, collection: str) -> None:
+        self.collection = collection
+        self.payload: dict[str, Any] = {}
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._position = 0
+        # Text received but not yet appended to the buffer, and its length
+        self._pending: list[str] = []
+        self._pending_length = 0
+        # Length of the unread text from which an incomplete value is decoded again
+        self._retry_length = 0
+        self._state = "start"
+        self._key = ""
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Add bytes of the body.
+
+        Returns:
+            list[Any]: The payloads of the items completed by these bytes.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        text = self._text_decoder.decode(chunk)
+        self._pending.append(text)
+        self._pending_length += len(text)
+        unread = len(self._buffer) - self._position + self._pending_length
+        if unread < self._retry_length:
+            return []
+        self._fill()
+        items: list[Any] = []
+        while self._step(items):
+            pass
+        return items
+
+    def close(self) -> list[Any]:
+        """
+        End the body, completing `payload`.
+
+        Returns:
+            list[Any]: The payloads of the items not handed over by `feed` yet.
+
+        Raises:
+            ValueError: If the body is incomplete or invalid.
+        """
+        self._pending.append(self._text_decoder.decode(b"", final=True))
+        self._fill()
+        self._retry_length = 0
+        items: list[Any] = []
+        while self._step(items):
+            pass
+        self._skip_whitespace()
+        if self._state != "end" or self._position < len(self._buffer):
+            raise ValueError(
+                f"Incomplete or invalid JSON body while reading {self._state!r}"
+            )
+        return items
+
+    def _fill(self) -> None:
+        """Drop the text read from the buffer, and append the pending text."""
+        self._buffer = self._buffer[self._position :] + "".join(self._pending)
+        self._position = 0
+        self._pending = []
+        self._pending_length = 0
+
+    def _skip_whitespace(self) -> bool:
+        """Skip whitespace, returning whether a character follows."""
+        self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore[union-attr]
+        return self._position < len(self._buffer)
+
+    def _expect(self, expected: str) -> str:
+        """Consume one of the expected characters."""
+        character = self._buffer[self._position]
+        if character not in expected:
+            raise ValueError(
+                f"Unexpected {character!r} in the body while reading {self._state!r}"
+            )
+        self._position += 1
+        return character
+
+    def _decode(self) -> tuple[bool, Any]:
+        """Decode the value at the position, if all of it has been received."""
+        buffer = self._buffer
+        unread = len(buffer) - self._position
+        try:
+            value, end = self._raw_decode(buffer, self._position)
+        except json.JSONDecodeError:
+            # Incomplete, or invalid, which close reports once the body has ended
+            self._retry_length = unread + max(unread, STREAM_CHUNK_SIZE)
+            return False, None
+        if buffer[self._position] in _SCALAR_START and (
+            end == len(buffer) or buffer[end] not in _SCALAR_END
+        ):
+            # More digits, or the exponent, of a number may follow
+            self._retry_length = unread + 1
+            return False, None
+        self._position = end
+        self._retry_length = 0
+        return True, value
+
+    def _step(self, items: list[Any]) -> bool:
+        """Parse the next token, returning False when more text is needed."""
+        state = self._state
+        if state == "end" or not self._skip_whitespace():
+            return False
+        character = self._buffer[self._position]
+
+        if state == "start":
+            self._expect("{")
+            self._state = "first_key"
+        elif state in ("first_key", "key"):
+            if character == "}" and state == "first_key":
+                self._position += 1
+                self._state = "end"
+                return True
+            self._expect('"')
+            self._position -= 1
+            complete, self._key = self._decode()
+            if not complete:
+                return False
+            self._state = "colon"
+        elif state == "colon":
+            self._expect(":")
+            self._state = "value"
+        elif state == "value":
+            if self._key == self.collection and character == "[":
+                self._position += 1
+                self._state = "first_item"
+                return True
+            complete, value = self._decode()
+            if not complete:
+                return False
+            self.payload[self._key] = value
+            self._state = "member_end"
+        elif state == "member_end":
+            self._state = "key" if self._expect(",}") == "," else "end"
+        elif state in ("first_item", "item"):
+            if character == "]" and state == "first_item":
+                self._position += 1
+                self._state = "member_end"
+                return True
+            complete, item = self._decode()
+            if not complete:
+                return False
+            items.append(item)
+            self._state = "item_end"
+        elif state == "item_end":
+            self._state = "item" if self._expect(",]") == "," else "member_end"
+        return True
@@ -26,6 +26,9 @@ class ArrivalRequest(BaseEntityRequest):
             Whether to disable geoJSON in the response (default is False).
         direction_type : str, optional
             The direction type of the arrivals to fetch, e.g., "all", "forward", "backward" (default is "all").
+        fields : Optional[Sequence[str]], optional
+            Dotted paths of the fields of the arrivals to parse, such as "route.id", reading others raising AttributeError.
+            Not sent to the API (default is None, parsing every field).
 
     """
 
@@ -36,6 +39,7 @@ class ArrivalRequest(BaseEntityRequest):
     data_freshness: str = "realtime"
     disable_geojson: bool = False
     direction_type: str = "all"
+    fields: Optional[Sequence[str]] = None
 
     def to_filters(self) -> Dict[str, Any]:
         """
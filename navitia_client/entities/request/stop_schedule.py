@@ -28,6 +28,9 @@ class StopScheduleRequest(BaseEntityRequest):
         Whether to disable geoJSON in the response (default is False).
     direction_type : str, optional
         The direction type of the stop schedules to fetch, e.g., "all", "forward", "backward" (default is "all").
+    fields : Optional[Sequence[str]], optional
+        Dotted paths of the fields of the stop schedules to parse, such as "route.id", reading others raising AttributeError.
+        Not sent to the API (default is None, parsing every field).
     """
 
     from_datetime: datetime = field(default_factory=datetime.now)
@@ -38,6 +41,7 @@ class StopScheduleRequest(BaseEntityRequest):
     data_freshness: str = "realtime"
     disable_geojson: bool = False
     direction_type: str = "all"
+    fields: Optional[Sequence[str]] = None
 
     def to_filters(self) -> Dict[str, Any]:
         """
@@ -41,6 +41,7 @@ class TrafficReportRequest(BaseEntityRequest):
         """
         filters: Dict[str, Any] = {
             "count": self.count,
+            "start_page": self.start_page,
             "depth": self.depth,
         }
 
@@ -4,7 +4,7 @@ from .base_entity import BaseEntity
 from .coord import Coord
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessPoint(BaseEntity):
     coord: Coord
     access_point_code: str
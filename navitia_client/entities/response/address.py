@@ -6,7 +6,7 @@ from .coord import Coord
 from .administrative_region import AdministrativeRegion
 
 
-@dataclass
+@dataclass(slots=True)
 class Address(BaseEntity):
     label: str
     coord: Coord
@@ -3,9 +3,10 @@ from datetime import datetime
 from typing import Any, Optional
 from .base_entity import BaseEntity
 from .coord import Coord
+from .datetime_parser import parse_date
 
 
-@dataclass
+@dataclass(slots=True)
 class Region(BaseEntity):
     dataset_created_at: Optional[datetime]
     end_production_date: Optional[datetime]
@@ -22,25 +23,21 @@ class Region(BaseEntity):
             dataset_created_at=datetime.fromisoformat(payload["dataset_created_at"])
             if "dataset_created_at" in payload
             else None,
-            end_production_date=datetime.strptime(
-                payload["end_production_date"], "%Y%m%d"
-            )
+            end_production_date=parse_date(payload["end_production_date"])
             if "end_production_date" in payload
             else None,
             last_load_at=datetime.fromisoformat(payload["last_load_at"])
             if "last_load_at" in payload
             else None,
             shape=payload["shape"],
-            start_production_date=datetime.strptime(
-                payload["start_production_date"], "%Y%m%d"
-            )
+            start_production_date=parse_date(payload["start_production_date"])
             if "end_production_date" in payload
             else None,
             status=payload["status"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AdministrativeRegion(BaseEntity):
     label: str
     coord: Coord
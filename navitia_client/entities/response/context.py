@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     timezone: str
     current_datetime: datetime
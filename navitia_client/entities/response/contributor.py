@@ -4,7 +4,7 @@ from typing import Any, Optional
 from navitia_client.entities.response.base_entity import BaseEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class Contributor(BaseEntity):
     license: str
     website: Optional[str]
@@ -3,9 +3,10 @@ from datetime import datetime
 from typing import Any, Optional
 
 from navitia_client.entities.response.contributor import Contributor
+from navitia_client.entities.response.datetime_parser import parse_datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Dataset:
     contributor: Contributor
     description: Optional[str]
@@ -20,13 +21,9 @@ class Dataset:
         return cls(
             contributor=Contributor.from_payload(payload["contributor"]),
             description=payload["description"],
-            end_validation_date=datetime.strptime(
-                payload["end_validation_date"], "%Y%m%dT%H%M%S"
-            ),
+            end_validation_date=parse_datetime(payload["end_validation_date"]),
             id=payload["id"],
             realtime_level=payload["realtime_level"],
-            start_validation_date=datetime.strptime(
-                payload["start_validation_date"], "%Y%m%dT%H%M%S"
-            ),
+            start_validation_date=parse_datetime(payload["start_validation_date"]),
             system=payload["system"],
         )
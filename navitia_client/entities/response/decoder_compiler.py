@@ -0,0 +1,165 @@
+from functools import lru_cache
+from typing import Any, Callable, TypeVar, Union
+
+from navitia_client.entities.response.datetime_parser import parse_date, parse_datetime
+from navitia_client.entities.response.field_rules import (
+    FieldRule,
+    field_rules,
+    follows_field_rules,
+    is_entity,
+)
+from navitia_client.entities.response.identity_map import (
+    current_identity_map,
+    is_identity_mapped,
+)
+from navitia_client.entities.response.lazy import FieldParser
+from navitia_client.entities.response.link import LinkList
+
+TEntity = TypeVar("TEntity")
+
+Decoder = Callable[[dict[str, Any]], Any]
+
+_CONVERTERS: dict[str, str] = {
+    "value": "{}",
+    "bool": "bool({})",
+    "datetime": "parse_datetime({})",
+    "date": "parse_date({})",
+    "links": "LinkList({})",
+}
+
+
+class _Compiler:
+    """Generates the source of the decoders of an entity and the entities it holds."""
+
+    def __init__(self) -> None:
+        self.namespace: dict[str, Any] = {
+            "parse_date": parse_date,
+            "parse_datetime": parse_datetime,
+            "LinkList": LinkList,
+            "current_identity_map": current_identity_map,
+        }
+        self.names: dict[type, str] = {}
+        self.sources: list[str] = []
+
+    def name(self, target: type) -> str:
+        """Name of the class in the namespace of the generated code."""
+        name = self.names.get(target)
+        if name is None:
+            name = self.names[target] = f"{target.__name__}_{len(self.names)}"
+            self.namespace[name] = target
+        return name
+
+    def decoder(self, entity_class: type) -> str:
+        """Name of the decoder of an entity, generating it on first use."""
+        if entity_class not in self.names:
+            name = self.name(entity_class)
+            if not follows_field_rules(entity_class):
+                self.namespace[f"decode_{name}"] = entity_class.from_payload  # type: ignore[attr-defined]
+            else:
+                self.sources.append(self.source(entity_class, name))
+        return f"decode_{self.name(entity_class)}"
+
+    def convert(self, rule: FieldRule, value: str) -> str:
+        if rule.kind == "entity":
+            converter = self.decoder(rule.target) + "({})"  # type: ignore[arg-type]
+        elif rule.kind == "enum":
+            converter = self.name(rule.target) + "({})"  # type: ignore[arg-type]
+        else:
+            converter = _CONVERTERS[rule.kind]
+        if rule.many:
+            return f"[{converter.format('item')} for item in {value}]"
+        return converter.format(value)
+
+    def expression(
+        self, name: str, field: str, rule: Union[FieldRule, FieldParser]
+    ) -> str:
+        if not isinstance(rule, FieldRule):
+            parser = f"parse_{name}_{field}"
+            self.namespace[parser] = rule
+            return f"{parser}(payload)"
+        key = repr(rule.key)
+        if rule.presence == "required":
+            return self.convert(rule, f"payload[{key}]")
+        if rule.presence == "optional":
+            return (
+                f"{self.convert(rule, f'payload[{key}]')} if {key} in payload else None"
+            )
+        if rule.kind == "value" and not rule.many:
+            return f"payload.get({key})"
+        return (
+            f"None if (value := payload.get({key})) is None "
+            f"else {self.convert(rule, 'value')}"
+        )
+
+    def source(self, entity_class: type, name: str) -> str:
+        arguments = [
+            self.expression(name, field, rule)
+            for field, rule in field_rules(entity_class).items()
+        ]
+        if not is_identity_mapped(entity_class):
+            return f"def decode_{name}(payload):\n{_build(name, arguments, indent=1)}"
+        # As with identity_mapped: build the entity, or get it from the active map
+        return (
+            f"def build_{name}(cls, payload):\n"
+            f"{_build('cls', arguments, indent=1)}\n"
+            f"def decode_{name}(payload):\n"
+            f"    identity_map = current_identity_map()\n"
+            f"    if identity_map is None:\n"
+            f"{_build(name, arguments, indent=2)}"
+            f"    return identity_map.get_or_parse({name}, payload, build_{name})\n"
+        )
+
+
+def _build(constructor: str, arguments: list[str], indent: int) -> str:
+    """Source of a return statement building an entity from positional arguments."""
+    margin = "    " * indent
+    lines = "".join(f"{margin}    {argument},\n" for argument in arguments)
+    return f"{margin}return {constructor}(\n{lines}{margin})\n"
+
+
+@lru_cache(maxsize=None)
+def _compile(entity_class: type) -> tuple[Decoder, str]:
+    compiler = _Compiler()
+    decoder = compiler.decoder(entity_class)
+    source = "\n".join(compiler.sources)
+    exec(
+        compile(source, f"<decoder of {entity_class.__name__}>", "exec"),
+        compiler.namespace,
+    )
+    return compiler.namespace[decoder], source
+
+
+def compile_decoder(entity_class: type[TEntity]) -> Callable[[dict[str, Any]], TEntity]:
+    """
+    Get a decoder building an entity from its payload, generated from its fields.
+
+    The decoder is equivalent to `entity_class.from_payload`, but is a single function
+    per entity class, generated from the annotations of its fields: nested entities
+    are decoded by their own generated function, called directly, and entities are
+    built with positional arguments. Fields annotated as Optional decode to None when
+    missing, other missing fields raise KeyError. Entities whose from_payload does not
+    follow their annotations keep being decoded by it. Entities having an id go
+    through the active identity map, as with from_payload.
+
+    Decoders are generated on first use and cached.
+
+    Args:
+        entity_class (type[TEntity]): A response entity dataclass with a
+            from_payload class method.
+
+    Returns:
+        Callable[[dict[str, Any]], TEntity]: The decoder of the entity.
+
+    Raises:
+        TypeError: If the class is not a response entity.
+    """
+    if not is_entity(entity_class):
+        raise TypeError(f"{entity_class!r} is not a response entity")
+    return _compile(entity_class)[0]  # type: ignore[arg-type]
+
+
+def decoder_source(entity_class: type) -> str:
+    """Source of the functions generated for an entity, for debugging."""
+    if not is_entity(entity_class):
+        raise TypeError(f"{entity_class!r} is not a response entity")
+    return _compile(entity_class)[1]
@@ -6,7 +6,7 @@ from navitia_client.entities.response.stop_area import StopPoint
 from navitia_client.entities.response.stop_datetime import StopDateTime
 
 
-@dataclass
+@dataclass(slots=True)
 class Departure:
     route: Route
     stop_date_time: StopDateTime
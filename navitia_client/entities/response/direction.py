@@ -4,7 +4,7 @@ from navitia_client.entities.response.base_entity import BaseEntity
 from navitia_client.entities.response.stop_area import StopArea
 
 
-@dataclass
+@dataclass(slots=True)
 class Direction(BaseEntity):
     embedded_type: str
     quality: int
@@ -4,7 +4,7 @@ from typing import Any, Optional, Sequence
 from .equipment import Equipment
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayInformation:
     network: str
     physical_mode: Optional[str]
@@ -3,6 +3,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional, Sequence
 
+from .datetime_parser import parse_datetime
 from .pt_object import PtObject
 from .line_and_route import Route
 from .stop_area import StopPoint
@@ -28,7 +29,7 @@ class Effect(Enum):
     ACCESSIBILITY_ISSUE = "ACCESSIBILITY_ISSUE"
 
 
-@dataclass
+@dataclass(slots=True)
 class Severity:
     color: str
     priority: int | None
@@ -45,7 +46,7 @@ class Severity:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DisruptionPeriod:
     begin: datetime
     end: datetime
@@ -53,12 +54,12 @@ class DisruptionPeriod:
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "DisruptionPeriod":
         return cls(
-            begin=datetime.strptime(payload["begin"], "%Y%m%dT%H%M%S"),
-            end=datetime.strptime(payload["end"], "%Y%m%dT%H%M%S"),
+            begin=parse_datetime(payload["begin"]),
+            end=parse_datetime(payload["end"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
     id: str
     content_type: str
@@ -71,7 +72,7 @@ class Channel:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DisruptionMessage:
     text: str
     channel: Channel
@@ -83,7 +84,7 @@ class DisruptionMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpactedSection:
     section_from: PtObject
     section_to: PtObject
@@ -107,7 +108,7 @@ class StopTimeEffect(Enum):
     UNCHANGED = "unchanged"
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpactedStop:
     stop_point: StopPoint
     amended_departure_time: str
@@ -140,7 +141,7 @@ class ImpactedStop:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpactedObject:
     pt_object: Optional[PtObject]
     impacted_section: Optional[ImpactedSection]
@@ -170,7 +171,7 @@ class ImpactedObject:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Disruption:
     id: str
     status: Optional[DisruptionStatus]
@@ -223,7 +224,7 @@ class Disruption:
             else None,
             application_periods=application_periods,
             messages=messages,
-            updated_at=datetime.strptime(payload["updated_at"], "%Y%m%dT%H%M%S")
+            updated_at=parse_datetime(payload["updated_at"])
             if "updated_at" in payload
             else None,
             impacted_objects=impacted_objects,
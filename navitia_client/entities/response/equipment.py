@@ -22,7 +22,7 @@ class Equipment(Enum):
     BIKE_DEPOT = "has_bike_depot"
 
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     label: str
 
@@ -31,7 +31,7 @@ class Label:
         return cls(label=data.get("label", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class Period:
     begin: str
     end: str
@@ -41,7 +41,7 @@ class Period:
         return cls(begin=data.get("begin", ""), end=data.get("end", ""))
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentAvailability:
     status: str
     cause: Optional[Label] = None
@@ -64,7 +64,7 @@ class EquipmentAvailability:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentDetails(BaseEntity):
     embedded_type: str
     current_availability: Optional[EquipmentAvailability] = None
@@ -83,7 +83,7 @@ class EquipmentDetails(BaseEntity):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StopAreaEquipments:
     equipment_details: List[EquipmentDetails]
     stop_area: Optional[StopArea] = None
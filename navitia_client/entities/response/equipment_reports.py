@@ -5,7 +5,7 @@ from .line_and_route import Line
 from .equipment import StopAreaEquipments
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipmentReports:
     line: Optional[Line] = None
     stop_area_equipments: List[StopAreaEquipments] = field(default_factory=list)
@@ -0,0 +1,274 @@
+import dataclasses
+import inspect
+import types
+import typing
+from collections.abc import Sequence as SequenceABC
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+from navitia_client.entities.response.address import Address
+from navitia_client.entities.response.administrative_region import Region
+from navitia_client.entities.response.company import Company
+from navitia_client.entities.response.contributor import Contributor
+from navitia_client.entities.response.coord import Coord
+from navitia_client.entities.response.dataset import Dataset
+from navitia_client.entities.response.datetime_parser import parse_date, parse_datetime
+from navitia_client.entities.response.display_information import DisplayInformation
+from navitia_client.entities.response.disruption import Disruption
+from navitia_client.entities.response.equipment import (
+    Equipment,
+    EquipmentAvailability,
+    EquipmentDetails,
+    Label,
+    Period,
+    StopAreaEquipments,
+)
+from navitia_client.entities.response.equipment_reports import EquipmentReports
+from navitia_client.entities.response.free_floating import FreeFloating
+from navitia_client.entities.response.lazy import FieldParser
+from navitia_client.entities.response.line_and_route import Line
+from navitia_client.entities.response.line_report import LineReport
+from navitia_client.entities.response.link import Link, LinkList
+from navitia_client.entities.response.path import Path
+from navitia_client.entities.response.physical_mode import PhysicalMode
+from navitia_client.entities.response.pt_datetime import PTDatetime
+from navitia_client.entities.response.schedule_table import ScheduleTable
+from navitia_client.entities.response.stop_area import StopPoint
+from navitia_client.entities.response.stop_schedule import (
+    AdditionalInformationEnum,
+    StopSchedule,
+    TerminusSchedule,
+)
+from navitia_client.entities.response.vehicle_journey import (
+    ActivePeriod,
+    ValidityPattern,
+)
+
+
+class FieldRule(NamedTuple):
+    """
+    How the from_payload of an entity parses one of its fields.
+
+    Rules are derived from the annotations of the fields, adjusted by the overrides of
+    this module, and are shared by the compiled decoders, the projections and the
+    lazy entities, so that they all parse a field as from_payload does.
+    """
+
+    key: str
+    # "required": a missing key raises KeyError and a null value is converted.
+    # "optional": a missing key gives None, a null value is converted.
+    # "nullable": a missing key or a null value gives None.
+    presence: str
+    # One of "value", "bool", "datetime", "date", "links", "enum" or "entity"
+    kind: str
+    # Enum or entity class of "enum" and "entity" fields
+    target: Optional[type] = None
+    # The value is a list of items to convert, copied even for "value" items
+    many: bool = False
+
+    def converter(self) -> Callable[[Any], Any]:
+        """Function converting a value, or each item of a list, of the field."""
+        if self.kind in ("entity", "enum"):
+            target: Any = self.target
+            return target.from_payload if self.kind == "entity" else target
+        return _CONVERTERS[self.kind]
+
+    def parser(self, convert: Optional[Callable[[Any], Any]] = None) -> FieldParser:
+        """
+        Function parsing the field from the payload of the entity.
+
+        Args:
+            convert (Optional[Callable[[Any], Any]]): Function converting the value,
+                or each item of a list. Defaults to the converter of the rule.
+        """
+        key = self.key
+        convert_value = convert if convert is not None else self.converter()
+        to_field: Callable[[Any], Any] = (
+            (lambda value: [convert_value(item) for item in value])
+            if self.many
+            else convert_value
+        )
+        if self.presence == "required":
+            return lambda payload: to_field(payload[key])
+        if self.presence == "optional":
+            return lambda payload: to_field(payload[key]) if key in payload else None
+        return lambda payload: (
+            None if (value := payload.get(key)) is None else to_field(value)
+        )
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "value": lambda value: value,
+    "bool": bool,
+    "datetime": parse_datetime,
+    "date": parse_date,
+    "links": LinkList,
+}
+
+# Entities whose from_payload cannot be derived from their fields: they use defaults
+# for missing keys, read a key guarded by another one... Entities whose from_payload
+# takes options, such as Journey, Section or Isochrone, cannot be derived either.
+_HAND_WRITTEN: frozenset[type] = frozenset(
+    {
+        Address,
+        Company,
+        Disruption,
+        EquipmentAvailability,
+        EquipmentDetails,
+        EquipmentReports,
+        FreeFloating,
+        Label,
+        Period,
+        Region,
+        StopAreaEquipments,
+    }
+)
+
+_STOP_SCHEDULE_OVERRIDES: dict[str, Union[dict[str, Any], FieldParser]] = {
+    "additional_informations": lambda payload: (
+        AdditionalInformationEnum(payload["additional_informations"])
+        if payload["additional_informations"]
+        else None
+    )
+}
+
+# Fields whose from_payload departs from the rule derived from their annotation:
+# replaced attributes of the rule, or a parser of the field
+_FIELD_OVERRIDES: dict[type, dict[str, Union[dict[str, Any], FieldParser]]] = {
+    ActivePeriod: {"begin": {"kind": "date"}, "end": {"kind": "date"}},
+    Contributor: {"website": {"presence": "required"}},
+    Coord: {"lon": {"presence": "nullable"}, "lat": {"presence": "nullable"}},
+    Dataset: {
+        "description": {"presence": "required"},
+        "system": {"presence": "required"},
+    },
+    DisplayInformation: {
+        "equipments": lambda payload: (
+            [Equipment(equipment) for equipment in payload["equipments"]]
+            if payload.get("equipments")
+            else None
+        )
+    },
+    Line: {"text_color": {"presence": "required"}},
+    LineReport: {"pt_objets": {"key": "pt_objects"}},
+    Path: {"segments": {"key": "path_items"}},
+    PhysicalMode: {
+        "id": {"kind": "value"},
+        "co2_emission_rate": {"kind": "value", "target": None},
+    },
+    PTDatetime: {
+        "departure_date_time": {"kind": "date"},
+        "arrival_date_time": {"kind": "date"},
+    },
+    ScheduleTable: {"_payload": lambda payload: payload},
+    StopPoint: {"equipments": {"many": False}},
+    StopSchedule: _STOP_SCHEDULE_OVERRIDES,
+    TerminusSchedule: _STOP_SCHEDULE_OVERRIDES,
+    ValidityPattern: {"beginning_date": {"kind": "date"}},
+}
+
+
+def is_entity(annotation: Any) -> bool:
+    """Whether an annotation is a response entity, a dataclass with from_payload."""
+    return dataclasses.is_dataclass(annotation) and hasattr(annotation, "from_payload")
+
+
+def _is_enum(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
+
+
+def follows_field_rules(entity_class: type) -> bool:
+    """Whether the from_payload of an entity parses each field as its rule says."""
+    if not is_entity(entity_class) or entity_class in _HAND_WRITTEN:
+        return False
+    from_payload: Any = getattr(entity_class, "from_payload")
+    return len(inspect.signature(from_payload).parameters) == 1
+
+
+def _field_rule(name: str, annotation: Any) -> FieldRule:
+    """The rule of a field, from its annotation."""
+    # Names clashing with a keyword, such as from_, end with an underscore
+    key = name[:-1] if name.endswith("_") else name
+    optional = False
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        arguments = [
+            arg for arg in typing.get_args(annotation) if arg is not type(None)
+        ]
+        optional = len(arguments) < len(typing.get_args(annotation))
+        annotation = arguments[0] if len(arguments) == 1 else Any
+
+    many = False
+    origin = typing.get_origin(annotation)
+    if isinstance(origin, type) and issubclass(origin, SequenceABC):
+        (annotation,) = typing.get_args(annotation) or (Any,)
+        many = annotation is not Link
+
+    target = None
+    if annotation is Link:
+        kind = "links"
+    elif annotation is bool:
+        kind = "bool"
+    elif annotation is datetime:
+        kind = "datetime"
+    elif _is_enum(annotation) or is_entity(annotation):
+        kind = "enum" if _is_enum(annotation) else "entity"
+        target = annotation
+    else:
+        kind = "value"
+
+    # Optional values are read with get, optional lists and objects when present
+    if not optional:
+        presence = "required"
+    elif many or kind in ("links", "enum", "entity"):
+        presence = "optional"
+    else:
+        presence = "nullable"
+    return FieldRule(key, presence, kind, target, many)
+
+
+@lru_cache(maxsize=None)
+def field_rules(entity_class: type) -> dict[str, Union[FieldRule, FieldParser]]:
+    """
+    The rule of every field of an entity, in the order of its __init__, or the
+    parser of the fields parsed by from_payload in their own way.
+
+    Args:
+        entity_class (type): A response entity.
+
+    Returns:
+        dict[str, Union[FieldRule, FieldParser]]: The rule or parser of each field.
+    """
+    hints = typing.get_type_hints(entity_class)
+    overrides = _FIELD_OVERRIDES.get(entity_class, {})
+    rules: dict[str, Union[FieldRule, FieldParser]] = {}
+    for field in dataclasses.fields(entity_class):
+        if not field.init:
+            continue
+        override = overrides.get(field.name)
+        if callable(override):
+            rules[field.name] = override
+            continue
+        rule = _field_rule(field.name, hints[field.name])
+        rules[field.name] = rule._replace(**override) if override else rule
+    return rules
+
+
+def field_parsers(entity_class: type, names: Iterable[str]) -> dict[str, FieldParser]:
+    """
+    Parsers of some fields of an entity, such as the lazy fields of its variant.
+
+    Args:
+        entity_class (type): A response entity.
+        names (Iterable[str]): The names of the fields.
+
+    Returns:
+        dict[str, FieldParser]: The parser of each field, by name.
+    """
+    rules = field_rules(entity_class)
+    parsers: dict[str, FieldParser] = {}
+    for name in names:
+        rule = rules[name]
+        parsers[name] = rule.parser() if isinstance(rule, FieldRule) else rule
+    return parsers
@@ -4,7 +4,7 @@ from typing import Dict, Any, Optional
 from .coord import Coord
 
 
-@dataclass
+@dataclass(slots=True)
 class FreeFloating:
     """
     Represents a free-floating shared mobility vehicle (bike, scooter, car, etc.).
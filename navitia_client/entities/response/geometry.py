@@ -0,0 +1,221 @@
+from array import array
+from itertools import chain
+from math import asin, cos, radians, sin, sqrt
+from typing import Any, Optional, Sequence
+
+# Mean radius of the Earth, in meters
+EARTH_RADIUS: float = 6_371_008.8
+
+# Nesting depth of the coordinates of each GeoJSON geometry type
+_DEPTHS: dict[str, int] = {
+    "Point": 0,
+    "MultiPoint": 1,
+    "LineString": 1,
+    "MultiLineString": 2,
+    "Polygon": 2,
+    "MultiPolygon": 3,
+}
+
+
+def _haversine(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Great-circle distance between two positions, in meters."""
+    lon1, lat1, lon2, lat2 = map(radians, (lon1, lat1, lon2, lat2))
+    h = (
+        sin((lat2 - lat1) / 2) ** 2
+        + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * asin(sqrt(h))
+
+
+class Geometry:
+    """
+    GeoJSON geometry holding its coordinates in a flat array of doubles.
+
+    Positions are stored as lon, lat pairs in a single array('d'), 16 bytes per
+    position instead of more than 100 for a list of two floats. As in GeoArrow, the
+    parts of nested geometries are described by offset arrays, from the outermost
+    level: for a MultiPolygon, offsets[0] delimits the rings of each polygon and
+    offsets[1] the positions of each ring.
+
+    Attributes:
+        type (str): GeoJSON type, such as "LineString" or "MultiPolygon".
+        coordinates (array): Longitude and latitude of every position, interleaved.
+        offsets (tuple[array, ...]): Boundaries of the parts of each nesting level.
+        foreign_members (Optional[dict[str, Any]]): Other members of the GeoJSON
+            object, such as the "properties" of section geometries.
+    """
+
+    __slots__ = ("type", "coordinates", "offsets", "foreign_members")
+
+    def __init__(
+        self,
+        type: str,
+        coordinates: array,
+        offsets: tuple[array, ...] = (),
+        foreign_members: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.type = type
+        self.coordinates = coordinates
+        self.offsets = offsets
+        self.foreign_members = foreign_members
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "Geometry":
+        """
+        Build a geometry from a GeoJSON geometry object with 2D positions.
+
+        Raises:
+            ValueError: For GeometryCollection and unknown types, or positions that
+                are not lon, lat pairs.
+        """
+        geometry_type = payload["type"]
+        depth = _DEPTHS.get(geometry_type)
+        if depth is None:
+            raise ValueError(f"Unsupported geometry type {geometry_type!r}")
+
+        coordinates = array("d")
+        offsets = tuple(array("I", [0]) for _ in range(depth - 1))
+        if depth == 0:
+            positions = 1
+            coordinates.extend(payload["coordinates"])
+        else:
+            positions = _flatten(payload["coordinates"], depth, 0, coordinates, offsets)
+            if depth > 1:
+                positions = offsets[-1][-1]
+        if len(coordinates) != 2 * positions:
+            raise ValueError("Geometry positions must be [lon, lat] pairs")
+
+        foreign_members = {
+            key: value
+            for key, value in payload.items()
+            if key != "type" and key != "coordinates"
+        }
+        return cls(geometry_type, coordinates, offsets, foreign_members or None)
+
+    def __len__(self) -> int:
+        """Number of positions."""
+        return len(self.coordinates) // 2
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Geometry):
+            return NotImplemented
+        return (
+            self.type == other.type
+            and self.coordinates == other.coordinates
+            and self.offsets == other.offsets
+            and self.foreign_members == other.foreign_members
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Geometry(type={self.type!r}, positions={len(self)})"
+
+    def position(self, index: int) -> tuple[float, float]:
+        """Longitude and latitude of a position."""
+        if index < 0:
+            index += len(self)
+        return self.coordinates[2 * index], self.coordinates[2 * index + 1]
+
+    def view(self) -> "memoryview[float]":
+        """Zero-copy, read-only view of the positions, of shape (positions, 2)."""
+        return (
+            memoryview(self.coordinates)
+            .toreadonly()
+            .cast("B")
+            .cast("d", (len(self), 2))
+        )
+
+    def to_numpy(self) -> Any:
+        """
+        Zero-copy NumPy array of the positions, of shape (positions, 2).
+
+        Requires NumPy, which is not a dependency of navitia_client.
+        """
+        import numpy  # type: ignore
+
+        return numpy.frombuffer(self.coordinates, dtype=numpy.float64).reshape(-1, 2)
+
+    @property
+    def bbox(self) -> Optional[tuple[float, float, float, float]]:
+        """(min lon, min lat, max lon, max lat), None for an empty geometry."""
+        if not self.coordinates:
+            return None
+        lons = self.coordinates[0::2]
+        lats = self.coordinates[1::2]
+        return min(lons), min(lats), max(lons), max(lats)
+
+    def _lines(self) -> Sequence[tuple[int, int]]:
+        """Start and stop position of each line or ring."""
+        if self.type in ("Point", "MultiPoint"):
+            return []
+        if not self.offsets:
+            return [(0, len(self))]
+        boundaries = self.offsets[-1]
+        return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+
+    def length(self) -> float:
+        """
+        Length of the lines, or perimeter of the rings, in meters.
+
+        Distances between positions are great-circle distances; points have no length.
+        """
+        coordinates = self.coordinates
+        total = 0.0
+        for start, stop in self._lines():
+            for index in range(start, stop - 1):
+                total += _haversine(*coordinates[2 * index : 2 * index + 4])
+        return total
+
+    def to_geojson(self) -> dict[str, Any]:
+        """The GeoJSON geometry object, as given by Navitia."""
+        depth = _DEPTHS[self.type]
+        if depth == 0:
+            nested: Any = list(self.coordinates)
+        elif depth == 1:
+            nested = self._nest(1, 0, 0, len(self))
+        else:
+            nested = self._nest(depth, 0, 0, len(self.offsets[0]) - 1)
+        geojson: dict[str, Any] = {"type": self.type, "coordinates": nested}
+        if self.foreign_members:
+            geojson.update(self.foreign_members)
+        return geojson
+
+    def _nest(self, depth: int, level: int, start: int, stop: int) -> list[Any]:
+        if depth == 1:
+            coordinates = self.coordinates
+            return [
+                [coordinates[2 * index], coordinates[2 * index + 1]]
+                for index in range(start, stop)
+            ]
+        boundaries = self.offsets[level]
+        return [
+            self._nest(depth - 1, level + 1, boundaries[index], boundaries[index + 1])
+            for index in range(start, stop)
+        ]
+
+
+def _flatten(
+    nested: Sequence[Any],
+    depth: int,
+    level: int,
+    coordinates: array,
+    offsets: tuple[array, ...],
+) -> int:
+    """Append the positions of nested coordinates, returning their number of parts."""
+    if depth == 1:
+        coordinates.extend(chain.from_iterable(nested))
+        return len(nested)
+    boundaries = offsets[level]
+    for part in nested:
+        boundaries.append(
+            boundaries[-1] + _flatten(part, depth - 1, level + 1, coordinates, offsets)
+        )
+    return len(nested)
+
+
+def parse_geojson(payload: Optional[dict[str, Any]], compact: bool) -> Any:
+    """The geometry of a payload, as a Geometry when `compact`, as is otherwise."""
+    if payload is None or not compact:
+        return payload
+    return Geometry.from_payload(payload)
@@ -0,0 +1,160 @@
+import contextvars
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, Optional, TypeVar
+
+TEntity = TypeVar("TEntity")
+
+# Default number of entities kept by an identity map
+DEFAULT_IDENTITY_MAP_MAX_SIZE: int = 100_000
+
+
+class IdentityMap:
+    """
+    Entities already parsed, keyed by class, id and set of payload keys.
+
+    Within a response, the same line, route, network, stop point... is repeated many
+    times. Parsing them through an identity map builds each of them once and shares
+    the instance, saving both parse time and memory. Shared entities must not be
+    mutated.
+
+    Payloads are matched on their set of keys too, so that a route nested without its
+    line does not stand for the same route given with its line. Nested objects are not
+    compared: a map shared between responses must only see responses requested with
+    the same depth.
+
+    The map is thread-safe and keeps at most `max_size` entities, evicting the least
+    recently used one when full. Entities are parsed outside of the lock: two threads
+    parsing the same new payload at once both parse it, and share the first instance
+    stored.
+
+    Attributes:
+        max_size (int): Maximum number of entities kept.
+        hits (int): Number of entities served from the map.
+        misses (int): Number of entities parsed and added to the map.
+        evictions (int): Number of entities dropped to make room for new ones.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_IDENTITY_MAP_MAX_SIZE) -> None:
+        """
+        Initialize an empty map.
+
+        Args:
+            max_size (int): Maximum number of entities kept.
+
+        Raises:
+            ValueError: If max_size is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entities: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get_or_parse(
+        self,
+        cls: type[TEntity],
+        payload: dict[str, Any],
+        parse: Callable[[type[TEntity], dict[str, Any]], TEntity],
+    ) -> TEntity:
+        """
+        Return the entity of a payload, parsing it with `parse` when not mapped yet.
+
+        Payloads without id are always parsed.
+        """
+        entity_id = payload.get("id")
+        if entity_id is None:
+            return parse(cls, payload)
+
+        key = (cls, entity_id, tuple(payload))
+        with self._lock:
+            entity = self._entities.get(key)
+            if entity is not None:
+                self._entities.move_to_end(key)
+                self.hits += 1
+                return entity
+
+        # Nested entities go through the map too, so the lock is not held while parsing
+        parsed = parse(cls, payload)
+        with self._lock:
+            entity = self._entities.setdefault(key, parsed)
+            self._entities.move_to_end(key)
+            if entity is parsed:
+                self.misses += 1
+                while len(self._entities) > self.max_size:
+                    self._entities.popitem(last=False)
+                    self.evictions += 1
+            else:
+                self.hits += 1
+        return entity
+
+    def clear(self) -> None:
+        """Forget every entity. Statistics are kept."""
+        with self._lock:
+            self._entities.clear()
+
+
+# Attribute marking the from_payload functions decorated with identity_mapped
+_IDENTITY_MAPPED = "__navitia_identity_mapped__"
+
+_identity_map: contextvars.ContextVar[Optional[IdentityMap]] = contextvars.ContextVar(
+    "navitia_identity_map", default=None
+)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    """The identity map of the current scope, None outside of any scope."""
+    return _identity_map.get()
+
+
+@contextmanager
+def identity_scope(identity_map: Optional[IdentityMap] = None) -> Iterator[IdentityMap]:
+    """
+    Parse the entities of the block through an identity map.
+
+    Args:
+        identity_map (Optional[IdentityMap]): The map to use, a new one by default.
+
+    Yields:
+        IdentityMap: The map in use.
+    """
+    scope_map = identity_map if identity_map is not None else IdentityMap()
+    token = _identity_map.set(scope_map)
+    try:
+        yield scope_map
+    finally:
+        _identity_map.reset(token)
+
+
+def identity_mapped(
+    from_payload: Callable[[type[TEntity], dict[str, Any]], TEntity],
+) -> Callable[[type[TEntity], dict[str, Any]], TEntity]:
+    """
+    Decorate the from_payload function of an entity having an id, below @classmethod,
+    so that it goes through the active identity map, if any.
+    """
+
+    @functools.wraps(from_payload)
+    def wrapper(cls: type[TEntity], payload: dict[str, Any]) -> TEntity:
+        identity_map = _identity_map.get()
+        if identity_map is None:
+            return from_payload(cls, payload)
+        return identity_map.get_or_parse(cls, payload, from_payload)
+
+    setattr(wrapper, _IDENTITY_MAPPED, True)
+    return wrapper
+
+
+def is_identity_mapped(entity_class: type) -> bool:
+    """Whether the from_payload of an entity is decorated with identity_mapped."""
+    from_payload = vars(entity_class).get("from_payload")
+    return getattr(getattr(from_payload, "__func__", None), _IDENTITY_MAPPED, False)
@@ -2,10 +2,12 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from navitia_client.entities.response.datetime_parser import parse_datetime
+from navitia_client.entities.response.geometry import parse_geojson
 from navitia_client.entities.response.place import Place
 
 
-@dataclass
+@dataclass(slots=True)
 class Isochrone:
     from_: Place
     geojson: Any
@@ -16,15 +18,20 @@ class Isochrone:
     requested_date_time: datetime
 
     @classmethod
-    def from_payload(cls, payload: dict[str, Any]) -> "Isochrone":
+    def from_payload(
+        cls, payload: dict[str, Any], compact_geometry: bool = False
+    ) -> "Isochrone":
+        """
+        Build an isochrone from its payload.
+
+        With `compact_geometry`, geojson is a Geometry instead of nested lists.
+        """
         return cls(
             from_=Place.from_payload(payload["from"]),
-            geojson=payload["geojson"],
-            max_date_time=datetime.strptime(payload["max_date_time"], "%Y%m%dT%H%M%S"),
+            geojson=parse_geojson(payload["geojson"], compact_geometry),
+            max_date_time=parse_datetime(payload["max_date_time"]),
             max_duration=payload["max_duration"],
-            min_date_time=datetime.strptime(payload["min_date_time"], "%Y%m%dT%H%M%S"),
+            min_date_time=parse_datetime(payload["min_date_time"]),
             min_duration=payload["min_duration"],
-            requested_date_time=datetime.strptime(
-                payload["requested_date_time"], "%Y%m%dT%H%M%S"
-            ),
+            requested_date_time=parse_datetime(payload["requested_date_time"]),
         )
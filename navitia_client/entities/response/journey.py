@@ -3,7 +3,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional, Sequence
 
+from navitia_client.entities.response.datetime_parser import parse_datetime
 from navitia_client.entities.response.display_information import DisplayInformation
+from navitia_client.entities.response.field_rules import field_parsers
+from navitia_client.entities.response.geometry import parse_geojson
+from navitia_client.entities.response.lazy import FieldParser, lazy_variant, new_lazy
 from navitia_client.entities.response.link import Link
 from navitia_client.entities.response.path import Path
 from navitia_client.entities.response.place import Place
@@ -45,7 +49,7 @@ class SectionTransferType(Enum):
     STAY_IN = "stay_in"
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     type: SectionType
     id: str
@@ -63,42 +67,48 @@ class Section:
     arrival_date_time: datetime
 
     @classmethod
-    def from_payload(cls, payload: dict[str, Any]) -> "Section":
-        return cls(
-            type=SectionType(payload["type"]),
-            id=payload["id"],
-            mode=payload.get("mode"),
-            duration=payload["duration"],
-            from_=Place.from_payload(payload["from"]) if "from" in payload else None,
-            to=Place.from_payload(payload["to"]) if "to" in payload else None,
-            links=[Link.from_payload(data) for data in payload["links"]],
-            display_informations=DisplayInformation.from_payload(
-                payload["display_informations"]
-            )
-            if "display_informations" in payload
-            else None,
-            additional_informations=SectionAdditionalInformation(
+    def from_payload(
+        cls, payload: dict[str, Any], lazy: bool = False, compact_geometry: bool = False
+    ) -> "Section":
+        """
+        Build a section from its payload.
+
+        With `lazy`, places, links, display informations and path are parsed on
+        first access instead. With `compact_geometry`, geojson is a Geometry instead
+        of nested lists.
+        """
+        values = {
+            "type": SectionType(payload["type"]),
+            "id": payload["id"],
+            "mode": payload.get("mode"),
+            "duration": payload["duration"],
+            "additional_informations": SectionAdditionalInformation(
                 payload["additional_informations"][0]
             )
             if "additional_informations" in payload
             else None,
-            geojson=payload.get("geojson"),
-            path=[Path.from_payload(data) for data in payload["path"]]
-            if "path" in payload
-            else None,
-            transfer_type=SectionTransferType(payload["transfer_type"])
+            "geojson": parse_geojson(payload.get("geojson"), compact_geometry),
+            "transfer_type": SectionTransferType(payload["transfer_type"])
             if "transfer_type" in payload
             else None,
-            departure_date_time=datetime.strptime(
-                payload["departure_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            arrival_date_time=datetime.strptime(
-                payload["arrival_date_time"], "%Y%m%dT%H%M%S"
-            ),
-        )
+            "departure_date_time": parse_datetime(payload["departure_date_time"]),
+            "arrival_date_time": parse_datetime(payload["arrival_date_time"]),
+        }
+        if lazy:
+            return new_lazy(LazySection, payload, values)
+        for name, parse in _SECTION_NESTED_FIELDS.items():
+            values[name] = parse(payload)
+        return cls(**values)
+
+
+_SECTION_NESTED_FIELDS = field_parsers(
+    Section, ("from_", "to", "links", "display_informations", "path")
+)
 
+LazySection = lazy_variant(Section, _SECTION_NESTED_FIELDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class Journey:
     duration: int
     nb_transfers: int
@@ -115,25 +125,54 @@ class Journey:
     status: str
 
     @classmethod
-    def from_payload(cls, payload: dict[str, Any]) -> "Journey":
-        return cls(
-            duration=payload["duration"],
-            nb_transfers=payload["nb_transfers"],
-            departure_date_time=datetime.strptime(
-                payload["departure_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            requested_date_time=datetime.strptime(
-                payload["requested_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            arrival_date_time=datetime.strptime(
-                payload["arrival_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            sections=[Section.from_payload(data) for data in payload["sections"]],
-            from_=Place.from_payload(payload["from"]) if "from" in payload else None,
-            to_=Place.from_payload(payload["to"]) if "to" in payload else None,
-            links=[Link.from_payload(data) for data in payload["links"]],
-            type=payload["type"],
-            fare=Fare.from_payload(payload["fare"]),
-            tags=[data for data in payload["tags"]],
-            status=payload["status"],
+    def from_payload(
+        cls, payload: dict[str, Any], lazy: bool = False, compact_geometry: bool = False
+    ) -> "Journey":
+        """
+        Build a journey from its payload.
+
+        With `lazy`, sections, places, links and fare are parsed on first access
+        instead, sections being lazy themselves. Reading only scalar attributes, such
+        as `duration` or `nb_transfers`, then skips most of the parsing. With
+        `compact_geometry`, the geojson of sections is a Geometry.
+        """
+        values = {
+            "duration": payload["duration"],
+            "nb_transfers": payload["nb_transfers"],
+            "departure_date_time": parse_datetime(payload["departure_date_time"]),
+            "requested_date_time": parse_datetime(payload["requested_date_time"]),
+            "arrival_date_time": parse_datetime(payload["arrival_date_time"]),
+            "type": payload["type"],
+            "tags": [data for data in payload["tags"]],
+            "status": payload["status"],
+        }
+        if lazy:
+            lazy_cls = LazyCompactJourney if compact_geometry else LazyJourney
+            return new_lazy(lazy_cls, payload, values)
+        nested_fields = (
+            _COMPACT_JOURNEY_NESTED_FIELDS
+            if compact_geometry
+            else _JOURNEY_NESTED_FIELDS
         )
+        for name, parse in nested_fields.items():
+            values[name] = parse(payload)
+        return cls(**values)
+
+
+def _journey_nested_fields(
+    lazy_sections: bool, compact_geometry: bool
+) -> dict[str, FieldParser]:
+    return {
+        "sections": lambda payload: [
+            Section.from_payload(data, lazy_sections, compact_geometry)
+            for data in payload["sections"]
+        ],
+        **field_parsers(Journey, ("from_", "to_", "links", "fare")),
+    }
+
+
+_JOURNEY_NESTED_FIELDS = _journey_nested_fields(False, False)
+_COMPACT_JOURNEY_NESTED_FIELDS = _journey_nested_fields(False, True)
+
+LazyJourney = lazy_variant(Journey, _journey_nested_fields(True, False))
+LazyCompactJourney = lazy_variant(Journey, _journey_nested_fields(True, True))
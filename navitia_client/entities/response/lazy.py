@@ -0,0 +1,84 @@
+import dataclasses
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+TEntity = TypeVar("TEntity")
+
+FieldParser = Callable[[dict[str, Any]], Any]
+
+
+class _LazyField:
+    """
+    Descriptor parsing a field from the raw payload of the entity on first access.
+
+    The parsed value is stored in the slot of the field, so later accesses cost as
+    much as with an eagerly parsed entity.
+    """
+
+    __slots__ = ("_slot", "_parse")
+
+    def __init__(self, slot: Any, parse: FieldParser) -> None:
+        self._slot = slot
+        self._parse = parse
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            value = self._parse(instance._payload)
+            self._slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+
+def lazy_variant(cls: type[TEntity], field_parsers: Mapping[str, FieldParser]) -> type:
+    """
+    Build a subclass of a slotted entity whose given fields are parsed on first access.
+
+    Instances of the subclass keep the raw payload they were built from. They are
+    instances of `cls` with the same attributes, so they can be used in its place.
+
+    Args:
+        cls (type[TEntity]): A slotted dataclass entity.
+        field_parsers (Mapping[str, FieldParser]): Function building each lazy field
+            from the payload of the entity.
+
+    Returns:
+        type: The lazy subclass, named after `cls` with a "Lazy" prefix.
+    """
+    field_names = [field.name for field in dataclasses.fields(cls)]  # type: ignore[arg-type]
+
+    def __eq__(self: Any, other: Any) -> bool:
+        # Lazy and eager entities built from the same payload are equal
+        if not isinstance(other, cls):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in field_names)
+
+    namespace: dict[str, Any] = {"__slots__": ("_payload",), "__eq__": __eq__}
+    for name, parse in field_parsers.items():
+        namespace[name] = _LazyField(getattr(cls, name), parse)
+    return type(f"Lazy{cls.__name__}", (cls,), namespace)
+
+
+def new_lazy(
+    lazy_cls: type, payload: dict[str, Any], eager_values: Mapping[str, Any]
+) -> Any:
+    """
+    Create an instance of a class built by lazy_variant.
+
+    Args:
+        lazy_cls (type): The lazy class.
+        payload (dict[str, Any]): The raw payload the lazy fields are parsed from.
+        eager_values (Mapping[str, Any]): Value of every field that is not lazy.
+
+    Returns:
+        Any: The entity.
+    """
+    entity: Any = object.__new__(lazy_cls)
+    entity._payload = payload
+    for name, value in eager_values.items():
+        setattr(entity, name, value)
+    return entity
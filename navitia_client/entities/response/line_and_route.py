@@ -6,10 +6,11 @@ from navitia_client.entities.response.direction import Direction
 from navitia_client.entities.response.network import Network
 
 from navitia_client.entities.response.base_entity import BaseEntity
+from navitia_client.entities.response.identity_map import identity_mapped
 from navitia_client.entities.response.physical_mode import CommercialMode, PhysicalMode
 
 
-@dataclass
+@dataclass(slots=True)
 class Line(BaseEntity):
     code: str
     color: str
@@ -22,6 +23,7 @@ class Line(BaseEntity):
     network: Network
 
     @classmethod
+    @identity_mapped
     def from_payload(
         cls,
         payload: Any,
@@ -52,7 +54,7 @@ class Line(BaseEntity):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Route(BaseEntity):
     is_frequence: bool
     line: Optional[Line]
@@ -60,6 +62,7 @@ class Route(BaseEntity):
     direction_type: str
 
     @classmethod
+    @identity_mapped
     def from_payload(
         cls,
         payload: dict[str, Any],
@@ -5,7 +5,7 @@ from navitia_client.entities.response.line_and_route import Line
 from navitia_client.entities.response.pt_object import PtObject
 
 
-@dataclass
+@dataclass(slots=True)
 class LineReport:
     line: Line
     pt_objets: Sequence[PtObject]
@@ -1,44 +1,252 @@
-from typing import Any, Optional, Sequence, Type
+from collections.abc import Sequence as SequenceABC
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    overload,
+)
 
+from navitia_client.entities.response.disruption import Disruption
 from navitia_client.entities.response.line_and_route import Line, Route
 from navitia_client.entities.response.network import Network
+from navitia_client.entities.response.note import Note
 from navitia_client.entities.response.physical_mode import CommercialMode, PhysicalMode
+from navitia_client.entities.response.stop_area import StopArea, StopPoint
 from navitia_client.entities.response.vehicle_journey import VehicleJourney
 
+TEntity = TypeVar("TEntity")
+
+# Entity lists a link payload may embed
+_LINKED_ENTITIES: dict[str, Type] = {
+    "lines": Line,
+    "vehicle_journeys": VehicleJourney,
+    "routes": Route,
+    "commercial_modes": CommercialMode,
+    "physical_modes": PhysicalMode,
+    "networks": Network,
+}
+
+# Top-level lists of a response links are resolved against, and their parser
+_RESOLVED_ENTITIES: dict[str, Callable[[dict[str, Any]], Any]] = {
+    **{key: entity.from_payload for key, entity in _LINKED_ENTITIES.items()},
+    "disruptions": Disruption.from_payload,
+    "notes": lambda payload: Note(id=payload["id"], value=payload["value"]),
+    "stop_areas": StopArea.from_payload,
+    "stop_points": StopPoint.from_payload,
+    "terminus": StopArea.from_payload,
+}
+
+
+class _LinkedEntities:
+    """Descriptor parsing an entity list embedded in a link payload on first access."""
+
+    __slots__ = ("_key", "_entity_class")
+
+    def __init__(self, key: str, entity_class: Type) -> None:
+        self._key = key
+        self._entity_class = entity_class
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        if self._key not in instance.payload:
+            return None
+        if instance._entities is None:
+            instance._entities = {}
+        entities = instance._entities.get(self._key)
+        if entities is None:
+            entities = instance._entities[self._key] = [
+                self._entity_class.from_payload(item)
+                for item in instance.payload[self._key]
+            ]
+        return entities
+
 
 class Link:
-    lines: Optional[Sequence[Line]] = None
-    vehicle_journeys: Optional[Sequence[VehicleJourney]] = None
-    routes: Optional[Sequence[Route]] = None
-    commercial_modes: Optional[Sequence[CommercialMode]] = None
-    physical_modes: Optional[Sequence[PhysicalMode]] = None
-    networks: Optional[Sequence[Network]] = None
-
-    @staticmethod
-    def _build_entity_list_from_payload(
-        entity_class: Type, payload: list[dict[str, Any]]
-    ) -> Sequence[Any]:
-        return [entity_class.from_payload(item) for item in payload]
+    """
+    A link to another object, such as {"type": "line", "id": "line:1"}.
+
+    The payload is kept as is: building a link costs a single object, and entity
+    lists embedded in the payload are only parsed when read. Use a LinkResolver, such
+    as the `links` of the LinkedResults of list methods, to get the object a link
+    points to from the top-level lists of the response.
+    """
+
+    __slots__ = ("payload", "_entities")
+
+    lines: Optional[Sequence[Line]] = _LinkedEntities("lines", Line)  # type: ignore[assignment]
+    vehicle_journeys: Optional[Sequence[VehicleJourney]] = _LinkedEntities(  # type: ignore[assignment]
+        "vehicle_journeys", VehicleJourney
+    )
+    routes: Optional[Sequence[Route]] = _LinkedEntities("routes", Route)  # type: ignore[assignment]
+    commercial_modes: Optional[Sequence[CommercialMode]] = _LinkedEntities(  # type: ignore[assignment]
+        "commercial_modes", CommercialMode
+    )
+    physical_modes: Optional[Sequence[PhysicalMode]] = _LinkedEntities(  # type: ignore[assignment]
+        "physical_modes", PhysicalMode
+    )
+    networks: Optional[Sequence[Network]] = _LinkedEntities("networks", Network)  # type: ignore[assignment]
+
+    def __init__(self, payload: Optional[dict[str, Any]] = None) -> None:
+        self.payload: dict[str, Any] = payload if payload is not None else {}
+        self._entities: Optional[dict[str, Sequence[Any]]] = None
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.payload.get("id")
+
+    @property
+    def type(self) -> Optional[str]:
+        return self.payload.get("type")
+
+    @property
+    def rel(self) -> Optional[str]:
+        return self.payload.get("rel")
+
+    @property
+    def href(self) -> Optional[str]:
+        return self.payload.get("href")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Link):
+            return NotImplemented
+        return self.payload == other.payload
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Link({self.payload!r})"
+
+    def resolve(self, resolver: "LinkResolver") -> Any:
+        """The object this link points to, None when not in the resolver."""
+        return resolver.resolve(self)
 
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "Link":
-        entity_mapping = {
-            "lines": Line,
-            "vehicle_journeys": VehicleJourney,
-            "routes": Route,
-            "commercial_modes": CommercialMode,
-            "physical_modes": PhysicalMode,
-            "networks": Network,
-        }
-
-        obj = cls()
-
-        for key, entity_class in entity_mapping.items():
-            if key in payload:
-                setattr(
-                    obj,
-                    key,
-                    cls._build_entity_list_from_payload(entity_class, payload[key]),
-                )
-
-        return obj
+        return cls(payload)
+
+
+class LinkList(SequenceABC):
+    """
+    Links of an entity, built from their payloads on first access.
+
+    Entities that are read without their links pay only for this wrapper.
+    """
+
+    __slots__ = ("_payloads", "_links")
+
+    def __init__(self, payloads: Sequence[dict[str, Any]]) -> None:
+        self._payloads = payloads
+        self._links: Optional[list[Link]] = None
+
+    def _materialize(self) -> list[Link]:
+        if self._links is None:
+            self._links = [Link(payload) for payload in self._payloads]
+        return self._links
+
+    @overload
+    def __getitem__(self, index: int) -> Link: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Link]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[Link]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LinkList):
+            return self._payloads == other._payloads
+        if isinstance(other, SequenceABC) and not isinstance(other, str):
+            return self._materialize() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LinkList({self._materialize()!r})"
+
+    @property
+    def payloads(self) -> Sequence[dict[str, Any]]:
+        """The raw payloads of the links."""
+        return self._payloads
+
+
+class LinkResolver:
+    """
+    Objects of the top-level lists of a response, such as "disruptions", "notes" or
+    "terminus", that links point to by id.
+
+    The lists are indexed on first resolution and objects are parsed on their first
+    resolution, once. Objects of unknown lists are returned as raw payloads.
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+        self._payloads: Optional[dict[str, tuple[str, dict[str, Any]]]] = None
+        self._resolved: dict[str, Any] = {}
+
+    def _index(self) -> dict[str, tuple[str, dict[str, Any]]]:
+        if self._payloads is None:
+            self._payloads = {}
+            for key, items in self._payload.items():
+                if not isinstance(items, list):
+                    continue
+                for item in items:
+                    if isinstance(item, dict) and "id" in item:
+                        self._payloads.setdefault(item["id"], (key, item))
+        return self._payloads
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def resolve(self, link: Link) -> Any:
+        """
+        Return the object a link points to.
+
+        Args:
+            link (Link): The link.
+
+        Returns:
+            Any: The parsed entity, the raw payload for lists without known entity,
+            or None when the response has no object with the id of the link.
+        """
+        link_id = link.id
+        if link_id is None:
+            return None
+        if link_id in self._resolved:
+            return self._resolved[link_id]
+        found = self._index().get(link_id)
+        if found is None:
+            return None
+        key, item = found
+        parse = _RESOLVED_ENTITIES.get(key)
+        resolved = parse(item) if parse else item
+        self._resolved[link_id] = resolved
+        return resolved
+
+
+class LinkedResults(List[TEntity]):
+    """
+    Entities of a response, with the LinkResolver of the response in `links`.
+
+    A list in every other respect: methods returning it still return the list of
+    their entities, and `results.links` resolves the links these entities hold.
+    """
+
+    __slots__ = ("links",)
+
+    def __init__(self, entities: Iterable[TEntity], links: LinkResolver) -> None:
+        super().__init__(entities)
+        self.links = links
@@ -2,13 +2,15 @@ from dataclasses import dataclass
 from typing import Any
 
 from .base_entity import BaseEntity
+from .identity_map import identity_mapped
 
 
-@dataclass
+@dataclass(slots=True)
 class Network(BaseEntity):
     pass
 
     @classmethod
+    @identity_mapped
     def from_payload(cls, payload: dict[str, Any]) -> "Network":
         return cls(
             id=payload["id"],
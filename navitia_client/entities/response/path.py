@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class PathItem:
     length: int
     name: str
@@ -19,7 +19,7 @@ class PathItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Path:
     segments: Sequence[PathItem]
 
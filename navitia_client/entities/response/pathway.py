@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .base_entity import BaseEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class Pathway(BaseEntity):
     is_entrance: bool
     is_exit: bool
@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Any, Optional, Sequence
 
 from .base_entity import BaseEntity
+from .identity_map import identity_mapped
 
 
 class PhysicalModeId(Enum):
@@ -25,11 +26,12 @@ class PhysicalModeId(Enum):
     TRAMWAY = "physical_mode:Tramway"
 
 
-@dataclass
+@dataclass(slots=True)
 class CommercialMode(BaseEntity):
     physical_modes: Optional[Sequence["PhysicalMode"]]
 
     @classmethod
+    @identity_mapped
     def from_payload(cls, payload: dict[str, Any]) -> "CommercialMode":
         physical_modes = (
             [
@@ -47,7 +49,7 @@ class CommercialMode(BaseEntity):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CO2EmissionRate(BaseEntity):
     pass
 
@@ -59,7 +61,7 @@ class CO2EmissionRate(BaseEntity):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalMode:
     id: PhysicalModeId
     name: str
@@ -67,6 +69,7 @@ class PhysicalMode:
     commercial_modes: Optional[Sequence[CommercialMode]]
 
     @classmethod
+    @identity_mapped
     def from_payload(
         cls,
         payload: dict[str, Any],
@@ -8,7 +8,7 @@ from .poi import POI
 from .stop_area import StopArea, StopPoint
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceEmbeddedType:
     administrative_region: AdministrativeRegion
     stop_area: StopArea
@@ -17,7 +17,7 @@ class PlaceEmbeddedType:
     poi: POI
 
 
-@dataclass
+@dataclass(slots=True)
 class Place(BaseEntity):
     quality: int
     embedded_type: str
@@ -4,12 +4,12 @@ from .base_entity import BaseEntity
 from .stand import Stands
 
 
-@dataclass
+@dataclass(slots=True)
 class POIType(BaseEntity):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class POI(BaseEntity):
     label: str
     poi_type: POIType
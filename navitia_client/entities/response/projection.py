@@ -0,0 +1,243 @@
+import dataclasses
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+from navitia_client.entities.response.field_rules import (
+    FieldRule,
+    field_rules,
+    follows_field_rules,
+)
+
+# Fields to parse, by name, each mapped to the fields to parse in its value, or to
+# None for the whole value
+ProjectionTree = Mapping[str, Optional["ProjectionTree"]]
+
+
+class _ProjectedField:
+    """
+    Descriptor of a field of a partial entity, raising AttributeError when the field
+    was not selected by the projection instead of giving a misleading None.
+    """
+
+    __slots__ = ("_slot", "_name")
+
+    def __init__(self, slot: Any, name: str) -> None:
+        self._slot = slot
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            raise AttributeError(
+                f"{type(instance).__name__}.{self._name} was not selected by the "
+                "projection"
+            ) from None
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+
+def _projected_fields(entity: Any, usage: str) -> dict[str, Any]:
+    """Selected fields of a partial entity used in its comparisons or its repr."""
+    return {
+        field.name: getattr(entity, field.name)
+        for field in dataclasses.fields(entity)
+        if getattr(field, usage) and hasattr(entity, field.name)
+    }
+
+
+@lru_cache(maxsize=None)
+def partial_variant(cls: type) -> type:
+    """
+    Build the subclass of a slotted entity holding only the fields of a projection.
+
+    Instances of the subclass are instances of `cls`, but reading a field that was not
+    selected raises AttributeError. Their repr only shows the selected fields, and
+    they are equal to the partial entities of the same class with the same fields.
+
+    Args:
+        cls (type): A slotted dataclass entity.
+
+    Returns:
+        type: The partial subclass, named after `cls` with a "Partial" prefix.
+    """
+
+    def __eq__(self: Any, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return _projected_fields(self, "compare") == _projected_fields(other, "compare")
+
+    def __repr__(self: Any) -> str:
+        values = ", ".join(
+            f"{name}={value!r}"
+            for name, value in _projected_fields(self, "repr").items()
+        )
+        return f"{type(self).__name__}({values})"
+
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__eq__": __eq__,
+        "__repr__": __repr__,
+        "__hash__": None,
+    }
+    for field in dataclasses.fields(cls):  # type: ignore[arg-type]
+        namespace[field.name] = _ProjectedField(getattr(cls, field.name), field.name)
+    return type(f"Partial{cls.__name__}", (cls,), namespace)
+
+
+def _projector(cls: type, tree: Optional[ProjectionTree]) -> Callable[[Any], Any]:
+    """Function parsing the fields of a tree from the payload of an entity."""
+    if tree is None or not follows_field_rules(cls):
+        return cls.from_payload  # type: ignore[attr-defined]
+
+    # Fields left out of comparisons, such as the raw payload of a schedule table,
+    # hold no data of their own: they are always set
+    bookkeeping = [field for field in dataclasses.fields(cls) if not field.compare]
+    tree = {
+        **tree,
+        **{field.name: None for field in bookkeeping if field.init},
+    }
+    defaults = {
+        field.name: field.default
+        for field in bookkeeping
+        if not field.init and field.default is not dataclasses.MISSING
+    }
+
+    rules = field_rules(cls)
+    parsers: dict[str, Callable[[dict[str, Any]], Any]] = {}
+    for name, subtree in tree.items():
+        rule = rules[name]
+        if not isinstance(rule, FieldRule):
+            parsers[name] = rule
+        elif subtree is None:
+            parsers[name] = rule.parser()
+        else:
+            parsers[name] = rule.parser(_projector(rule.target, subtree))  # type: ignore[arg-type]
+
+    if parsers.keys() == rules.keys():
+        # Every field is selected: the entity is whole
+        def parse_whole(payload: dict[str, Any]) -> Any:
+            return cls(**{name: parse(payload) for name, parse in parsers.items()})
+
+        return parse_whole
+
+    partial_cls = partial_variant(cls)
+
+    def parse(payload: dict[str, Any]) -> Any:
+        entity: Any = object.__new__(partial_cls)
+        for name, value in defaults.items():
+            setattr(entity, name, value)
+        for name, parse_field in parsers.items():
+            setattr(entity, name, parse_field(payload))
+        return entity
+
+    return parse
+
+
+def _check_tree(cls: type, tree: ProjectionTree, path: str) -> None:
+    field_names = {field.name for field in dataclasses.fields(cls)}
+    rules = field_rules(cls)
+    for name, subtree in tree.items():
+        if name not in field_names:
+            raise ValueError(f"Unknown field {path}{name} of {cls.__name__}")
+        if subtree is None:
+            continue
+        rule = rules.get(name)
+        if not (isinstance(rule, FieldRule) and rule.kind == "entity"):
+            raise ValueError(
+                f"Field {path}{name} of {cls.__name__} has no fields to select"
+            )
+        _check_tree(rule.target, subtree, f"{path}{name}.")  # type: ignore[arg-type]
+
+
+class Projection:
+    """
+    Fields of an entity to parse, given as dotted paths such as "route.line.code".
+
+    Other fields are not parsed, so that the subtrees of the payload that are not
+    needed, such as links, geojson or administrative regions, cost nothing. Selecting
+    an entity field as a whole, such as "route", parses it fully.
+
+    Entities missing some fields are instances of a partial subclass of their class,
+    see partial_variant, on which reading an unselected field raises AttributeError.
+
+    Fields are parsed by the rules of navitia_client.entities.response.field_rules,
+    as from_payload does. Entities whose from_payload does not follow these rules,
+    such as journeys or disruptions, are parsed as a whole.
+    """
+
+    __slots__ = ("entity_class", "fields", "_parse")
+
+    def __init__(self, entity_class: type, fields: Iterable[str]) -> None:
+        """
+        Args:
+            entity_class (type): The class of the entities to parse.
+            fields (Iterable[str]): The dotted paths of the fields to parse.
+
+        Raises:
+            ValueError: When a path does not lead to a field.
+        """
+        self.entity_class = entity_class
+        self.fields = tuple(fields)
+        tree: dict[str, Any] = {}
+        for path in self.fields:
+            node = tree
+            names = path.split(".")
+            for name in names[:-1]:
+                child = node.setdefault(name, {})
+                if child is None:
+                    # The whole field is already selected
+                    break
+                node = child
+            else:
+                node[names[-1]] = None
+        _check_tree(entity_class, tree, "")
+        self._parse = _projector(entity_class, tree)
+
+    def parse(self, payload: dict[str, Any]) -> Any:
+        """Parse the selected fields of an entity from its payload."""
+        return self._parse(payload)
+
+
+@lru_cache(maxsize=128)
+def _cached_projection(entity_class: type, fields: tuple[str, ...]) -> Projection:
+    return Projection(entity_class, fields)
+
+
+def get_projection(
+    entity_class: type, fields: Optional[Sequence[str]]
+) -> Optional[Projection]:
+    """
+    The projection of the given fields of an entity class, None to parse every field.
+
+    Projections are cached, so that polling with the same fields validates them once.
+    """
+    if fields is None:
+        return None
+    return _cached_projection(entity_class, tuple(fields))
+
+
+def parse_entities(
+    entity_class: type,
+    payloads: Iterable[dict[str, Any]],
+    fields: Optional[Sequence[str]] = None,
+) -> list[Any]:
+    """
+    Parse entities from their payloads, only the given fields when any.
+
+    Args:
+        entity_class (type): The class of the entities.
+        payloads (Iterable[dict[str, Any]]): Their payloads.
+        fields (Optional[Sequence[str]]): Dotted paths of the fields to parse, see
+            Projection. Every field is parsed by default.
+
+    Returns:
+        list[Any]: The entities.
+    """
+    projection = get_projection(entity_class, fields)
+    if projection is None:
+        return [entity_class.from_payload(payload) for payload in payloads]  # type: ignore[attr-defined]
+    return [projection.parse(payload) for payload in payloads]
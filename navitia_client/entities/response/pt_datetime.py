@@ -2,10 +2,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional, Sequence
 
-from navitia_client.entities.response.link import Link
+from navitia_client.entities.response.datetime_parser import parse_date
+from navitia_client.entities.response.link import Link, LinkList
 
 
-@dataclass
+@dataclass(slots=True)
 class PTDatetime:
     additional_informations: Sequence[str]
     departure_date_time: Optional[datetime]
@@ -19,13 +20,11 @@ class PTDatetime:
                 additional_information
                 for additional_information in payload["additional_informations"]
             ],
-            departure_date_time=datetime.strptime(
-                payload["departure_date_time"], "%Y%m%d"
-            )
+            departure_date_time=parse_date(payload["departure_date_time"])
             if "departure_date_time" in payload
             else None,
-            arrival_date_time=datetime.strptime(payload["arrival_date_time"], "%Y%m%d")
+            arrival_date_time=parse_date(payload["arrival_date_time"])
             if "arrival_date_time" in payload
             else None,
-            links=[Link.from_payload(link) for link in payload["links"]],
+            links=LinkList(payload["links"]),
         )
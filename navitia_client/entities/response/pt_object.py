@@ -9,7 +9,7 @@ from .stop_area import StopArea, StopPoint
 from .trip import Trip
 
 
-@dataclass
+@dataclass(slots=True)
 class PtObjectEmbeddedType:
     network: Network
     commercial_mode: CommercialMode
@@ -20,7 +20,7 @@ class PtObjectEmbeddedType:
     trip: Trip
 
 
-@dataclass
+@dataclass(slots=True)
 class PtObject(BaseEntity):
     quality: int
     embedded_type: str
@@ -4,7 +4,7 @@ from navitia_client.entities.response.display_information import DisplayInformat
 from navitia_client.entities.response.schedule_table import ScheduleTable
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteSchedule:
     display_informations: DisplayInformation
     table: ScheduleTable
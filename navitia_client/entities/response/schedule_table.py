@@ -1,13 +1,14 @@
-from dataclasses import dataclass
-from typing import Any, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
 
 from navitia_client.entities.response.display_information import DisplayInformation
-from navitia_client.entities.response.link import Link
+from navitia_client.entities.response.link import Link, LinkList
 from navitia_client.entities.response.pt_datetime import PTDatetime
 from navitia_client.entities.response.stop_area import StopPoint
+from navitia_client.entities.response.timetable_matrix import TimetableMatrix
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleTableHeader:
     additional_informations: Sequence[str]
     display_informations: DisplayInformation
@@ -23,11 +24,11 @@ class ScheduleTableHeader:
             display_informations=DisplayInformation.from_payload(
                 payload["display_informations"]
             ),
-            links=[Link.from_payload(link) for link in payload["links"]],
+            links=LinkList(payload["links"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleTableRow:
     date_times: Sequence[PTDatetime]
     stop_point: StopPoint
@@ -43,10 +44,15 @@ class ScheduleTableRow:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleTable:
     headers: Sequence[ScheduleTableHeader]
     rows: Sequence[ScheduleTableRow]
+    # Raw table, from which the matrix is built on demand
+    _payload: Optional[dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _matrix: Optional[TimetableMatrix] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "ScheduleTable":
@@ -56,4 +62,19 @@ class ScheduleTable:
                 for table_header in payload["headers"]
             ],
             rows=[ScheduleTableRow.from_payload(row) for row in payload["rows"]],
+            _payload=payload,
         )
+
+    def matrix(self) -> TimetableMatrix:
+        """
+        Stops x trips date times of the table, built on first call from the payload.
+
+        Raises:
+            ValueError: If the table was not built from a payload, or if a row does
+                not have a date time per header.
+        """
+        if self._matrix is None:
+            if self._payload is None:
+                raise ValueError("The table was not built from a payload")
+            self._matrix = TimetableMatrix.from_payload(self._payload)
+        return self._matrix
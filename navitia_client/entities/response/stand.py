@@ -8,7 +8,7 @@ class StandStatus(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Stands:
     available_places: int
     available_bikes: int
@@ -4,10 +4,11 @@ from typing import Any, Optional, Sequence
 
 from .base_entity import BaseEntity
 from .coord import Coord
+from .identity_map import identity_mapped
 from .administrative_region import AdministrativeRegion
 
 
-@dataclass
+@dataclass(slots=True)
 class StopArea(BaseEntity):
     label: str
     coord: Coord
@@ -15,6 +16,7 @@ class StopArea(BaseEntity):
     stop_points: Optional[Sequence["StopPoint"]]
 
     @classmethod
+    @identity_mapped
     def from_payload(cls, payload: dict[str, Any]) -> "StopArea":
         administrative_regions = (
             [
@@ -44,7 +46,7 @@ class StopArea(BaseEntity):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StopPoint(BaseEntity):
     label: str
     coord: Coord
@@ -53,6 +55,7 @@ class StopPoint(BaseEntity):
     stop_area: Optional[StopArea]
 
     @classmethod
+    @identity_mapped
     def from_payload(
         cls,
         payload: dict[str, Any],
@@ -2,10 +2,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Sequence
 
-from navitia_client.entities.response.link import Link
+from navitia_client.entities.response.datetime_parser import parse_datetime
+from navitia_client.entities.response.link import Link, LinkList
 
 
-@dataclass
+@dataclass(slots=True)
 class StopDateTime:
     additional_informations: Sequence[str]
     arrival_date_time: datetime
@@ -22,18 +23,12 @@ class StopDateTime:
                 additional_information
                 for additional_information in payload["additional_informations"]
             ],
-            arrival_date_time=datetime.strptime(
-                payload["arrival_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            base_arrival_date_time=datetime.strptime(
-                payload["base_arrival_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            base_departure_date_time=datetime.strptime(
-                payload["base_departure_date_time"], "%Y%m%dT%H%M%S"
+            arrival_date_time=parse_datetime(payload["arrival_date_time"]),
+            base_arrival_date_time=parse_datetime(payload["base_arrival_date_time"]),
+            base_departure_date_time=parse_datetime(
+                payload["base_departure_date_time"]
             ),
             data_freshness=payload["data_freshness"],
-            departure_date_time=datetime.strptime(
-                payload["departure_date_time"], "%Y%m%dT%H%M%S"
-            ),
-            links=[Link.from_payload(link) for link in payload["links"]],
+            departure_date_time=parse_datetime(payload["departure_date_time"]),
+            links=LinkList(payload["links"]),
         )
@@ -18,7 +18,7 @@ class AdditionalInformationEnum(Enum):
     ACTIVE_DISRUPTION = "active_disruption"
 
 
-@dataclass
+@dataclass(slots=True)
 class StopSchedule:
     display_informations: DisplayInformation
     route: Route
@@ -45,7 +45,7 @@ class StopSchedule:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminusSchedule(StopSchedule):
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "TerminusSchedule":
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 from typing import Any, Optional, Sequence
 from navitia_client.entities.response.base_entity import BaseEntity
-from navitia_client.entities.response.link import Link
+from navitia_client.entities.response.link import Link, LinkList
 
 
-@dataclass
+@dataclass(slots=True)
 class Cost:
     value: str
     currency: Optional[str]
@@ -17,7 +17,7 @@ class Cost:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Fare:
     total: Cost
     found: bool
@@ -28,11 +28,11 @@ class Fare:
         return cls(
             total=Cost.from_payload(payload["total"]),
             found=bool(payload["found"]),
-            links=[Link.from_payload(data) for data in payload["links"]],
+            links=LinkList(payload["links"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket(BaseEntity):
     found: bool
     cost: Cost
@@ -45,5 +45,5 @@ class Ticket(BaseEntity):
             name=payload["name"],
             found=bool(payload["found"]),
             cost=Cost.from_payload(payload["cost"]),
-            links=[Link.from_payload(data) for data in payload["links"]],
+            links=LinkList(payload["links"]),
         )
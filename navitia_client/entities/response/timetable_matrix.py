@@ -0,0 +1,197 @@
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Optional
+
+from navitia_client.entities.response.datetime_parser import (
+    MISSING_DATE_TIME,
+    parse_epoch_seconds,
+)
+
+# Value of a cell where the trip does not stop, read by NumPy as NaT
+NO_STOP: int = MISSING_DATE_TIME
+
+_INT64_MAX: int = 2**63 - 1
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """NumPy when it is installed, None otherwise."""
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+def _to_array(values: Any) -> array:
+    """Copy a NumPy int64 array into a signed 64-bit array."""
+    result = array("q")
+    result.frombytes(values.tobytes())
+    return result
+
+
+@dataclass(slots=True)
+class TimetableMatrix:
+    """
+    Stops x trips matrix of the date times of a route schedule table.
+
+    Date times are Navitia local times, as seconds since 1970-01-01T00:00:00, stored
+    row by row in a single signed 64-bit array, the layout of a C-ordered NumPy
+    `datetime64[s]` array of shape (stops, trips). Cells where a trip does not stop
+    hold NO_STOP. Helpers work on whole rows or columns, sliced out of the array
+    without walking entity objects. With NumPy installed, first_departures,
+    last_departures, headways and running_times are vectorized over a view of the
+    array; without it, they loop over the cells in Python and give the same results.
+
+    Attributes:
+        stop_point_ids (list[str]): Stop point of each row.
+        trip_ids (list[str]): Vehicle journey of each column, "" when the header
+            has no vehicle journey link.
+        date_times (array): Date time of each cell, row by row.
+    """
+
+    stop_point_ids: list[str] = field(default_factory=list)
+    trip_ids: list[str] = field(default_factory=list)
+    date_times: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "TimetableMatrix":
+        """Build the matrix of the "table" of a route schedule."""
+        trip_ids = [
+            next(
+                (
+                    link["id"]
+                    for link in header["links"]
+                    if link["type"] == "vehicle_journey"
+                ),
+                "",
+            )
+            for header in payload["headers"]
+        ]
+        stop_point_ids = []
+        date_times = array("q")
+        for row in payload["rows"]:
+            stop_point_ids.append(row["stop_point"]["id"])
+            cells = row["date_times"]
+            if len(cells) != len(trip_ids):
+                raise ValueError(
+                    f"Row of {row['stop_point']['id']} has {len(cells)} date times "
+                    f"for {len(trip_ids)} trips"
+                )
+            date_times.extend(
+                parse_epoch_seconds(value) if value else NO_STOP
+                for value in (cell.get("date_time") for cell in cells)
+            )
+        return cls(stop_point_ids, trip_ids, date_times)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Number of stops and of trips."""
+        return len(self.stop_point_ids), len(self.trip_ids)
+
+    def stop_index(self, stop_point_id: str) -> int:
+        """Row of a stop point, raising ValueError when it is not in the table."""
+        return self.stop_point_ids.index(stop_point_id)
+
+    def time(self, stop: int, trip: int) -> Optional[int]:
+        """Date time of a trip at a stop, None when it does not stop there."""
+        value = self.date_times[stop * len(self.trip_ids) + trip]
+        return None if value == NO_STOP else value
+
+    def stop_times(self, stop: int) -> array:
+        """Date times of every trip at a stop, as a row of the matrix."""
+        trips = len(self.trip_ids)
+        return self.date_times[stop * trips : (stop + 1) * trips]
+
+    def trip_times(self, trip: int) -> array:
+        """Date times of a trip at every stop, as a column of the matrix."""
+        if not self.trip_ids:
+            return array("q")
+        return self.date_times[trip :: len(self.trip_ids)]
+
+    def _int64_view(self, numpy: Any) -> Any:
+        """Zero-copy NumPy int64 array of the matrix, of shape (stops, trips)."""
+        return numpy.frombuffer(self.date_times, dtype=numpy.int64).reshape(self.shape)
+
+    def first_departures(self) -> array:
+        """Earliest date time of each stop, NO_STOP when no trip stops there."""
+        numpy = _numpy()
+        if numpy is not None:
+            cells = self._int64_view(numpy)
+            earliest = numpy.where(cells == NO_STOP, _INT64_MAX, cells).min(
+                axis=1, initial=_INT64_MAX
+            )
+            return _to_array(numpy.where(earliest == _INT64_MAX, NO_STOP, earliest))
+
+        return array(
+            "q",
+            (
+                min((value for value in row if value != NO_STOP), default=NO_STOP)
+                for row in map(self.stop_times, range(len(self.stop_point_ids)))
+            ),
+        )
+
+    def last_departures(self) -> array:
+        """Latest date time of each stop, NO_STOP when no trip stops there."""
+        numpy = _numpy()
+        # NO_STOP is the smallest int64, below every date time
+        if numpy is not None:
+            return _to_array(self._int64_view(numpy).max(axis=1, initial=NO_STOP))
+
+        return array(
+            "q",
+            (
+                max(row, default=NO_STOP)
+                for row in map(self.stop_times, range(len(self.stop_point_ids)))
+            ),
+        )
+
+    def headways(self, stop: int) -> array:
+        """Seconds between successive trips stopping at a stop, in time order."""
+        numpy = _numpy()
+        if numpy is not None:
+            row = numpy.frombuffer(self.stop_times(stop), dtype=numpy.int64)
+            return _to_array(numpy.diff(numpy.sort(row[row != NO_STOP])))
+
+        times = sorted(value for value in self.stop_times(stop) if value != NO_STOP)
+        return array("q", [later - earlier for earlier, later in zip(times, times[1:])])
+
+    def running_times(self, from_stop: int, to_stop: int) -> array:
+        """
+        Seconds taken by each trip from a stop to another.
+
+        NO_STOP for the trips that do not stop at both.
+        """
+        starts = self.stop_times(from_stop)
+        ends = self.stop_times(to_stop)
+        numpy = _numpy()
+        if numpy is not None:
+            # A stop out of the table gives an empty row, and no running time
+            count = min(len(starts), len(ends))
+            start = numpy.frombuffer(starts, dtype=numpy.int64)[:count]
+            end = numpy.frombuffer(ends, dtype=numpy.int64)[:count]
+            return _to_array(
+                numpy.where((start == NO_STOP) | (end == NO_STOP), NO_STOP, end - start)
+            )
+
+        return array(
+            "q",
+            [
+                NO_STOP if start == NO_STOP or end == NO_STOP else end - start
+                for start, end in zip(starts, ends)
+            ],
+        )
+
+    def to_numpy(self) -> Any:
+        """
+        Zero-copy NumPy `datetime64[s]` array of the matrix, of shape (stops, trips).
+
+        Cells where a trip does not stop are NaT. Requires NumPy, which is not a
+        dependency of navitia_client.
+        """
+        import numpy  # type: ignore
+
+        return numpy.frombuffer(self.date_times, dtype="datetime64[s]").reshape(
+            self.shape
+        )
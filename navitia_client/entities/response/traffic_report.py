@@ -5,7 +5,7 @@ from navitia_client.entities.response.network import Network
 from navitia_client.entities.response.vehicle_journey import VehicleJourney
 
 
-@dataclass
+@dataclass(slots=True)
 class TrafficReport:
     network: Network
     vehicle_journeys: Sequence[VehicleJourney]
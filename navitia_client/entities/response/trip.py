@@ -4,7 +4,7 @@ from typing import Any
 from .base_entity import BaseEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class Trip(BaseEntity):
     pass
 
@@ -3,12 +3,13 @@ from datetime import datetime
 from typing import Any, Optional, Sequence
 
 from navitia_client.entities.response.base_entity import BaseEntity
+from navitia_client.entities.response.datetime_parser import parse_date
 from navitia_client.entities.response.disruption import Disruption
 from navitia_client.entities.response.stop_area import StopPoint
 from navitia_client.entities.response.trip import Trip
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivePeriod:
     begin: datetime
     end: datetime
@@ -16,12 +17,12 @@ class ActivePeriod:
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "ActivePeriod":
         return cls(
-            begin=datetime.strptime(payload["begin"], "%Y%m%d"),
-            end=datetime.strptime(payload["end"], "%Y%m%d"),
+            begin=parse_date(payload["begin"]),
+            end=parse_date(payload["end"]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WeekPattern:
     monday: bool
     tuesday: bool
@@ -44,7 +45,7 @@ class WeekPattern:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Calendar:
     active_periods: Sequence[ActivePeriod]
     week_pattern: WeekPattern
@@ -59,7 +60,7 @@ class Calendar:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Code:
     type: str
     value: str
@@ -72,7 +73,7 @@ class Code:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class JourneyPattern(BaseEntity):
     pass
 
@@ -84,7 +85,7 @@ class JourneyPattern(BaseEntity):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StopTime:
     arrival_time: int
     departure_time: int
@@ -111,7 +112,7 @@ class StopTime:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidityPattern:
     beginning_date: datetime
     days: str
@@ -119,12 +120,12 @@ class ValidityPattern:
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "ValidityPattern":
         return cls(
-            beginning_date=datetime.strptime(payload["beginning_date"], "%Y%m%d"),
+            beginning_date=parse_date(payload["beginning_date"]),
             days=payload["days"],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VehicleJourney:
     id: str
     name: Optional[str]
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -6,6 +7,7 @@ from unittest.mock import MagicMock, patch
 from navitia_client.entities.response.physical_mode import CommercialMode
 from navitia_client.entities.request.public_transportations import CommercialModeRequest
 from navitia_client.client.apis.public_transportation_apis import (
+    AsyncCommercialModeApiClient,
     CommercialModeApiClient,
 )
 
@@ -24,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/commercial_mode.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -45,7 +47,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/commercial_mode.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -57,3 +59,34 @@ def test_get_entity_by_id(
     # Then
     assert len(commercial_modes) == 2
     assert isinstance(commercial_modes[0], CommercialMode)
+
+
+@pytest.fixture
+def async_commercial_modes_apis():
+    return AsyncCommercialModeApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncCommercialModeApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock,
+    async_commercial_modes_apis: AsyncCommercialModeApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/commercial_mode.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    commercial_modes, _ = asyncio.run(
+        async_commercial_modes_apis.list_entity_collection_from_region(
+            "tuz", CommercialModeRequest()
+        )
+    )
+
+    # Then
+    assert len(commercial_modes) == 2
+    assert isinstance(commercial_modes[1], CommercialMode)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -5,7 +6,10 @@ from unittest.mock import MagicMock, patch
 
 from navitia_client.entities.response.company import Company
 from navitia_client.entities.request.public_transportations import CompanyRequest
-from navitia_client.client.apis.public_transportation_apis import CompanyApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncCompanyApiClient,
+    CompanyApiClient,
+)
 
 
 @pytest.fixture
@@ -22,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/company.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -42,7 +46,7 @@ def test_get_entity_by_id(
 ) -> None:
     # Given
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.payload = {
         "companies": [
             {
                 "codes": [{"type": "source", "value": "12"}],
@@ -65,3 +69,31 @@ def test_get_entity_by_id(
     # Then
     assert len(companies) == 1
     assert isinstance(companies[0], Company)
+
+
+@pytest.fixture
+def async_company_apis():
+    return AsyncCompanyApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncCompanyApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_company_apis: AsyncCompanyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/company.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    companies, _ = asyncio.run(
+        async_company_apis.list_entity_collection_from_region("tuz", CompanyRequest())
+    )
+
+    # Then
+    assert len(companies) == 1
+    assert isinstance(companies[0], Company)
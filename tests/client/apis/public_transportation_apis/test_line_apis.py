@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -5,7 +6,10 @@ from unittest.mock import MagicMock, patch
 
 from navitia_client.entities.response.line_and_route import Line
 from navitia_client.entities.request.public_transportations import LineRequest
-from navitia_client.client.apis.public_transportation_apis import LineApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncLineApiClient,
+    LineApiClient,
+)
 
 
 @pytest.fixture
@@ -22,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/line.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -41,7 +45,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/line.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -51,3 +55,31 @@ def test_get_entity_by_id(
     # Then
     assert len(lines) == 2
     assert isinstance(lines[0], Line)
+
+
+@pytest.fixture
+def async_line_apis():
+    return AsyncLineApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncLineApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_line_apis: AsyncLineApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/line.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    lines, _ = asyncio.run(
+        async_line_apis.list_entity_collection_from_region("tuz", LineRequest())
+    )
+
+    # Then
+    assert len(lines) == 2
+    assert isinstance(lines[0], Line)
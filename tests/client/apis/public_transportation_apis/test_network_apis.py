@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -5,7 +6,10 @@ from unittest.mock import MagicMock, patch
 
 from navitia_client.entities.response.network import Network
 from navitia_client.entities.request.public_transportations import NetworkRequest
-from navitia_client.client.apis.public_transportation_apis import NetworkApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncNetworkApiClient,
+    NetworkApiClient,
+)
 
 
 @pytest.fixture
@@ -22,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/network.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -43,7 +47,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/network.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -53,3 +57,31 @@ def test_get_entity_by_id(
     # Then
     assert len(networks) == 2
     assert isinstance(networks[0], Network)
+
+
+@pytest.fixture
+def async_network_apis():
+    return AsyncNetworkApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncNetworkApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_network_apis: AsyncNetworkApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/network.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    networks, _ = asyncio.run(
+        async_network_apis.list_entity_collection_from_region("tuz", NetworkRequest())
+    )
+
+    # Then
+    assert len(networks) == 2
+    assert isinstance(networks[1], Network)
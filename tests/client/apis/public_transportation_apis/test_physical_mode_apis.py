@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -6,6 +7,7 @@ from unittest.mock import MagicMock, patch
 from navitia_client.entities.response.physical_mode import PhysicalMode
 from navitia_client.entities.request.public_transportations import PhysicalModeRequest
 from navitia_client.client.apis.public_transportation_apis import (
+    AsyncPhysicalModeApiClient,
     PhysicalModeApiClient,
 )
 
@@ -24,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/physical_mode.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -45,7 +47,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/physical_mode.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -57,3 +59,34 @@ def test_get_entity_by_id(
     # Then
     assert len(physical_modes) == 3
     assert isinstance(physical_modes[0], PhysicalMode)
+
+
+@pytest.fixture
+def async_physical_modes_apis():
+    return AsyncPhysicalModeApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncPhysicalModeApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock,
+    async_physical_modes_apis: AsyncPhysicalModeApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/physical_mode.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    physical_modes, _ = asyncio.run(
+        async_physical_modes_apis.list_entity_collection_from_region(
+            "tuz", PhysicalModeRequest()
+        )
+    )
+
+    # Then
+    assert len(physical_modes) == 3
+    assert isinstance(physical_modes[1], PhysicalMode)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -5,7 +6,10 @@ from unittest.mock import MagicMock, patch
 
 from navitia_client.entities.response.line_and_route import Route
 from navitia_client.entities.request.public_transportations import RouteRequest
-from navitia_client.client.apis.public_transportation_apis import RouteApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncRouteApiClient,
+    RouteApiClient,
+)
 
 
 @pytest.fixture
@@ -22,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/routes.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -42,7 +46,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/routes.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -52,3 +56,32 @@ def test_get_entity_by_id(
     # Then
     assert len(routes) == 2
     assert isinstance(routes[0], Route)
+
+
+@pytest.fixture
+def async_route_apis():
+    return AsyncRouteApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncRouteApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_route_apis: AsyncRouteApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/routes.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    routes, _ = asyncio.run(
+        async_route_apis.list_entity_collection_from_region("tuz", RouteRequest())
+    )
+
+    # Then
+    assert len(routes) == 2
+    assert isinstance(routes[0], Route)
+    assert isinstance(routes[1], Route)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import pytest
 
@@ -5,7 +6,10 @@ from unittest.mock import MagicMock, patch
 
 from navitia_client.entities.response.stop_area import StopArea
 from navitia_client.entities.request.public_transportations import StopAreaRequest
-from navitia_client.client.apis.public_transportation_apis import StopAreaApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncStopAreaApiClient,
+    StopAreaApiClient,
+)
 
 
 @pytest.fixture
@@ -22,7 +26,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/stop_areas.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -43,7 +47,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/stop_areas.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -53,3 +57,33 @@ def test_get_entity_by_id(
     # Then
     assert len(physical_modes) == 3
     assert isinstance(physical_modes[0], StopArea)
+
+
+@pytest.fixture
+def async_stop_area_apis():
+    return AsyncStopAreaApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncStopAreaApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_stop_area_apis: AsyncStopAreaApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/stop_areas.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    physical_modes, _ = asyncio.run(
+        async_stop_area_apis.list_entity_collection_from_region(
+            "bar", StopAreaRequest()
+        )
+    )
+
+    # Then
+    assert len(physical_modes) == 3
+    assert isinstance(physical_modes[1], StopArea)
@@ -1,11 +1,16 @@
+import asyncio
 import json
 import pytest
+from typing import AsyncIterator, Iterator
 
 from unittest.mock import MagicMock, patch
 
 from navitia_client.entities.response.stop_area import StopPoint
 from navitia_client.entities.request.public_transportations import StopPointRequest
-from navitia_client.client.apis.public_transportation_apis import StopPointApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncStopPointApiClient,
+    StopPointApiClient,
+)
 
 
 @pytest.fixture
@@ -22,7 +27,7 @@ def test_list_entity_collection_from_region(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -43,7 +48,7 @@ def test_get_entity_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -53,3 +58,184 @@ def test_get_entity_by_id(
     # Then
     assert len(physical_modes) == 3
     assert isinstance(physical_modes[0], StopPoint)
+
+
+@pytest.fixture
+def async_stop_point_apis():
+    return AsyncStopPointApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncStopPointApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_stop_point_apis: AsyncStopPointApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    physical_modes, _ = asyncio.run(
+        async_stop_point_apis.list_entity_collection_from_region(
+            "bar", StopPointRequest()
+        )
+    )
+
+    # Then
+    assert len(physical_modes) == 3
+    assert isinstance(physical_modes[1], StopPoint)
+
+
+@patch.object(StopPointApiClient, "get_navitia_api")
+def test_iter_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, stop_point_apis: StopPointApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    mock_responses = []
+    for start_page in range(4):
+        mock_response = MagicMock()
+        mock_response.payload = {
+            **payload,
+            "pagination": {**payload["pagination"], "start_page": start_page},
+        }
+        mock_responses.append(mock_response)
+    mock_get_navitia_api.side_effect = mock_responses
+
+    # When
+    stop_points = list(
+        stop_point_apis.iter_entity_collection_from_region("bar", StopPointRequest())
+    )
+
+    # Then
+    assert len(stop_points) == 12
+    assert all(isinstance(stop_point, StopPoint) for stop_point in stop_points)
+    assert mock_get_navitia_api.call_count == 4
+    assert "start_page=3" in mock_get_navitia_api.call_args.args[0]
+
+
+@patch.object(AsyncStopPointApiClient, "get_navitia_api")
+def test_async_iter_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, async_stop_point_apis: AsyncStopPointApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+    mock_response.payload["pagination"]["total_result"] = 3
+
+    mock_get_navitia_api.return_value = mock_response
+
+    async def run() -> list[StopPoint]:
+        return [
+            stop_point
+            async for stop_point in async_stop_point_apis.iter_entity_collection_from_region(
+                "bar", StopPointRequest()
+            )
+        ]
+
+    # When
+    stop_points = asyncio.run(run())
+
+    # Then
+    assert len(stop_points) == 3
+    mock_get_navitia_api.assert_called_once()
+
+
+@patch.object(StopPointApiClient, "get_navitia_api")
+def test_fetch_all_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock, stop_point_apis: StopPointApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    def get_navitia_api(url: str) -> MagicMock:
+        start_page = int(url.split("start_page=")[1].split("&")[0])
+        mock_response = MagicMock()
+        mock_response.payload = {
+            **payload,
+            "pagination": {**payload["pagination"], "start_page": start_page},
+        }
+        return mock_response
+
+    mock_get_navitia_api.side_effect = get_navitia_api
+
+    # When
+    stop_points = stop_point_apis.fetch_all_entity_collection_from_region(
+        "bar", StopPointRequest()
+    )
+
+    # Then
+    assert len(stop_points) == 12
+    assert mock_get_navitia_api.call_count == 4
+
+
+@patch.object(StopPointApiClient, "stream_navitia_api")
+def test_stream_entity_collection_from_region(
+    mock_stream_navitia_api: MagicMock, stop_point_apis: StopPointApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    def stream_navitia_api(url: str, collection: str, members: dict) -> Iterator:
+        start_page = int(url.split("start_page=")[1].split("&")[0])
+        members["pagination"] = {**payload["pagination"], "start_page": start_page}
+        return iter(payload[collection])
+
+    mock_stream_navitia_api.side_effect = stream_navitia_api
+
+    # When
+    stop_points = list(
+        stop_point_apis.stream_entity_collection_from_region("bar", StopPointRequest())
+    )
+
+    # Then
+    assert len(stop_points) == 12
+    assert all(isinstance(stop_point, StopPoint) for stop_point in stop_points)
+    assert mock_stream_navitia_api.call_count == 4
+    assert mock_stream_navitia_api.call_args.args[0].startswith(
+        "https://api.navitia.io/v1//coverage/bar/stop_points?"
+    )
+    assert "start_page=3" in mock_stream_navitia_api.call_args.args[0]
+
+
+@patch.object(AsyncStopPointApiClient, "stream_navitia_api")
+def test_async_stream_entity_collection_from_coordinates(
+    mock_stream_navitia_api: MagicMock, async_stop_point_apis: AsyncStopPointApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/stop_points.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    async def stream_navitia_api(
+        url: str, collection: str, members: dict
+    ) -> AsyncIterator:
+        members["pagination"] = {**payload["pagination"], "total_result": 3}
+        for item in payload[collection]:
+            yield item
+
+    mock_stream_navitia_api.side_effect = stream_navitia_api
+
+    async def run() -> list[StopPoint]:
+        return [
+            stop_point
+            async for stop_point in async_stop_point_apis.stream_entity_collection_from_coordinates(
+                2.3, 48.8, StopPointRequest()
+            )
+        ]
+
+    # When
+    stop_points = asyncio.run(run())
+
+    # Then
+    assert len(stop_points) == 3
+    assert all(isinstance(stop_point, StopPoint) for stop_point in stop_points)
+    assert "/coverage/2.3;48.8/stop_points" in mock_stream_navitia_api.call_args.args[0]
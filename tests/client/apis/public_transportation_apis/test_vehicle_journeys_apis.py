@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from unittest.mock import MagicMock, patch
@@ -5,6 +6,7 @@ from unittest.mock import MagicMock, patch
 from navitia_client.entities.response.vehicle_journey import VehicleJourney
 from navitia_client.entities.request.public_transportations import VehicleJourneyRequest
 from navitia_client.client.apis.public_transportation_apis import (
+    AsyncVehicleJourneyApiClient,
     VehicleJourneyApiClient,
 )
 
@@ -22,7 +24,7 @@ def test_list_entity_collection_from_region(
 ) -> None:
     # Given
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.payload = {
         "vehicle_journeys": [
             {
                 "calendars": [
@@ -279,7 +281,7 @@ def test_get_entity_by_id(
 ) -> None:
     # Given
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.payload = {
         "vehicle_journeys": [
             {
                 "calendars": [
@@ -451,3 +453,42 @@ def test_get_entity_by_id(
     # Then
     assert len(vehicle_journeys) == 1
     assert isinstance(vehicle_journeys[0], VehicleJourney)
+
+
+@pytest.fixture
+def async_vehicle_journeys_apis():
+    return AsyncVehicleJourneyApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncVehicleJourneyApiClient, "get_navitia_api")
+def test_async_list_entity_collection_from_region(
+    mock_get_navitia_api: MagicMock,
+    async_vehicle_journeys_apis: AsyncVehicleJourneyApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    mock_response.payload = {
+        "vehicle_journeys": [],
+        "pagination": {
+            "items_on_page": 0,
+            "items_per_page": 25,
+            "start_page": 0,
+            "total_result": 0,
+        },
+    }
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    vehicle_journeys, pagination = asyncio.run(
+        async_vehicle_journeys_apis.list_entity_collection_from_region(
+            "tuz", VehicleJourneyRequest()
+        )
+    )
+
+    # Then
+    assert len(vehicle_journeys) == 0
+    assert pagination.total_result == 0
+    mock_get_navitia_api.assert_awaited_once()
+    assert "/coverage/tuz/vehicle_journeys?" in mock_get_navitia_api.call_args[0][0]
@@ -1,12 +1,35 @@
+import asyncio
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import httpx
 import pytest
-from requests import Response  # type: ignore
-from navitia_client.client.apis.api_base_client import ApiBaseClient
+from requests import Response, Session  # type: ignore
+from requests.exceptions import ConnectionError as RequestsConnectionError  # type: ignore
+from requests.exceptions import ReadTimeout as RequestsReadTimeout  # type: ignore
+from navitia_client.client.apis.api_base_client import (
+    ApiBaseClient,
+    AsyncApiBaseClient,
+    NavitiaResponse,
+    identity_scoped,
+)
+from navitia_client.client.deadline import deadline
 from navitia_client.client.exceptions import (
     NavitiaAccessTokenMissingError,
+    NavitiaDeadlineExceededError,
     NavitiaForbiddenAccessError,
     NavitiaUnableToParseError,
     NavitiaUnknownObjectError,
 )
+from navitia_client.client.cache import ResponseCache
+from navitia_client.client.rate_limit import RateLimiter
+from navitia_client.client.retry import NO_RETRY, RetryPolicy, RetryStats
+from navitia_client.client.singleflight import AsyncSingleFlight, SingleFlight
+from navitia_client.entities.response.identity_map import IdentityMap
+from navitia_client.entities.response.network import Network
 
 
 def test_http_base_client() -> None:
@@ -29,40 +52,77 @@ def api_base_client():
     )
 
 
-def test_check_response_for_exception(api_base_client: ApiBaseClient) -> None:
+def test_build_navitia_response_raises_on_error(
+    api_base_client: ApiBaseClient,
+) -> None:
     # Given
-    response = Response()
-    response._content = (
+    content = (
         b'{"error": {"id": "unknown_object", "message": "Unable to find place: 0;0"}}'
     )
     # When/Then
     with pytest.raises(NavitiaUnknownObjectError):
-        api_base_client._check_response_for_exception(response)
+        api_base_client._build_navitia_response("url", 404, content, 0.0)
 
     # Given
-    response = Response()
-    response._content = (
+    content = (
         b'{"error": {"id": "unable_to_parse", "message": "Unable to parse : {0;0}"}}'
     )
     # When/Then
     with pytest.raises(NavitiaUnableToParseError):
-        api_base_client._check_response_for_exception(response)
+        api_base_client._build_navitia_response("url", 400, content, 0.0)
 
     # Given
-    response = Response()
-    response._content = b'{"message": "no token"}'
+    content = b'{"message": "no token"}'
     # When/Then
     with pytest.raises(NavitiaAccessTokenMissingError):
-        api_base_client._check_response_for_exception(response)
+        api_base_client._build_navitia_response("url", 401, content, 0.0)
 
     # Given
-    response = Response()
-    response._content = (
+    content = (
         b'{"message": "It is either read-protected or not readable by the server."}'
     )
     # When/Then
     with pytest.raises(NavitiaForbiddenAccessError):
-        api_base_client._check_response_for_exception(response)
+        api_base_client._build_navitia_response("url", 403, content, 0.0)
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_decodes_payload(
+    mock_get: MagicMock, api_base_client: ApiBaseClient
+) -> None:
+    # Given
+    response = Response()
+    response.status_code = 200
+    response._content = b'{"regions": []}'
+    mock_get.return_value = response
+
+    # When
+    navitia_response = api_base_client.get_navitia_api(
+        "https://api.navitia.io/v1/coverage"
+    )
+
+    # Then
+    assert isinstance(navitia_response, NavitiaResponse)
+    assert navitia_response.payload == {"regions": []}
+    assert navitia_response.content == b'{"regions": []}'
+    assert navitia_response.status_code == 200
+    assert navitia_response.elapsed >= 0
+
+
+def test_navitia_response_behaves_as_requests_response() -> None:
+    # Given
+    navitia_response = NavitiaResponse(
+        url="url",
+        status_code=200,
+        content='{"name": "Gare de l\'Est"}'.encode("utf-8"),
+        payload={"name": "Gare de l'Est"},
+        elapsed=0.0,
+    )
+
+    # When/Then
+    assert navitia_response.json() == {"name": "Gare de l'Est"}
+    assert navitia_response.text == '{"name": "Gare de l\'Est"}'
+    assert navitia_response.ok
 
 
 def test_generate_filter_query(api_base_client: ApiBaseClient) -> None:
@@ -128,3 +188,818 @@ def test_generate_filter_query_arg_list_is_empty(
 
     # Then
     assert expected_filters_string == generated_filters_string
+
+
+def test_http_base_client_reuses_provided_session() -> None:
+    # Given
+    session = Session()
+
+    # When
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=session,
+    )
+
+    # Then
+    assert client.session is session
+
+
+def test_async_get_navitia_api() -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "foobar"
+        return httpx.Response(200, json={"regions": []})
+
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(
+            headers={"Authorization": "foobar"},
+            transport=httpx.MockTransport(handler),
+        ),
+    )
+
+    # When
+    response = asyncio.run(client.get_navitia_api("https://api.navitia.io/v1/coverage"))
+
+    # Then
+    assert response.payload == {"regions": []}
+
+
+def test_async_get_navitia_api_raises_on_error() -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            404,
+            json={"error": {"id": "unknown_object", "message": "Unable to find"}},
+        )
+
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    # When/Then
+    with pytest.raises(NavitiaUnknownObjectError):
+        asyncio.run(client.get_navitia_api("https://api.navitia.io/v1/coverage/foo"))
+
+
+def _build_response(
+    status_code: int, content: bytes, headers: dict[str, str] | None = None
+) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+@patch("navitia_client.client.apis.api_base_client.time.sleep")
+@patch.object(Session, "get")
+def test_get_navitia_api_retries_on_retryable_status(
+    mock_get: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    stats = RetryStats()
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        retry_policy=RetryPolicy(max_attempts=3, jitter=False),
+        retry_stats=stats,
+    )
+    mock_get.side_effect = [
+        _build_response(503, b"{}"),
+        _build_response(429, b"{}", {"Retry-After": "2"}),
+        _build_response(200, b'{"regions": []}'),
+    ]
+
+    # When
+    response = client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # Then
+    assert response.payload == {"regions": []}
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 2.0]
+    assert stats.attempts == 3
+    assert stats.retries == 2
+    assert stats.exhausted == 0
+    assert stats.backoff_time == 2.5
+    assert stats.retries_by_reason == {"503": 1, "429": 1}
+
+
+@patch("navitia_client.client.apis.api_base_client.time.sleep")
+@patch.object(Session, "get")
+def test_get_navitia_api_retries_on_connection_error(
+    mock_get: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    stats = RetryStats()
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        retry_policy=RetryPolicy(max_attempts=2),
+        retry_stats=stats,
+    )
+    mock_get.side_effect = [
+        RequestsConnectionError("Connection reset by peer"),
+        _build_response(200, b'{"regions": []}'),
+    ]
+
+    # When
+    response = client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # Then
+    assert response.payload == {"regions": []}
+    assert stats.retries_by_reason == {"ConnectionError": 1}
+
+
+@patch("navitia_client.client.apis.api_base_client.time.sleep")
+@patch.object(Session, "get")
+def test_get_navitia_api_gives_up_after_max_attempts(
+    mock_get: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    stats = RetryStats()
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        retry_policy=RetryPolicy(max_attempts=2),
+        retry_stats=stats,
+    )
+    mock_get.side_effect = RequestsConnectionError("Connection reset by peer")
+
+    # When/Then
+    with pytest.raises(RequestsConnectionError):
+        client.get_navitia_api("https://api.navitia.io/v1/coverage")
+    assert mock_get.call_count == 2
+    assert stats.exhausted == 1
+
+
+@patch("navitia_client.client.apis.api_base_client.time.sleep")
+@patch.object(Session, "get")
+def test_get_navitia_api_without_retry(
+    mock_get: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        retry_policy=NO_RETRY,
+    )
+    mock_get.return_value = _build_response(503, b'{"message": "unavailable"}')
+
+    # When
+    response = client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # Then
+    assert response.status_code == 503
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+@patch("navitia_client.client.apis.api_base_client.asyncio.sleep")
+def test_async_get_navitia_api_retries(mock_sleep: MagicMock) -> None:
+    # Given
+    responses = iter(
+        [
+            httpx.Response(502, json={}),
+            httpx.Response(200, json={"regions": []}),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(responses)
+
+    stats = RetryStats()
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(jitter=False),
+        retry_stats=stats,
+    )
+
+    # When
+    response = asyncio.run(client.get_navitia_api("https://api.navitia.io/v1/coverage"))
+
+    # Then
+    assert response.payload == {"regions": []}
+    mock_sleep.assert_called_once_with(0.5)
+    assert stats.retries_by_reason == {"502": 1}
+
+
+@patch("navitia_client.client.apis.api_base_client.asyncio.sleep")
+def test_async_get_navitia_api_retries_on_connection_error(
+    mock_sleep: MagicMock,
+) -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection reset by peer", request=request)
+
+    stats = RetryStats()
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(max_attempts=3),
+        retry_stats=stats,
+    )
+
+    # When/Then
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(client.get_navitia_api("https://api.navitia.io/v1/coverage"))
+    assert stats.attempts == 3
+    assert stats.retries_by_reason == {"ConnectError": 2}
+    assert stats.exhausted == 1
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_waits_for_rate_limiter(mock_get: MagicMock) -> None:
+    # Given
+    rate_limiter = MagicMock(spec=RateLimiter)
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        rate_limiter=rate_limiter,
+    )
+    mock_get.return_value = _build_response(200, b'{"regions": []}')
+
+    # When
+    client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # Then
+    rate_limiter.acquire.assert_called_once()
+
+
+def test_async_get_navitia_api_waits_for_rate_limiter() -> None:
+    # Given
+    rate_limiter = MagicMock(spec=RateLimiter)
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"regions": []})
+            )
+        ),
+        rate_limiter=rate_limiter,
+    )
+
+    # When
+    asyncio.run(client.get_navitia_api("https://api.navitia.io/v1/coverage"))
+
+    # Then
+    rate_limiter.aacquire.assert_awaited_once()
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_uses_response_cache(mock_get: MagicMock) -> None:
+    # Given
+    cache = ResponseCache()
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        response_cache=cache,
+    )
+    mock_get.return_value = _build_response(200, b'{"lines": []}')
+
+    # When
+    first = client.get_navitia_api("https://api.navitia.io/v1/coverage/fr-idf/lines")
+    second = client.get_navitia_api("https://api.navitia.io/v1/coverage/fr-idf/lines")
+
+    # Then
+    assert second is first
+    mock_get.assert_called_once()
+    assert cache.hits == 1
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_does_not_share_cache_between_tokens(
+    mock_get: MagicMock,
+) -> None:
+    # Given
+    cache = ResponseCache()
+    clients = [
+        ApiBaseClient(
+            auth_token=auth_token,
+            base_navitia_url="https://api.navitia.io/v1/",
+            response_cache=cache,
+        )
+        for auth_token in ("foobar", "other")
+    ]
+    mock_get.side_effect = lambda *args, **kwargs: _build_response(
+        200, b'{"lines": []}'
+    )
+
+    # When
+    for client in clients:
+        client.get_navitia_api("https://api.navitia.io/v1/coverage/fr-idf/lines")
+
+    # Then
+    assert mock_get.call_count == 2
+    assert len(cache) == 2
+
+
+def test_async_get_navitia_api_uses_response_cache() -> None:
+    # Given
+    handler = MagicMock(return_value=httpx.Response(200, json={"lines": []}))
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        response_cache=ResponseCache(),
+    )
+
+    async def run() -> None:
+        for _ in range(3):
+            await client.get_navitia_api(
+                "https://api.navitia.io/v1/coverage/fr-idf/lines"
+            )
+
+    # When
+    asyncio.run(run())
+
+    # Then
+    handler.assert_called_once()
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_uses_timeouts(mock_get: MagicMock) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        connect_timeout=2,
+        read_timeout=10,
+    )
+    mock_get.return_value = _build_response(200, b'{"regions": []}')
+
+    # When
+    client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # Then
+    mock_get.assert_called_once_with(
+        "https://api.navitia.io/v1/coverage", timeout=(2, 10)
+    )
+
+
+@patch("navitia_client.client.deadline.time.monotonic", return_value=100.0)
+@patch.object(Session, "get")
+def test_get_navitia_api_timeouts_fit_deadline(
+    mock_get: MagicMock, mock_monotonic: MagicMock
+) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+    mock_get.return_value = _build_response(200, b'{"regions": []}')
+
+    # When
+    with deadline(1.5):
+        client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # Then
+    assert mock_get.call_args.kwargs["timeout"] == (1.5, 1.5)
+
+
+@patch("navitia_client.client.deadline.time.monotonic")
+@patch.object(Session, "get")
+def test_get_navitia_api_raises_on_read_timeout_past_deadline(
+    mock_get: MagicMock, mock_monotonic: MagicMock
+) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+    mock_monotonic.return_value = 100.0
+
+    def stalled_get(*args, **kwargs):
+        mock_monotonic.return_value = 102.0
+        raise RequestsReadTimeout("Read timed out")
+
+    mock_get.side_effect = stalled_get
+
+    # When/Then
+    with deadline(1):
+        with pytest.raises(NavitiaDeadlineExceededError):
+            client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_raises_on_read_timeout(mock_get: MagicMock) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+    mock_get.side_effect = RequestsReadTimeout("Read timed out")
+
+    # When/Then
+    with pytest.raises(RequestsReadTimeout):
+        client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+
+@patch("navitia_client.client.apis.api_base_client.time.sleep")
+@patch.object(Session, "get")
+def test_get_navitia_api_does_not_retry_past_deadline(
+    mock_get: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        retry_policy=RetryPolicy(jitter=False),
+    )
+    mock_get.return_value = _build_response(503, b"{}", {"Retry-After": "30"})
+
+    # When/Then
+    with deadline(5):
+        with pytest.raises(NavitiaDeadlineExceededError):
+            client.get_navitia_api("https://api.navitia.io/v1/coverage")
+    mock_get.assert_called_once()
+    mock_sleep.assert_not_called()
+
+
+def test_async_get_navitia_api_raises_past_deadline() -> None:
+    # Given
+    handler = MagicMock(return_value=httpx.Response(200, json={"regions": []}))
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run() -> None:
+        with deadline(0.05):
+            await asyncio.sleep(0.06)
+            await client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # When/Then
+    with pytest.raises(NavitiaDeadlineExceededError):
+        asyncio.run(run())
+    handler.assert_not_called()
+
+
+def test_async_get_navitia_api_timeouts_fit_deadline() -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.extensions["timeout"]["connect"] <= 2
+        assert request.extensions["timeout"]["read"] <= 2
+        return httpx.Response(200, json={"regions": []})
+
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run() -> None:
+        with deadline(2):
+            await client.get_navitia_api("https://api.navitia.io/v1/coverage")
+
+    # When/Then
+    asyncio.run(run())
+
+
+@patch.object(Session, "get")
+def test_get_navitia_api_coalesces_identical_calls(mock_get: MagicMock) -> None:
+    # Given
+    release = threading.Event()
+
+    def get(*args, **kwargs) -> Response:
+        release.wait(timeout=5)
+        return _build_response(200, b'{"departures": []}')
+
+    mock_get.side_effect = get
+    singleflight = SingleFlight()
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        singleflight=singleflight,
+    )
+    url = "https://api.navitia.io/v1/coverage/fr-idf/stop_areas/sa:1/departures"
+
+    # When
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(client.get_navitia_api, url) for _ in range(4)]
+        while singleflight.coalesced < 3:
+            pass
+        release.set()
+        responses = [future.result() for future in futures]
+
+    # Then
+    mock_get.assert_called_once()
+    assert all(response is responses[0] for response in responses)
+
+
+def test_async_get_navitia_api_coalesces_identical_calls() -> None:
+    # Given
+    handler = MagicMock(return_value=httpx.Response(200, json={"departures": []}))
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        singleflight=AsyncSingleFlight(),
+    )
+    url = "https://api.navitia.io/v1/coverage/fr-idf/stop_areas/sa:1/departures"
+
+    async def run() -> None:
+        await asyncio.gather(*(client.get_navitia_api(url) for _ in range(4)))
+
+    # When
+    asyncio.run(run())
+
+    # Then
+    handler.assert_called_once()
+
+
+_NETWORKS = b'{"networks": [{"id": "network:1", "name": "N"}, {"id": "network:1", "name": "N"}]}'
+
+
+class _NetworksClient(ApiBaseClient):
+    @identity_scoped
+    def list_networks(self) -> list[Network]:
+        response = self.get_navitia_api("https://api.navitia.io/v1/networks")
+        return [Network.from_payload(data) for data in response.payload["networks"]]
+
+
+class _AsyncNetworksClient(AsyncApiBaseClient):
+    @identity_scoped
+    async def list_networks(self) -> list[Network]:
+        response = await self.get_navitia_api("https://api.navitia.io/v1/networks")
+        return [Network.from_payload(data) for data in response.payload["networks"]]
+
+
+@patch.object(Session, "get")
+def test_identity_scoped_shares_entities_within_a_response(mock_get: MagicMock) -> None:
+    # Given
+    mock_get.return_value = _build_response(200, _NETWORKS)
+    client = _NetworksClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+    # When
+    first = client.list_networks()
+    second = client.list_networks()
+
+    # Then
+    assert first[0] is first[1]
+    assert second[0] is not first[0]
+
+
+@patch.object(Session, "get")
+def test_identity_scoped_shares_entities_across_responses(mock_get: MagicMock) -> None:
+    # Given
+    mock_get.return_value = _build_response(200, _NETWORKS)
+    identity_map = IdentityMap()
+    client = _NetworksClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        identity_map=identity_map,
+    )
+
+    # When
+    first = client.list_networks()
+    second = client.list_networks()
+
+    # Then
+    assert second[0] is first[0]
+    assert identity_map.hits == 3
+
+
+def test_async_identity_scoped_shares_entities_within_a_response() -> None:
+    # Given
+    handler = MagicMock(return_value=httpx.Response(200, content=_NETWORKS))
+    client = _AsyncNetworksClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    # When
+    networks = asyncio.run(client.list_networks())
+
+    # Then
+    assert networks[0] is networks[1]
+
+
+def _build_streamed_response(status_code: int, content: bytes) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+_STREAMED_NETWORKS = (
+    b'{"networks": [{"id": "network:1"}, {"id": "network:2"}], '
+    b'"pagination": {"start_page": 0, "items_on_page": 2}}'
+)
+
+
+@patch.object(Session, "get")
+def test_stream_navitia_api_yields_items_of_the_collection(
+    mock_get: MagicMock, api_base_client: ApiBaseClient
+) -> None:
+    # Given
+    mock_get.return_value = _build_streamed_response(200, _STREAMED_NETWORKS)
+    payload: dict = {}
+
+    # When
+    stream = api_base_client.stream_navitia_api(
+        "https://api.navitia.io/v1/coverage/foo/networks", "networks", payload
+    )
+    first = next(stream)
+
+    # Then
+    assert first == {"id": "network:1"}
+    assert payload == {}
+    assert list(stream) == [{"id": "network:2"}]
+    assert payload == {"pagination": {"start_page": 0, "items_on_page": 2}}
+    assert mock_get.call_args.kwargs["stream"] is True
+
+
+@patch.object(Session, "get")
+def test_stream_navitia_api_bypasses_response_cache(mock_get: MagicMock) -> None:
+    # Given
+    cache = ResponseCache()
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        response_cache=cache,
+    )
+    mock_get.side_effect = lambda *args, **kwargs: _build_streamed_response(
+        200, _STREAMED_NETWORKS
+    )
+    url = "https://api.navitia.io/v1/coverage/foo/networks"
+
+    # When
+    list(client.stream_navitia_api(url, "networks"))
+    list(client.stream_navitia_api(url, "networks"))
+
+    # Then
+    assert mock_get.call_count == 2
+    assert cache.get(url) is None
+
+
+@patch.object(Session, "get")
+def test_stream_navitia_api_raises_on_error(
+    mock_get: MagicMock, api_base_client: ApiBaseClient
+) -> None:
+    # Given
+    mock_get.return_value = _build_streamed_response(
+        404, b'{"error": {"id": "unknown_object", "message": "Unable to find"}}'
+    )
+
+    # When/Then
+    with pytest.raises(NavitiaUnknownObjectError):
+        list(
+            api_base_client.stream_navitia_api(
+                "https://api.navitia.io/v1/coverage/foo/networks", "networks"
+            )
+        )
+
+
+@patch.object(Session, "get")
+def test_stream_navitia_api_raises_on_truncated_body(
+    mock_get: MagicMock, api_base_client: ApiBaseClient
+) -> None:
+    # Given
+    mock_get.return_value = _build_streamed_response(200, _STREAMED_NETWORKS[:40])
+
+    # When/Then
+    with pytest.raises(ValueError):
+        list(
+            api_base_client.stream_navitia_api(
+                "https://api.navitia.io/v1/coverage/foo/networks", "networks"
+            )
+        )
+
+
+@patch("navitia_client.client.apis.api_base_client.STREAM_CHUNK_SIZE", 40)
+@patch.object(Session, "get")
+def test_stream_navitia_api_checks_deadline_per_chunk(
+    mock_get: MagicMock, api_base_client: ApiBaseClient
+) -> None:
+    # Given
+    mock_get.return_value = _build_streamed_response(200, _STREAMED_NETWORKS)
+
+    # When/Then
+    with deadline(0.05):
+        stream = api_base_client.stream_navitia_api(
+            "https://api.navitia.io/v1/coverage/foo/networks", "networks"
+        )
+        assert next(stream) == {"id": "network:1"}
+        time.sleep(0.06)
+        with pytest.raises(NavitiaDeadlineExceededError):
+            next(stream)
+
+
+@patch("navitia_client.client.apis.api_base_client.time.sleep")
+@patch.object(Session, "get")
+def test_stream_navitia_api_retries_on_retryable_status(
+    mock_get: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    client = ApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        retry_policy=RetryPolicy(max_attempts=2, jitter=False),
+    )
+    unavailable = _build_streamed_response(503, b"{}")
+    mock_get.side_effect = [
+        unavailable,
+        _build_streamed_response(200, _STREAMED_NETWORKS),
+    ]
+
+    # When
+    networks = list(
+        client.stream_navitia_api(
+            "https://api.navitia.io/v1/coverage/foo/networks", "networks"
+        )
+    )
+
+    # Then
+    assert len(networks) == 2
+    assert unavailable.raw.closed
+    mock_sleep.assert_called_once()
+
+
+def test_async_stream_navitia_api() -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_STREAMED_NETWORKS)
+
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    payload: dict = {}
+
+    async def run() -> list:
+        return [
+            network
+            async for network in client.stream_navitia_api(
+                "https://api.navitia.io/v1/coverage/foo/networks", "networks", payload
+            )
+        ]
+
+    # When
+    networks = asyncio.run(run())
+
+    # Then
+    assert networks == [{"id": "network:1"}, {"id": "network:2"}]
+    assert payload["pagination"] == {"start_page": 0, "items_on_page": 2}
+
+
+@patch("navitia_client.client.apis.api_base_client.STREAM_CHUNK_SIZE", 40)
+def test_async_stream_navitia_api_checks_deadline_per_chunk() -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_STREAMED_NETWORKS)
+
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run() -> None:
+        with deadline(0.05):
+            stream = client.stream_navitia_api(
+                "https://api.navitia.io/v1/coverage/foo/networks", "networks"
+            )
+            assert await anext(stream) == {"id": "network:1"}
+            await asyncio.sleep(0.06)
+            with pytest.raises(NavitiaDeadlineExceededError):
+                await anext(stream)
+
+    # When/Then
+    asyncio.run(run())
+
+
+def test_async_stream_navitia_api_raises_on_error() -> None:
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            404,
+            json={"error": {"id": "unknown_object", "message": "Unable to find"}},
+        )
+
+    client = AsyncApiBaseClient(
+        auth_token="foobar",
+        base_navitia_url="https://api.navitia.io/v1/",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    async def run() -> list:
+        return [
+            network
+            async for network in client.stream_navitia_api(
+                "https://api.navitia.io/v1/coverage/foo/networks", "networks"
+            )
+        ]
+
+    # When/Then
+    with pytest.raises(NavitiaUnknownObjectError):
+        asyncio.run(run())
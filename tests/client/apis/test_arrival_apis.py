@@ -1,11 +1,14 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.arrival_apis import (
+    AsyncArrivalApiClient,
     ArrivalApiClient,
 )
+from navitia_client.client.exceptions import NavitiaUnknownObjectError
 from navitia_client.entities.request.arrival import ArrivalRequest
 from navitia_client.entities.response.arrival import Arrival
 
@@ -24,7 +27,7 @@ def test_list_objects_by_id_and_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -46,7 +49,7 @@ def test_list_objects_by_coordinates(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -59,3 +62,143 @@ def test_list_objects_by_coordinates(
     # Then
     assert len(arrivals) == 10
     assert isinstance(arrivals[0], Arrival)
+
+
+@pytest.fixture
+def async_arrival_apis():
+    return AsyncArrivalApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncArrivalApiClient, "get_navitia_api")
+def test_async_list_objects_by_id_and_path(
+    mock_get_navitia_api: MagicMock, async_arrival_apis: AsyncArrivalApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    request = ArrivalRequest()
+    arrivals, _ = asyncio.run(
+        async_arrival_apis.list_arrivals_by_region_id_and_path(
+            region_id="bar", resource_path="foo:bar:fuzz", request=request
+        )
+    )
+
+    # Then
+    assert len(arrivals) == 10
+    assert isinstance(arrivals[0], Arrival)
+
+
+@patch.object(AsyncArrivalApiClient, "get_navitia_api")
+def test_async_list_arrivals_with_fields(
+    mock_get_navitia_api: MagicMock, async_arrival_apis: AsyncArrivalApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = ArrivalRequest(fields=["stop_point.name", "stop_date_time"])
+
+    # When
+    arrivals, _ = asyncio.run(
+        async_arrival_apis.list_arrivals_by_coordinates(
+            region_lon=1.1, region_lat=1.2, lon=2.1, lat=2.2, request=request
+        )
+    )
+
+    # Then
+    assert len(arrivals) == 10
+    assert isinstance(arrivals[0], Arrival)
+    assert arrivals[0].stop_point.name is not None
+    assert not hasattr(arrivals[0].stop_point, "coord")
+    assert arrivals[0].stop_date_time.links is not None
+    assert not hasattr(arrivals[0], "route")
+
+
+@patch.object(AsyncArrivalApiClient, "get_navitia_api")
+def test_async_list_arrival_columns_by_coordinates(
+    mock_get_navitia_api: MagicMock, async_arrival_apis: AsyncArrivalApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    columns, _ = asyncio.run(
+        async_arrival_apis.list_arrival_columns_by_coordinates(
+            region_lon=1.1, region_lat=1.2, lon=2.1, lat=2.2, request=ArrivalRequest()
+        )
+    )
+
+    # Then
+    assert len(columns) == 10
+    assert len(columns.date_times) == 10
+    assert mock_get_navitia_api.call_args[0][0].startswith(
+        "https://api.navitia.io/v1//coverage/1.1;1.2/coords/2.1;2.2/arrivals?"
+    )
+
+
+@patch.object(ArrivalApiClient, "get_navitia_api")
+def test_list_arrivals_by_region_id_and_paths(
+    mock_get_navitia_api: MagicMock, arrival_apis: ArrivalApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    def get_navitia_api(url: str) -> MagicMock:
+        if "stop_point:bad" in url:
+            raise NavitiaUnknownObjectError("Unknown object")
+        return mock_response
+
+    mock_get_navitia_api.side_effect = get_navitia_api
+    paths = ["stop_points/stop_point:1", "stop_points/stop_point:bad"] * 2
+
+    # When
+    bulk_result = arrival_apis.list_arrivals_by_region_id_and_paths(
+        region_id="bar", resource_paths=paths, request=ArrivalRequest()
+    )
+
+    # Then
+    assert mock_get_navitia_api.call_count == 2
+    arrivals, _ = bulk_result.results["stop_points/stop_point:1"]
+    assert len(arrivals) == 10
+    assert isinstance(
+        bulk_result.errors["stop_points/stop_point:bad"], NavitiaUnknownObjectError
+    )
+
+
+@patch.object(AsyncArrivalApiClient, "get_navitia_api")
+def test_async_list_arrivals_by_region_id_and_paths(
+    mock_get_navitia_api: MagicMock, async_arrival_apis: AsyncArrivalApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/arrivals.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    paths = ["stop_points/stop_point:1", "stop_points/stop_point:2"]
+
+    # When
+    bulk_result = asyncio.run(
+        async_arrival_apis.list_arrivals_by_region_id_and_paths(
+            region_id="bar", resource_paths=paths, request=ArrivalRequest()
+        )
+    )
+
+    # Then
+    assert list(bulk_result.results) == paths
+    assert bulk_result.ok
@@ -1,9 +1,13 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.contributors_apis import ContributorsApiClient
+from navitia_client.client.apis.contributors_apis import (
+    AsyncContributorsApiClient,
+    ContributorsApiClient,
+)
 from navitia_client.entities.request.contributor import ContributorRequest
 from navitia_client.entities.response.contributor import Contributor
 from navitia_client.entities.response import Pagination
@@ -23,7 +27,7 @@ def test_list_contributors(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/contributors.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = ContributorRequest()
@@ -50,7 +54,7 @@ def test_get_region_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/contributors.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
     mock_get_navitia_api.return_value = mock_response
     request = ContributorRequest()
 
@@ -66,3 +70,37 @@ def test_get_region_by_id(
     assert contributors[0].id == "foo:foo-piv"
     assert contributors[0].license == "Private"
     assert contributors[0].website == ""
+
+
+@pytest.fixture
+def async_contributors_apis():
+    return AsyncContributorsApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncContributorsApiClient, "get_navitia_api")
+def test_async_list_contributors(
+    mock_get_navitia_api: MagicMock, async_contributors_apis: AsyncContributorsApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/contributors.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = ContributorRequest()
+
+    # When
+    contributors, pagination = asyncio.run(
+        async_contributors_apis.list_contributors(region_id="bar", request=request)
+    )
+
+    # Then
+    assert len(contributors) == 1
+    assert isinstance(contributors[0], Contributor)
+    assert contributors[0].name == "foo Production"
+    assert contributors[0].id == "foo:foo-piv"
+    assert contributors[0].license == "Private"
+    assert contributors[0].website == ""
+    assert isinstance(pagination, Pagination)
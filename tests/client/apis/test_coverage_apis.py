@@ -1,10 +1,14 @@
 from datetime import datetime
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.coverage_apis import CoverageApiClient
+from navitia_client.client.apis.coverage_apis import (
+    AsyncCoverageApiClient,
+    CoverageApiClient,
+)
 from navitia_client.entities.request.coverage import CoverageRequest
 from navitia_client.entities.response.administrative_region import Region
 from navitia_client.entities.response import Pagination
@@ -24,7 +28,7 @@ def test_list_covered_areas(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/coverage.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = CoverageRequest()
@@ -52,7 +56,7 @@ def test_get_region_by_id(
 ) -> None:
     # Given
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.payload = {
         "regions": [
             {
                 "id": "region1",
@@ -90,7 +94,7 @@ def test_get_region_by_coordinates(
 ) -> None:
     # Given
     mock_response = MagicMock()
-    mock_response.json.return_value = {
+    mock_response.payload = {
         "regions": [
             {
                 "id": "region1",
@@ -124,3 +128,41 @@ def test_get_region_by_coordinates(
     assert len(regions) == 1
     assert isinstance(regions[0], Region)
     assert isinstance(pagination, Pagination)
+
+
+@pytest.fixture
+def async_coverage_apis():
+    return AsyncCoverageApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncCoverageApiClient, "get_navitia_api")
+def test_async_list_covered_areas(
+    mock_get_navitia_api: MagicMock, async_coverage_apis: AsyncCoverageApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/coverage.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = CoverageRequest()
+
+    # When
+    regions, pagination = asyncio.run(
+        async_coverage_apis.list_covered_areas(request=request)
+    )
+
+    # Then
+    assert len(regions) == 1
+    assert isinstance(regions[0], Region)
+    assert regions[0].id == "region1"
+    assert regions[0].name == "Region 1"
+    assert regions[0].dataset_created_at == datetime(2022, 1, 1, 0, 0)
+    assert regions[0].end_production_date == datetime(2022, 12, 31, 0, 0)
+    assert regions[0].last_load_at == datetime(2022, 1, 1, 0, 0)
+    assert regions[0].shape == "shape_data"
+    assert regions[0].start_production_date == datetime(2022, 1, 1, 0, 0)
+    assert regions[0].status == "active"
+    assert isinstance(pagination, Pagination)
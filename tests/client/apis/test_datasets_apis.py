@@ -1,10 +1,14 @@
 from datetime import datetime
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.datasets_apis import DatasetsApiClient
+from navitia_client.client.apis.datasets_apis import (
+    AsyncDatasetsApiClient,
+    DatasetsApiClient,
+)
 from navitia_client.entities.request.dataset import DatasetRequest
 from navitia_client.entities.response.dataset import Dataset
 
@@ -23,7 +27,7 @@ def test_list_covered_areas(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/datasets.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = DatasetRequest()
@@ -54,7 +58,7 @@ def test_get_region_by_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/datasets.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = DatasetRequest()
@@ -78,7 +82,7 @@ def test_get_region_by_id_missing_contributor(
     with open(
         "tests/test_data/datasets_missing_contributor.json", encoding="utf-8"
     ) as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = DatasetRequest()
@@ -90,3 +94,43 @@ def test_get_region_by_id_missing_contributor(
 
     # Then
     assert len(datasets) == 0
+
+
+@pytest.fixture
+def async_datasets_apis():
+    return AsyncDatasetsApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncDatasetsApiClient, "get_navitia_api")
+def test_async_list_covered_areas(
+    mock_get_navitia_api: MagicMock, async_datasets_apis: AsyncDatasetsApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/datasets.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = DatasetRequest()
+
+    # When
+    datasets, _ = asyncio.run(
+        async_datasets_apis.list_datasets(region_id="bar", request=request)
+    )
+
+    # Then
+    assert len(datasets) == 1
+    assert isinstance(datasets[0], Dataset)
+    assert datasets[0].description == ""
+    assert datasets[0].start_validation_date == datetime(2024, 4, 5, 2, 0, 0)
+    assert datasets[0].end_validation_date == datetime(2024, 4, 28, 2, 0, 0)
+    assert datasets[0].id == "foo:xxx"
+    assert datasets[0].realtime_level == "base_schedule"
+    assert datasets[0].system == ""
+    contributor = datasets[0].contributor
+    assert contributor.name == "foo Production"
+    assert contributor.id == "foo:foo-piv"
+    assert contributor.license == "Private"
+    assert contributor.website == ""
@@ -1,11 +1,14 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.departure_apis import (
+    AsyncDepartureApiClient,
     DepartureApiClient,
 )
+from navitia_client.client.exceptions import NavitiaUnknownObjectError
 from navitia_client.entities.request.departure import DepartureRequest
 from navitia_client.entities.response.departure import Departure
 
@@ -24,7 +27,7 @@ def test_list_objects_by_region_id_and_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/departures.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = DepartureRequest()
@@ -46,7 +49,7 @@ def test_list_objects_by_coordinates(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/departures.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = DepartureRequest()
@@ -59,3 +62,166 @@ def test_list_objects_by_coordinates(
     # Then
     assert len(departures) == 10
     assert isinstance(departures[0], Departure)
+
+
+@patch.object(DepartureApiClient, "get_navitia_api")
+def test_list_departures_with_fields(
+    mock_get_navitia_api: MagicMock, departure_apis: DepartureApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = DepartureRequest(
+        fields=["stop_date_time.departure_date_time", "route.id"]
+    )
+
+    # When
+    departures, _ = departure_apis.list_departures_by_region_id_and_path(
+        region_id="bar", resource_path="foo:bar:fuzz", request=request
+    )
+
+    # Then
+    assert len(departures) == 10
+    assert departures[0].route.id == "route:SNCF:B"
+    assert not hasattr(departures[0].route, "line")
+    assert departures[0].stop_date_time.departure_date_time is not None
+    assert not hasattr(departures[0].stop_date_time, "links")
+    assert not hasattr(departures[0], "stop_point")
+    assert "fields" not in request.to_filters()
+
+
+@patch.object(DepartureApiClient, "get_navitia_api")
+def test_list_departure_columns_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock, departure_apis: DepartureApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    columns, pagination = departure_apis.list_departure_columns_by_region_id_and_path(
+        region_id="bar", resource_path="foo:bar:fuzz", request=DepartureRequest()
+    )
+
+    # Then
+    assert len(columns) == 10
+    assert columns.route_ids[0] == "route:SNCF:B"
+    assert pagination.total_result == 10
+    assert mock_get_navitia_api.call_args[0][0].startswith(
+        "https://api.navitia.io/v1//coverage/bar/foo:bar:fuzz/departures?"
+    )
+
+
+@pytest.fixture
+def async_departure_apis():
+    return AsyncDepartureApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncDepartureApiClient, "get_navitia_api")
+def test_async_list_objects_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock, async_departure_apis: AsyncDepartureApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = DepartureRequest()
+
+    # When
+    departures, _ = asyncio.run(
+        async_departure_apis.list_departures_by_region_id_and_path(
+            region_id="bar", resource_path="foo:bar:fuzz", request=request
+        )
+    )
+
+    # Then
+    assert len(departures) == 10
+    assert isinstance(departures[0], Departure)
+
+
+@patch.object(DepartureApiClient, "get_navitia_api")
+def test_iter_departures_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock, departure_apis: DepartureApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    departures = list(
+        departure_apis.iter_departures_by_region_id_and_path(
+            region_id="bar", resource_path="foo:bar:fuzz", request=DepartureRequest()
+        )
+    )
+
+    # Then
+    assert len(departures) == 10
+    mock_get_navitia_api.assert_called_once()
+
+
+@patch.object(DepartureApiClient, "get_navitia_api")
+def test_list_departures_by_region_id_and_paths(
+    mock_get_navitia_api: MagicMock, departure_apis: DepartureApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    def get_navitia_api(url: str) -> MagicMock:
+        if "stop_point:bad" in url:
+            raise NavitiaUnknownObjectError("Unknown object")
+        return mock_response
+
+    mock_get_navitia_api.side_effect = get_navitia_api
+    paths = ["stop_points/stop_point:1", "stop_points/stop_point:bad"] * 2
+
+    # When
+    bulk_result = departure_apis.list_departures_by_region_id_and_paths(
+        region_id="bar", resource_paths=paths, request=DepartureRequest()
+    )
+
+    # Then
+    assert mock_get_navitia_api.call_count == 2
+    departures, _ = bulk_result.results["stop_points/stop_point:1"]
+    assert len(departures) == 10
+    assert isinstance(
+        bulk_result.errors["stop_points/stop_point:bad"], NavitiaUnknownObjectError
+    )
+
+
+@patch.object(AsyncDepartureApiClient, "get_navitia_api")
+def test_async_list_departures_by_region_id_and_paths(
+    mock_get_navitia_api: MagicMock, async_departure_apis: AsyncDepartureApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    paths = ["stop_points/stop_point:1", "stop_points/stop_point:2"]
+
+    # When
+    bulk_result = asyncio.run(
+        async_departure_apis.list_departures_by_region_id_and_paths(
+            region_id="bar", resource_paths=paths, request=DepartureRequest()
+        )
+    )
+
+    # Then
+    assert list(bulk_result.results) == paths
+    assert bulk_result.ok
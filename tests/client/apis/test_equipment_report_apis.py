@@ -1,9 +1,13 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.equipment_report_apis import EquipmentReportsApiClient
+from navitia_client.client.apis.equipment_report_apis import (
+    AsyncEquipmentReportsApiClient,
+    EquipmentReportsApiClient,
+)
 from navitia_client.entities.request.equipment_report import EquipmentReportRequest
 
 
@@ -24,7 +28,7 @@ def test_list_equipment_reports(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/equipment_reports.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -51,7 +55,7 @@ def test_list_equipment_reports_with_resource_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/equipment_reports.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -72,3 +76,40 @@ def test_list_equipment_reports_with_resource_path(
     assert len(equipment_reports[0].stop_area_equipments) > 0
     assert pagination.total_result == 2
     assert pagination.items_on_page == 2
+
+
+@pytest.fixture
+def async_equipment_report_apis():
+    return AsyncEquipmentReportsApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncEquipmentReportsApiClient, "get_navitia_api")
+def test_async_list_equipment_reports(
+    mock_get_navitia_api: MagicMock,
+    async_equipment_report_apis: AsyncEquipmentReportsApiClient,
+) -> None:
+    """
+    Test that list_equipment_reports returns equipment reports and pagination.
+    """
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/equipment_reports.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    equipment_reports, pagination = asyncio.run(
+        async_equipment_report_apis.list_equipment_reports(
+            region_id="fr-idf", request=EquipmentReportRequest()
+        )
+    )
+
+    # Then
+    assert len(equipment_reports) == 2
+    assert equipment_reports[0].line is not None
+    assert len(equipment_reports[0].stop_area_equipments) > 0
+    assert pagination.total_result == 2
+    assert pagination.items_on_page == 2
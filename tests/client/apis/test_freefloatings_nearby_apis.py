@@ -1,9 +1,11 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.freefloatings_nearby_apis import (
+    AsyncFreefloatingsNearbyApiClient,
     FreefloatingsNearbyApiClient,
 )
 from navitia_client.entities.request.freefloatings_nearby import (
@@ -29,7 +31,7 @@ def test_list_freefloatings_nearby(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/freefloatings_nearby.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -67,7 +69,7 @@ def test_list_freefloatings_nearby_with_resource_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/freefloatings_nearby.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -103,7 +105,7 @@ def test_list_freefloatings_nearby_by_coordinates(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/freefloatings_nearby.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -137,7 +139,7 @@ def test_list_freefloatings_nearby_by_coordinates_only(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/freefloatings_nearby.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -156,3 +158,50 @@ def test_list_freefloatings_nearby_by_coordinates_only(
     assert free_floatings[0].type == "scooter"
     assert free_floatings[1].type == "bike"
     assert pagination.total_result == 2
+
+
+@pytest.fixture
+def async_freefloatings_nearby_apis():
+    return AsyncFreefloatingsNearbyApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncFreefloatingsNearbyApiClient, "get_navitia_api")
+def test_async_list_freefloatings_nearby(
+    mock_get_navitia_api: MagicMock,
+    async_freefloatings_nearby_apis: AsyncFreefloatingsNearbyApiClient,
+) -> None:
+    """
+    Test that list_freefloatings_nearby returns free floatings and pagination.
+    """
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/freefloatings_nearby.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    free_floatings, pagination = asyncio.run(
+        async_freefloatings_nearby_apis.list_freefloatings_nearby(
+            region_id="fr-idf",
+            lon=2.3522,
+            lat=48.8566,
+            request=FreefloatingsNearbyRequest(),
+        )
+    )
+
+    # Then
+    assert len(free_floatings) == 2
+    assert free_floatings[0].public_id == "scooter_12345"
+    assert free_floatings[0].provider_name == "Lime"
+    assert free_floatings[0].type == "scooter"
+    assert free_floatings[0].propulsion == "electric"
+    assert free_floatings[0].battery == 85
+    assert free_floatings[0].distance == 120
+    assert free_floatings[0].coord is not None
+    assert free_floatings[0].coord.lat == "48.8560"
+    assert free_floatings[0].coord.lon == "2.3500"
+    assert pagination.total_result == 2
+    assert pagination.items_on_page == 2
@@ -1,9 +1,11 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.inverted_geocoding_apis import (
+    AsyncInvertedGeocodingApiClient,
     InvertedGeocodingApiClient,
 )
 from navitia_client.entities.response.place import Place
@@ -23,7 +25,7 @@ def test_list_objects(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/inverted_geocoding.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -35,3 +37,34 @@ def test_list_objects(
     # Then
     assert len(places) == 1
     assert isinstance(places[0], Place)
+
+
+@pytest.fixture
+def async_inverted_geocoding_apis():
+    return AsyncInvertedGeocodingApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncInvertedGeocodingApiClient, "get_navitia_api")
+def test_async_list_objects(
+    mock_get_navitia_api: MagicMock,
+    async_inverted_geocoding_apis: AsyncInvertedGeocodingApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/inverted_geocoding.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    places = asyncio.run(
+        async_inverted_geocoding_apis.get_address_from_region_id_and_id(
+            region_id="foo", id="bar"
+        )
+    )
+
+    # Then
+    assert len(places) == 1
+    assert isinstance(places[0], Place)
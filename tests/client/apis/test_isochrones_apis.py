@@ -1,10 +1,15 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.isochrone_apis import IsochronesApiClient
+from navitia_client.client.apis.isochrone_apis import (
+    AsyncIsochronesApiClient,
+    IsochronesApiClient,
+)
 from navitia_client.entities.request.isochrone import IsochroneRequest
+from navitia_client.entities.response.geometry import Geometry
 from navitia_client.entities.response.isochrones import Isochrone
 
 
@@ -22,7 +27,7 @@ def test_list_covered_areas_with_region_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/isochrones.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -44,7 +49,7 @@ def test_list_covered_areas(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/isochrones.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -55,3 +60,54 @@ def test_list_covered_areas(
     # Then
     assert len(isocrhones) == 1
     assert isinstance(isocrhones[0], Isochrone)
+
+
+@patch.object(IsochronesApiClient, "get_navitia_api")
+def test_list_isochrones_with_compact_geometry(
+    mock_get_navitia_api: MagicMock, isochrones_apis: IsochronesApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/isochrones.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    request = IsochroneRequest(from_="foo")
+    isochrones = isochrones_apis.list_isochrones(request=request, compact_geometry=True)
+
+    # Then
+    assert isinstance(isochrones[0].geojson, Geometry)
+    assert isochrones[0].geojson.type == "MultiPolygon"
+
+
+@pytest.fixture
+def async_isochrones_apis():
+    return AsyncIsochronesApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncIsochronesApiClient, "get_navitia_api")
+def test_async_list_covered_areas_with_region_id(
+    mock_get_navitia_api: MagicMock, async_isochrones_apis: AsyncIsochronesApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/isochrones.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    request = IsochroneRequest(from_="foo")
+    isocrhones = asyncio.run(
+        async_isochrones_apis.list_isochrones_with_region_id(
+            region_id="bar", request=request
+        )
+    )
+
+    # Then
+    assert len(isocrhones) == 1
+    assert isinstance(isocrhones[0], Isochrone)
@@ -1,12 +1,20 @@
 from datetime import datetime
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.journeys_apis import JourneyApiClient
+from navitia_client.client.apis.journeys_apis import (
+    AsyncJourneyApiClient,
+    JourneyApiClient,
+)
+from navitia_client.client.cache import ResponseCache
+from navitia_client.client.exceptions import NavitiaNotFoundError
+from navitia_client.client.response import NavitiaResponse
 from navitia_client.entities.request.journey import JourneyRequest
 from navitia_client.entities.response import Journey
+from navitia_client.entities.response.note import Note
 
 
 @pytest.fixture
@@ -23,7 +31,7 @@ def test_list_covered_areas_with_region_id(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/journeys.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -37,6 +45,30 @@ def test_list_covered_areas_with_region_id(
     assert isinstance(journeys[0], Journey)
 
 
+@patch.object(JourneyApiClient, "get_navitia_api")
+def test_list_journeys_resolves_links_against_the_response(
+    mock_get_navitia_api: MagicMock, journeys_apis: JourneyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+    mock_response.payload["notes"] = [{"id": "note:1", "value": "Works"}]
+    mock_response.payload["journeys"][0]["sections"][0]["links"].append(
+        {"type": "notes", "id": "note:1", "rel": "notes"}
+    )
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    journeys = journeys_apis.list_journeys(request=JourneyRequest())
+
+    # Then
+    note_link = journeys[0].sections[0].links[-1]
+    assert note_link.resolve(journeys.links) == Note(id="note:1", value="Works")
+    assert journeys[0].links[0].resolve(journeys.links) is None
+
+
 @patch.object(JourneyApiClient, "get_navitia_api")
 def test_list_covered_areas_with_resource_path(
     mock_get_navitia_api: MagicMock, journeys_apis: JourneyApiClient
@@ -44,7 +76,7 @@ def test_list_covered_areas_with_resource_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/journeys.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -65,7 +97,7 @@ def test_list_covered_areas(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/journeys.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -85,7 +117,7 @@ def test_list_empty_add_poi_infos_parameter(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/journeys.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     expected_url = "https://api.navitia.io/v1//journeys?datetime=2024-06-01T00:00:00&datetime_represents=departure&traveler_type=standard&data_freshness=realtime&language=en-GB&depth=1&max_duration_to_pt=1800&walking_speed=1.12&bike_speed=4.1&bss_speed=4.1&car_speed=16.8&min_nb_journeys=1&max_nb_journeys=1&count=10&max_nb_transfers=10&min_nb_transfers=0&max_duration=86400&wheelchair=False&direct_path=indifferent&debug=False&free_radius_from=0&free_radius_to=0&timeframe_duration=0&is_journey_schedules=False&park_mode=none&from=foo"
@@ -105,7 +137,7 @@ def test_list_add_poi_infos_parameter(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/journeys.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     expected_url = "https://api.navitia.io/v1//journeys?datetime=2024-06-01T00:00:00&datetime_represents=departure&traveler_type=standard&data_freshness=realtime&language=en-GB&depth=1&max_duration_to_pt=1800&walking_speed=1.12&bike_speed=4.1&bss_speed=4.1&car_speed=16.8&min_nb_journeys=1&max_nb_journeys=1&count=10&max_nb_transfers=10&min_nb_transfers=0&max_duration=86400&wheelchair=False&direct_path=indifferent&debug=False&free_radius_from=0&free_radius_to=0&timeframe_duration=0&is_journey_schedules=False&park_mode=none&from=foo&add_poi_infos[]=bss_stands&add_poi_infos[]=car_parks"
@@ -120,3 +152,164 @@ def test_list_add_poi_infos_parameter(
 
     # Then
     mock_get_navitia_api.assert_called_with(expected_url)
+
+
+@pytest.fixture
+def async_journeys_apis():
+    return AsyncJourneyApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncJourneyApiClient, "get_navitia_api")
+def test_async_list_covered_areas_with_region_id(
+    mock_get_navitia_api: MagicMock, async_journeys_apis: AsyncJourneyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    journeys = asyncio.run(
+        async_journeys_apis.list_journeys_with_region_id(
+            region_id="bar", request=JourneyRequest()
+        )
+    )
+
+    # Then
+    assert len(journeys) == 1
+    assert isinstance(journeys[0], Journey)
+
+
+@patch.object(JourneyApiClient, "get_navitia_api")
+def test_journey_matrix(
+    mock_get_navitia_api: MagicMock, journeys_apis: JourneyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    matrix = journeys_apis.journey_matrix(
+        origins=["a", "b"],
+        destinations=["a", "b", "c", "c"],
+        request=JourneyRequest(datetime_=datetime(2024, 1, 1)),
+        region_id="bar",
+        include_journeys=True,
+    )
+
+    # Then
+    assert mock_get_navitia_api.call_count == 4
+    assert list(matrix.durations) == [0, 3660, 3660, 3660, 3660, 0, 3660, 3660]
+    assert matrix.transfers("a", "c") == 1
+    assert matrix.journeys is not None
+    assert isinstance(matrix.journeys[("b", "c")][0], Journey)
+    requested_urls = [call.args[0] for call in mock_get_navitia_api.call_args_list]
+    assert all("/coverage/bar/journeys?" in url for url in requested_urls)
+    assert any("from=a" in url and "to=c" in url for url in requested_urls)
+
+
+@patch.object(JourneyApiClient, "get_navitia_api")
+def test_journey_matrix_uses_pair_cache(
+    mock_get_navitia_api: MagicMock, journeys_apis: JourneyApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/journeys.json", "rb") as file:
+        content = file.read()
+    mock_get_navitia_api.side_effect = lambda url: NavitiaResponse(
+        url=url,
+        status_code=200,
+        content=content,
+        payload=json.loads(content),
+        elapsed=0.0,
+    )
+    pair_cache = ResponseCache(ttls={"journeys": 3600})
+    request = JourneyRequest(datetime_=datetime(2024, 1, 1))
+
+    # When
+    journeys_apis.journey_matrix(["a"], ["b", "c"], request, pair_cache=pair_cache)
+    matrix = journeys_apis.journey_matrix(
+        ["a"], ["b", "c"], request, pair_cache=pair_cache
+    )
+
+    # Then
+    assert mock_get_navitia_api.call_count == 2
+    assert pair_cache.hits == 2
+    assert matrix.duration("a", "c") == 3660
+
+
+@patch.object(JourneyApiClient, "get_navitia_api")
+def test_journey_matrix_keeps_errors_per_pair(
+    mock_get_navitia_api: MagicMock, journeys_apis: JourneyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    def get_navitia_api(url: str) -> MagicMock:
+        if "to=unreachable" in url:
+            raise NavitiaNotFoundError("no solution")
+        return mock_response
+
+    mock_get_navitia_api.side_effect = get_navitia_api
+
+    # When
+    matrix = journeys_apis.journey_matrix(
+        ["a"], ["b", "unreachable"], JourneyRequest(datetime_=datetime(2024, 1, 1))
+    )
+
+    # Then
+    assert matrix.duration("a", "b") == 3660
+    assert matrix.duration("a", "unreachable") is None
+    assert isinstance(matrix.errors[("a", "unreachable")], NavitiaNotFoundError)
+
+
+@patch.object(AsyncJourneyApiClient, "get_navitia_api")
+def test_async_journey_matrix(
+    mock_get_navitia_api: MagicMock, async_journeys_apis: AsyncJourneyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    matrix = asyncio.run(
+        async_journeys_apis.journey_matrix(
+            ["a", "b"], ["a", "b"], JourneyRequest(datetime_=datetime(2024, 1, 1))
+        )
+    )
+
+    # Then
+    assert mock_get_navitia_api.call_count == 2
+    assert list(matrix.durations) == [0, 3660, 3660, 0]
+    assert matrix.journeys is None
+
+
+@patch.object(JourneyApiClient, "get_navitia_api")
+def test_list_journeys_lazy(
+    mock_get_navitia_api: MagicMock, journeys_apis: JourneyApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    journeys = journeys_apis.list_journeys(request=JourneyRequest(), lazy=True)
+
+    # Then
+    assert isinstance(journeys[0], Journey)
+    assert type(journeys[0]) is not Journey
+    assert journeys[0].duration == 3660
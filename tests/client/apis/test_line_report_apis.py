@@ -1,9 +1,13 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.line_report_apis import LineReportsApiClient
+from navitia_client.client.apis.line_report_apis import (
+    AsyncLineReportsApiClient,
+    LineReportsApiClient,
+)
 from navitia_client.entities.request.line_report import LineReportRequest
 from navitia_client.entities.response.disruption import Disruption
 from navitia_client.entities.response.line_report import LineReport
@@ -23,7 +27,7 @@ def test_list_covered_areas(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/line_report.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -37,3 +41,35 @@ def test_list_covered_areas(
     assert isinstance(disruptions[0], Disruption)
     assert len(line_reports) == 1
     assert isinstance(line_reports[0], LineReport)
+
+
+@pytest.fixture
+def async_line_reports_apis():
+    return AsyncLineReportsApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncLineReportsApiClient, "get_navitia_api")
+def test_async_list_covered_areas(
+    mock_get_navitia_api: MagicMock, async_line_reports_apis: AsyncLineReportsApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/line_report.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    disruptions, line_reports = asyncio.run(
+        async_line_reports_apis.list_line_reports(
+            request=LineReportRequest(), region_id="bar", resource_path="foo"
+        )
+    )
+
+    # Then
+    assert len(disruptions) == 1
+    assert isinstance(disruptions[0], Disruption)
+    assert len(line_reports) == 1
+    assert isinstance(line_reports[0], LineReport)
@@ -1,9 +1,10 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.place_apis import PlacesApiClient
+from navitia_client.client.apis.place_apis import AsyncPlacesApiClient, PlacesApiClient
 from navitia_client.entities.request.place import PlaceRequest
 from navitia_client.entities.response.place import Place
 
@@ -22,7 +23,7 @@ def test_list_objects(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/places.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
     mock_get_navitia_api.return_value = mock_response
 
     # When
@@ -32,3 +33,31 @@ def test_list_objects(
     # Then
     assert len(places) == 1
     assert isinstance(places[0], Place)
+
+
+@pytest.fixture
+def async_places_apis():
+    return AsyncPlacesApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncPlacesApiClient, "get_navitia_api")
+def test_async_list_objects(
+    mock_get_navitia_api: MagicMock, async_places_apis: AsyncPlacesApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/places.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    request = PlaceRequest(query="DEFENSE")
+    places = asyncio.run(
+        async_places_apis.list_places(region_id="bar", request=request)
+    )
+
+    # Then
+    assert len(places) == 1
+    assert isinstance(places[0], Place)
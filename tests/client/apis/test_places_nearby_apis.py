@@ -1,9 +1,13 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.places_nearby_apis import PlacesNearbyApiClient
+from navitia_client.client.apis.places_nearby_apis import (
+    AsyncPlacesNearbyApiClient,
+    PlacesNearbyApiClient,
+)
 from navitia_client.entities.request.places_nearby import PlacesNearbyRequest
 from navitia_client.entities.response.place import Place
 
@@ -22,7 +26,7 @@ def test_list_objects(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/places_nearby.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -38,3 +42,38 @@ def test_list_objects(
     assert isinstance(places[0], Place)
     assert places[0].embedded_type == "stop_area"
     assert places[1].embedded_type == "stop_point"
+
+
+@pytest.fixture
+def async_places_nearby_apis():
+    return AsyncPlacesNearbyApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncPlacesNearbyApiClient, "get_navitia_api")
+def test_async_list_objects(
+    mock_get_navitia_api: MagicMock,
+    async_places_nearby_apis: AsyncPlacesNearbyApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/places_nearby.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    places, _ = asyncio.run(
+        async_places_nearby_apis.list_objects_by_region_id_and_path(
+            region_id="bar",
+            resource_path="stop_area/foo:bar",
+            request=PlacesNearbyRequest(),
+        )
+    )
+
+    # Then
+    assert len(places) == 2
+    assert isinstance(places[0], Place)
+    assert places[0].embedded_type == "stop_area"
+    assert places[1].embedded_type == "stop_point"
@@ -1,9 +1,11 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.public_transport_objects_apis import (
+    AsyncPublicTransportObjectsApiClient,
     PublicTransportObjectsApiClient,
 )
 from navitia_client.entities.request.public_transport_object import (
@@ -28,7 +30,7 @@ def test_list_objects(
     with open(
         "tests/test_data/public_transport_objects.json", encoding="utf-8"
     ) as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -41,3 +43,37 @@ def test_list_objects(
     # Then
     assert len(pt_objects) == 1
     assert isinstance(pt_objects[0], PtObject)
+
+
+@pytest.fixture
+def async_pt_objects_apis():
+    return AsyncPublicTransportObjectsApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncPublicTransportObjectsApiClient, "get_navitia_api")
+def test_async_list_objects(
+    mock_get_navitia_api: MagicMock,
+    async_pt_objects_apis: AsyncPublicTransportObjectsApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open(
+        "tests/test_data/public_transport_objects.json", encoding="utf-8"
+    ) as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    request = PublicTransportObjectRequest(query="REMY")
+    pt_objects = asyncio.run(
+        async_pt_objects_apis.list_public_transport_objects(
+            region_id="bar", request=request
+        )
+    )
+
+    # Then
+    assert len(pt_objects) == 1
+    assert isinstance(pt_objects[0], PtObject)
@@ -1,9 +1,12 @@
+import asyncio
 import json
+from typing import AsyncIterator, Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.route_schedules_apis import (
+    AsyncRouteSchedulesApiClient,
     RouteSchedulesApiClient,
 )
 from navitia_client.entities.request.route_schedule import RouteScheduleRequest
@@ -24,7 +27,7 @@ def test_list_objects_by_region_id_and_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = RouteScheduleRequest()
@@ -46,7 +49,7 @@ def test_list_objects_by_coordinates(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = RouteScheduleRequest()
@@ -59,3 +62,134 @@ def test_list_objects_by_coordinates(
     # Then
     assert len(route_schedules) == 1
     assert isinstance(route_schedules[0], RouteSchedule)
+
+
+@patch.object(RouteSchedulesApiClient, "stream_navitia_api")
+def test_stream_route_schedules_by_region_id_and_path(
+    mock_stream_navitia_api: MagicMock, route_schedules_apis: RouteSchedulesApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    def stream_navitia_api(url: str, collection: str) -> Iterator:
+        return iter(payload[collection])
+
+    mock_stream_navitia_api.side_effect = stream_navitia_api
+
+    # When
+    route_schedules = list(
+        route_schedules_apis.stream_route_schedules_by_region_id_and_path(
+            region_id="bar",
+            resource_path="foo:bar:fuzz",
+            request=RouteScheduleRequest(),
+        )
+    )
+
+    # Then
+    assert route_schedules == [
+        RouteSchedule.from_payload(data) for data in payload["route_schedules"]
+    ]
+    assert mock_stream_navitia_api.call_args.args[0].startswith(
+        "https://api.navitia.io/v1//coverage/bar/foo:bar:fuzz/route_schedules?"
+    )
+
+
+@pytest.fixture
+def async_route_schedules_apis():
+    return AsyncRouteSchedulesApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncRouteSchedulesApiClient, "get_navitia_api")
+def test_async_list_objects_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock,
+    async_route_schedules_apis: AsyncRouteSchedulesApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = RouteScheduleRequest()
+
+    # When
+    route_schedules = asyncio.run(
+        async_route_schedules_apis.list_route_schedules_by_region_id_and_path(
+            region_id="bar", resource_path="foo:bar:fuzz", request=request
+        )
+    )
+
+    # Then
+    assert len(route_schedules) == 1
+    assert isinstance(route_schedules[0], RouteSchedule)
+
+
+@patch.object(AsyncRouteSchedulesApiClient, "get_navitia_api")
+def test_async_list_route_schedules_with_fields(
+    mock_get_navitia_api: MagicMock,
+    async_route_schedules_apis: AsyncRouteSchedulesApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = RouteScheduleRequest(fields=["table.headers", "table.rows"])
+
+    # When
+    route_schedules = asyncio.run(
+        async_route_schedules_apis.list_route_schedules_by_coordinates(
+            region_lon=1.1, region_lat=1.2, lon=2.1, lat=2.2, request=request
+        )
+    )
+
+    # Then
+    assert isinstance(route_schedules[0], RouteSchedule)
+    assert not hasattr(route_schedules[0], "display_informations")
+    table = route_schedules[0].table
+    assert (
+        table
+        == RouteSchedule.from_payload(mock_response.payload["route_schedules"][0]).table
+    )
+    assert table.matrix().shape
+
+
+@patch.object(AsyncRouteSchedulesApiClient, "stream_navitia_api")
+def test_async_stream_route_schedules_by_coordinates(
+    mock_stream_navitia_api: MagicMock,
+    async_route_schedules_apis: AsyncRouteSchedulesApiClient,
+) -> None:
+    # Given
+    with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    async def stream_navitia_api(url: str, collection: str) -> AsyncIterator:
+        for item in payload[collection]:
+            yield item
+
+    mock_stream_navitia_api.side_effect = stream_navitia_api
+    request = RouteScheduleRequest(fields=["table"])
+
+    async def run() -> list[RouteSchedule]:
+        return [
+            route_schedule
+            async for route_schedule in async_route_schedules_apis.stream_route_schedules_by_coordinates(
+                region_lon=1.1, region_lat=1.2, lon=2.1, lat=2.2, request=request
+            )
+        ]
+
+    # When
+    route_schedules = asyncio.run(run())
+
+    # Then
+    assert len(route_schedules) == 1
+    assert not hasattr(route_schedules[0], "display_informations")
+    assert route_schedules[0].table.rows
+    assert (
+        "/coverage/1.1;1.2/coords/2.1;2.2/route_schedules"
+        in (mock_stream_navitia_api.call_args.args[0])
+    )
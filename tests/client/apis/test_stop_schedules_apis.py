@@ -1,9 +1,11 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.stop_schedules_apis import (
+    AsyncStopSchedulesApiClient,
     StopSchedulesApiClient,
 )
 from navitia_client.entities.request.stop_schedule import StopScheduleRequest
@@ -24,7 +26,7 @@ def test_list_objects_by_region_id_and_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/stop_schedules.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = StopScheduleRequest()
@@ -39,6 +41,53 @@ def test_list_objects_by_region_id_and_path(
     assert isinstance(stop_schedules[0], StopSchedule)
 
 
+@patch.object(StopSchedulesApiClient, "get_navitia_api")
+def test_list_stop_schedules_with_fields(
+    mock_get_navitia_api: MagicMock, stop_schedules_apis: StopSchedulesApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/stop_schedules.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = StopScheduleRequest(fields=["route.id", "date_times"])
+
+    # When
+    stop_schedules, _ = stop_schedules_apis.list_stop_schedules_by_region_id_and_path(
+        region_id="bar", resource_path="foo:bar:fuzz", request=request
+    )
+
+    # Then
+    assert isinstance(stop_schedules[0], StopSchedule)
+    assert stop_schedules[0].route.id is not None
+    assert stop_schedules[0].date_times
+    assert not hasattr(stop_schedules[0], "stop_point")
+    assert "fields" not in request.to_filters()
+
+
+@patch.object(StopSchedulesApiClient, "get_navitia_api")
+def test_list_stop_schedule_columns_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock, stop_schedules_apis: StopSchedulesApiClient
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/stop_schedules.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    columns, _ = stop_schedules_apis.list_stop_schedule_columns_by_region_id_and_path(
+        region_id="bar", resource_path="foo:bar:fuzz", request=StopScheduleRequest()
+    )
+
+    # Then
+    date_times = mock_response.payload["stop_schedules"][0]["date_times"]
+    assert len(columns) == len(date_times)
+    assert set(columns.stop_point_ids) == {"stop_point:SNCF:87758896:RapidTransit"}
+
+
 @patch.object(StopSchedulesApiClient, "get_navitia_api")
 def test_list_objects_by_coordinates(
     mock_get_navitia_api: MagicMock, stop_schedules_apis: StopSchedulesApiClient
@@ -46,7 +95,7 @@ def test_list_objects_by_coordinates(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/stop_schedules.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = StopScheduleRequest()
@@ -59,3 +108,35 @@ def test_list_objects_by_coordinates(
     # Then
     assert len(stop_schedules) == 1
     assert isinstance(stop_schedules[0], StopSchedule)
+
+
+@pytest.fixture
+def async_stop_schedules_apis():
+    return AsyncStopSchedulesApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncStopSchedulesApiClient, "get_navitia_api")
+def test_async_list_objects_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock,
+    async_stop_schedules_apis: AsyncStopSchedulesApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/stop_schedules.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = StopScheduleRequest()
+
+    # When
+    stop_schedules, _ = asyncio.run(
+        async_stop_schedules_apis.list_stop_schedules_by_region_id_and_path(
+            region_id="bar", resource_path="foo:bar:fuzz", request=request
+        )
+    )
+
+    # Then
+    assert len(stop_schedules) == 1
+    assert isinstance(stop_schedules[0], StopSchedule)
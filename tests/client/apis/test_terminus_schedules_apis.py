@@ -1,9 +1,11 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from navitia_client.client.apis.terminus_schedules_apis import (
+    AsyncTerminusSchedulesApiClient,
     TerminusSchedulesApiClient,
 )
 from navitia_client.entities.request.terminus_schedule import TerminusScheduleRequest
@@ -24,7 +26,7 @@ def test_list_objects_by_region_id_and_path(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/terminus_schedules.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = TerminusScheduleRequest()
@@ -48,7 +50,7 @@ def test_list_objects_by_coordinates(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/terminus_schedules.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
     request = TerminusScheduleRequest()
@@ -63,3 +65,35 @@ def test_list_objects_by_coordinates(
     # Then
     assert len(terminus_schedules) == 2
     assert isinstance(terminus_schedules[0], TerminusSchedule)
+
+
+@pytest.fixture
+def async_terminus_schedules_apis():
+    return AsyncTerminusSchedulesApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncTerminusSchedulesApiClient, "get_navitia_api")
+def test_async_list_objects_by_region_id_and_path(
+    mock_get_navitia_api: MagicMock,
+    async_terminus_schedules_apis: AsyncTerminusSchedulesApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/terminus_schedules.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+    request = TerminusScheduleRequest()
+
+    # When
+    terminus_schedules, _ = asyncio.run(
+        async_terminus_schedules_apis.list_terminus_schedules_by_region_id_and_path(
+            region_id="bar", resource_path="foo:bar:fuzz", request=request
+        )
+    )
+
+    # Then
+    assert len(terminus_schedules) == 2
+    assert isinstance(terminus_schedules[0], TerminusSchedule)
@@ -1,9 +1,14 @@
+import asyncio
 import json
+from typing import AsyncIterator, Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from navitia_client.client.apis.traffic_report_apis import TrafficReportsApiClient
+from navitia_client.client.apis.traffic_report_apis import (
+    AsyncTrafficReportsApiClient,
+    TrafficReportsApiClient,
+)
 from navitia_client.entities.request.traffic_report import TrafficReportRequest
 from navitia_client.entities.response.disruption import Disruption
 from navitia_client.entities.response.traffic_report import TrafficReport
@@ -23,7 +28,7 @@ def test_list_covered_areas(
     # Given
     mock_response = MagicMock()
     with open("tests/test_data/traffic_reports.json", encoding="utf-8") as file:
-        mock_response.json.return_value = json.load(file)
+        mock_response.payload = json.load(file)
 
     mock_get_navitia_api.return_value = mock_response
 
@@ -37,3 +42,110 @@ def test_list_covered_areas(
     assert isinstance(disruptions[0], Disruption)
     assert len(traffic_report) == 1
     assert isinstance(traffic_report[0], TrafficReport)
+
+
+@patch.object(TrafficReportsApiClient, "stream_navitia_api")
+def test_stream_traffic_reports(
+    mock_stream_navitia_api: MagicMock, traffic_reports_apis: TrafficReportsApiClient
+) -> None:
+    # Given
+    with open("tests/test_data/traffic_reports.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    def stream_navitia_api(url: str, collection: str, members: dict) -> Iterator:
+        start_page = int(url.split("start_page=")[1].split("&")[0])
+        members["pagination"] = {**payload["pagination"], "start_page": start_page}
+        members["disruptions"] = payload["disruptions"]
+        return iter(payload[collection])
+
+    mock_stream_navitia_api.side_effect = stream_navitia_api
+    disruptions: list[Disruption] = []
+
+    # When
+    traffic_reports = list(
+        traffic_reports_apis.stream_traffic_reports(
+            request=TrafficReportRequest(),
+            region_id="bar",
+            resource_path="foo",
+            disruptions=disruptions,
+        )
+    )
+
+    # Then
+    assert len(traffic_reports) == 6
+    assert all(isinstance(report, TrafficReport) for report in traffic_reports)
+    assert len(disruptions) == 6
+    assert all(isinstance(disruption, Disruption) for disruption in disruptions)
+    assert mock_stream_navitia_api.call_args.args[0].startswith(
+        "https://api.navitia.io/v1//coverage/bar/foo/traffic_reports?"
+    )
+    assert "start_page=5" in mock_stream_navitia_api.call_args.args[0]
+
+
+@pytest.fixture
+def async_traffic_reports_apis():
+    return AsyncTrafficReportsApiClient(
+        auth_token="foobar", base_navitia_url="https://api.navitia.io/v1/"
+    )
+
+
+@patch.object(AsyncTrafficReportsApiClient, "get_navitia_api")
+def test_async_list_covered_areas(
+    mock_get_navitia_api: MagicMock,
+    async_traffic_reports_apis: AsyncTrafficReportsApiClient,
+) -> None:
+    # Given
+    mock_response = MagicMock()
+    with open("tests/test_data/traffic_reports.json", encoding="utf-8") as file:
+        mock_response.payload = json.load(file)
+
+    mock_get_navitia_api.return_value = mock_response
+
+    # When
+    disruptions, traffic_report, _ = asyncio.run(
+        async_traffic_reports_apis.list_traffic_reports(
+            request=TrafficReportRequest(), region_id="bar", resource_path="foo"
+        )
+    )
+
+    # Then
+    assert len(disruptions) == 1
+    assert isinstance(disruptions[0], Disruption)
+    assert len(traffic_report) == 1
+    assert isinstance(traffic_report[0], TrafficReport)
+
+
+@patch.object(AsyncTrafficReportsApiClient, "stream_navitia_api")
+def test_async_stream_traffic_reports(
+    mock_stream_navitia_api: MagicMock,
+    async_traffic_reports_apis: AsyncTrafficReportsApiClient,
+) -> None:
+    # Given
+    with open("tests/test_data/traffic_reports.json", encoding="utf-8") as file:
+        payload = json.load(file)
+
+    async def stream_navitia_api(
+        url: str, collection: str, members: dict
+    ) -> AsyncIterator:
+        members.update(payload)
+        members["pagination"] = {**payload["pagination"], "total_result": 1}
+        for item in payload[collection]:
+            yield item
+
+    mock_stream_navitia_api.side_effect = stream_navitia_api
+
+    async def run() -> list[TrafficReport]:
+        return [
+            report
+            async for report in async_traffic_reports_apis.stream_traffic_reports(
+                request=TrafficReportRequest(), region_id="bar"
+            )
+        ]
+
+    # When
+    traffic_reports = asyncio.run(run())
+
+    # Then
+    assert len(traffic_reports) == 1
+    assert isinstance(traffic_reports[0], TrafficReport)
+    assert "/coverage/bar/traffic_reports?" in mock_stream_navitia_api.call_args.args[0]
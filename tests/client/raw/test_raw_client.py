@@ -1,8 +1,11 @@
+import asyncio
+
+import httpx
 import pytest
 from unittest.mock import MagicMock, patch
 
 
-from navitia_client.client.raw.raw_client import RawClient
+from navitia_client.client.raw.raw_client import AsyncRawClient, RawClient
 
 
 @pytest.fixture
@@ -52,3 +55,37 @@ def test_call_api(mock_raw_client_call_api, raw_client):
     # Then
     assert response.status_code == 200
     assert response.json() == {"dummy": "data"}
+
+
+def test_async_call_api():
+    # Given
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert str(request.url) == "http://api.navitia.io/coverage/?key1=value1"
+        return httpx.Response(200, json={"dummy": "data"})
+
+    raw_client = AsyncRawClient(
+        "test_token",
+        "http://api.navitia.io",
+        session=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    # When
+    response = asyncio.run(raw_client.call_api("coverage", {"key1": "value1"}))
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"dummy": "data"}
+
+
+@patch("requests.Session.get")
+def test_call_api_uses_timeouts(mock_get):
+    # Given
+    raw_client = RawClient(
+        "test_token", "http://api.navitia.io", connect_timeout=1, read_timeout=4
+    )
+
+    # When
+    raw_client.call_api("coverage", {})
+
+    # Then
+    mock_get.assert_called_once_with("http://api.navitia.io/coverage/", timeout=(1, 4))
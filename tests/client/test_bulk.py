@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import pytest
+
+from navitia_client.client.bulk import BulkResult, afetch_many, fetch_many
+from navitia_client.client.deadline import deadline, remaining_time
+
+
+def test_fetch_many_returns_results_keyed_by_item() -> None:
+    # When
+    bulk_result = fetch_many(str.upper, ["a", "b", "c"])
+
+    # Then
+    assert bulk_result.results == {"a": "A", "b": "B", "c": "C"}
+    assert bulk_result.errors == {}
+    assert bulk_result.ok
+
+
+def test_fetch_many_fetches_repeated_items_once() -> None:
+    # Given
+    calls = []
+    lock = threading.Lock()
+
+    def fetch(key: str) -> str:
+        with lock:
+            calls.append(key)
+        return key
+
+    # When
+    bulk_result = fetch_many(fetch, ["a", "b", "a", "b", "a"])
+
+    # Then
+    assert sorted(calls) == ["a", "b"]
+    assert list(bulk_result.results) == ["a", "b"]
+
+
+def test_fetch_many_keeps_errors_per_item() -> None:
+    # Given
+    def fetch(key: str) -> str:
+        if key == "bad":
+            raise ValueError(key)
+        return key
+
+    # When
+    bulk_result = fetch_many(fetch, ["good", "bad"])
+
+    # Then
+    assert bulk_result.results == {"good": "good"}
+    assert isinstance(bulk_result.errors["bad"], ValueError)
+    assert not bulk_result.ok
+
+
+def test_fetch_many_bounds_concurrency() -> None:
+    # Given
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+    release = threading.Event()
+
+    def fetch(key: str) -> str:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        release.wait(timeout=0.01)
+        with lock:
+            running -= 1
+        return key
+
+    # When
+    fetch_many(fetch, [str(index) for index in range(20)], max_workers=3)
+
+    # Then
+    assert max_running <= 3
+
+
+def test_fetch_many_with_no_item() -> None:
+    assert fetch_many(str.upper, []) == BulkResult()
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_fetch_many_rejects_less_than_one_worker(max_workers: int) -> None:
+    # Given
+    fetched = []
+
+    async def afetch(key: str) -> str:
+        fetched.append(key)
+        return key
+
+    # When/Then
+    with pytest.raises(ValueError, match="max_workers"):
+        fetch_many(fetched.append, ["a", "b"], max_workers=max_workers)
+    with pytest.raises(ValueError, match="max_workers"):
+        asyncio.run(afetch_many(afetch, ["a", "b"], max_workers=max_workers))
+    assert fetched == []
+
+
+def test_fetch_many_propagates_deadline() -> None:
+    # When
+    with deadline(10):
+        bulk_result = fetch_many(lambda key: remaining_time(), ["a"])
+
+    # Then
+    assert bulk_result.results["a"] is not None
+
+
+def test_afetch_many() -> None:
+    # Given
+    running = 0
+    max_running = 0
+
+    async def fetch(key: str) -> str:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if key == "bad":
+            raise ValueError(key)
+        return key.upper()
+
+    # When
+    bulk_result = asyncio.run(
+        afetch_many(fetch, ["a", "b", "a", "bad", "c"], max_workers=2)
+    )
+
+    # Then
+    assert bulk_result.results == {"a": "A", "b": "B", "c": "C"}
+    assert list(bulk_result.errors) == ["bad"]
+    assert max_running <= 2
+
+
+def test_afetch_many_does_not_swallow_cancellation() -> None:
+    # Given
+    async def fetch(key: str) -> str:
+        raise asyncio.CancelledError()
+
+    # When/Then
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(afetch_many(fetch, ["a"]))
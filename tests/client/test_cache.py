@@ -0,0 +1,291 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from navitia_client.client.apis.api_base_client import NavitiaResponse
+from navitia_client.client.cache import (
+    ResponseCache,
+    SQLiteResponseCache,
+    normalize_cache_key,
+)
+
+
+def _response(url: str) -> NavitiaResponse:
+    return NavitiaResponse(
+        url=url, status_code=200, content=b"{}", payload={}, elapsed=0.0
+    )
+
+
+def test_normalize_cache_key() -> None:
+    # Given
+    urls = [
+        "https://API.navitia.io/v1//coverage/fr-idf/lines/?depth=1&count=25",
+        "https://api.navitia.io/v1/coverage/fr-idf/lines?count=25&depth=1",
+    ]
+
+    # When
+    keys = {normalize_cache_key(url) for url in urls}
+
+    # Then
+    assert keys == {"https://api.navitia.io/v1/coverage/fr-idf/lines?count=25&depth=1"}
+
+
+def test_normalize_cache_key_keeps_repeated_parameters_order() -> None:
+    # When
+    key = normalize_cache_key("https://api.navitia.io/v1/places?type[]=b&q=x&type[]=a")
+
+    # Then
+    assert key == "https://api.navitia.io/v1/places?q=x&type%5B%5D=b&type%5B%5D=a"
+
+
+def test_normalize_cache_key_separates_tokens() -> None:
+    # Given
+    url = "https://api.navitia.io/v1/coverage/fr-idf/lines"
+
+    # When
+    keys = {
+        normalize_cache_key(url, "first-token"),
+        normalize_cache_key(url, "second-token"),
+        normalize_cache_key(url),
+    }
+
+    # Then
+    assert len(keys) == 3
+    assert normalize_cache_key(url, "first-token") in keys
+    assert not any("token" in key for key in keys)
+
+
+@pytest.mark.parametrize(
+    "url,expected_ttl",
+    [
+        ("https://api.navitia.io/v1/coverage", 3600),
+        ("https://api.navitia.io/v1/coverage/fr-idf/lines/line:A", 86400),
+        ("https://api.navitia.io/v1/coverage/fr-idf/lines/line:A/departures", 15),
+        ("https://api.navitia.io/v1/coverage/fr-idf/journeys?from=a&to=b", 0),
+        ("https://api.navitia.io/v1/unknown", 0),
+    ],
+)
+def test_ttl_for(url, expected_ttl) -> None:
+    assert ResponseCache().ttl_for(url) == expected_ttl
+
+
+def test_invalid_max_size() -> None:
+    with pytest.raises(ValueError):
+        ResponseCache(max_size=0)
+
+
+def test_get_and_set() -> None:
+    # Given
+    cache = ResponseCache()
+    url = "https://api.navitia.io/v1/coverage/fr-idf/lines?count=25"
+    response = _response(url)
+
+    # When
+    missing = cache.get(url)
+    cache.set(url, response)
+    found = cache.get("https://api.navitia.io/v1/coverage/fr-idf/lines/?count=25")
+
+    # Then
+    assert missing is None
+    assert found is response
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_ratio == 0.5
+
+
+def test_set_skips_uncached_endpoints() -> None:
+    # Given
+    cache = ResponseCache()
+    url = "https://api.navitia.io/v1/coverage/fr-idf/journeys?from=a&to=b"
+
+    # When
+    cache.set(url, _response(url))
+
+    # Then
+    assert len(cache) == 0
+
+
+@patch("navitia_client.client.cache.time.monotonic")
+def test_get_expired(mock_monotonic: MagicMock) -> None:
+    # Given
+    cache = ResponseCache(ttls={"departures": 10})
+    url = "https://api.navitia.io/v1/coverage/fr-idf/stop_areas/sa:1/departures"
+    mock_monotonic.return_value = 100.0
+    cache.set(url, _response(url))
+
+    # When
+    mock_monotonic.return_value = 105.0
+    fresh = cache.get(url)
+    mock_monotonic.return_value = 110.0
+    expired = cache.get(url)
+
+    # Then
+    assert fresh is not None
+    assert expired is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction() -> None:
+    # Given
+    cache = ResponseCache(max_size=2)
+    urls = [f"https://api.navitia.io/v1/coverage/fr-idf/lines/line:{i}" for i in "ABC"]
+    cache.set(urls[0], _response(urls[0]))
+    cache.set(urls[1], _response(urls[1]))
+
+    # When
+    cache.get(urls[0])
+    cache.set(urls[2], _response(urls[2]))
+
+    # Then
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+    assert cache.get(urls[2]) is not None
+    assert cache.evictions == 1
+
+
+def test_clear() -> None:
+    # Given
+    cache = ResponseCache()
+    url = "https://api.navitia.io/v1/coverage"
+    cache.set(url, _response(url))
+
+    # When
+    cache.clear()
+
+    # Then
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    cache = SQLiteResponseCache(tmp_path / "navitia.sqlite3", max_size=2)
+    yield cache
+    cache.close()
+
+
+def test_sqlite_get_and_set(sqlite_cache: SQLiteResponseCache) -> None:
+    # Given
+    url = "https://api.navitia.io/v1/coverage/fr-idf/lines?count=25"
+    response = NavitiaResponse(
+        url=url,
+        status_code=200,
+        content=b'{"lines": [{"id": "line:A"}]}',
+        payload={"lines": [{"id": "line:A"}]},
+        elapsed=0.1,
+    )
+
+    # When
+    missing = sqlite_cache.get(url)
+    sqlite_cache.set(url, response)
+    found = sqlite_cache.get(url)
+
+    # Then
+    assert missing is None
+    assert found == response
+    assert sqlite_cache.hits == 1
+    assert sqlite_cache.misses == 1
+
+
+def test_sqlite_is_shared_between_instances(tmp_path) -> None:
+    # Given
+    path = tmp_path / "navitia.sqlite3"
+    url = "https://api.navitia.io/v1/coverage"
+    writer = SQLiteResponseCache(path)
+    writer.set(url, _response(url))
+    writer.close()
+
+    # When
+    reader = SQLiteResponseCache(path)
+    found = reader.get(url)
+    reader.close()
+
+    # Then
+    assert found == _response(url)
+
+
+def test_sqlite_does_not_share_responses_between_tokens(
+    sqlite_cache: SQLiteResponseCache,
+) -> None:
+    # Given
+    url = "https://api.navitia.io/v1/coverage"
+    sqlite_cache.set(url, _response(url), auth_token="first-token")
+
+    # When
+    other_token = sqlite_cache.get(url, auth_token="second-token")
+    same_token = sqlite_cache.get(url, auth_token="first-token")
+
+    # Then
+    assert other_token is None
+    assert same_token == _response(url)
+
+
+def test_sqlite_stores_compressed_content(sqlite_cache: SQLiteResponseCache) -> None:
+    # Given
+    url = "https://api.navitia.io/v1/coverage/fr-idf/lines"
+    content = b'{"lines": [' + b",".join([b'{"id": "line:A"}'] * 1000) + b"]}"
+    response = NavitiaResponse(
+        url=url, status_code=200, content=content, payload=None, elapsed=0.0
+    )
+
+    # When
+    sqlite_cache.set(url, response)
+
+    # Then
+    (stored,) = sqlite_cache._connection.execute(
+        "SELECT content FROM responses"
+    ).fetchone()
+    assert len(stored) < len(content) / 10
+
+
+@patch("navitia_client.client.cache.time.time")
+def test_sqlite_get_expired(
+    mock_time: MagicMock, sqlite_cache: SQLiteResponseCache
+) -> None:
+    # Given
+    url = "https://api.navitia.io/v1/coverage/fr-idf/stop_areas/sa:1/departures"
+    mock_time.return_value = 100.0
+    sqlite_cache.set(url, _response(url))
+
+    # When
+    mock_time.return_value = 200.0
+    expired = sqlite_cache.get(url)
+
+    # Then
+    assert expired is None
+    assert len(sqlite_cache) == 0
+
+
+@patch("navitia_client.client.cache.time.time")
+def test_sqlite_lru_eviction(
+    mock_time: MagicMock, sqlite_cache: SQLiteResponseCache
+) -> None:
+    # Given
+    urls = [f"https://api.navitia.io/v1/coverage/fr-idf/lines/line:{i}" for i in "ABC"]
+    mock_time.return_value = 1.0
+    sqlite_cache.set(urls[0], _response(urls[0]))
+    mock_time.return_value = 2.0
+    sqlite_cache.set(urls[1], _response(urls[1]))
+
+    # When
+    mock_time.return_value = 3.0
+    sqlite_cache.get(urls[0])
+    mock_time.return_value = 4.0
+    sqlite_cache.set(urls[2], _response(urls[2]))
+
+    # Then
+    assert sqlite_cache.get(urls[1]) is None
+    assert sqlite_cache.get(urls[0]) is not None
+    assert sqlite_cache.get(urls[2]) is not None
+    assert sqlite_cache.evictions == 1
+
+
+def test_sqlite_clear(sqlite_cache: SQLiteResponseCache) -> None:
+    # Given
+    url = "https://api.navitia.io/v1/coverage"
+    sqlite_cache.set(url, _response(url))
+
+    # When
+    sqlite_cache.clear()
+
+    # Then
+    assert len(sqlite_cache) == 0
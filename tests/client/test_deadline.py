@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from navitia_client.client.deadline import (
+    bound_timeouts,
+    check_deadline,
+    deadline,
+    raise_if_deadline_exceeded,
+    remaining_time,
+)
+from navitia_client.client.exceptions import NavitiaDeadlineExceededError
+
+
+def test_no_deadline() -> None:
+    assert remaining_time() is None
+    assert check_deadline() is None
+    assert bound_timeouts(5, 30) == (5, 30)
+
+
+@patch("navitia_client.client.deadline.time.monotonic", return_value=100.0)
+def test_deadline(mock_monotonic: MagicMock) -> None:
+    # When
+    with deadline(10):
+        remaining = remaining_time()
+
+    # Then
+    assert remaining == 10
+    assert remaining_time() is None
+
+
+@patch("navitia_client.client.deadline.time.monotonic", return_value=100.0)
+def test_nested_deadline_cannot_extend_enclosing_one(mock_monotonic: MagicMock) -> None:
+    # When
+    with deadline(10):
+        with deadline(60):
+            nested_remaining = remaining_time()
+        with deadline(2):
+            shorter_remaining = remaining_time()
+
+    # Then
+    assert nested_remaining == 10
+    assert shorter_remaining == 2
+
+
+@patch("navitia_client.client.deadline.time.monotonic")
+def test_check_deadline_raises_once_passed(mock_monotonic: MagicMock) -> None:
+    # Given
+    mock_monotonic.return_value = 100.0
+    with deadline(1):
+        # When
+        mock_monotonic.return_value = 101.0
+
+        # Then
+        with pytest.raises(NavitiaDeadlineExceededError):
+            check_deadline()
+        with pytest.raises(NavitiaDeadlineExceededError):
+            raise_if_deadline_exceeded(TimeoutError())
+
+
+@patch("navitia_client.client.deadline.time.monotonic", return_value=100.0)
+def test_bound_timeouts(mock_monotonic: MagicMock) -> None:
+    with deadline(3):
+        assert bound_timeouts(5, 30) == (3, 3)
+        assert bound_timeouts(1, None) == (1, 3)
+
+
+def test_deadline_follows_asyncio_tasks() -> None:
+    # Given
+    async def child() -> float | None:
+        return remaining_time()
+
+    async def run() -> tuple[float | None, float | None]:
+        with deadline(10):
+            return await asyncio.gather(child(), child())
+
+    # When
+    remainings = asyncio.run(run())
+
+    # Then
+    assert all(remaining is not None and remaining <= 10 for remaining in remainings)
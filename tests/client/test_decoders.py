@@ -0,0 +1,51 @@
+import json
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from navitia_client.client.decoders import get_json_decoder
+
+PAYLOAD = b'{"departures": [{"id": "stop_point:1", "value": 1.5}], "empty": null}'
+
+
+@pytest.mark.parametrize("name", ["auto", "orjson", "msgspec", "json"])
+def test_get_json_decoder(name):
+    # Given
+    decoder = get_json_decoder(name)
+
+    # When
+    result = decoder(PAYLOAD)
+
+    # Then
+    assert result == json.loads(PAYLOAD)
+
+
+def test_auto_prefers_orjson():
+    assert get_json_decoder() is orjson.loads
+
+
+def test_auto_falls_back_to_stdlib():
+    # Given
+    def missing():
+        raise ImportError
+
+    factories = {"orjson": missing, "msgspec": missing, "json": lambda: json.loads}
+
+    # When
+    with patch("navitia_client.client.decoders._DECODER_FACTORIES", factories):
+        decoder = get_json_decoder()
+
+    # Then
+    assert decoder is json.loads
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError):
+        get_json_decoder("unknown")
+
+
+def test_missing_decoder():
+    with patch.dict("sys.modules", {"orjson": None}):
+        with pytest.raises(ImportError):
+            get_json_decoder("orjson")
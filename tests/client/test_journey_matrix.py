@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Sequence
+from unittest.mock import MagicMock
+
+from navitia_client.client.bulk import BulkResult
+from navitia_client.client.exceptions import NavitiaNotFoundError
+from navitia_client.client.journey_matrix import (
+    NO_JOURNEY,
+    JourneyMatrix,
+    build_journey_matrix,
+    matrix_pairs,
+    pair_request,
+)
+from navitia_client.entities.request.journey import JourneyRequest
+from navitia_client.entities.response import Journey
+
+
+def _journey(duration: int, nb_transfers: int) -> MagicMock:
+    journey = MagicMock()
+    journey.duration = duration
+    journey.nb_transfers = nb_transfers
+    return journey
+
+
+def test_matrix_pairs_skips_trivial_and_duplicate_pairs() -> None:
+    # When
+    pairs = matrix_pairs(["a", "b", "a"], ["a", "c", "c"])
+
+    # Then
+    assert pairs == [("a", "c"), ("b", "a"), ("b", "c")]
+
+
+def test_pair_request_copies_template() -> None:
+    # Given
+    request = JourneyRequest(datetime_=datetime(2024, 1, 1), max_nb_transfers=2)
+
+    # When
+    new_request = pair_request(request, "a", "b")
+
+    # Then
+    assert (new_request.from_, new_request.to_) == ("a", "b")
+    assert new_request.max_nb_transfers == 2
+    assert request.from_ is None
+
+
+def test_empty_matrix() -> None:
+    # When
+    matrix = JourneyMatrix.empty(["a", "b"], ["c", "d", "e"], with_journeys=False)
+
+    # Then
+    assert list(matrix.durations) == [NO_JOURNEY] * 6
+    assert matrix.duration("b", "e") is None
+    assert matrix.journeys is None
+
+
+def test_set_pair_keeps_fastest_journey_for_repeated_places() -> None:
+    # Given
+    matrix = JourneyMatrix.empty(["a", "b", "a"], ["c"], with_journeys=True)
+    journeys = [_journey(900, 2), _journey(600, 1)]
+
+    # When
+    matrix.set_pair("a", "c", journeys)
+
+    # Then
+    assert list(matrix.durations) == [600, NO_JOURNEY, 600]
+    assert list(matrix.nb_transfers) == [1, NO_JOURNEY, 1]
+    assert matrix.transfers("a", "c") == 1
+    assert matrix.journeys == {("a", "c"): journeys}
+
+
+def test_build_journey_matrix() -> None:
+    # Given
+    pair_urls = {("a", "b"): "url_ab", ("b", "a"): "url_ba"}
+    error = NavitiaNotFoundError("no solution")
+    bulk_result: BulkResult[Sequence[Journey]] = BulkResult(
+        results={"url_ab": [_journey(300, 0)]}, errors={"url_ba": error}
+    )
+
+    # When
+    matrix = build_journey_matrix(
+        ["a", "b"], ["a", "b"], pair_urls, bulk_result, include_journeys=False
+    )
+
+    # Then
+    assert list(matrix.durations) == [0, 300, NO_JOURNEY, 0]
+    assert list(matrix.duration_row("a")) == [0, 300]
+    assert matrix.errors == {("b", "a"): error}
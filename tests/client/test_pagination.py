@@ -0,0 +1,312 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence, Tuple
+
+import pytest
+
+from navitia_client.client.deadline import deadline, remaining_time
+from navitia_client.client.pagination import (
+    afetch_all,
+    aiter_pages,
+    aiter_results,
+    fetch_all,
+    has_next_page,
+    iter_pages,
+    iter_results,
+    page_request,
+    remaining_pages,
+)
+from navitia_client.entities.request.base_entity_request import BaseEntityRequest
+from navitia_client.entities.response import Pagination
+
+
+@dataclass
+class FakeRequest(BaseEntityRequest):
+    def to_filters(self) -> Dict[str, Any]:
+        return {"count": self.count, "start_page": self.start_page}
+
+
+def _fetch_page(
+    request: FakeRequest, total: int = 23
+) -> Tuple[Sequence[int], Pagination]:
+    first = request.start_page * request.count
+    results = list(range(first, min(first + request.count, total)))
+    return results, Pagination(
+        items_on_page=len(results),
+        total_result=total,
+        items_per_page=request.count,
+        start_page=request.start_page,
+    )
+
+
+def test_has_next_page() -> None:
+    assert has_next_page(
+        Pagination(items_on_page=10, total_result=23, items_per_page=10, start_page=0)
+    )
+    assert has_next_page(
+        Pagination(items_on_page=10, total_result=23, items_per_page=10, start_page=1)
+    )
+    assert not has_next_page(
+        Pagination(items_on_page=3, total_result=23, items_per_page=10, start_page=2)
+    )
+    assert not has_next_page(Pagination(items_on_page=0, total_result=23))
+
+
+def test_page_request_copies_request() -> None:
+    # Given
+    request = FakeRequest()
+
+    # When
+    next_request = page_request(request, 3)
+
+    # Then
+    assert next_request.start_page == 3
+    assert request.start_page == 0
+
+
+def test_iter_results() -> None:
+    # Given
+    request = FakeRequest()
+    request.count = 10
+
+    # When
+    results = list(iter_results(_fetch_page, request))
+
+    # Then
+    assert results == list(range(23))
+    assert request.start_page == 0
+
+
+def test_iter_results_without_prefetch() -> None:
+    # Given
+    request = FakeRequest()
+    request.count = 10
+
+    # When
+    results = list(iter_results(_fetch_page, request, prefetch=False))
+
+    # Then
+    assert results == list(range(23))
+
+
+def test_iter_pages_starts_at_request_page() -> None:
+    # Given
+    request = FakeRequest()
+    request.count = 10
+    request.start_page = 1
+
+    # When
+    pages = [
+        pagination.start_page for _, pagination in iter_pages(_fetch_page, request)
+    ]
+
+    # Then
+    assert pages == [1, 2]
+
+
+def test_iter_pages_prefetches_next_page() -> None:
+    # Given
+    fetched_pages = []
+
+    def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        fetched_pages.append(request.start_page)
+        return _fetch_page(request)
+
+    request = FakeRequest()
+    request.count = 10
+    pages = iter_pages(fetch_page, request)
+
+    # When
+    next(pages)
+    while len(fetched_pages) < 2:
+        pass
+
+    # Then
+    assert fetched_pages == [0, 1]
+    pages.close()
+
+
+def test_iter_pages_keeps_deadline_in_prefetch() -> None:
+    # Given
+    remaining_times = []
+
+    def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        remaining_times.append(remaining_time())
+        return _fetch_page(request)
+
+    request = FakeRequest()
+    request.count = 10
+
+    # When
+    with deadline(60):
+        list(iter_pages(fetch_page, request))
+
+    # Then
+    assert len(remaining_times) == 3
+    assert all(remaining is not None for remaining in remaining_times)
+
+
+def test_aiter_results() -> None:
+    # Given
+    async def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        return _fetch_page(request)
+
+    async def run(prefetch: bool) -> list[int]:
+        request = FakeRequest()
+        request.count = 10
+        return [result async for result in aiter_results(fetch_page, request, prefetch)]
+
+    # When/Then
+    assert asyncio.run(run(prefetch=True)) == list(range(23))
+    assert asyncio.run(run(prefetch=False)) == list(range(23))
+
+
+def test_aiter_pages_cancels_prefetch_on_early_exit() -> None:
+    # Given
+    started = []
+
+    async def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        started.append(request.start_page)
+        if request.start_page > 0:
+            await asyncio.sleep(10)
+        return _fetch_page(request)
+
+    async def run() -> None:
+        request = FakeRequest()
+        request.count = 10
+        pages = aiter_pages(fetch_page, request)
+        async for _ in pages:
+            await asyncio.sleep(0)
+            break
+        await pages.aclose()
+
+    # When
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    # Then
+    assert started == [0, 1]
+
+
+def test_remaining_pages() -> None:
+    assert remaining_pages(
+        Pagination(items_on_page=10, total_result=95, items_per_page=10, start_page=0)
+    ) == range(1, 10)
+    assert remaining_pages(
+        Pagination(items_on_page=10, total_result=95, items_per_page=10, start_page=3)
+    ) == range(4, 10)
+    assert not remaining_pages(
+        Pagination(items_on_page=5, total_result=5, items_per_page=10, start_page=0)
+    )
+
+
+def test_fetch_all_returns_results_in_order() -> None:
+    # Given
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        with lock:
+            running.append(request.start_page)
+            max_running.append(len(running))
+        # Later pages answer first
+        time.sleep(0.01 * (10 - request.start_page) / 10)
+        with lock:
+            running.remove(request.start_page)
+        return _fetch_page(request, total=95)
+
+    request = FakeRequest()
+    request.count = 10
+
+    # When
+    results = fetch_all(fetch_page, request, max_workers=3)
+
+    # Then
+    assert results == list(range(95))
+    assert max(max_running) <= 3
+
+
+def test_fetch_all_single_page() -> None:
+    # Given
+    request = FakeRequest()
+    request.count = 50
+
+    # When
+    results = fetch_all(_fetch_page, request)
+
+    # Then
+    assert results == list(range(23))
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_fetch_all_rejects_less_than_one_worker(max_workers: int) -> None:
+    # Given
+    fetched = []
+
+    def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        fetched.append(request.start_page)
+        return _fetch_page(request)
+
+    async def afetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        return fetch_page(request)
+
+    # When/Then
+    with pytest.raises(ValueError, match="max_workers"):
+        fetch_all(fetch_page, FakeRequest(), max_workers=max_workers)
+    with pytest.raises(ValueError, match="max_workers"):
+        asyncio.run(afetch_all(afetch_page, FakeRequest(), max_workers=max_workers))
+    assert fetched == []
+
+
+def test_afetch_all_returns_results_in_order() -> None:
+    # Given
+    running = []
+    max_running = []
+
+    async def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        running.append(request.start_page)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01 * (10 - request.start_page) / 10)
+        running.remove(request.start_page)
+        return _fetch_page(request, total=95)
+
+    request = FakeRequest()
+    request.count = 10
+
+    # When
+    results = asyncio.run(afetch_all(fetch_page, request, max_workers=4))
+
+    # Then
+    assert results == list(range(95))
+    assert max(max_running) <= 4
+
+
+def test_afetch_all_cancels_pending_pages_on_error() -> None:
+    # Given
+    cancelled = []
+
+    async def fetch_page(request: FakeRequest) -> Tuple[Sequence[int], Pagination]:
+        if request.start_page == 1:
+            raise ValueError("boom")
+        if request.start_page > 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(request.start_page)
+                raise
+        return _fetch_page(request, total=50)
+
+    async def run() -> list[int]:
+        request = FakeRequest()
+        request.count = 10
+        with pytest.raises(ValueError):
+            await afetch_all(fetch_page, request, max_workers=4)
+        return sorted(cancelled)
+
+    # When
+    cancelled_on_error = asyncio.run(run())
+
+    # Then
+    assert cancelled_on_error == [2, 3, 4]
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from navitia_client.client.deadline import deadline
+from navitia_client.client.exceptions import NavitiaDeadlineExceededError
+from navitia_client.client.rate_limit import RateLimiter
+
+
+@pytest.mark.parametrize("rate,burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_settings(rate, burst) -> None:
+    with pytest.raises(ValueError):
+        RateLimiter(rate=rate, burst=burst)
+
+
+@patch("navitia_client.client.rate_limit.time.sleep")
+@patch("navitia_client.client.rate_limit.time.monotonic", return_value=100.0)
+def test_acquire_queues_calls_over_the_limit(
+    mock_monotonic: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    limiter = RateLimiter(rate=10, burst=2)
+
+    # When
+    for _ in range(4):
+        limiter.acquire()
+
+    # Then
+    assert [call.args[0] for call in mock_sleep.call_args_list] == pytest.approx(
+        [0.1, 0.2]
+    )
+    assert limiter.waits == 2
+    assert limiter.wait_time == pytest.approx(0.3)
+
+
+@patch("navitia_client.client.rate_limit.time.sleep")
+@patch("navitia_client.client.rate_limit.time.monotonic")
+def test_acquire_refills_over_time(
+    mock_monotonic: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(rate=2, burst=1)
+    limiter.acquire()
+
+    # When
+    mock_monotonic.return_value = 110.0
+    limiter.acquire()
+
+    # Then
+    mock_sleep.assert_not_called()
+
+
+@patch("navitia_client.client.rate_limit.asyncio.sleep")
+@patch("navitia_client.client.rate_limit.time.monotonic", return_value=100.0)
+def test_aacquire_queues_calls_over_the_limit(
+    mock_monotonic: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    limiter = RateLimiter(rate=4, burst=1)
+
+    async def run() -> None:
+        await asyncio.gather(*(limiter.aacquire() for _ in range(3)))
+
+    # When
+    asyncio.run(run())
+
+    # Then
+    assert sorted(call.args[0] for call in mock_sleep.call_args_list) == [0.25, 0.5]
+
+
+def test_acquire_is_thread_safe() -> None:
+    # Given
+    limiter = RateLimiter(rate=1000, burst=50)
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(50)]
+
+    # When
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Then
+    assert limiter.waits == 0
+
+
+def test_acquire_does_not_wait_past_the_deadline() -> None:
+    # Given
+    limiter = RateLimiter(rate=0.1, burst=1)
+    limiter.acquire()
+    started_at = time.monotonic()
+
+    # When/Then
+    with deadline(0.05), pytest.raises(NavitiaDeadlineExceededError):
+        limiter.acquire()
+    assert time.monotonic() - started_at < 1
+    assert limiter.waits == 0
+
+
+def test_aacquire_does_not_wait_past_the_deadline() -> None:
+    # Given
+    limiter = RateLimiter(rate=0.1, burst=1)
+
+    async def run() -> None:
+        await limiter.aacquire()
+        with deadline(0.05):
+            await limiter.aacquire()
+
+    started_at = time.monotonic()
+
+    # When/Then
+    with pytest.raises(NavitiaDeadlineExceededError):
+        asyncio.run(run())
+    assert time.monotonic() - started_at < 1
+
+
+@patch("navitia_client.client.rate_limit.time.sleep")
+@patch("navitia_client.client.rate_limit.time.monotonic", return_value=100.0)
+def test_acquire_gives_back_tokens_not_waited_for(
+    mock_monotonic: MagicMock, mock_sleep: MagicMock
+) -> None:
+    # Given
+    limiter = RateLimiter(rate=1, burst=1)
+    limiter.acquire()
+
+    # When
+    with (
+        patch("navitia_client.client.rate_limit.remaining_time", return_value=0.5),
+        pytest.raises(NavitiaDeadlineExceededError),
+    ):
+        limiter.acquire()
+    limiter.acquire()
+
+    # Then
+    mock_sleep.assert_called_once_with(pytest.approx(1.0))
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from navitia_client.client.retry import NO_RETRY, RetryPolicy, RetryStats
+
+
+def test_allows_retry() -> None:
+    # Given
+    policy = RetryPolicy(max_attempts=3)
+
+    # When/Then
+    assert policy.allows_retry("GET", 1)
+    assert policy.allows_retry("get", 2)
+    assert not policy.allows_retry("GET", 3)
+    assert not policy.allows_retry("POST", 1)
+    assert not NO_RETRY.allows_retry("GET", 1)
+
+
+def test_is_retryable_status() -> None:
+    # Given
+    policy = RetryPolicy()
+
+    # When/Then
+    assert policy.is_retryable_status(429)
+    assert policy.is_retryable_status(503)
+    assert not policy.is_retryable_status(200)
+    assert not policy.is_retryable_status(404)
+
+
+@pytest.mark.parametrize("attempt,expected_delay", [(1, 0.5), (2, 1.0), (3, 2.0)])
+def test_compute_delay_exponential_backoff(attempt, expected_delay) -> None:
+    # Given
+    policy = RetryPolicy(backoff_factor=0.5, jitter=False)
+
+    # When
+    delay = policy.compute_delay(attempt)
+
+    # Then
+    assert delay == expected_delay
+
+
+def test_compute_delay_is_capped() -> None:
+    # Given
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    # When/Then
+    assert policy.compute_delay(10) == 5
+    assert policy.compute_delay(1, retry_after="120") == 5
+
+
+def test_compute_delay_with_jitter() -> None:
+    # Given
+    policy = RetryPolicy(backoff_factor=1)
+
+    # When
+    with patch("navitia_client.client.retry.random.uniform", return_value=0.3) as mock:
+        delay = policy.compute_delay(3)
+
+    # Then
+    mock.assert_called_once_with(0, 4)
+    assert delay == 0.3
+
+
+def test_compute_delay_honors_retry_after_seconds() -> None:
+    # Given
+    policy = RetryPolicy()
+
+    # When/Then
+    assert policy.compute_delay(1, retry_after="7") == 7
+    assert policy.compute_delay(1, retry_after="not a date") <= policy.backoff_factor
+
+
+def test_compute_delay_honors_retry_after_date() -> None:
+    # Given
+    policy = RetryPolicy()
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=10)
+
+    # When
+    delay = policy.compute_delay(1, retry_after=format_datetime(retry_at, usegmt=True))
+
+    # Then
+    assert 8 <= delay <= 10
+
+
+def test_compute_delay_ignores_retry_after() -> None:
+    # Given
+    policy = RetryPolicy(respect_retry_after=False, jitter=False)
+
+    # When/Then
+    assert policy.compute_delay(1, retry_after="7") == policy.backoff_factor
+
+
+def test_retry_stats() -> None:
+    # Given
+    stats = RetryStats()
+
+    # When
+    stats.record_attempt()
+    stats.record_attempt()
+    stats.record_retry("503", 0.5)
+    stats.record_exhausted()
+
+    # Then
+    assert stats.attempts == 2
+    assert stats.retries == 1
+    assert stats.exhausted == 1
+    assert stats.backoff_time == 0.5
+    assert stats.retries_by_reason == {"503": 1}
+
+    # When
+    stats.reset()
+
+    # Then
+    assert stats == RetryStats()
@@ -0,0 +1,273 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from navitia_client.client.deadline import deadline
+from navitia_client.client.exceptions import NavitiaDeadlineExceededError
+from navitia_client.client.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_do_coalesces_concurrent_calls() -> None:
+    # Given
+    singleflight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def function() -> str:
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    # When
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(singleflight.do, "key", function) for _ in range(5)]
+        while singleflight.coalesced < 4:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    # Then
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert singleflight.coalesced == 4
+
+
+def test_do_runs_sequential_calls() -> None:
+    # Given
+    singleflight = SingleFlight()
+
+    # When
+    results = [singleflight.do("key", lambda: index) for index in range(3)]
+
+    # Then
+    assert results == [0, 1, 2]
+    assert singleflight.coalesced == 0
+
+
+def test_do_shares_errors() -> None:
+    # Given
+    singleflight = SingleFlight()
+    release = threading.Event()
+
+    def function() -> str:
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    # When
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(singleflight.do, "key", function) for _ in range(2)]
+        while singleflight.coalesced < 1:
+            pass
+        release.set()
+
+        # Then
+        errors = []
+        for future in futures:
+            with pytest.raises(ValueError, match="boom") as error:
+                future.result()
+            errors.append(error.value)
+        leader_error, follower_error = sorted(
+            errors, key=lambda error: error.__cause__ is not None
+        )
+        assert follower_error is not leader_error
+        assert follower_error.__cause__ is leader_error
+
+
+def test_do_retries_leader_deadline_for_waiters_with_time_left() -> None:
+    # Given
+    singleflight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def function() -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            release.wait(timeout=5)
+            raise NavitiaDeadlineExceededError("Deadline exceeded")
+        return "result"
+
+    # When
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(singleflight.do, "key", function)
+        started.wait(timeout=5)
+        follower = executor.submit(singleflight.do, "key", function)
+        while singleflight.coalesced < 1:
+            pass
+        release.set()
+
+        # Then
+        with pytest.raises(NavitiaDeadlineExceededError):
+            leader.result()
+        assert follower.result() == "result"
+    assert len(calls) == 2
+
+
+def test_do_waiter_respects_deadline() -> None:
+    # Given
+    singleflight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def function() -> str:
+        started.set()
+        release.wait(timeout=5)
+        return "result"
+
+    def wait_with_deadline() -> str:
+        with deadline(0.01):
+            return singleflight.do("key", function)
+
+    # When
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(singleflight.do, "key", function)
+        started.wait(timeout=5)
+
+        # Then
+        with pytest.raises(NavitiaDeadlineExceededError):
+            wait_with_deadline()
+        release.set()
+        assert leader.result() == "result"
+
+
+def test_async_do_coalesces_concurrent_calls() -> None:
+    # Given
+    singleflight = AsyncSingleFlight()
+    calls = []
+
+    async def function() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run() -> list[str]:
+        return await asyncio.gather(
+            *(singleflight.do("key", function) for _ in range(5))
+        )
+
+    # When
+    results = asyncio.run(run())
+
+    # Then
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert singleflight.coalesced == 4
+
+
+def test_async_do_survives_cancelled_caller() -> None:
+    # Given
+    singleflight = AsyncSingleFlight()
+
+    async def function() -> str:
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run() -> str:
+        first = asyncio.ensure_future(singleflight.do("key", function))
+        second = asyncio.ensure_future(singleflight.do("key", function))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    # When
+    result = asyncio.run(run())
+
+    # Then
+    assert result == "result"
+
+
+def test_async_do_retries_cancelled_call_for_waiters() -> None:
+    # Given
+    singleflight = AsyncSingleFlight()
+    calls = []
+
+    async def function() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise asyncio.CancelledError()
+        return "result"
+
+    async def run() -> list[object]:
+        return await asyncio.gather(
+            *(singleflight.do("key", function) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+    # When
+    leader_result, follower_result = asyncio.run(run())
+
+    # Then
+    assert isinstance(leader_result, asyncio.CancelledError)
+    assert follower_result == "result"
+    assert len(calls) == 2
+
+
+def test_async_do_respects_deadline() -> None:
+    # Given
+    singleflight = AsyncSingleFlight()
+
+    async def function() -> str:
+        await asyncio.sleep(1)
+        return "result"
+
+    async def run() -> str:
+        with deadline(0.01):
+            return await singleflight.do("key", function)
+
+    # When/Then
+    with pytest.raises(NavitiaDeadlineExceededError):
+        asyncio.run(run())
+
+
+def test_async_do_raises_chained_errors_to_waiters() -> None:
+    # Given
+    singleflight = AsyncSingleFlight()
+
+    async def function() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run() -> list[object]:
+        return await asyncio.gather(
+            *(singleflight.do("key", function) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+    # When
+    leader_error, follower_error = asyncio.run(run())
+
+    # Then
+    assert isinstance(follower_error, ValueError)
+    assert follower_error is not leader_error
+    assert follower_error.__cause__ is leader_error
+
+
+def test_async_do_retries_leader_deadline_for_waiters_with_time_left() -> None:
+    # Given
+    singleflight = AsyncSingleFlight()
+    calls = []
+
+    async def function() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise NavitiaDeadlineExceededError("Deadline exceeded")
+        return "result"
+
+    async def run() -> list[object]:
+        return await asyncio.gather(
+            *(singleflight.do("key", function) for _ in range(2)),
+            return_exceptions=True,
+        )
+
+    # When
+    leader_result, follower_result = asyncio.run(run())
+
+    # Then
+    assert isinstance(leader_result, NavitiaDeadlineExceededError)
+    assert follower_result == "result"
+    assert len(calls) == 2
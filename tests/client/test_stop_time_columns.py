@@ -0,0 +1,101 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from navitia_client.client.stop_time_columns import (
+    DATA_FRESHNESS_CODES,
+    MISSING_DATE_TIME,
+    UNKNOWN_DATA_FRESHNESS,
+    StopTimeColumns,
+)
+from navitia_client.entities.response.departure import Departure
+
+
+def _epoch(value: datetime) -> int:
+    return int((value - datetime(1970, 1, 1)).total_seconds())
+
+
+def test_columns_from_departures_match_departure_objects() -> None:
+    # Given
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        payloads = json.load(file)["departures"]
+
+    # When
+    columns = StopTimeColumns.from_departures(payloads)
+
+    # Then
+    departures = [Departure.from_payload(payload) for payload in payloads]
+    assert len(columns) == len(departures)
+    assert columns.base_date_times.typecode == "q"
+    assert columns.stop_point_ids == [d.stop_point.id for d in departures]
+    assert columns.route_ids == [d.route.id for d in departures]
+    assert list(columns.date_times) == [
+        _epoch(d.stop_date_time.departure_date_time) for d in departures
+    ]
+    assert list(columns.base_date_times) == [
+        _epoch(d.stop_date_time.base_departure_date_time) for d in departures
+    ]
+    assert [DATA_FRESHNESS_CODES[code] for code in columns.data_freshness] == [
+        d.stop_date_time.data_freshness for d in departures
+    ]
+
+
+def test_columns_from_stop_schedules_have_a_row_per_date_time() -> None:
+    # Given
+    with open("tests/test_data/stop_schedules.json", encoding="utf-8") as file:
+        payloads = json.load(file)["stop_schedules"]
+
+    # When
+    columns = StopTimeColumns.from_stop_schedules(payloads)
+
+    # Then
+    date_times = [
+        date_time for payload in payloads for date_time in payload["date_times"]
+    ]
+    assert len(columns) == len(date_times)
+    assert list(columns.date_times) == [
+        _epoch(datetime.strptime(date_time["date_time"], "%Y%m%dT%H%M%S"))
+        for date_time in date_times
+    ]
+    assert columns.route_ids == [payloads[0]["route"]["id"]] * len(date_times)
+
+
+def test_columns_with_missing_values() -> None:
+    # Given
+    columns = StopTimeColumns()
+
+    # When
+    columns.append("stop_point:1", "route:1", None, "20240519T122300", None)
+    columns.extend(columns)
+
+    # Then
+    assert len(columns) == 2
+    assert list(columns.base_date_times) == [MISSING_DATE_TIME] * 2
+    assert list(columns.date_times) == [_epoch(datetime(2024, 5, 19, 12, 23))] * 2
+    assert list(columns.data_freshness) == [UNKNOWN_DATA_FRESHNESS] * 2
+
+
+def test_columns_to_numpy() -> None:
+    numpy = pytest.importorskip("numpy")
+    columns = StopTimeColumns()
+    columns.append("stop_point:1", "route:1", None, "20240519T122300", "realtime")
+
+    arrays = columns.to_numpy()
+
+    assert arrays["date_times"][0] == numpy.datetime64("2024-05-19T12:23:00")
+    assert numpy.isnat(arrays["base_date_times"][0])
+    assert numpy.shares_memory(
+        arrays["date_times"], numpy.frombuffer(columns.date_times, dtype="int64")
+    )
+
+
+def test_columns_to_pandas() -> None:
+    pytest.importorskip("pandas")
+    columns = StopTimeColumns()
+    columns.append("stop_point:1", "route:1", None, "20240519T122300", "realtime")
+
+    frame = columns.to_pandas()
+
+    assert list(frame["route_ids"]) == ["route:1"]
+    assert list(frame["data_freshness"]) == ["realtime"]
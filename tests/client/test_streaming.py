@@ -0,0 +1,143 @@
+import json
+
+import pytest
+
+from navitia_client.client.streaming import STREAM_CHUNK_SIZE, CollectionParser
+
+
+def _parse(collection: str, content: bytes, chunk_size: int) -> tuple[list, dict]:
+    parser = CollectionParser(collection)
+    items = []
+    for start in range(0, len(content), chunk_size):
+        items.extend(parser.feed(content[start : start + chunk_size]))
+    items.extend(parser.close())
+    return items, parser.payload
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 65536])
+@pytest.mark.parametrize(
+    "file_name, collection",
+    [
+        ("departures.json", "departures"),
+        ("journeys.json", "journeys"),
+        ("route_schedules.json", "route_schedules"),
+        ("stop_points.json", "stop_points"),
+        ("traffic_reports.json", "disruptions"),
+    ],
+)
+def test_collection_parser_matches_json_loads(
+    file_name: str, collection: str, chunk_size: int
+) -> None:
+    # Given
+    with open(f"tests/test_data/{file_name}", "rb") as file:
+        content = file.read()
+    payload = json.loads(content)
+
+    # When
+    items, members = _parse(collection, content, chunk_size)
+
+    # Then
+    assert items == payload.pop(collection)
+    assert members == payload
+
+
+def test_collection_parser_yields_items_as_soon_as_received() -> None:
+    # Given
+    with open("tests/test_data/stop_points.json", "rb") as file:
+        payload = json.load(file)
+    payload["stop_points"] *= 200
+    content = json.dumps(payload).encode()
+    parser = CollectionParser("stop_points")
+
+    # When
+    batches = [
+        parser.feed(content[start : start + STREAM_CHUNK_SIZE])
+        for start in range(0, len(content), STREAM_CHUNK_SIZE)
+    ]
+    last_items = parser.close()
+
+    # Then
+    assert len(batches) > 2
+    assert all(batches[:-1])
+    assert sum(map(len, batches)) + len(last_items) == 600
+    assert parser.payload == {"pagination": payload["pagination"]}
+
+
+def test_collection_parser_handles_items_larger_than_a_chunk() -> None:
+    # Given
+    large_item = {"id": "route:1", "name": "x" * (3 * STREAM_CHUNK_SIZE)}
+    content = json.dumps({"routes": [large_item, {"id": "route:2"}]}).encode()
+
+    # When
+    items, members = _parse("routes", content, chunk_size=1024)
+
+    # Then
+    assert items == [large_item, {"id": "route:2"}]
+    assert members == {}
+
+
+def test_collection_parser_handles_strings_and_scalars() -> None:
+    # Given
+    content = (
+        b'{"pagination": {"total_result": 2}, "lines": '
+        b'[{"name": "Ligne \\"A\\" [nuit] {\\\\}", "code": "\xc3\xa9"}, 12, null, '
+        b'"\\u00e9]", -1.5e3], "message": "ok"}'
+    )
+
+    # When
+    items, members = _parse("lines", content, chunk_size=1)
+
+    # Then
+    assert items == [
+        {"name": 'Ligne "A" [nuit] {\\}', "code": "é"},
+        12,
+        None,
+        "é]",
+        -1500.0,
+    ]
+    assert members == {"pagination": {"total_result": 2}, "message": "ok"}
+
+
+def test_collection_parser_handles_empty_collections() -> None:
+    # Given
+    content = b' { "lines" : [ ] , "pagination" : { } } '
+
+    # When
+    items, members = _parse("lines", content, chunk_size=1)
+
+    # Then
+    assert items == []
+    assert members == {"pagination": {}}
+
+
+def test_collection_parser_decodes_members_without_the_collection() -> None:
+    # Given
+    content = b'{"error": {"id": "unknown_object", "message": "Unable to find"}}'
+
+    # When
+    items, members = _parse("lines", content, chunk_size=7)
+
+    # Then
+    assert items == []
+    assert members == {"error": {"id": "unknown_object", "message": "Unable to find"}}
+
+
+def test_collection_parser_raises_on_incomplete_body() -> None:
+    # Given
+    parser = CollectionParser("lines")
+    parser.feed(b'{"lines": [{"id": "line:1"}, {"id": "li')
+
+    # When/Then
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize("content", [b"[]", b'{"lines" [', b'{"lines": [1 2]}'])
+def test_collection_parser_raises_on_invalid_body(content: bytes) -> None:
+    # Given
+    parser = CollectionParser("lines")
+
+    # When/Then
+    with pytest.raises(ValueError):
+        parser.feed(content)
+        parser.close()
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+
+from navitia_client.entities.response.datetime_parser import (
+    parse_date,
+    parse_datetime,
+    parse_epoch_seconds,
+)
+
+
+def test_parse_datetime() -> None:
+    assert parse_datetime("20240519T172805") == datetime(2024, 5, 19, 17, 28, 5)
+
+
+def test_parse_datetime_returns_memoized_value() -> None:
+    assert parse_datetime("20240519T172800") is parse_datetime("20240519T172800")
+
+
+@pytest.mark.parametrize(
+    "value", ["20240519T172800Z", "20241319T172800", "2024O519T172800", "", "20240519"]
+)
+def test_parse_datetime_rejects_invalid_values(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_datetime(value)
+
+
+def test_parse_datetime_matches_strptime_on_irregular_values() -> None:
+    assert parse_datetime("2024519T172800") == datetime.strptime(
+        "2024519T172800", "%Y%m%dT%H%M%S"
+    )
+
+
+def test_parse_date() -> None:
+    assert parse_date("20240519") == datetime(2024, 5, 19)
+
+
+@pytest.mark.parametrize("value", ["20240519T172800", "20240230", "2024-05-19"])
+def test_parse_date_rejects_invalid_values(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_date(value)
+
+
+def test_parse_epoch_seconds() -> None:
+    assert parse_epoch_seconds("19700101T000001") == 1
+    assert parse_epoch_seconds("20240519T172805") == int(
+        (datetime(2024, 5, 19, 17, 28, 5) - datetime(1970, 1, 1)).total_seconds()
+    )
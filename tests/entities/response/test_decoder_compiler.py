@@ -0,0 +1,233 @@
+import copy
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from navitia_client.entities.response import (
+    Arrival,
+    CommercialMode,
+    Coord,
+    Disruption,
+    Journey,
+    Line,
+    Network,
+    PhysicalMode,
+    Place,
+    PtObject,
+    Route,
+    StopArea,
+    StopPoint,
+)
+from navitia_client.entities.response.administrative_region import Region
+from navitia_client.entities.response.company import Company
+from navitia_client.entities.response.contributor import Contributor
+from navitia_client.entities.response.dataset import Dataset
+from navitia_client.entities.response.decoder_compiler import (
+    compile_decoder,
+    decoder_source,
+)
+from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.equipment_reports import EquipmentReports
+from navitia_client.entities.response.free_floating import FreeFloating
+from navitia_client.entities.response.identity_map import identity_scope
+from navitia_client.entities.response.isochrones import Isochrone
+from navitia_client.entities.response.line_report import LineReport
+from navitia_client.entities.response.route_schedule import RouteSchedule
+from navitia_client.entities.response.stop_schedule import (
+    StopSchedule,
+    TerminusSchedule,
+)
+from navitia_client.entities.response.traffic_report import TrafficReport
+
+# Entity of every collection of the fixtures of tests/test_data
+_FIXTURE_COLLECTIONS: dict[str, type[Any]] = {
+    "arrivals": Arrival,
+    "commercial_modes": CommercialMode,
+    "companies": Company,
+    "contributors": Contributor,
+    "datasets": Dataset,
+    "departures": Departure,
+    "disruptions": Disruption,
+    "equipment_reports": EquipmentReports,
+    "free_floatings": FreeFloating,
+    "isochrones": Isochrone,
+    "journeys": Journey,
+    "line_reports": LineReport,
+    "lines": Line,
+    "networks": Network,
+    "physical_modes": PhysicalMode,
+    "places": Place,
+    "places_nearby": Place,
+    "pt_objects": PtObject,
+    "regions": Region,
+    "route_schedules": RouteSchedule,
+    "routes": Route,
+    "stop_areas": StopArea,
+    "stop_points": StopPoint,
+    "stop_schedules": StopSchedule,
+    "terminus": StopArea,
+    "terminus_schedules": TerminusSchedule,
+    "traffic_reports": TrafficReport,
+}
+
+
+def _decode_all(
+    decode: Callable[[dict[str, Any]], Any], items: list[dict[str, Any]]
+) -> Any:
+    """Entities of the items, or the type of the error raised by the first failure."""
+    try:
+        return [decode(item) for item in items]
+    except Exception as error:
+        return type(error)
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    sorted(Path("tests/test_data").glob("*.json")),
+    ids=lambda path: path.name,
+)
+def test_compiled_decoders_match_from_payload_on_every_fixture(fixture: Path) -> None:
+    # Given
+    payload = json.loads(fixture.read_text(encoding="utf-8"))
+    collections = {
+        key: value
+        for key, value in payload.items()
+        if isinstance(value, list) and value and isinstance(value[0], dict)
+    }
+
+    for collection, items in collections.items():
+        assert collection in _FIXTURE_COLLECTIONS, f"No entity for {collection}"
+        entity_class = _FIXTURE_COLLECTIONS[collection]
+        decode = compile_decoder(entity_class)
+
+        # When
+        decoded = _decode_all(decode, items)
+        with identity_scope():
+            decoded_in_scope = _decode_all(decode, items)
+
+        # Then
+        assert decoded == _decode_all(entity_class.from_payload, items)
+        with identity_scope():
+            assert decoded_in_scope == _decode_all(entity_class.from_payload, items)
+        if isinstance(decoded, list):
+            assert all(type(entity) is entity_class for entity in decoded)
+
+
+def _mutations(item: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Copies of an item missing one key, or with one null value, at any depth."""
+    paths: list[tuple[Any, ...]] = []
+
+    def collect(node: Any, path: tuple[Any, ...]) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                paths.append(path + (key,))
+                collect(value, path + (key,))
+        elif isinstance(node, list) and node:
+            collect(node[0], path + (0,))
+
+    collect(item, ())
+    for path in paths:
+        for remove in (True, False):
+            mutated = copy.deepcopy(item)
+            parent = mutated
+            for step in path[:-1]:
+                parent = parent[step]
+            if remove:
+                del parent[path[-1]]
+            else:
+                parent[path[-1]] = None
+            yield mutated
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    sorted(Path("tests/test_data").glob("*.json")),
+    ids=lambda path: path.name,
+)
+def test_compiled_decoders_match_from_payload_on_mutated_payloads(
+    fixture: Path,
+) -> None:
+    # Given
+    payload = json.loads(fixture.read_text(encoding="utf-8"))
+    collections = {
+        key: value
+        for key, value in payload.items()
+        if isinstance(value, list) and value and isinstance(value[0], dict)
+    }
+
+    for collection, items in collections.items():
+        entity_class = _FIXTURE_COLLECTIONS[collection]
+        decode = compile_decoder(entity_class)
+
+        for mutated in _mutations(items[0]):
+            # When
+            decoded = _decode_all(decode, [mutated])
+
+            # Then
+            assert decoded == _decode_all(entity_class.from_payload, [mutated])
+            with identity_scope():
+                assert _decode_all(decode, [mutated]) == _decode_all(
+                    entity_class.from_payload, [mutated]
+                )
+
+
+def test_compiled_decoder_shares_entities_through_the_identity_map() -> None:
+    # Given
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        payloads = json.load(file)["departures"]
+    decode = compile_decoder(Departure)
+
+    # When
+    with identity_scope() as identity_map:
+        compiled = [decode(payload) for payload in payloads]
+        hand_written = Departure.from_payload(payloads[0])
+
+    # Then
+    assert identity_map.hits > 0
+    assert compiled[0].route is compiled[1].route
+    assert hand_written.route is compiled[0].route
+
+
+def test_compiled_decoder_tolerates_missing_optional_fields() -> None:
+    # Given
+    decode = compile_decoder(Route)
+    payload: dict[str, Any] = {
+        "id": "route:1",
+        "name": "Route",
+        "is_frequence": "False",
+        "direction_type": "forward",
+        "direction": {
+            "id": "stop_area:1",
+            "name": "Stop",
+            "embedded_type": "stop_area",
+            "quality": 0,
+            "stop_area": {"id": "stop_area:1", "name": "Stop", "label": "Stop"},
+        },
+    }
+
+    # Then
+    with pytest.raises(KeyError):
+        decode(payload)
+
+    payload["direction"]["stop_area"]["coord"] = {}
+    route = decode(payload)
+    assert route.line is None
+    assert route.direction.stop_area.coord == Coord(lon=None, lat=None)  # type: ignore[arg-type]
+    assert route.direction.stop_area.stop_points is None
+
+
+def test_hand_written_entities_keep_their_from_payload() -> None:
+    assert compile_decoder(Journey) == Journey.from_payload
+    assert compile_decoder(Disruption) == Disruption.from_payload
+    assert "def decode_Route" in decoder_source(Line)
+
+
+def test_compiled_decoders_are_cached() -> None:
+    assert compile_decoder(StopPoint) is compile_decoder(StopPoint)
+
+
+def test_compile_decoder_rejects_other_classes() -> None:
+    with pytest.raises(TypeError):
+        compile_decoder(dict)
@@ -0,0 +1,91 @@
+import dataclasses
+
+import pytest
+
+from navitia_client.entities.response import Coord, Line, Route, StopPoint
+from navitia_client.entities.response.arrival import Arrival
+from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.disruption import Disruption
+from navitia_client.entities.response.field_rules import (
+    FieldRule,
+    field_parsers,
+    field_rules,
+    follows_field_rules,
+)
+from navitia_client.entities.response.isochrones import Isochrone
+from navitia_client.entities.response.journey import Journey, Section
+
+
+@pytest.mark.parametrize(
+    "entity_class", [Arrival, Coord, Departure, Journey, Line, Route, Section]
+)
+def test_field_rules_cover_every_field(entity_class: type) -> None:
+    assert list(field_rules(entity_class)) == [
+        field.name for field in dataclasses.fields(entity_class)
+    ]
+
+
+def test_field_rules_follow_annotations_and_overrides() -> None:
+    # When
+    route_rules = field_rules(Route)
+    line_rules = field_rules(Line)
+    section_rules = field_rules(Section)
+
+    # Then
+    assert route_rules["line"] == FieldRule("line", "optional", "entity", Line)
+    assert route_rules["is_frequence"] == FieldRule("is_frequence", "required", "bool")
+    assert line_rules["text_color"] == FieldRule("text_color", "required", "value")
+    assert line_rules["routes"] == FieldRule(
+        "routes", "optional", "entity", Route, many=True
+    )
+    assert section_rules["from_"].key == "from"  # type: ignore[union-attr]
+    assert field_rules(StopPoint)["equipments"] == FieldRule(
+        "equipments", "required", "value"
+    )
+
+
+@pytest.mark.parametrize(
+    "presence, payload, expected",
+    [
+        ("required", {"key": "value"}, "value"),
+        ("required", {"key": None}, None),
+        ("optional", {}, None),
+        ("optional", {"key": "value"}, "value"),
+        ("nullable", {}, None),
+        ("nullable", {"key": None}, None),
+    ],
+)
+def test_field_rule_parser_presence(
+    presence: str, payload: dict, expected: object
+) -> None:
+    assert FieldRule("key", presence, "value").parser()(payload) == expected
+
+
+def test_field_rule_parser_rejects_like_from_payload() -> None:
+    # Given
+    required = FieldRule("key", "required", "value").parser()
+    optional_entity = FieldRule("key", "optional", "entity", Coord).parser()
+
+    # When/Then
+    with pytest.raises(KeyError):
+        required({})
+    with pytest.raises(AttributeError):
+        optional_entity({"key": None})
+
+
+def test_field_parsers_use_overrides() -> None:
+    # When
+    parsers = field_parsers(Section, ["from_", "links"])
+
+    # Then
+    assert parsers["from_"]({"to": {}}) is None
+    assert list(parsers["links"]({"links": []})) == []
+
+
+@pytest.mark.parametrize(
+    "entity_class, expected",
+    [(Departure, True), (Route, True), (Disruption, False), (Journey, False)],
+)
+def test_follows_field_rules(entity_class: type, expected: bool) -> None:
+    assert follows_field_rules(entity_class) is expected
+    assert not follows_field_rules(Isochrone)
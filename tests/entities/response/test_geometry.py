@@ -0,0 +1,146 @@
+import json
+from typing import Any
+
+import pytest
+
+from navitia_client.entities.response import Journey
+from navitia_client.entities.response.geometry import Geometry
+from navitia_client.entities.response.isochrones import Isochrone
+
+
+@pytest.fixture
+def isochrone_payload() -> dict[str, Any]:
+    with open("tests/test_data/isochrones.json", encoding="utf-8") as file:
+        return json.load(file)["isochrones"][0]
+
+
+@pytest.mark.parametrize(
+    "geojson",
+    [
+        {"type": "Point", "coordinates": [2.35, 48.85]},
+        {"type": "MultiPoint", "coordinates": [[2.35, 48.85], [2.36, 48.86]]},
+        {"type": "LineString", "coordinates": [[2.35, 48.85], [2.36, 48.86]]},
+        {
+            "type": "MultiLineString",
+            "coordinates": [[[0.0, 0.0], [1.0, 0.0]], [[2.0, 2.0], [3.0, 3.0]]],
+        },
+        {
+            "type": "Polygon",
+            "coordinates": [
+                [[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 0.0]],
+                [[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 1.0]],
+            ],
+        },
+        {
+            "type": "LineString",
+            "coordinates": [],
+            "properties": [{"length": 0}],
+        },
+    ],
+)
+def test_geometry_round_trips_to_geojson(geojson: dict[str, Any]) -> None:
+    assert Geometry.from_payload(geojson).to_geojson() == geojson
+
+
+def test_geometry_of_a_multipolygon(isochrone_payload: dict[str, Any]) -> None:
+    # Given
+    geojson = isochrone_payload["geojson"]
+
+    # When
+    geometry = Geometry.from_payload(geojson)
+
+    # Then
+    positions = geojson["coordinates"][0][0]
+    assert len(geometry) == len(positions)
+    assert geometry.coordinates.typecode == "d"
+    assert [list(offsets) for offsets in geometry.offsets] == [[0, 1], [0, 181]]
+    assert geometry.position(0) == tuple(positions[0])
+    assert geometry.position(-1) == tuple(positions[-1])
+    assert geometry.view()[1, 1] == positions[1][1]
+    assert geometry.bbox == (
+        min(lon for lon, _ in positions),
+        min(lat for _, lat in positions),
+        max(lon for lon, _ in positions),
+        max(lat for _, lat in positions),
+    )
+    assert geometry.to_geojson() == geojson
+
+
+def test_geometry_view_is_a_zero_copy_read_only_view() -> None:
+    # Given
+    geometry = Geometry.from_payload(
+        {"type": "LineString", "coordinates": [[2.35, 48.85], [2.36, 48.86]]}
+    )
+
+    # When
+    view = geometry.view()
+    geometry.coordinates[2] = 2.4
+
+    # Then
+    assert view.shape == (2, 2)
+    assert view.readonly
+    assert view[1, 0] == 2.4
+
+
+def test_geometry_length() -> None:
+    # One degree of latitude along a meridian
+    line = Geometry.from_payload(
+        {"type": "LineString", "coordinates": [[0.0, 0.0], [0.0, 0.5], [0.0, 1.0]]}
+    )
+    point = Geometry.from_payload({"type": "Point", "coordinates": [0.0, 0.0]})
+
+    assert line.length() == pytest.approx(111_195, rel=1e-4)
+    assert point.length() == 0.0
+
+
+def test_geometry_to_numpy_shares_the_buffer() -> None:
+    numpy = pytest.importorskip("numpy")
+    geometry = Geometry.from_payload(
+        {"type": "LineString", "coordinates": [[2.35, 48.85], [2.36, 48.86]]}
+    )
+
+    positions = geometry.to_numpy()
+
+    assert positions.shape == (2, 2)
+    assert numpy.shares_memory(positions, numpy.frombuffer(geometry.coordinates))
+
+
+@pytest.mark.parametrize(
+    "geojson",
+    [
+        {"type": "GeometryCollection", "geometries": []},
+        {"type": "LineString", "coordinates": [[2.35, 48.85, 35.0]]},
+    ],
+)
+def test_geometry_rejects_unsupported_geometries(geojson: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        Geometry.from_payload(geojson)
+
+
+def test_compact_isochrone(isochrone_payload: dict[str, Any]) -> None:
+    # When
+    compact = Isochrone.from_payload(isochrone_payload, compact_geometry=True)
+    default = Isochrone.from_payload(isochrone_payload)
+
+    # Then
+    assert isinstance(compact.geojson, Geometry)
+    assert compact.geojson.to_geojson() == isochrone_payload["geojson"]
+    assert default.geojson is isochrone_payload["geojson"]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compact_journey_sections(lazy: bool) -> None:
+    # Given
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        payload = json.load(file)["journeys"][0]
+
+    # When
+    journey = Journey.from_payload(payload, lazy=lazy, compact_geometry=True)
+
+    # Then
+    for section, section_payload in zip(journey.sections, payload["sections"]):
+        if "geojson" in section_payload:
+            assert isinstance(section.geojson, Geometry)
+            assert section.geojson.to_geojson() == section_payload["geojson"]
+        else:
+            assert section.geojson is None
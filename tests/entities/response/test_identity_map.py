@@ -0,0 +1,157 @@
+import functools
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.identity_map import (
+    IdentityMap,
+    identity_scope,
+    is_identity_mapped,
+)
+from navitia_client.entities.response.network import Network
+
+
+def test_entities_are_parsed_separately_without_scope() -> None:
+    # Given
+    payload = {"id": "network:1", "name": "Network"}
+
+    # When/Then
+    assert Network.from_payload(payload) is not Network.from_payload(payload)
+
+
+def test_identity_scope_shares_entities_with_same_id() -> None:
+    # Given
+    payload = {"id": "network:1", "name": "Network"}
+
+    # When
+    with identity_scope() as identity_map:
+        first = Network.from_payload(payload)
+        second = Network.from_payload(dict(payload))
+        other = Network.from_payload({"id": "network:2", "name": "Other"})
+
+    # Then
+    assert first is second
+    assert other is not first
+    assert (identity_map.hits, identity_map.misses) == (1, 2)
+    assert Network.from_payload(payload) is not first
+
+
+def test_identity_scope_distinguishes_payload_keys() -> None:
+    # Given
+    payload = {"id": "network:1", "name": "Network"}
+
+    # When
+    with identity_scope():
+        first = Network.from_payload(payload)
+        second = Network.from_payload({**payload, "links": []})
+
+    # Then
+    assert first is not second
+
+
+def test_identity_scope_shares_entities_across_departures() -> None:
+    # Given
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        payload = json.load(file)["departures"]
+
+    # When
+    with identity_scope():
+        departures = [Departure.from_payload(data) for data in payload]
+
+    # Then
+    routes = {id(departure.route) for departure in departures}
+    route_ids = {departure.route.id for departure in departures}
+    assert len(routes) == len(route_ids)
+
+
+def test_identity_scope_reuses_given_map() -> None:
+    # Given
+    identity_map = IdentityMap()
+    payload = {"id": "network:1", "name": "Network"}
+
+    # When
+    with identity_scope(identity_map):
+        first = Network.from_payload(payload)
+    with identity_scope(identity_map):
+        second = Network.from_payload(payload)
+
+    # Then
+    assert first is second
+    assert len(identity_map) == 1
+
+
+def test_identity_map_evicts_least_recently_used_entities() -> None:
+    # Given
+    identity_map = IdentityMap(max_size=2)
+    first_payload = {"id": "network:1", "name": "First"}
+
+    # When
+    with identity_scope(identity_map):
+        first = Network.from_payload(first_payload)
+        Network.from_payload({"id": "network:2", "name": "Second"})
+        Network.from_payload(first_payload)
+        Network.from_payload({"id": "network:3", "name": "Third"})
+        kept = Network.from_payload(first_payload)
+        second = Network.from_payload({"id": "network:2", "name": "Second"})
+
+    # Then
+    assert kept is first
+    assert second.name == "Second"
+    assert len(identity_map) == 2
+    assert (identity_map.hits, identity_map.misses) == (2, 4)
+    assert identity_map.evictions == 2
+
+
+def test_identity_map_rejects_empty_size() -> None:
+    # When/Then
+    with pytest.raises(ValueError):
+        IdentityMap(max_size=0)
+
+
+def test_identity_map_shares_one_instance_between_threads() -> None:
+    # Given
+    identity_map = IdentityMap()
+    payload = {"id": "network:1", "name": "Network"}
+    barrier = threading.Barrier(8)
+
+    def parse(cls: type[Network], data: dict) -> Network:
+        barrier.wait()
+        return Network.from_payload(data)
+
+    # When
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        networks = list(
+            executor.map(
+                lambda _: identity_map.get_or_parse(Network, payload, parse), range(8)
+            )
+        )
+
+    # Then
+    assert all(network is networks[0] for network in networks)
+    assert len(identity_map) == 1
+    assert (identity_map.hits, identity_map.misses) == (7, 1)
+
+
+def test_is_identity_mapped_checks_the_decorator() -> None:
+    # Given
+    def logged(function: Any) -> Any:
+        @functools.wraps(function)
+        def wrapper(*args: Any) -> Any:
+            return function(*args)
+
+        return wrapper
+
+    class Logged:
+        @classmethod
+        @logged
+        def from_payload(cls, payload: dict) -> "Logged":
+            return cls()
+
+    # When/Then
+    assert is_identity_mapped(Network)
+    assert not is_identity_mapped(Departure)
+    assert not is_identity_mapped(Logged)
@@ -0,0 +1,82 @@
+import dataclasses
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from navitia_client.entities.response import Journey
+from navitia_client.entities.response.journey import Section
+
+
+@pytest.fixture
+def journey_payload() -> dict[str, Any]:
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        return json.load(file)["journeys"][0]
+
+
+def test_lazy_journey_equals_eager_journey(journey_payload: dict[str, Any]) -> None:
+    # When
+    eager = Journey.from_payload(journey_payload)
+    lazy = Journey.from_payload(journey_payload, lazy=True)
+
+    # Then
+    assert isinstance(lazy, Journey)
+    assert isinstance(lazy.sections[0], Section)
+    assert lazy == eager
+
+
+def test_lazy_entity_equals_eager_entity() -> None:
+    # Given
+    payload = {
+        "type": "waiting",
+        "id": "section:1",
+        "duration": 60,
+        "links": [],
+        "departure_date_time": "20240522T182100",
+        "arrival_date_time": "20240522T182200",
+    }
+
+    # When/Then
+    assert Section.from_payload(payload, lazy=True) == Section.from_payload(payload)
+    assert Section.from_payload(payload) == Section.from_payload(payload, lazy=True)
+
+
+def test_lazy_journey_parses_nested_objects_on_first_access(
+    journey_payload: dict[str, Any],
+) -> None:
+    # Given
+    with patch.object(
+        Section, "from_payload", wraps=Section.from_payload
+    ) as from_payload:
+        journey = Journey.from_payload(journey_payload, lazy=True)
+
+        # When
+        duration = journey.duration
+        nb_transfers = journey.nb_transfers
+
+        # Then
+        assert (duration, nb_transfers) == (3660, 1)
+        from_payload.assert_not_called()
+
+        # When
+        first_access = journey.sections
+        second_access = journey.sections
+
+        # Then
+        assert from_payload.call_count == len(journey_payload["sections"])
+        assert first_access is second_access
+
+
+def test_lazy_journey_fields_can_be_set(journey_payload: dict[str, Any]) -> None:
+    # Given
+    journey = Journey.from_payload(journey_payload, lazy=True)
+
+    # When
+    journey.sections = []
+    replaced = dataclasses.replace(journey, duration=60)
+
+    # Then
+    assert journey.sections == []
+    assert replaced.duration == 60
+    assert replaced.sections == []
@@ -0,0 +1,108 @@
+import json
+from unittest.mock import patch
+
+from navitia_client.entities.response import Line, Note, StopArea
+from navitia_client.entities.response.link import (
+    Link,
+    LinkedResults,
+    LinkList,
+    LinkResolver,
+)
+
+
+def test_link_keeps_its_payload() -> None:
+    # When
+    link = Link.from_payload({"type": "line", "id": "line:1", "rel": "lines"})
+
+    # Then
+    assert link.type == "line"
+    assert link.id == "line:1"
+    assert link.rel == "lines"
+    assert link.href is None
+    assert link.lines is None
+    assert link == Link({"type": "line", "id": "line:1", "rel": "lines"})
+
+
+def test_link_parses_embedded_entities_on_first_access() -> None:
+    # Given
+    link = Link.from_payload({"lines": [{"id": "line:1", "name": "1"}]})
+
+    with patch.object(Line, "from_payload", return_value="line") as from_payload:
+        # When
+        first = link.lines
+        second = link.lines
+
+    # Then
+    assert first == ["line"]
+    assert second is first
+    from_payload.assert_called_once()
+
+
+def test_link_list_builds_links_on_first_access() -> None:
+    # Given
+    payloads = [{"type": "line", "id": "line:1"}, {"type": "route", "id": "route:1"}]
+
+    # When
+    links = LinkList(payloads)
+
+    # Then
+    assert len(links) == 2
+    assert links._links is None
+    assert links[1].id == "route:1"
+    assert [link.type for link in links] == ["line", "route"]
+    assert links == [Link(payload) for payload in payloads]
+    assert links.payloads is payloads
+
+
+def test_link_resolver_resolves_top_level_objects() -> None:
+    # Given
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        payload = json.load(file)
+    resolver = LinkResolver(payload)
+    terminus_links = [
+        link
+        for section in payload["journeys"][0]["sections"]
+        for link in LinkList(section.get("display_informations", {}).get("links", []))
+        if link.rel == "terminus"
+    ]
+
+    # When
+    terminus = terminus_links[0].resolve(resolver)
+
+    # Then
+    assert isinstance(terminus, StopArea)
+    assert terminus.id == terminus_links[0].id
+    assert resolver.resolve(terminus_links[0]) is terminus
+    assert resolver.resolve(Link({"type": "line", "id": "line:unknown"})) is None
+    assert resolver.resolve(Link({"type": "journeys"})) is None
+
+
+def test_link_resolver_builds_notes_and_keeps_unknown_objects_raw() -> None:
+    # Given
+    resolver = LinkResolver(
+        {
+            "notes": [{"id": "note:1", "value": "No service on sundays"}],
+            "others": [{"id": "other:1"}],
+            "pagination": {"total_result": 1},
+        }
+    )
+
+    # When/Then
+    assert resolver.resolve(Link({"type": "notes", "id": "note:1"})) == Note(
+        id="note:1", value="No service on sundays"
+    )
+    assert resolver.resolve(Link({"id": "other:1"})) == {"id": "other:1"}
+    assert len(resolver) == 2
+
+
+def test_linked_results_are_lists_holding_a_resolver() -> None:
+    # Given
+    resolver = LinkResolver({"notes": [{"id": "note:1", "value": "Hello"}]})
+
+    # When
+    results = LinkedResults(["first", "second"], resolver)
+
+    # Then
+    assert results == ["first", "second"]
+    assert results.links is resolver
+    assert len(results.links) == 1
@@ -0,0 +1,160 @@
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from navitia_client.entities.response import AdministrativeRegion, Route
+from navitia_client.entities.response.arrival import Arrival
+from navitia_client.entities.response.departure import Departure
+from navitia_client.entities.response.journey import Journey, Section
+from navitia_client.entities.response.projection import (
+    Projection,
+    get_projection,
+    parse_entities,
+    partial_variant,
+)
+
+
+@pytest.fixture
+def departures_payload() -> list[dict[str, Any]]:
+    with open("tests/test_data/departures.json", encoding="utf-8") as file:
+        return json.load(file)["departures"]
+
+
+def test_projection_of_every_field_equals_from_payload(
+    departures_payload: list[dict[str, Any]],
+) -> None:
+    # Given
+    fields = [
+        "route.id",
+        "route.name",
+        "route.is_frequence",
+        "route.line",
+        "route.direction.stop_area",
+        "route.direction.id",
+        "route.direction.name",
+        "route.direction.embedded_type",
+        "route.direction.quality",
+        "route.direction_type",
+        "stop_point.id",
+        "stop_point.name",
+        "stop_point.label",
+        "stop_point.coord.lon",
+        "stop_point.coord.lat",
+        "stop_point.administrative_regions",
+        "stop_point.equipments",
+        "stop_point.stop_area",
+        "stop_date_time",
+    ]
+
+    # When
+    projected = parse_entities(Departure, departures_payload, fields)
+
+    # Then
+    assert projected == [Departure.from_payload(data) for data in departures_payload]
+
+
+def test_projection_raises_on_other_fields(
+    departures_payload: list[dict[str, Any]],
+) -> None:
+    # Given
+    projection = Projection(
+        Departure, ["stop_date_time.departure_date_time", "route.id"]
+    )
+
+    with patch.object(Route, "from_payload") as route_from_payload:
+        # When
+        departure = projection.parse(departures_payload[0])
+
+    # Then
+    route_from_payload.assert_not_called()
+    assert isinstance(departure, Departure)
+    assert isinstance(departure.route, Route)
+    assert departure.route.id == "route:SNCF:B"
+    assert departure.stop_date_time.departure_date_time == (
+        Departure.from_payload(departures_payload[0]).stop_date_time.departure_date_time
+    )
+    with pytest.raises(AttributeError, match="PartialRoute.name was not selected"):
+        departure.route.name
+    with pytest.raises(AttributeError):
+        departure.stop_date_time.links
+    assert not hasattr(departure, "stop_point")
+
+
+def test_projection_builds_partial_entities(
+    departures_payload: list[dict[str, Any]],
+) -> None:
+    # Given
+    projection = Projection(Departure, ["route.id"])
+
+    # When
+    first = projection.parse(departures_payload[0])
+    second = projection.parse(departures_payload[0])
+
+    # Then
+    assert type(first).__name__ == "PartialDeparture"
+    assert type(first) is partial_variant(Departure)
+    assert repr(first) == "PartialDeparture(route=PartialRoute(id='route:SNCF:B'))"
+    assert first == second
+    assert first != Departure.from_payload(departures_payload[0])
+
+
+def test_projection_of_a_whole_field_wins_over_its_subfields(
+    departures_payload: list[dict[str, Any]],
+) -> None:
+    # When
+    first = Projection(Departure, ["route.id", "route"]).parse(departures_payload[0])
+    second = Projection(Departure, ["route", "route.id"]).parse(departures_payload[0])
+
+    # Then
+    expected = Route.from_payload(departures_payload[0]["route"])
+    assert first.route == expected
+    assert second.route == expected
+
+
+def test_projection_parses_entities_without_field_rules_as_a_whole() -> None:
+    # Given
+    with open("tests/test_data/journeys.json", encoding="utf-8") as file:
+        payload = json.load(file)["journeys"][0]
+
+    # When
+    journey = Projection(Journey, ["sections.id"]).parse(payload)
+
+    # Then
+    assert journey == Journey.from_payload(payload)
+    assert all(isinstance(section, Section) for section in journey.sections)
+
+
+def test_projection_partially_parses_nested_entities(
+    departures_payload: list[dict[str, Any]],
+) -> None:
+    # When
+    departure = Projection(Departure, ["stop_point.administrative_regions.name"]).parse(
+        departures_payload[0]
+    )
+
+    # Then
+    regions = departure.stop_point.administrative_regions
+    assert regions
+    assert all(isinstance(region, AdministrativeRegion) for region in regions)
+    assert regions[0].name is not None
+    with pytest.raises(AttributeError):
+        regions[0].id
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [["route.unknown"], ["stop_date_time.departure_date_time.year"], ["routes"]],
+)
+def test_projection_rejects_unknown_fields(fields: list[str]) -> None:
+    with pytest.raises(ValueError):
+        Projection(Arrival, fields)
+
+
+def test_get_projection_is_cached() -> None:
+    # When/Then
+    assert get_projection(Arrival, None) is None
+    assert get_projection(Arrival, ["route.id"]) is get_projection(
+        Arrival, ("route.id",)
+    )
@@ -0,0 +1,43 @@
+import dataclasses
+import inspect
+from enum import Enum
+
+import pytest
+
+import navitia_client.entities.response as response_module
+from navitia_client.entities.response import Coord
+from navitia_client.entities.response.stop_area import StopPoint
+
+
+def _entity_classes() -> list[type]:
+    classes = set()
+    for module_name in dir(response_module):
+        module = getattr(response_module, module_name)
+        if inspect.ismodule(module):
+            for _, member in inspect.getmembers(module, inspect.isclass):
+                if (
+                    dataclasses.is_dataclass(member)
+                    and not issubclass(member, Enum)
+                    and member.__module__.startswith(response_module.__name__)
+                ):
+                    classes.add(member)
+    return sorted(classes, key=lambda cls: cls.__qualname__)
+
+
+@pytest.mark.parametrize(
+    "entity_class", _entity_classes(), ids=lambda cls: cls.__name__
+)
+def test_entities_have_no_instance_dict(entity_class: type) -> None:
+    assert "__slots__" in vars(entity_class)
+    assert "__dict__" not in dir(entity_class)
+
+
+def test_slotted_entity_rejects_unknown_attributes() -> None:
+    coord = Coord(lat=48.85, lon=2.35)
+
+    with pytest.raises(AttributeError):
+        coord.altitude = 35  # type: ignore[attr-defined]
+
+
+def test_slotted_subclass_keeps_base_fields() -> None:
+    assert set(StopPoint.__slots__).isdisjoint({"id", "name"})
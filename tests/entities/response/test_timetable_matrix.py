@@ -0,0 +1,193 @@
+import json
+import random
+from array import array
+from datetime import datetime
+from typing import Any, Callable
+from unittest.mock import patch
+
+import pytest
+
+from navitia_client.entities.response.decoder_compiler import compile_decoder
+from navitia_client.entities.response.route_schedule import RouteSchedule
+from navitia_client.entities.response.timetable_matrix import NO_STOP, TimetableMatrix
+
+
+def _epoch(value: str) -> int:
+    return int(
+        (
+            datetime.strptime(value, "%Y%m%dT%H%M%S") - datetime(1970, 1, 1)
+        ).total_seconds()
+    )
+
+
+def _table(rows: dict[str, list[str]], trips: int) -> dict[str, Any]:
+    return {
+        "headers": [
+            {"links": [{"id": f"vehicle_journey:{trip}", "type": "vehicle_journey"}]}
+            for trip in range(trips)
+        ],
+        "rows": [
+            {
+                "stop_point": {"id": stop_point_id},
+                "date_times": [{"date_time": value} for value in values],
+            }
+            for stop_point_id, values in rows.items()
+        ],
+    }
+
+
+@pytest.fixture
+def matrix() -> TimetableMatrix:
+    return TimetableMatrix.from_payload(
+        _table(
+            {
+                "stop_point:A": ["20240510T080000", "20240510T081500", ""],
+                "stop_point:B": ["20240510T081000", "", "20240510T090000"],
+                "stop_point:C": ["", "", ""],
+            },
+            trips=3,
+        )
+    )
+
+
+def test_matrix_of_a_route_schedule() -> None:
+    # Given
+    with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
+        payload = json.load(file)["route_schedules"][0]
+
+    # When
+    table = RouteSchedule.from_payload(payload).table
+
+    # Then
+    matrix = table.matrix()
+    assert table.matrix() is matrix
+    rows = payload["table"]["rows"]
+    assert matrix.shape == (len(rows), len(payload["table"]["headers"]))
+    assert matrix.stop_point_ids == [row["stop_point"]["id"] for row in rows]
+    assert (
+        matrix.trip_ids[0]
+        == "vehicle_journey:SNCF:2024-05-10:9339:0018:LongDistanceTrain"
+    )
+    assert list(matrix.trip_times(0)) == [
+        _epoch(row["date_times"][0]["date_time"]) for row in rows
+    ]
+    assert list(matrix.stop_times(1)) == [
+        _epoch(cell["date_time"]) for cell in rows[1]["date_times"]
+    ]
+
+
+def test_matrix_cells(matrix: TimetableMatrix) -> None:
+    assert matrix.shape == (3, 3)
+    assert matrix.stop_index("stop_point:B") == 1
+    assert matrix.time(0, 1) == _epoch("20240510T081500")
+    assert matrix.time(1, 1) is None
+    assert list(matrix.trip_times(2)) == [NO_STOP, _epoch("20240510T090000"), NO_STOP]
+
+
+def test_matrix_first_and_last_departures(matrix: TimetableMatrix) -> None:
+    assert list(matrix.first_departures()) == [
+        _epoch("20240510T080000"),
+        _epoch("20240510T081000"),
+        NO_STOP,
+    ]
+    assert list(matrix.last_departures()) == [
+        _epoch("20240510T081500"),
+        _epoch("20240510T090000"),
+        NO_STOP,
+    ]
+
+
+def test_matrix_headways_and_running_times(matrix: TimetableMatrix) -> None:
+    assert list(matrix.headways(0)) == [900]
+    assert list(matrix.headways(2)) == []
+    assert list(matrix.running_times(0, 1)) == [600, NO_STOP, NO_STOP]
+
+
+def test_matrix_rejects_ragged_rows() -> None:
+    with pytest.raises(ValueError):
+        TimetableMatrix.from_payload(_table({"stop_point:A": [""]}, trips=2))
+
+
+@pytest.mark.parametrize(
+    "decode", [RouteSchedule.from_payload, compile_decoder(RouteSchedule)]
+)
+def test_ragged_table_fails_only_when_its_matrix_is_built(
+    decode: Callable[[dict[str, Any]], RouteSchedule],
+) -> None:
+    # Given
+    with open("tests/test_data/route_schedules.json", encoding="utf-8") as file:
+        payload = json.load(file)["route_schedules"][0]
+    payload["table"]["rows"][0]["date_times"].pop()
+
+    # When
+    table = decode(payload).table
+
+    # Then
+    assert len(table.rows[0].date_times) == len(table.headers) - 1
+    with pytest.raises(ValueError):
+        table.matrix()
+
+
+def test_matrix_without_trips() -> None:
+    matrix = TimetableMatrix.from_payload(_table({"stop_point:A": []}, trips=0))
+
+    assert matrix.shape == (1, 0)
+    assert list(matrix.trip_times(0)) == []
+    assert list(matrix.stop_times(0)) == []
+    assert list(matrix.first_departures()) == [NO_STOP]
+
+
+def test_matrix_to_numpy(matrix: TimetableMatrix) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    array = matrix.to_numpy()
+
+    assert array.shape == (3, 3)
+    assert array[0, 0] == numpy.datetime64("2024-05-10T08:00:00")
+    assert numpy.isnat(array[2]).all()
+
+
+def _helper_results(matrix: TimetableMatrix) -> list[list[int]]:
+    stops = range(-1, matrix.shape[0] + 1)
+    return [
+        list(matrix.first_departures()),
+        list(matrix.last_departures()),
+        *(list(matrix.headways(stop)) for stop in stops),
+        *(list(matrix.running_times(start, end)) for start in stops for end in stops),
+    ]
+
+
+def test_vectorized_helpers_match_the_python_loops() -> None:
+    # Given
+    pytest.importorskip("numpy")
+    generator = random.Random(20240510)
+    matrices = [TimetableMatrix()]
+    for _ in range(50):
+        stops, trips = generator.randint(0, 6), generator.randint(0, 8)
+        matrices.append(
+            TimetableMatrix(
+                [f"stop_point:{stop}" for stop in range(stops)],
+                [f"vehicle_journey:{trip}" for trip in range(trips)],
+                array(
+                    "q",
+                    (
+                        NO_STOP
+                        if generator.random() < 0.3
+                        else generator.randint(1_700_000_000, 1_700_100_000)
+                        for _ in range(stops * trips)
+                    ),
+                ),
+            )
+        )
+
+    for matrix in matrices:
+        # When
+        vectorized = _helper_results(matrix)
+        with patch(
+            "navitia_client.entities.response.timetable_matrix._numpy",
+            return_value=None,
+        ):
+            looped = _helper_results(matrix)
+
+        # Then
+        assert vectorized == looped
@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import pytest
+
+from navitia_client.client.apis.departure_apis import AsyncDepartureApiClient
+from navitia_client.client.apis.journeys_apis import AsyncJourneyApiClient
+from navitia_client.client.apis.public_transportation_apis import (
+    AsyncLineApiClient,
+    AsyncStopPointApiClient,
+)
+from navitia_client.client.async_navitia_client import AsyncNavitiaClient
+from navitia_client.client.raw.raw_client import AsyncRawClient
+
+
+@pytest.fixture
+def async_navitia_client():
+    auth_token = "test_token"
+    base_navitia_url = "http://api.navitia.io/v1/"
+    return AsyncNavitiaClient(auth_token=auth_token, base_navitia_url=base_navitia_url)
+
+
+def test_departures_client(async_navitia_client):
+    assert isinstance(async_navitia_client.departures, AsyncDepartureApiClient)
+
+
+def test_journeys_client(async_navitia_client):
+    assert isinstance(async_navitia_client.journeys, AsyncJourneyApiClient)
+
+
+def test_lines_client(async_navitia_client):
+    assert isinstance(async_navitia_client.lines, AsyncLineApiClient)
+
+
+def test_stop_points_client(async_navitia_client):
+    assert isinstance(async_navitia_client.stop_points, AsyncStopPointApiClient)
+
+
+def test_raw_client(async_navitia_client):
+    assert isinstance(async_navitia_client.raw, AsyncRawClient)
+
+
+def test_sub_clients_are_cached(async_navitia_client):
+    assert async_navitia_client.departures is async_navitia_client.departures
+
+
+def test_sub_clients_share_session(async_navitia_client):
+    assert async_navitia_client.departures.session is async_navitia_client.session
+    assert async_navitia_client.lines.session is async_navitia_client.session
+
+
+def test_session_headers(async_navitia_client):
+    assert async_navitia_client.session.headers["Authorization"] == "test_token"
+
+
+def test_context_manager_closes_session():
+    async def run() -> AsyncNavitiaClient:
+        async with AsyncNavitiaClient(auth_token="test_token") as client:
+            pass
+        return client
+
+    client = asyncio.run(run())
+
+    assert client.session.is_closed
+
+
+def test_json_decoder_is_shared_with_sub_clients():
+    client = AsyncNavitiaClient(auth_token="test_token", json_decoder="json")
+
+    assert client.departures.json_decoder is json.loads
+    assert client.lines.json_decoder is json.loads
+
+
+def test_rate_limiter_is_shared_with_sub_clients():
+    client = AsyncNavitiaClient(auth_token="test_token", rate_limit=5)
+
+    assert client.departures.rate_limiter is client.rate_limiter
+    assert client.lines.rate_limiter is client.rate_limiter
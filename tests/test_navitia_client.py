@@ -1,4 +1,9 @@
+import json
+from unittest.mock import patch
+
 import pytest
+from requests import Session  # type: ignore
+
 from navitia_client.client.apis.arrival_apis import ArrivalApiClient
 from navitia_client.client.apis.contributors_apis import ContributorsApiClient
 from navitia_client.client.apis.coverage_apis import CoverageApiClient
@@ -39,8 +44,11 @@ from navitia_client.client.apis.terminus_schedules_apis import (
     TerminusSchedulesApiClient,
 )
 from navitia_client.client.apis.traffic_report_apis import TrafficReportsApiClient
-from navitia_client.client.raw.raw_client import RawClient
+from navitia_client.client.cache import ResponseCache
 from navitia_client.client.navitia_client import NavitiaClient
+from navitia_client.client.raw.raw_client import RawClient
+from navitia_client.client.retry import NO_RETRY
+from navitia_client.entities.response.identity_map import IdentityMap
 
 
 @pytest.fixture
@@ -164,3 +172,104 @@ def test_isochrones_client(navitia_client):
 
 def test_raw_client(navitia_client):
     assert isinstance(navitia_client.raw, RawClient)
+
+
+def test_sub_clients_are_cached(navitia_client):
+    assert navitia_client.departures is navitia_client.departures
+    assert navitia_client.lines is navitia_client.lines
+
+
+def test_sub_clients_share_session(navitia_client):
+    assert navitia_client.departures.session is navitia_client.session
+    assert navitia_client.journeys.session is navitia_client.session
+    assert navitia_client.raw.session is navitia_client.session
+
+
+def test_session_pool_configuration():
+    client = NavitiaClient(auth_token="test_token", pool_maxsize=42)
+
+    adapter = client.session.get_adapter("https://api.navitia.io/v1/")
+
+    assert adapter._pool_maxsize == 42
+    assert client.session.headers["Authorization"] == "test_token"
+
+
+def test_session_without_keep_alive():
+    client = NavitiaClient(auth_token="test_token", keep_alive=False)
+
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_context_manager_closes_session():
+    with (
+        patch.object(Session, "close") as mock_close,
+        NavitiaClient(auth_token="test_token"),
+    ):
+        pass
+
+    mock_close.assert_called_once()
+
+
+def test_json_decoder_is_shared_with_sub_clients():
+    client = NavitiaClient(auth_token="test_token", json_decoder="json")
+
+    assert client.decode_json is json.loads
+    assert client.departures.json_decoder is json.loads
+    assert client.lines.json_decoder is json.loads
+
+
+def test_unknown_json_decoder():
+    with pytest.raises(ValueError):
+        NavitiaClient(auth_token="test_token", json_decoder="unknown")
+
+
+def test_retry_settings_are_shared_with_sub_clients():
+    client = NavitiaClient(auth_token="test_token", retry_policy=NO_RETRY)
+
+    assert client.departures.retry_policy is NO_RETRY
+    assert client.departures.retry_stats is client.retry_stats
+    assert client.lines.retry_stats is client.retry_stats
+
+
+def test_rate_limiter_is_shared_with_sub_clients():
+    client = NavitiaClient(auth_token="test_token", rate_limit=5, rate_limit_burst=3)
+
+    assert client.rate_limiter is not None
+    assert client.rate_limiter.rate == 5
+    assert client.rate_limiter.burst == 3
+    assert client.departures.rate_limiter is client.rate_limiter
+    assert client.lines.rate_limiter is client.rate_limiter
+
+
+def test_no_rate_limiter_by_default(navitia_client):
+    assert navitia_client.rate_limiter is None
+    assert navitia_client.departures.rate_limiter is None
+
+
+def test_response_cache_is_shared_with_sub_clients():
+    cache = ResponseCache()
+    client = NavitiaClient(auth_token="test_token", response_cache=cache)
+
+    assert client.lines.response_cache is cache
+    assert client.networks.response_cache is cache
+
+
+def test_singleflight_is_shared_with_sub_clients():
+    client = NavitiaClient(auth_token="test_token", coalesce_requests=True)
+
+    assert client.singleflight is not None
+    assert client.departures.singleflight is client.singleflight
+    assert client.stop_schedules.singleflight is client.singleflight
+
+
+def test_singleflight_is_disabled_by_default(navitia_client):
+    assert navitia_client.singleflight is None
+    assert navitia_client.departures.singleflight is None
+
+
+def test_identity_map_is_shared_with_sub_clients():
+    identity_map = IdentityMap()
+    client = NavitiaClient(auth_token="test_token", identity_map=identity_map)
+
+    assert client.lines.identity_map is identity_map
+    assert client.departures.identity_map is identity_map